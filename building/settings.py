@@ -112,12 +112,22 @@ CORS_ALLOW_METHODS = [
 CORS_ALLOW_HEADERS = [
     'content-type',
     'authorization',
+    'if-match',
     # 'x-csrftoken',
     # 'accept',
     # 'origin',
     # 'x-requested-with',
 ]
 
+# Lets browser clients read the assessment version for If-Match, and the next page of lists (core.pagination)
+CORS_EXPOSE_HEADERS = [
+    'etag',
+    'link',
+    'x-next-cursor',
+    'x-next-jobs-cursor',
+    'x-next-quotes-cursor',
+]
+
 # CORS_ALLOWED_CONTENT_TYPES = [
 #     'application/json',
 #     'application/x-www-form-urlencoded',
@@ -237,6 +247,41 @@ STATIC_URL = 'static/'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Shared by every server process and management command, unlike the default per-process
+# memory: the autosave buffers and their locks (core.autosave), the job feeds
+# (core.job_feed), the job map's change log (core.job_map) and the rankings made by the
+# rank_jobs command (core.recommendations). The table is made by
+# `python manage.py createcachetable`.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'core_cache',
+        'OPTIONS': {'MAX_ENTRIES': 100000},
+    }
+}
+
+# Buffered assessment autosaves are written to the database at most this often (core.autosave)
+ASSESSMENT_AUTOSAVE_FLUSH_SECONDS = 10
+
+# Draft tokens from GET get-quote/ can be saved for this long (core.quote_drafts)
+QUOTE_DRAFT_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+# Quotes left without contact details are deleted after this many days (reap_drafts command)
+QUOTE_DRAFT_REAP_AFTER_DAYS = 30
+# Bulk quote uploads are saved this many rows per transaction, and read up to this many rows (core.quote_intake)
+QUOTE_INTAKE_CHUNK_SIZE = 1000
+QUOTE_INTAKE_MAX_ROWS = 50000
+
+# Job search re-reads the towns and property types it matches terms against this often (core.search)
+JOB_SEARCH_VOCABULARY_SECONDS = 60
+
+# Accessors' job feeds keep this many pending jobs per county in the cache, for at most this long (core.job_feed)
+JOB_FEED_SIZE = 200
+JOB_FEED_SECONDS = 60 * 60
+
+# Each accessor's ranking of pending jobs keeps this many jobs in the cache, for at most this long (core.recommendations)
+RECOMMENDATIONS_SIZE = 100
+RECOMMENDATIONS_SECONDS = 30 * 60
+
 
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
\ No newline at end of file
@@ -0,0 +1,133 @@
+"""
+Coalescing autosave for assessments.
+
+The surveyor app sends every field change as a small delta with an increasing sequence
+number. Deltas are merged into a buffer in the cache, one per assessment and device, and
+written to the database at most once every ASSESSMENT_AUTOSAVE_FLUSH_SECONDS, or when the
+app asks for a commit. Each response acknowledges two sequence numbers:
+
+- received_seq: the last delta merged into the buffer. Lower or equal numbers sent again
+  are ignored, so retrying a request is safe.
+- committed_seq: the last delta written to the database. The app can drop its local copy
+  of every delta up to this one. If received_seq ever comes back lower than what it sent
+  (the buffer was lost), it resends everything after committed_seq.
+
+Deltas sent with If-Match are flushed only onto that version, as a PUT would be: the buffer
+keeps the latest version the device said its changes are based on (or the version its own
+last flush wrote). When another device saved the assessment meanwhile, the flush raises
+AutosaveConflict and the buffer is kept; once the app has reloaded the assessment, its next
+delta with the new ETag flushes it onto that version.
+
+The buffers and their locks are kept in the cache (CACHES in settings), shared by every server
+process.
+"""
+import time
+import uuid
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .checkbox_groups import CHECKBOX_KEYS
+from .models import AssessmentVersionConflict
+from .serializers import CompiledAssessmentSerializer, assessment_queryset
+
+
+# Unflushed changes are kept this long after the last delta
+BUFFER_TIMEOUT = 24 * 60 * 60
+
+
+class AutosaveBusy(Exception):
+    """Another request held the assessment's buffer for too long."""
+
+
+class AutosaveConflict(AssessmentVersionConflict):
+    """The buffer wasn't flushed: the assessment is no longer at the version it is based on."""
+
+    def __init__(self, current_version, ack):
+        super().__init__(current_version)
+        self.ack = ack
+
+
+def _buffer_key(assessment_id, device):
+    return f'assessment-autosave:{assessment_id}:{device}'
+
+
+@contextmanager
+def _locked_buffer(assessment_id, device, wait=5):
+    lock_key = _buffer_key(assessment_id, device) + ':lock'
+    # Only released by its holder: once it has timed out, another request may hold it
+    token = uuid.uuid4().hex
+    deadline = time.monotonic() + wait
+    while not cache.add(lock_key, token, timeout=30):
+        if time.monotonic() > deadline:
+            raise AutosaveBusy()
+        time.sleep(0.01)
+    try:
+        yield
+    finally:
+        if cache.get(lock_key) == token:
+            cache.delete(lock_key)
+
+
+def merge_changes(pending, changes):
+    """Apply `changes` on top of the buffered `pending` ones, the latest value of a key winning."""
+    for key, value in changes.items():
+        group = CHECKBOX_KEYS.get(key)
+        if group is not None and group.exclusive and value:
+            # Ticking a box unticks the rest of its group, as it would when written directly
+            for other in group.keys:
+                pending.pop(other, None)
+        pending[key] = value
+
+
+def autosave(assessment_id, seq, changes, commit=False, device='', user=None, expected_version=None):
+    """
+    Buffer the already validated `changes` of delta `seq`, based on `expected_version` (from
+    If-Match, None for any), and flush the buffer if it is due or `commit` is set, as a version
+    changed by `user`. Returns the acknowledgement for the client, or raises AutosaveConflict.
+    """
+    key = _buffer_key(assessment_id, device)
+    conflict = None
+    with _locked_buffer(assessment_id, device):
+        now = time.time()
+        buffer = cache.get(key) or {'changes': {}, 'received_seq': 0, 'committed_seq': 0, 'flushed_at': now}
+        if seq is not None and seq > buffer['received_seq']:
+            merge_changes(buffer['changes'], changes)
+            buffer['received_seq'] = seq
+        if expected_version is not None:
+            # Versions only go up: an older one is from before this device's own last flush
+            buffer['base_version'] = max(expected_version, buffer.get('base_version') or 0)
+
+        version = None
+        if commit or now - buffer['flushed_at'] >= settings.ASSESSMENT_AUTOSAVE_FLUSH_SECONDS:
+            try:
+                version = _flush(assessment_id, buffer['changes'], user, buffer.get('base_version'))
+            except AssessmentVersionConflict as e:
+                conflict = e  # Kept buffered, for when the app has reloaded
+            else:
+                buffer.update(changes={}, committed_seq=buffer['received_seq'], flushed_at=now)
+                if buffer.get('base_version') is not None:
+                    buffer['base_version'] = version
+        cache.set(key, buffer, BUFFER_TIMEOUT)
+
+    ack = {'received_seq': buffer['received_seq'], 'committed_seq': buffer['committed_seq'],
+           'pending': len(buffer['changes'])}
+    if conflict is not None:
+        raise AutosaveConflict(conflict.current_version, ack)
+    if version is not None:
+        ack['version'] = version
+    return ack
+
+
+def _flush(assessment_id, changes, user=None, expected_version=None):
+    # One write for all the merged deltas, through the same path as a PUT
+    assessment = assessment_queryset(set(changes)).get(pk=assessment_id)
+    if changes:
+        serializer = CompiledAssessmentSerializer(assessment, data=changes, partial=True,
+                                                  context={'changed_by': user, 'expected_version': expected_version})
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+    elif expected_version is not None and expected_version != assessment.version:
+        raise AssessmentVersionConflict(assessment.version)
+    return assessment.version
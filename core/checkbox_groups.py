@@ -0,0 +1,115 @@
+"""
+Packed storage for the checkbox groups of the assessment form.
+
+The paper form has groups of tick boxes (dwelling type, age band, wall construction, ...)
+that used to be one BooleanField each. They are now stored as:
+
+- exclusive groups (only one box can be ticked): one CharField holding the ticked key,
+  or null when nothing is ticked. These columns are indexed, so a filter such as
+  `envelope__wall_construction='cavity'` is a plain index lookup.
+- multi-select groups: one small integer where bit n is the n-th box of the group.
+
+AssessmentSerializer keeps accepting and returning the original flat boolean keys
+through the codec below, so clients don't see the change.
+"""
+
+
+class CheckboxGroup:
+    def __init__(self, field, keys, section=None, values=None, exclusive=False):
+        self.field = field  # packed column
+        self.keys = keys  # legacy boolean keys, in form order
+        self.section = section  # None for columns on Assesment itself
+        self.values = values or keys  # stored value per key (exclusive groups only)
+        self.exclusive = exclusive
+
+    @property
+    def default(self):
+        return None if self.exclusive else 0
+
+    def stored_value(self, assessment):
+        row = assessment.section(self.section) if self.section else assessment
+        return getattr(row, self.field)
+
+    def is_checked(self, stored, key):
+        index = self.keys.index(key)
+        if self.exclusive:
+            return stored == self.values[index]
+        return bool((stored or 0) & (1 << index))
+
+    def decode(self, stored):
+        """Packed value -> {legacy key: bool} for every box in the group."""
+        return {key: self.is_checked(stored, key) for key in self.keys}
+
+    def encode(self, flags, stored=None):
+        """
+        Apply {legacy key: bool} on top of the packed value `stored` and return the new
+        packed value. Keys not in `flags` keep their current state, as with a partial PUT.
+        """
+        if stored is None:
+            stored = self.default
+        for key, checked in flags.items():
+            index = self.keys.index(key)
+            if self.exclusive:
+                if checked:
+                    stored = self.values[index]
+                elif stored == self.values[index]:
+                    stored = None
+            elif checked:
+                stored = (stored or 0) | (1 << index)
+            else:
+                stored = (stored or 0) & ~(1 << index)
+        return stored
+
+
+AGE_BANDS = [
+    'pre_1900', 'between_1900_and_1929', 'between_1930_and_1949', 'between_1950_and_1966',
+    'between_1967_and_1977', 'between_1978_and_1982', 'between_1983_and_1993',
+    'between_1994_and_1999', 'from_2000_onwards',
+]
+WALL_CONSTRUCTIONS = ['stone', 'solid_brick', 'cavity', 'solid_concrete', 'hollow_block', 'timber_frame', 'other_unknown']
+ROOF_CONSTRUCTIONS = [
+    'pitched_insulation_btw_joists', 'pitched_insulation_in_rafters', 'Flat_insulation_integral',
+    'room_in_roof', 'no_heat_loss_roof', 'roof_Construction_Other',
+]
+
+CHECKBOX_GROUPS = [
+    CheckboxGroup('dwelling_type', [
+        'detached_house', 'semi_detached_house', 'end_of_terrace', 'mid_terrace', 'ground_floor_apartment',
+        'mid_floor_apartment', 'top_floor_apartment', 'basement_apartment', 'maisonette',
+    ], exclusive=True),
+    CheckboxGroup('age_band', AGE_BANDS, exclusive=True),
+    CheckboxGroup('extension_1_age_band', ['x' + band for band in AGE_BANDS], values=AGE_BANDS, exclusive=True),
+    CheckboxGroup('extension_2_age_band', ['xx' + band for band in AGE_BANDS], values=AGE_BANDS, exclusive=True),
+    CheckboxGroup('purpose_of_rating', [
+        'new_owner_occupation', 'sale', 'private_letting', 'social_housing_letting', 'grant_support',
+        'major_renovation', 'purpose_of_rating_other',
+    ]),
+
+    # The legacy keys of the wall types are not consistently named, hence the explicit lists.
+    CheckboxGroup('wall_construction', WALL_CONSTRUCTIONS, section='envelope', exclusive=True),
+    CheckboxGroup('type_2_wall_construction', [
+        'type_2_stone', 'Type_2_solid_brick', 'type_2_cavity', 'type_2_solid_concrete', 'type_2_hollow_block',
+        'type_2_timber_frame', 'type_2_other_unknown',
+    ], section='envelope', values=WALL_CONSTRUCTIONS, exclusive=True),
+    CheckboxGroup('type_3_wall_construction', [
+        'type_3_stone', 'Type_3_solid_brick', 'type_3_cavity', 'type_3_solid_concrete', 'type_3_hollow_block',
+        'type_3_timber_frame', 'type_3_ther_unknown',
+    ], section='envelope', values=WALL_CONSTRUCTIONS, exclusive=True),
+    CheckboxGroup('type_4_wall_construction', [
+        'type_4_stone', 'Type_4_solid_brick', 'type_4_cavity', 'type_4_solid_concrete', 'type_4_hollow_block',
+        'type_4_timber_frame', 'type_4_ther_unknown',
+    ], section='envelope', values=WALL_CONSTRUCTIONS, exclusive=True),
+    CheckboxGroup('roof_construction', ROOF_CONSTRUCTIONS, section='envelope'),
+    CheckboxGroup('type_2_roof_construction', ['type_2_' + key for key in ROOF_CONSTRUCTIONS], section='envelope'),
+    CheckboxGroup('type_3_roof_construction', ['type_3_' + key for key in ROOF_CONSTRUCTIONS], section='envelope'),
+    CheckboxGroup('type_4_roof_construction', ['type_4_' + key for key in ROOF_CONSTRUCTIONS], section='envelope'),
+
+    CheckboxGroup('boiler_type', [
+        'standard', 'Combi', 'condensing', 'back_boiler', 'cpsu', 'range_cooker', 'single_burner', 'twin_burner',
+    ], section='heating'),
+    CheckboxGroup('boiler_flue_type', ['open', 'balanced', 'fan_assisted'], section='heating'),
+    CheckboxGroup('room_heater_flue_type', ['flue_type_open', 'flue_type_balanced', 'flue_type_fan_assisted'], section='heating'),
+]
+
+# Legacy boolean key -> its group.
+CHECKBOX_KEYS = {key: group for group in CHECKBOX_GROUPS for key in group.keys}
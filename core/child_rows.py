@@ -0,0 +1,153 @@
+"""
+Legacy flat keys for the assessment's child rows.
+
+Rooms (AssessmentRoom) and storeys with their heat loss areas (AssessmentStorey,
+AssessmentHeatLossArea) used to be fixed columns: room_1_* to room_5_*, and
+{storey}_storey_heigh, {storey}_heatloss_wall_1, ... . Those keys are still read and
+written by AssessmentSerializer through this mapping. Rooms beyond the fifth and areas
+beyond the fourth only exist as rows (see the rooms/ and storeys/ endpoints).
+"""
+from .models import AssessmentRoom, AssessmentStorey, AssessmentHeatLossArea
+from .room_totals import ROOM_COLUMNS, ROOM_TOTALS, compute_totals, update_totals
+
+ROOM, STOREY, AREA = 'room', 'storey', 'area'
+
+LEGACY_ROOMS = 5
+LEGACY_AREAS = 4
+ROOM_OPENING_COLUMNS = ROOM_COLUMNS[:10]
+ROOM_DATA_COLUMNS = ROOM_COLUMNS[10:]
+# In form order
+STOREYS = ['ground', 'first', 'second', 'third', 'basement']
+
+
+class ChildKey:
+    def __init__(self, kind, owner, attr, model_field):
+        self.kind = kind  # ROOM, STOREY or AREA
+        self.owner = owner  # room position, or storey name
+        self.attr = attr  # column, or (element, position) for an area
+        self.model_field = model_field
+
+    def row(self, assessment):
+        """The row holding this key's value, or None when it doesn't exist yet."""
+        if self.kind == ROOM:
+            return assessment.rooms_by_position().get(self.owner)
+        storey = assessment.storeys_by_name().get(self.owner)
+        if self.kind == STOREY or storey is None:
+            return storey
+        return storey.areas_by_position().get(self.attr)
+
+    def read(self, assessment):
+        row = self.row(assessment)
+        if row is None:
+            return None
+        return row.area if self.kind == AREA else getattr(row, self.attr)
+
+
+def _legacy_keys():
+    keys = {}
+    for columns in (ROOM_OPENING_COLUMNS, ROOM_DATA_COLUMNS):
+        for position in range(1, LEGACY_ROOMS + 1):
+            for column in columns:
+                keys[f'room_{position}_{column}'] = ChildKey(
+                    ROOM, position, column, AssessmentRoom._meta.get_field(column))
+    for storey in STOREYS:
+        keys[f'{storey}_storey_heigh'] = ChildKey(
+            STOREY, storey, 'storey_height', AssessmentStorey._meta.get_field('storey_height'))
+        keys[f'{storey}_total_floor_area'] = ChildKey(
+            STOREY, storey, 'total_floor_area', AssessmentStorey._meta.get_field('total_floor_area'))
+        for element in ('floor', 'perimeter', 'wall', 'roof'):
+            if element == 'perimeter':
+                keys[f'{storey}_heatloss_perimeter'] = ChildKey(
+                    STOREY, storey, 'heatloss_perimeter', AssessmentStorey._meta.get_field('heatloss_perimeter'))
+                continue
+            for position in range(1, LEGACY_AREAS + 1):
+                keys[f'{storey}_heatloss_{element}_{position}'] = ChildKey(
+                    AREA, storey, (element, position), AssessmentHeatLossArea._meta.get_field('area'))
+    return keys
+
+
+# Legacy key -> ChildKey, in the order the keys had in the payload
+CHILD_KEYS = _legacy_keys()
+
+# Where the keys go in the payload: before these keys, which follow them on the form
+CHILD_KEYS_BEFORE = {
+    'living_area': [key for key, child in CHILD_KEYS.items() if child.kind != ROOM],
+    'room_opening_total': [key for key, child in CHILD_KEYS.items() if child.kind == ROOM],
+}
+
+
+def assign_child_values(assessment, values):
+    """
+    Assign {legacy key: value} to the child rows, creating the rows that don't exist yet
+    (but not for null values). Returns the rows to save as (row, [changed fields]) in save
+    order, and the old values of each changed room as {position: {column: old value}}.
+    """
+    rooms = assessment.rooms_by_position()
+    storeys = assessment.storeys_by_name()
+    changed_rows = {}  # id(row) -> (row, [changed fields]), rows without a pk aren't hashable
+    room_changes = {}
+
+    def get_row(kind, owner, attr):
+        if kind == ROOM:
+            if owner not in rooms:
+                rooms[owner] = AssessmentRoom(assessment=assessment, position=owner)
+            return rooms[owner]
+        if owner not in storeys:
+            storeys[owner] = AssessmentStorey(assessment=assessment, storey=owner)
+            # Saved even if only its areas are set
+            changed_rows[id(storeys[owner])] = (storeys[owner], [])
+        storey = storeys[owner]
+        if kind == STOREY:
+            return storey
+        areas = storey.areas_by_position()
+        if attr not in areas:
+            areas[attr] = AssessmentHeatLossArea(storey=storey, element=attr[0], position=attr[1])
+        return areas[attr]
+
+    for key, value in values.items():
+        child = CHILD_KEYS[key]
+        if value is None and child.row(assessment) is None:
+            continue
+        row = get_row(child.kind, child.owner, child.attr)
+        attr = 'area' if child.kind == AREA else child.attr
+        _, fields = changed_rows.setdefault(id(row), (row, []))
+        if row._state.adding or getattr(row, attr) != value:
+            if child.kind == ROOM:
+                room_changes.setdefault(child.owner, {})[attr] = getattr(row, attr)
+            setattr(row, attr, value)
+            fields.append(attr)
+
+    # Storeys before their areas, so the areas get the new storey's id
+    order = {AssessmentStorey: 0, AssessmentHeatLossArea: 1, AssessmentRoom: 2}
+    children = sorted(((row, fields) for row, fields in changed_rows.values() if fields or row._state.adding),
+                      key=lambda item: order[type(item[0])])
+    return children, room_changes
+
+
+def refresh_room_totals(assessment, room_changes, added_or_removed=False):
+    """
+    Bring the room totals on the 'rooms' section row up to date after `room_changes` (see
+    assign_child_values) and return the total fields that changed. A change to one existing
+    room is applied incrementally, anything else is recomputed from all the rooms.
+    """
+    totals_row = assessment.section('rooms')
+    if not room_changes and not added_or_removed:
+        return []
+
+    position = next(iter(room_changes), None)
+    room = assessment.rooms_by_position().get(position)
+    if (len(room_changes) == 1 and not added_or_removed and not totals_row._state.adding
+            and room is not None and not room._state.adding):
+        old = room_changes[position]
+        new = {column: getattr(room, column) for column in old}
+        current = {total: getattr(totals_row, total) for _, total, _ in ROOM_TOTALS}
+        totals = update_totals(current, old, new)
+    else:
+        totals = compute_totals(assessment.rooms_by_position().values())
+
+    changed = []
+    for total, value in totals.items():
+        if getattr(totals_row, total) != value:
+            setattr(totals_row, total, value)
+            changed.append(total)
+    return changed
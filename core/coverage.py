@@ -0,0 +1,96 @@
+"""
+The counties, and optionally towns, accessors take jobs in.
+
+Each accessor has AccessorCoverage rows: a county, or one town of a county. Counties and
+towns are kept upper case and jobs are matched on Upper(county) and Upper(nearest_town), so
+the jobs of several counties are one query, a page from each county's range of the pending
+jobs' index (Job.Meta.indexes), and the accessors covering a job are read from the coverage
+rows' unique index.
+
+UserModel.preference stays as the text of the covered counties ("Cork, Kerry"); setting it
+through preference/ covers those counties whole.
+"""
+from django.db import connection, transaction
+from django.db.models import Q
+from django.db.models.functions import Upper
+
+from .models import Accessor, AccessorCoverage
+from .pagination import NEWEST_FIRST
+
+MAX_AREAS = 32  # The counties of Ireland
+
+
+def preference_counties(preference):
+    """The counties in a preference, "Cork" or "Cork, Kerry"."""
+    counties = [county.strip().upper() for county in (preference or '').split(',')]
+    return list(dict.fromkeys(county for county in counties if county))
+
+
+def _areas(rows):
+    # {county: towns} from (county, town) rows, where no towns is the whole county
+    areas = {}
+    for county, town in rows:
+        areas.setdefault(county, set()).add(town)
+    # A whole county covers its towns
+    return {county: frozenset() if '' in towns else frozenset(towns) for county, towns in areas.items()}
+
+
+def areas_of(accessor_user):
+    """
+    The areas covered by the accessor of a user: {county: towns}, where no towns is the whole
+    county.
+    """
+    return _areas(AccessorCoverage.objects.filter(accessor__user=accessor_user).values_list('county', 'nearest_town'))
+
+
+def areas_by_accessor(accessors):
+    """The areas covered by each of the `accessors` queryset, {accessor id: {county: towns}}, in one query."""
+    rows = {}
+    for accessor_id, county, town in (AccessorCoverage.objects.filter(accessor__in=accessors)
+                                      .values_list('accessor', 'county', 'nearest_town')):
+        rows.setdefault(accessor_id, []).append((county, town))
+    return {accessor_id: _areas(areas) for accessor_id, areas in rows.items()}
+
+
+def set_areas(accessor, areas):
+    """
+    Replace what `accessor` covers with `areas`, {county: towns}, and set its user's preference
+    to the counties.
+    """
+    rows = [
+        AccessorCoverage(accessor=accessor, county=county.strip().upper(), nearest_town=town.strip().upper())
+        for county, towns in areas.items() for town in (towns or [''])
+    ]
+    with transaction.atomic():
+        AccessorCoverage.objects.filter(accessor=accessor).delete()
+        AccessorCoverage.objects.bulk_create(rows, ignore_conflicts=True)
+        accessor.user.preference = ', '.join(dict.fromkeys(row.county.title() for row in rows)) or None
+        accessor.user.save(update_fields=['preference'])
+
+
+def pending_jobs(jobs, areas, page):
+    """
+    The jobs of the `jobs` queryset in `areas` ({county: towns}), newest first from the cursor
+    of `page` (a core.pagination.Page) on.
+    """
+    jobs = jobs.alias(coverage_county=Upper('county'), coverage_town=Upper('nearest_town'))
+    if len(areas) == 1 or not connection.features.supports_slicing_ordering_in_compound:
+        in_towns = Q()
+        for county, towns in areas.items():
+            in_towns |= Q(coverage_county=county, **({'coverage_town__in': towns} if towns else {}))
+        return page.order(jobs.filter(in_towns))
+    # A page of the newest jobs of each county, each read in the order of the job_pending_county_newest
+    # index, rather than sorting every pending job of the counties
+    counties = []
+    for county, towns in areas.items():
+        county_jobs = jobs.filter(coverage_county=county, **({'coverage_town__in': towns} if towns else {}))
+        counties.append(page.order(county_jobs)[:page.limit + 1])
+    return counties[0].union(*counties[1:], all=True).order_by(*NEWEST_FIRST)
+
+
+def accessors_covering(job):
+    """The accessors covering the county and town of `job`."""
+    covering = AccessorCoverage.objects.filter(
+        county=(job.county or '').upper(), nearest_town__in=['', (job.nearest_town or '').upper()],
+    )
+    return Accessor.objects.filter(pk__in=covering.values('accessor'))
@@ -0,0 +1,198 @@
+"""
+Columnar export of assessments for analytics.
+
+Each table is exported with one column per stored field: 'assessments' is an Assesment row
+joined with its section rows, and 'rooms', 'storeys' and 'heat_loss_areas' hold the child
+rows with their assessment id. Rows are read through a server-side cursor and written one
+chunk at a time (a Parquet row group, an Arrow record batch or a block of CSV lines), so
+memory use doesn't grow with the number of rows.
+
+Parquet and Arrow IPC need pyarrow; without it only CSV is available.
+"""
+import csv
+import io
+from datetime import datetime, time
+
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Assesment, ASSESSMENT_SECTIONS, AssessmentRoom, AssessmentStorey, AssessmentHeatLossArea
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+PARQUET, ARROW, CSV = 'parquet', 'arrow', 'csv'
+FORMATS = [PARQUET, ARROW, CSV]
+CONTENT_TYPES = {
+    PARQUET: 'application/vnd.apache.parquet',
+    ARROW: 'application/vnd.apache.arrow.stream',
+    CSV: 'text/csv',
+}
+FILE_EXTENSIONS = {PARQUET: 'parquet', ARROW: 'arrows', CSV: 'csv'}
+
+TABLES = ['assessments', 'rooms', 'storeys', 'heat_loss_areas']
+
+
+class ExportError(Exception):
+    pass
+
+
+def default_format():
+    return PARQUET if pa is not None else CSV
+
+
+def _model_columns(model, prefix='', exclude=()):
+    # (column name, values_list path, model field) for each stored field of the model
+    return [
+        (field.attname if field.is_relation else field.name, prefix + field.attname, field)
+        for field in model._meta.concrete_fields if field.name not in exclude
+    ]
+
+
+def table_columns(table):
+    """(column name, values_list path, model field) for each column of an export table."""
+    if table == 'assessments':
+        columns = _model_columns(Assesment)
+        for section, model in ASSESSMENT_SECTIONS.items():
+            columns += _model_columns(model, f'{section}__', exclude=['assessment'])
+        return columns
+    if table == 'rooms':
+        return _model_columns(AssessmentRoom, exclude=['id'])
+    if table == 'storeys':
+        return _model_columns(AssessmentStorey, exclude=['id'])
+    if table == 'heat_loss_areas':
+        return [('assessment_id', 'storey__assessment_id', AssessmentStorey._meta.get_field('assessment')),
+                ('storey', 'storey__storey', AssessmentStorey._meta.get_field('storey')),
+                *_model_columns(AssessmentHeatLossArea, exclude=['id', 'storey'])]
+    raise ExportError(f"Unknown table {table}, expected one of {', '.join(TABLES)}.")
+
+
+def filter_assessments(county=None, since=None, until=None, accessor=None):
+    """
+    Assessments in a county (of their quote or job), created between two dates (inclusive,
+    as YYYY-MM-DD) and/or by an accessor. Raises ExportError for an invalid date.
+    """
+    assessments = Assesment.objects.all()
+    if county:
+        assessments = assessments.filter(Q(quote__county__iexact=county) | Q(project__job__county__iexact=county))
+    for value, lookup, at in ((since, 'created_at__gte', time.min), (until, 'created_at__lte', time.max)):
+        if value:
+            try:
+                day = datetime.strptime(value, '%Y-%m-%d').date()
+            except ValueError:
+                raise ExportError(f"{value} is not a date, expected YYYY-MM-DD.")
+            assessments = assessments.filter(**{lookup: timezone.make_aware(datetime.combine(day, at))})
+    if accessor is not None:
+        assessments = assessments.filter(accessor_id=accessor)
+    return assessments
+
+
+def table_rows(table, assessments):
+    # Queryset of the table's rows for the given assessments, in a stable order
+    if table == 'assessments':
+        return assessments.order_by('id')
+    model, lookup = {
+        'rooms': (AssessmentRoom, 'assessment__in'),
+        'storeys': (AssessmentStorey, 'assessment__in'),
+        'heat_loss_areas': (AssessmentHeatLossArea, 'storey__assessment__in'),
+    }[table]
+    return model.objects.filter(**{lookup: assessments.values('id')}).order_by('id')
+
+
+def _arrow_type(field):
+    if isinstance(field, models.BooleanField):
+        return pa.bool_()
+    if isinstance(field, (models.IntegerField, models.AutoField)) or field.is_relation:
+        return pa.int64()
+    if isinstance(field, (models.FloatField, models.DecimalField)):
+        return pa.float64()
+    if isinstance(field, models.DateTimeField):
+        return pa.timestamp('us', tz='UTC')
+    if isinstance(field, models.DateField):
+        return pa.date32()
+    return pa.string()
+
+
+class _Pipe:
+    # File-like object for the Arrow writers: collects what they write until take() is called
+    closed = False
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def take(self):
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def _batches(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def export(table, assessments, file_format=None, chunk_size=2000):
+    """
+    Generate the export of `table` for the `assessments` queryset as chunks of bytes.
+    Raises ExportError for an unknown table or format, or one that needs pyarrow without it.
+    """
+    file_format = file_format or default_format()
+    if file_format not in FORMATS:
+        raise ExportError(f"Unknown format {file_format}, expected one of {', '.join(FORMATS)}.")
+    if file_format != CSV and pa is None:
+        raise ExportError(f"The {file_format} format needs pyarrow, which is not installed. Use csv.")
+    columns = table_columns(table)
+    rows = table_rows(table, assessments).values_list(*(path for _, path, _ in columns)).iterator(chunk_size=chunk_size)
+    batches = _batches(rows, chunk_size)
+    if file_format == CSV:
+        return _csv_chunks(columns, batches)
+    return _arrow_chunks(columns, batches, file_format)
+
+
+def _csv_chunks(columns, batches):
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow([name for name, _, _ in columns])
+    for batch in batches:
+        writer.writerows(batch)
+        yield out.getvalue().encode()
+        out.seek(0)
+        out.truncate()
+    if out.tell():
+        yield out.getvalue().encode()
+
+
+def _arrow_chunks(columns, batches, file_format):
+    schema = pa.schema([(name, _arrow_type(field)) for name, _, field in columns])
+    pipe = _Pipe()
+    writer = pq.ParquetWriter(pipe, schema) if file_format == PARQUET else pa.ipc.new_stream(pipe, schema)
+    try:
+        for batch in batches:
+            arrays = [pa.array(values, type=column.type) for values, column in zip(zip(*batch), schema)]
+            writer.write_batch(pa.record_batch(arrays, schema=schema))
+            yield pipe.take()
+    finally:
+        writer.close()
+    yield pipe.take()
@@ -0,0 +1,191 @@
+"""
+Indicative heat loss and BER band for many assessments at once.
+
+This is a screening estimate for portfolios, not a DEAP calculation. Each dwelling's
+fabric heat loss is its heat loss areas times default U-values for its age band and wall
+construction, plus thermal bridging. Ventilation loss comes from the volume, the age band
+and the chimneys and flues. The annual space and water heating demand, divided by the
+heating efficiency and weighted by the fuel's primary energy factor, gives kWh/m2/yr and
+the BER band.
+
+load_inputs() reads the columns of a queryset into NumPy arrays and compute() only works
+on the arrays, so there is no Python code run per dwelling.
+"""
+import numpy as np
+from django.db import connections
+from django.db.models import Case, F, IntegerField, Q, Sum, Value, When
+from django.db.models.functions import Coalesce
+
+from .checkbox_groups import AGE_BANDS, ROOF_CONSTRUCTIONS
+from .models import AssessmentEnvelope, AssessmentHeatLossArea, AssessmentStorey
+
+# Default U-values (W/m2K) by age band, in AGE_BANDS order, the last one for an unknown age band
+WALL_U = np.array([2.1, 2.1, 2.1, 2.1, 1.1, 0.6, 0.6, 0.55, 0.37, 1.1])
+ROOF_U = np.array([2.3, 2.3, 2.3, 2.3, 0.49, 0.4, 0.4, 0.36, 0.25, 0.49])
+FLOOR_U = np.array([0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.45, 0.41, 0.61])
+WINDOW_U = np.array([4.8, 4.8, 4.8, 4.8, 4.8, 3.1, 3.1, 3.1, 2.2, 3.1])
+# Air changes per hour through the fabric
+INFILTRATION_ACH = np.array([1.0, 1.0, 1.0, 0.9, 0.8, 0.7, 0.6, 0.5, 0.35, 0.7])
+
+# Before 1978 walls weren't insulated, so the construction decides their U-value (NaN: use the age band)
+WALL_CONSTRUCTIONS = [construction for construction, _ in AssessmentEnvelope.WALL_CONSTRUCTIONS]
+WALL_CONSTRUCTION_U = np.array([2.1, 2.1, 1.64, 2.2, 2.4, 1.0, np.nan, np.nan])
+UNINSULATED_WALLS_BEFORE = AGE_BANDS.index('between_1978_and_1982')
+NO_HEAT_LOSS_ROOF = 1 << ROOF_CONSTRUCTIONS.index('no_heat_loss_roof')
+
+THERMAL_BRIDGING = 0.15  # W/m2K over the whole heat loss area
+CHIMNEY_M3H, FLUE_M3H = 40, 20
+DEFAULT_STOREY_HEIGHT = 2.5
+# With a base temperature that allows for internal and solar gains
+DEGREE_DAYS = 2000
+HOT_WATER_KWH = 2500
+
+# (fuel, words that identify it in the fuel text, primary energy factor, default efficiency)
+FUELS = [
+    ('gas', ['gas', 'lpg'], 1.1, 0.8),
+    ('oil', ['oil', 'kerosene'], 1.1, 0.8),
+    ('electricity', ['elec'], 2.08, 1.0),
+    ('solid', ['coal', 'turf', 'peat', 'wood', 'pellet', 'biomass'], 1.1, 0.6),
+]
+# The last one for an unknown fuel
+PRIMARY_ENERGY_FACTOR = np.array([factor for _, _, factor, _ in FUELS] + [1.1])
+DEFAULT_EFFICIENCY = np.array([efficiency for _, _, _, efficiency in FUELS] + [0.75])
+
+# Upper limits in kWh/m2/yr, anything above the last one is G
+BER_BANDS = ['A1', 'A2', 'A3', 'B1', 'B2', 'B3', 'C1', 'C2', 'C3', 'D1', 'D2', 'E1', 'E2', 'F', 'G']
+BER_BAND_LIMITS = np.array([25, 50, 75, 100, 125, 150, 175, 200, 225, 260, 300, 340, 380, 450])
+
+ELEMENTS = [element for element, _ in AssessmentHeatLossArea.ELEMENTS]
+
+RESULT_COLUMNS = ['id', 'fabric_heat_loss', 'ventilation_heat_loss', 'heat_loss_indicator', 'energy_kwh_m2', 'ber_band']
+
+
+def _code(field, keys):
+    # Index of the field's value in `keys` (len(keys) for anything else), worked out by the database
+    return Case(*(When(**{field: key}, then=Value(i)) for i, key in enumerate(keys)),
+                default=Value(len(keys)), output_field=IntegerField())
+
+
+def _fuel_code(field):
+    whens = [When(**{f'{field}__icontains': word}, then=Value(i))
+             for i, (_, words, _, _) in enumerate(FUELS) for word in words]
+    return Case(*whens, default=Value(len(FUELS)), output_field=IntegerField())
+
+
+def _fetch(queryset):
+    # The rows of a values_list() queryset as a float matrix (NULL as NaN), without building
+    # a Python object per row through the ORM
+    sql, params = queryset.query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(sql, params)
+        return np.array(cursor.fetchall(), dtype=float).reshape(-1, len(queryset.query.values_select)
+                                                                  + len(queryset.query.annotation_select))
+
+
+def _per_assessment(ids, matrix):
+    # Spread (assessment id, values...) rows over the assessments in `ids`, zero where there is no row
+    values = np.zeros((len(ids), matrix.shape[1] - 1))
+    values[np.searchsorted(ids, matrix[:, 0].astype(np.int64))] = np.nan_to_num(matrix[:, 1:])
+    return values.T
+
+
+def load_inputs(queryset):
+    """The columns compute() needs for the assessments of `queryset`, as arrays ordered by id."""
+    matrix = _fetch(queryset.order_by('id').values_list(
+        'id',
+        'rooms__room_opening_dimensions_totaL',
+        'rooms__room_chimney_flueless_total',
+        'rooms__room_open_flues_total',
+        'heating__efficiency',
+        # Expressions come after the columns in the SQL, in this order
+        _code('age_band', AGE_BANDS),
+        _code('envelope__wall_construction', WALL_CONSTRUCTIONS),
+        Coalesce('envelope__roof_construction', Value(0)),
+        _fuel_code('heating__fuel_type_heating_system'),
+    ))
+    names = ['id', 'window_area', 'chimneys', 'flues', 'efficiency', 'age_band', 'wall_construction',
+             'roof_construction', 'fuel']
+    inputs = dict(zip(names, matrix.T))
+    for name in ('id', 'age_band', 'wall_construction', 'roof_construction', 'fuel'):
+        inputs[name] = inputs[name].astype(np.int64)
+    ids = inputs['id']
+    assessments = queryset.values('id')
+
+    # Sums over the storeys and their heat loss areas, one row per assessment from the database
+    inputs['total_floor_area'], inputs['volume'] = _per_assessment(ids, _fetch(
+        AssessmentStorey.objects.filter(assessment__in=assessments).order_by().values_list('assessment_id').annotate(
+            floor_area=Sum('total_floor_area'),
+            volume=Sum(F('total_floor_area') * Coalesce('storey_height', Value(DEFAULT_STOREY_HEIGHT))),
+        )
+    ))
+    element_areas = _per_assessment(ids, _fetch(
+        AssessmentHeatLossArea.objects.filter(storey__assessment__in=assessments).order_by()
+        .values_list('storey__assessment_id')
+        .annotate(**{element: Sum('area', filter=Q(element=element)) for element in ELEMENTS})
+    ))
+    for element, areas in zip(ELEMENTS, element_areas):
+        inputs[f'{element}_area'] = areas
+    return inputs
+
+
+def compute(inputs):
+    """
+    Estimates from load_inputs() arrays: fabric and ventilation heat loss (W/K), heat loss
+    indicator (W/K/m2), primary energy (kWh/m2/yr) and BER band. Dwellings without a floor
+    area get NaN and no band.
+    """
+    age = inputs['age_band']
+    construction_u = WALL_CONSTRUCTION_U[inputs['wall_construction']]
+    wall_u = np.where((age < UNINSULATED_WALLS_BEFORE) & ~np.isnan(construction_u), construction_u, WALL_U[age])
+    roof_u = np.where(inputs['roof_construction'] & NO_HEAT_LOSS_ROOF, 0.0, ROOF_U[age])
+
+    # Windows and doors are part of the wall area
+    window_area = np.minimum(np.nan_to_num(inputs['window_area']), inputs['wall_area'])
+    wall_area = inputs['wall_area'] - window_area
+    fabric = (wall_u * wall_area + WINDOW_U[age] * window_area + roof_u * inputs['roof_area']
+              + FLOOR_U[age] * inputs['floor_area']
+              + THERMAL_BRIDGING * (inputs['wall_area'] + inputs['roof_area'] + inputs['floor_area']))
+
+    openings = CHIMNEY_M3H * np.nan_to_num(inputs['chimneys']) + FLUE_M3H * np.nan_to_num(inputs['flues'])
+    ventilation = 0.33 * (INFILTRATION_ACH[age] * inputs['volume'] + openings)
+
+    efficiency = inputs['efficiency']
+    efficiency = np.where(efficiency > 1.5, efficiency / 100, efficiency)  # entered as a percentage
+    efficiency = np.where(efficiency > 0, efficiency, DEFAULT_EFFICIENCY[inputs['fuel']])
+    demand = (fabric + ventilation) * DEGREE_DAYS * 24 / 1000 + HOT_WATER_KWH
+
+    floor_area = np.where(inputs['total_floor_area'] > 0, inputs['total_floor_area'], np.nan)
+    indicator = (fabric + ventilation) / floor_area
+    energy = demand / efficiency * PRIMARY_ENERGY_FACTOR[inputs['fuel']] / floor_area
+
+    band = np.where(np.isnan(energy), len(BER_BANDS), np.searchsorted(BER_BAND_LIMITS, energy))
+    return {
+        'id': inputs['id'],
+        'fabric_heat_loss': fabric,
+        'ventilation_heat_loss': ventilation,
+        'heat_loss_indicator': indicator,
+        'energy_kwh_m2': energy,
+        'ber_band': np.array([*BER_BANDS, None], dtype=object)[band],
+    }
+
+
+def estimate(queryset):
+    """compute() for the assessments of `queryset`."""
+    return compute(load_inputs(queryset))
+
+
+def results_as_rows(results, decimals=2):
+    """compute() results as one dict per dwelling, for output."""
+    columns = [results['id'].tolist()]
+    for name in RESULT_COLUMNS[1:-1]:
+        values = np.round(results[name], decimals)
+        columns.append([None if value != value else value for value in values.tolist()])
+    columns.append(results['ber_band'].tolist())
+    return [dict(zip(RESULT_COLUMNS, row)) for row in zip(*columns)]
+
+
+def band_counts(results):
+    """Number of dwellings in each BER band, in band order (None: no floor area)."""
+    bands, counts = np.unique(results['ber_band'].astype(str), return_counts=True)
+    found = dict(zip(bands.tolist(), counts.tolist()))
+    return {band: found[str(band)] for band in [*BER_BANDS, None] if str(band) in found}
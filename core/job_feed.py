@@ -0,0 +1,234 @@
+"""
+Cached per-county feeds of pending jobs for AccessorJobView.
+
+Accessors poll jobs/ for the pending jobs of the counties they cover, and most of them poll
+the same few counties. So each county's newest pending jobs, up to JOB_FEED_SIZE, are kept in
+the cache already serialized, along with a version, and an accessor's jobs are the view() of
+the feeds of their counties. A job saved or deleted is applied to the cached feeds once its
+transaction commits (the Job signals in core.signals, and jobs_changed() for bulk writes that
+send none), rather than the feed being read again.
+
+A feed's version changes with each change applied to it, and the versions of a view's feeds
+are served as its ETag, so a poll with If-None-Match of the current versions is answered 304
+without reading or rendering jobs. A feed holds the newest pending jobs of its county and,
+unless it is complete, only those: pages past it are read from the database. Feeds also
+expire after JOB_FEED_SECONDS, in case jobs are written some other way. The feeds are kept in
+the cache every server process shares (CACHES in settings).
+
+Each county's feed has a lock of its own, held while it is read from the database or changes
+are applied to it, so a big county being read holds up nothing but the writes to its own feed.
+"""
+import heapq
+import time
+import uuid
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.dateparse import parse_datetime
+
+from .models import Job
+from .pagination import NEWEST_FIRST
+from .serializers import JobSerializer
+
+# The counties with a cached feed
+COUNTIES_KEY = 'job-feed:counties'
+LOCK_SECONDS = 30
+
+
+class FeedBusy(Exception):
+    pass
+
+
+def _feed_key(county):
+    return f'job-feed:{county}'
+
+
+def _lock_key(name):
+    return f'job-feed:lock:{name}'
+
+
+@contextmanager
+def _locked(name, wait=2):
+    # The lock of a county's feed, or of the list of counties: reading a feed and applying changes
+    # to it are a query and a few cache calls. Only released by its holder, since once it has
+    # timed out someone else may hold it.
+    key, token = _lock_key(name), uuid.uuid4().hex
+    deadline = time.monotonic() + wait
+    while not cache.add(key, token, timeout=LOCK_SECONDS):
+        if time.monotonic() > deadline:
+            raise FeedBusy()
+        time.sleep(0.01)
+    try:
+        yield
+    finally:
+        if cache.get(key) == token:
+            cache.delete(key)
+
+
+def _entry(job):
+    # (sort key, payload) of a job in a feed
+    return (job.created_at, job.pk), dict(JobSerializer(job).data)
+
+
+def _build(county):
+    jobs = list(Job.objects.filter(status='pending', county__iexact=county)
+                .order_by(*NEWEST_FIRST)[:settings.JOB_FEED_SIZE + 1])
+    return {
+        'version': uuid.uuid4().hex[:12],
+        'changes': 0,
+        'entries': [_entry(job) for job in jobs[:settings.JOB_FEED_SIZE]],
+        'complete': len(jobs) <= settings.JOB_FEED_SIZE,
+    }
+
+
+def _register(county):
+    # Before the county's jobs are read, so changes committed meanwhile are applied to its feed
+    with _locked('counties'):
+        registered = cache.get(COUNTIES_KEY, set())
+        if county not in registered:
+            cache.set(COUNTIES_KEY, registered | {county}, None)
+
+
+def feeds(counties):
+    """
+    The cached feeds of the pending jobs of `counties` (upper case), read and cached first if
+    need be: {county: feed}, a feed being a dict of its 'entries' [((created_at, id), payload)]
+    newest first, whether it is 'complete', and its 'version' and 'changes' applied since.
+    None if they can't be had from the cache now.
+    """
+    keys = {_feed_key(county): county for county in counties}
+    found = cache.get_many([*keys, COUNTIES_KEY])
+    # A feed that isn't among the counties would miss changes
+    registered = found.get(COUNTIES_KEY, set())
+    snapshots = {county: found[key] for key, county in keys.items() if key in found and county in registered}
+    for key, county in sorted(keys.items()):
+        if county in snapshots:
+            continue
+        try:
+            with _locked(county):
+                # Another request may have read it meanwhile
+                snapshot = cache.get(key)
+                if snapshot is None or county not in cache.get(COUNTIES_KEY, set()):
+                    _register(county)
+                    snapshot = _build(county)
+                    cache.set(key, snapshot, settings.JOB_FEED_SECONDS)
+                snapshots[county] = snapshot
+        except FeedBusy:
+            return None
+    return snapshots
+
+
+def view(areas):
+    """
+    The pending jobs of `areas` ({county: towns}, see core.coverage) from their counties' cached
+    feeds, newest first: a dict of their 'entries', whether they are 'complete' (else the jobs
+    after them have to be read from the database) and their 'etag'. None if the feeds can't be
+    had from the cache now.
+    """
+    snapshots = feeds(sorted(areas))
+    if snapshots is None:
+        return None
+    entries = heapq.merge(*(
+        [entry for entry in snapshot['entries']
+         if not areas[county] or (entry[1]['nearest_town'] or '').upper() in areas[county]]
+        for county, snapshot in sorted(snapshots.items())
+    ), key=lambda entry: entry[0], reverse=True)
+    # An incomplete feed holds none of its county's jobs past its last one, so neither can the view
+    incomplete = [snapshot['entries'] for snapshot in snapshots.values() if not snapshot['complete']]
+    if not all(incomplete):
+        return None
+    ends = [entries[-1][0] for entries in incomplete]
+    end = max(ends, default=None)
+    return {
+        'entries': [entry for entry in entries if end is None or entry[0] >= end],
+        'complete': end is None,
+        'etag': '"{}"'.format('-'.join(f"{snapshot['version']}.{snapshot['changes']}"
+                                       for _, snapshot in sorted(snapshots.items()))),
+    }
+
+
+def page_rows(snapshot, page):
+    """
+    The payloads of `page` (a core.pagination.Page, newest first) from a view(), or None if the
+    page goes past the jobs in it and has to be read from the database.
+    """
+    entries = snapshot['entries']
+    after = page.after(NEWEST_FIRST)
+    start = 0
+    if after is not None:
+        after = (parse_datetime(after[0]), after[1])
+        while start < len(entries) and entries[start][0] >= after:
+            start += 1
+    window = entries[start:start + page.limit + 1]
+    if len(window) <= page.limit and not snapshot['complete']:
+        return None
+    return page.rows([payload for _, payload in window], NEWEST_FIRST)
+
+
+def _applied(snapshot, county, jobs, removed):
+    # The feed with the jobs with ids in `removed` taken out and `jobs` pending in the county added
+    # back where they fall among its jobs, or None if that changes nothing
+    entries = [entry for entry in snapshot['entries'] if entry[0][1] not in removed]
+    touched = len(entries) < len(snapshot['entries'])
+    for job in jobs:
+        if job.status != 'pending' or (job.county or '').upper() != county:
+            continue
+        entry = _entry(job)
+        # Past the last job of an incomplete feed, it is among the jobs the feed doesn't hold
+        if snapshot['complete'] or (entries and entry[0] > entries[-1][0]):
+            entries.append(entry)
+            touched = True
+    if not touched:
+        return None
+    entries.sort(key=lambda entry: entry[0], reverse=True)
+    return {
+        **snapshot, 'entries': entries[:settings.JOB_FEED_SIZE], 'changes': snapshot['changes'] + 1,
+        'complete': snapshot['complete'] and len(entries) <= settings.JOB_FEED_SIZE,
+    }
+
+
+def _apply(load_jobs, deleted_ids=()):
+    # Applies the jobs from load_jobs() and the deletion of those with `deleted_ids` to the feeds
+    # they were in and the feeds of the counties they are now pending in, one feed at a time
+    counties = cache.get(COUNTIES_KEY, set())
+    if not counties:
+        return
+    jobs = load_jobs()
+    removed = {job.pk for job in jobs} | set(deleted_ids)
+    keys = {_feed_key(county): county for county in counties}
+    held = cache.get_many([_lock_key(county) for county in counties])
+    affected = {(job.county or '').upper() for job in jobs if job.status == 'pending'} & counties
+    # A feed being read now may have read the jobs as they were
+    affected |= {county for county in counties if _lock_key(county) in held}
+    affected |= {keys[key] for key, snapshot in cache.get_many(keys).items()
+                 if any(entry[0][1] in removed for entry in snapshot['entries'])}
+    for county in sorted(affected):
+        try:
+            with _locked(county):
+                snapshot = cache.get(_feed_key(county))
+                changed = snapshot and _applied(snapshot, county, jobs, removed)
+                if changed:
+                    cache.set(_feed_key(county), changed, settings.JOB_FEED_SECONDS)
+        except FeedBusy:
+            # Read again when next asked for, rather than possibly missing this change
+            cache.delete(_feed_key(county))
+
+
+def job_saved(job):
+    """Apply a job saved in the current transaction to the cached feeds, once it commits."""
+    transaction.on_commit(lambda: _apply(lambda: [job]))
+
+
+def job_deleted(job_id):
+    transaction.on_commit(lambda: _apply(list, [job_id]))
+
+
+def jobs_changed(job_ids):
+    """
+    Apply the jobs with `job_ids`, written in the current transaction by queries that send no
+    signals (bulk_create(), update()), to the cached feeds once it commits. They are only read
+    again if some feed is cached.
+    """
+    transaction.on_commit(lambda: _apply(lambda: list(Job.objects.filter(pk__in=job_ids))))
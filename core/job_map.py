@@ -0,0 +1,183 @@
+"""
+An in-process map of the pending jobs, for AccessorJobView's jobs within some km of a point.
+
+Jobs are placed by core.places, at the routing key of their Eircode or else at their nearest
+town, so many jobs share a point. The map is a grid of CELL_DEGREES cells holding those points,
+each with its jobs: a radius query measures each point in the cells around it once, then
+walks the jobs of the nearest points, newest first, until it has a page. Jobs that can't be
+placed aren't on the map.
+
+Each server process keeps its own map, read from the database when first asked for. Jobs
+saved or deleted are logged in the cache once their transaction commits (the Job signals in
+core.signals, and jobs_changed() for bulk writes that send none), and before answering a
+process applies the changes logged since it last looked, reading only the changed jobs
+again. It reads the whole map again when it has fallen more than MAX_CHANGES behind or the
+log has expired. The log is kept in the cache every server process shares (CACHES in
+settings).
+"""
+import heapq
+import math
+import random
+import threading
+from itertools import groupby, islice
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.dateparse import parse_datetime
+
+from .models import Job
+from .places import distance_km, locate
+
+CELL_DEGREES = 0.1  # About 11km north to south and 7km east to west
+KM_PER_DEGREE = 111.2  # Of latitude
+MAX_RADIUS_KM = 200
+MAX_CHANGES = 1000
+CHANGES_SECONDS = 60 * 60
+SEQUENCE_KEY = 'job-map:sequence'
+UNREAD = object()
+NEAREST_FIRST = ('distance', '-created_at', '-id')
+
+
+def _change_key(sequence):
+    return f'job-map:change:{sequence}'
+
+
+def _cell(point):
+    return math.floor(point[0] / CELL_DEGREES), math.floor(point[1] / CELL_DEGREES)
+
+
+class _Map:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sequence = UNREAD  # Of the last change applied, None before any was logged
+        self.cells = {}  # (row, column): {point: {job id: created_at}}
+        self.points = {}  # job id: point
+        self.newest = {}  # point: [(created_at, job id)] newest first, sorted when first walked
+
+    def sync(self):
+        # Applies the changes logged since the map was last synced, or reads it all again
+        sequence = cache.get(SEQUENCE_KEY)
+        if sequence == self.sequence:
+            return
+        logged = self.sequence not in (UNREAD, None) and sequence is not None
+        if not logged or not self.sequence < sequence <= self.sequence + MAX_CHANGES:
+            return self.read(sequence)
+        changes = cache.get_many([_change_key(n) for n in range(self.sequence + 1, sequence + 1)])
+        if len(changes) < sequence - self.sequence:
+            return self.read(sequence)
+        job_ids = set().union(*changes.values())
+        for job_id in job_ids:
+            self.remove(job_id)
+        self.add(Job.objects.filter(pk__in=job_ids, status='pending'))
+        self.sequence = sequence
+
+    def read(self, sequence):
+        # Changes logged after `sequence` are applied again when next synced
+        self.cells, self.points, self.newest = {}, {}, {}
+        self.add(Job.objects.filter(status='pending'))
+        self.sequence = sequence
+
+    def add(self, jobs):
+        rows = jobs.values_list('id', 'created_at', 'eircode', 'nearest_town', 'county')
+        for job_id, created_at, eircode, nearest_town, county in rows.iterator(chunk_size=5000):
+            point = locate(eircode, nearest_town, county)
+            if point is not None:
+                self.points[job_id] = point
+                self.cells.setdefault(_cell(point), {}).setdefault(point, {})[job_id] = created_at
+                self.newest.pop(point, None)
+
+    def remove(self, job_id):
+        point = self.points.pop(job_id, None)
+        if point is not None:
+            cell = self.cells[_cell(point)]
+            del cell[point][job_id]
+            if not cell[point]:
+                del cell[point]
+            self.newest.pop(point, None)
+
+    def nearest(self, point, km, after):
+        # The jobs within `km` of `point` after the sort key `after`, nearest first and then newest
+        lat_km = km / KM_PER_DEGREE
+        lon_km = km / (KM_PER_DEGREE * math.cos(math.radians(min(abs(point[0]) + lat_km, 89))))
+        low, high = _cell((point[0] - lat_km, point[1] - lon_km)), _cell((point[0] + lat_km, point[1] + lon_km))
+        near = []
+        for row in range(low[0], high[0] + 1):
+            for column in range(low[1], high[1] + 1):
+                for other in self.cells.get((row, column), ()):
+                    distance = round(distance_km(point, other), 2)
+                    if distance <= km and (after is None or distance >= after[0]):
+                        near.append((distance, other))
+        near.sort()
+        if after is not None:
+            after = (after[0], parse_datetime(after[1]), after[2])
+        for distance, points in groupby(near, key=lambda near: near[0]):
+            # Points as far away as each other have their jobs interleaved, newest first
+            jobs = heapq.merge(*(self.newest_of(other) for _, other in points), reverse=True)
+            for created_at, job_id in jobs:
+                if after is None or distance > after[0] or (created_at, job_id) < after[1:]:
+                    yield {'id': job_id, 'distance': distance, 'created_at': created_at}
+
+    def newest_of(self, point):
+        if point not in self.newest:
+            self.newest[point] = sorted(((created_at, job_id) for job_id, created_at in
+                                         self.cells[_cell(point)][point].items()), reverse=True)
+        return self.newest[point]
+
+
+_map = _Map()
+
+
+def jobs_near(point, km, page, accept=None):
+    """
+    The page (a core.pagination.Page, NEAREST_FIRST) of the pending jobs within `km` of `point`,
+    (latitude, longitude), nearest first and then newest: dicts of their 'id', 'distance' in km
+    and 'created_at'. accept(ids), if given, returns the ids among `ids` to keep, as those of the
+    jobs matching some filters in the database.
+    """
+    after = page.after(NEAREST_FIRST)
+    wanted = page.limit + 1
+    rows = []
+    # The map can't change while it is walked
+    with _map.lock:
+        _map.sync()
+        jobs = _map.nearest(point, km, after)
+        while len(rows) < wanted:
+            chunk = list(islice(jobs, max(wanted * 2, 50) if accept else wanted))
+            if not chunk:
+                break
+            if accept:
+                kept = accept([row['id'] for row in chunk])
+                chunk = [row for row in chunk if row['id'] in kept]
+            rows += chunk
+    return page.rows(rows[:wanted], NEAREST_FIRST)
+
+
+def forget():
+    """Drop this process's map, to be read again when next asked for."""
+    with _map.lock:
+        _map.sequence = UNREAD
+
+
+def _next_sequence():
+    try:
+        return cache.incr(SEQUENCE_KEY)
+    except ValueError:
+        # Started anywhere, so a map synced before the cache lost the sequence isn't taken as up to date
+        cache.add(SEQUENCE_KEY, random.randrange(1 << 48), None)
+        return cache.incr(SEQUENCE_KEY)
+
+
+def _log(job_ids):
+    # incr() isn't atomic in every cache backend, so two processes may get the same number: the
+    # change is logged under the first number nobody has logged one under
+    while not cache.add(_change_key(_next_sequence()), job_ids, CHANGES_SECONDS):
+        pass
+
+
+def jobs_changed(job_ids):
+    """
+    Log the jobs with `job_ids`, saved or deleted in the current transaction, for every process's
+    map once it commits.
+    """
+    job_ids = list(job_ids)
+    transaction.on_commit(lambda: _log(job_ids))
@@ -0,0 +1,57 @@
+"""
+The states of jobs and quotes, and the moves between them.
+
+A job or quote is pending while it takes bids, in progress once one is accepted, and then
+completed (TRANSITIONS). A move is one conditional UPDATE ... WHERE status = <from>, made in
+the transaction of the writes that go with it: of two requests making the same move at once,
+exactly one changes the row and goes on, and the other updates nothing and is told it lost.
+Nothing locks the row beforehand (select_for_update()), so losers don't queue up behind each
+other; one that reaches the row while the winner's transaction is open waits only for it to
+commit. A won move rolls back with the rest of its transaction.
+"""
+from django.utils import timezone
+
+from . import job_feed, job_map
+from .models import Job
+
+PENDING = 'pending'
+IN_PROGRESS = 'in Progress'
+COMPLETED = 'completed'
+
+TRANSITIONS = {
+    PENDING: {IN_PROGRESS},  # A bid was accepted
+    IN_PROGRESS: {COMPLETED},
+    COMPLETED: set(),
+}
+
+
+class InvalidTransition(ValueError):
+    pass
+
+
+def check(source, target):
+    """Raise InvalidTransition unless a job or quote can move from `source` to `target`."""
+    if target not in TRANSITIONS.get(source, ()):
+        allowed = ', '.join(sorted(TRANSITIONS.get(source, ()))) or 'nothing'
+        raise InvalidTransition(f"A job that is {source!r} can't become {target!r}, only {allowed}.")
+
+
+def move(instance, target, source=None):
+    """
+    Move `instance`, a Job or Quote, from `source` (the status it was read with by default) to
+    `target` in one conditional UPDATE. Returns True if this call made the move, and sets
+    instance.status, or False if the row had already left `source`.
+    """
+    source = instance.status if source is None else source
+    check(source, target)
+    model = type(instance)
+    # update() sends no signals and doesn't set auto_now fields
+    moved = model.objects.filter(pk=instance.pk, status=source).update(status=target, updated_at=timezone.now())
+    if not moved:
+        return False
+    instance.status = target
+    if model is Job:
+        # No longer pending, so out of the accessors' feeds and job map
+        job_feed.jobs_changed([instance.pk])
+        job_map.jobs_changed([instance.pk])
+    return True
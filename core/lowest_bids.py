@@ -0,0 +1,34 @@
+"""
+Each job's lowest bid, kept on the job (Job.lowest_bid_amount and Job.lowest_bid_id) so lists
+of bids show it without a query per bid.
+
+The Bid signals in core.signals refresh it when a bid is saved or deleted, in the transaction
+of the write: BidCreateView and BidDetailView save bids in one, and cascading deletes run in
+one. A bid saved outside a transaction is refreshed in one of its own, just after. A refresh
+locks the job's row first and only then reads its bids, so of two bids written on a job at
+once, the one refreshed second waits for the other to commit and sees it.
+"""
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+
+from .models import Bid, Job
+
+
+def lowest_bids():
+    """The bids of the job of OuterRef('pk'), lowest first as read by the bid_job_amount index."""
+    return Bid.objects.filter(job=OuterRef('pk')).order_by('amount', 'id')
+
+
+def refresh(job_ids):
+    """Set the lowest bid of the jobs with `job_ids` from their bids."""
+    job_ids = sorted({job_id for job_id in job_ids if job_id is not None})
+    if not job_ids:
+        return
+    # In the transaction of the write, or one of its own after a write made outside one
+    with transaction.atomic(savepoint=False):
+        # Locked in order of id, so writes of bids on several jobs can't deadlock
+        list(Job.objects.select_for_update().filter(pk__in=job_ids).order_by('pk').values_list('pk', flat=True))
+        Job.objects.filter(pk__in=job_ids).update(
+            lowest_bid_amount=Subquery(lowest_bids().values('amount')[:1]),
+            lowest_bid_id=Subquery(lowest_bids().values('id')[:1]),
+        )
@@ -0,0 +1,89 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Avg, Count, Func, IntegerField
+from rest_framework import serializers
+from core.history import assessment_at
+from core.models import (Assesment, ASSESSMENT_SECTIONS, AssessmentRevision, AssessmentRoom, AssessmentStorey,
+                         AssessmentHeatLossArea)
+from core.serializers import CompiledAssessmentSerializer, assessment_queryset
+from .bench_assessment_writes import sample_values
+
+
+def column_size(field):
+    return Func(field, function='pg_column_size', output_field=IntegerField())
+
+
+class Command(BaseCommand):
+    help = (
+        "Save a fully surveyed assessment many times with a few changed fields each, then time "
+        "rebuilding every version from its revisions (see core.history) and check each rebuilt "
+        "version against what was saved. Everything runs in a rolled back transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--versions', type=int, default=200, help='Saves to make.')
+        parser.add_argument('--fields', type=int, default=3, help='Fields changed per save.')
+
+    def handle(self, *args, **options):
+        rng = random.Random(0)
+        with transaction.atomic():
+            assessment = self._create()
+            instance = assessment_queryset().get(pk=assessment.pk)
+            fields = CompiledAssessmentSerializer().fields
+            keys = [key for key, field in fields.items() if not field.read_only
+                    and type(field) in (serializers.BooleanField, serializers.CharField, serializers.FloatField)]
+
+            saved, write_times = {}, []
+            for _ in range(options['versions']):
+                data = CompiledAssessmentSerializer(instance).data
+                changes = {}
+                for key in rng.sample(keys, options['fields']):
+                    if isinstance(fields[key], serializers.BooleanField):
+                        changes[key] = not data[key]
+                    elif isinstance(fields[key], serializers.FloatField):
+                        changes[key] = round(rng.uniform(0, 100), 2)
+                    else:
+                        changes[key] = f'value {rng.randrange(10 ** 6)}'[:fields[key].max_length or 255]
+                serializer = CompiledAssessmentSerializer(instance, data=changes, partial=True)
+                serializer.is_valid(raise_exception=True)
+                start = time.perf_counter()
+                serializer.save()
+                write_times.append(time.perf_counter() - start)
+                saved[instance.version] = CompiledAssessmentSerializer(instance).data
+
+            rebuild_times = []
+            for version, expected in saved.items():
+                start = time.perf_counter()
+                data = CompiledAssessmentSerializer(assessment_at(assessment.pk, version)).data
+                rebuild_times.append(time.perf_counter() - start)
+                if data != expected:
+                    raise CommandError(f"Version {version} was not rebuilt as it was saved.")
+
+            revisions = AssessmentRevision.objects.filter(assessment=assessment)
+            diffs = revisions.filter(snapshot__isnull=True).aggregate(n=Count('id'), size=Avg(column_size('changes')))
+            checkpoints = revisions.filter(snapshot__isnull=False).aggregate(n=Count('id'), size=Avg(column_size('snapshot')))
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"{len(saved)} versions of {options['fields']} changed fields (all rebuilt identically)")
+        self.stdout.write(f"{'diff revisions':<28}{diffs['n']:>6}, {diffs['size'] or 0:>8.0f} bytes on average")
+        self.stdout.write(f"{'checkpoints':<28}{checkpoints['n']:>6}, {checkpoints['size'] or 0:>8.0f} bytes on average")
+        for name, times in (('save', write_times), ('rebuild and serialize', rebuild_times)):
+            times.sort()
+            self.stdout.write(f"{name:<28}median {times[len(times) // 2] * 1000:6.2f}ms  "
+                              f"p95 {times[int(len(times) * 0.95)] * 1000:6.2f}ms  max {times[-1] * 1000:6.2f}ms")
+
+    def _create(self):
+        assessment = Assesment.objects.create(**sample_values(Assesment))
+        for model in ASSESSMENT_SECTIONS.values():
+            model.objects.create(assessment=assessment, **sample_values(model))
+        for position in range(1, 6):
+            AssessmentRoom.objects.create(assessment=assessment, **{**sample_values(AssessmentRoom), 'position': position})
+        for storey, _ in AssessmentStorey.STOREYS:
+            row = AssessmentStorey.objects.create(assessment=assessment, **{**sample_values(AssessmentStorey), 'storey': storey})
+            for element, _ in AssessmentHeatLossArea.ELEMENTS:
+                for position in range(1, 5):
+                    AssessmentHeatLossArea.objects.create(storey=row, element=element, position=position, area=position)
+        return assessment
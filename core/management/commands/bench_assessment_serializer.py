@@ -0,0 +1,78 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from core.models import Assesment, ASSESSMENT_SECTIONS, AssessmentRoom, AssessmentStorey, AssessmentHeatLossArea
+from core.serializers import AssessmentSerializer, CompiledAssessmentSerializer, assessment_queryset
+from .bench_assessment_writes import sample_values
+
+
+SPARSE_PAYLOAD = {'eircode': 'T12 AB34', 'main_gas': True, 'cavity': True}
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare AssessmentSerializer with CompiledAssessmentSerializer in operations per second: "
+        "serializing a full assessment, and validating a full and a sparse partial PUT. "
+        "Also checks that both produce the same output. Nothing is saved."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=200, help='Operations timed per case.')
+
+    def handle(self, *args, **options):
+        runs = options['runs']
+
+        with transaction.atomic():
+            assessment = Assesment.objects.create(**sample_values(Assesment))
+            for model in ASSESSMENT_SECTIONS.values():
+                model.objects.create(assessment=assessment, **sample_values(model))
+            for position in range(1, 6):
+                AssessmentRoom.objects.create(assessment=assessment, **{**sample_values(AssessmentRoom), 'position': position})
+            for storey, _ in AssessmentStorey.STOREYS:
+                row = AssessmentStorey.objects.create(assessment=assessment, **{**sample_values(AssessmentStorey), 'storey': storey})
+                for element, _ in AssessmentHeatLossArea.ELEMENTS:
+                    for position in range(1, 5):
+                        AssessmentHeatLossArea.objects.create(storey=row, element=element, position=position, area=position)
+            instance = assessment_queryset().get(pk=assessment.pk)
+            transaction.set_rollback(True)
+
+        full_payload = AssessmentSerializer(instance).data.copy()
+        for key in ('id', 'version', 'lidar'):
+            full_payload.pop(key)
+
+        def read(serializer_class, payload):
+            return serializer_class(instance).data
+
+        def put(serializer_class, payload):
+            serializer = serializer_class(instance, data=payload, partial=True)
+            serializer.is_valid(raise_exception=True)
+            return serializer.validated_data
+
+        cases = [
+            ('read', read, None),
+            (f'full PUT ({len(full_payload)} keys)', put, full_payload),
+            (f'sparse PUT ({len(SPARSE_PAYLOAD)} keys)', put, SPARSE_PAYLOAD),
+        ]
+        for name, operation, payload in cases:
+            expected, compiled = operation(AssessmentSerializer, payload), operation(CompiledAssessmentSerializer, payload)
+            if operation is read:
+                expected, compiled = JSONRenderer().render(expected), JSONRenderer().render(compiled)
+            if expected != compiled:
+                raise CommandError(f"{name}: the compiled serializer gives a different result.")
+
+        self.stdout.write(f"Assessment serializer throughput, {runs} runs per case (outputs identical)")
+        self.stdout.write(f"{'case':<24}{'ops/s':>10}{'compiled':>10}{'speedup':>10}")
+        for name, operation, payload in cases:
+            baseline = self._ops_per_second(runs, lambda: operation(AssessmentSerializer, payload))
+            compiled = self._ops_per_second(runs, lambda: operation(CompiledAssessmentSerializer, payload))
+            self.stdout.write(f"{name:<24}{baseline:>10.0f}{compiled:>10.0f}{compiled / baseline:>9.1f}x")
+
+    def _ops_per_second(self, runs, operation):
+        for _ in range(5):
+            operation()
+        start = time.perf_counter()
+        for _ in range(runs):
+            operation()
+        return runs / (time.perf_counter() - start)
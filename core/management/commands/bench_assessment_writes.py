@@ -0,0 +1,114 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, models, transaction
+from core.models import Assesment, ASSESSMENT_SECTIONS
+from core.serializers import AssessmentSerializer
+
+
+WIDE_TABLE = 'bench_wide_assesment'
+
+
+def sample_values(model):
+    # A fully surveyed assessment: every column holds a value.
+    values = {}
+    for i, f in enumerate(model._meta.concrete_fields):
+        if f.primary_key or f.is_relation or isinstance(f, models.FileField):
+            continue
+        if f.choices:
+            values[f.name] = f.choices[0][0]
+        elif isinstance(f, models.BooleanField):
+            values[f.name] = i % 2 == 0
+        elif isinstance(f, (models.IntegerField, models.FloatField)):
+            values[f.name] = i
+        elif isinstance(f, models.CharField):
+            values[f.name] = f'sample {i}'[:f.max_length or 255]
+    return values
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure bytes written per assessment PUT: one wide Assesment row (the pre-split layout) "
+        "against the section tables. Postgres only; everything runs in a rolled back transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=50, help='PUTs measured per layout.')
+        parser.add_argument('--field', default='main_gas', help='Boolean section field flipped on every PUT.')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError("WAL positions are only available on PostgreSQL.")
+
+        field = options['field']
+        section = next((name for name, model in ASSESSMENT_SECTIONS.items()
+                        if isinstance(self._get_field(model, field), models.BooleanField)), None)
+        if section is None:
+            raise CommandError(f"'{field}' is not a boolean section field.")
+        runs = options['runs']
+
+        with transaction.atomic():
+            assessment = Assesment.objects.create(**sample_values(Assesment))
+            for model in ASSESSMENT_SECTIONS.values():
+                model.objects.create(assessment=assessment, **sample_values(model))
+            self._create_wide_table(assessment)
+
+            column = connection.ops.quote_name(field)
+            wide = self._measure(runs, lambda i: self._execute(
+                f"UPDATE {WIDE_TABLE} SET {column} = NOT {column} WHERE id = %s", [assessment.id]))
+            wide_tuple = self._fetch(f"SELECT pg_column_size(w.*) FROM {WIDE_TABLE} w WHERE id = %s", [assessment.id])
+
+            def put(i):
+                instance = Assesment.objects.select_related(*ASSESSMENT_SECTIONS).get(pk=assessment.pk)
+                serializer = AssessmentSerializer(instance, data={field: i % 2 == 0}, partial=True)
+                serializer.is_valid(raise_exception=True)
+                serializer.save()
+
+            split = self._measure(runs, put)
+            section_table = ASSESSMENT_SECTIONS[section]._meta.db_table
+            split_tuple = self._fetch(
+                f"SELECT pg_column_size(s.*) FROM {section_table} s WHERE assessment_id = %s", [assessment.id])
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"Bytes written per PUT changing '{field}' ({section} section), {runs} runs")
+        self.stdout.write(f"{'layout':<18}{'new tuple':>12}{'WAL':>12}")
+        self.stdout.write(f"{'wide row':<18}{wide_tuple:>12}{wide:>12.0f}")
+        self.stdout.write(f"{'section tables':<18}{split_tuple:>12}{split:>12.0f}")
+
+    def _get_field(self, model, name):
+        try:
+            return model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+
+    def _create_wide_table(self, assessment):
+        # Rebuild the pre-split row: the core columns plus every section's columns.
+        qn = connection.ops.quote_name
+        columns, joins = ['a.*'], []
+        for i, model in enumerate(ASSESSMENT_SECTIONS.values()):
+            alias = f's{i}'
+            columns += [f'{alias}.{qn(f.column)}' for f in model._meta.concrete_fields if f.name != 'assessment']
+            joins.append(f'JOIN {qn(model._meta.db_table)} {alias} ON {alias}.assessment_id = a.id')
+        self._execute(
+            f"CREATE TABLE {WIDE_TABLE} AS SELECT {', '.join(columns)} "
+            f"FROM {qn(Assesment._meta.db_table)} a {' '.join(joins)} WHERE a.id = %s",
+            [assessment.id],
+        )
+
+    def _measure(self, runs, write):
+        # Warm up first so full-page images after a checkpoint don't skew the average.
+        for i in range(5):
+            write(i)
+        start = self._fetch("SELECT pg_current_wal_insert_lsn()")
+        for i in range(runs):
+            write(i)
+        return self._fetch("SELECT pg_wal_lsn_diff(pg_current_wal_insert_lsn(), %s)", [start]) / runs
+
+    def _execute(self, sql, params=None):
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+
+    def _fetch(self, sql, params=None):
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchone()[0]
@@ -0,0 +1,167 @@
+import math
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, models, transaction
+from core import heat_loss
+from core.checkbox_groups import AGE_BANDS
+from core.models import (Assesment, AssessmentEnvelope, AssessmentHeating, AssessmentRooms, AssessmentStorey,
+                         AssessmentHeatLossArea)
+
+
+def naive_estimate(assessment):
+    # The same estimate as core.heat_loss, one assessment at a time from its model instances
+    age = AGE_BANDS.index(assessment.age_band) if assessment.age_band in AGE_BANDS else len(AGE_BANDS)
+    envelope, heating, rooms = (assessment.section(name) for name in ('envelope', 'heating', 'rooms'))
+
+    areas = {element: 0.0 for element in heat_loss.ELEMENTS}
+    floor_area = volume = 0.0
+    for storey in assessment.storeys.all():
+        if storey.total_floor_area is not None:
+            floor_area += storey.total_floor_area
+            volume += storey.total_floor_area * (storey.storey_height or heat_loss.DEFAULT_STOREY_HEIGHT)
+        for area in storey.heat_loss_areas.all():
+            areas[area.element] += area.area or 0.0
+
+    wall_u = heat_loss.WALL_U[age]
+    if envelope.wall_construction in heat_loss.WALL_CONSTRUCTIONS and age < heat_loss.UNINSULATED_WALLS_BEFORE:
+        construction_u = heat_loss.WALL_CONSTRUCTION_U[heat_loss.WALL_CONSTRUCTIONS.index(envelope.wall_construction)]
+        if not math.isnan(construction_u):
+            wall_u = construction_u
+    roof_u = 0.0 if envelope.roof_construction & heat_loss.NO_HEAT_LOSS_ROOF else heat_loss.ROOF_U[age]
+    window_area = min(rooms.room_opening_dimensions_totaL or 0.0, areas['wall'])
+    fabric = ((areas['wall'] - window_area) * wall_u + window_area * heat_loss.WINDOW_U[age]
+              + areas['roof'] * roof_u + areas['floor'] * heat_loss.FLOOR_U[age]
+              + heat_loss.THERMAL_BRIDGING * sum(areas.values()))
+    openings = (heat_loss.CHIMNEY_M3H * (rooms.room_chimney_flueless_total or 0)
+                + heat_loss.FLUE_M3H * (rooms.room_open_flues_total or 0))
+    ventilation = 0.33 * (heat_loss.INFILTRATION_ACH[age] * volume + openings)
+
+    fuel_text = (heating.fuel_type_heating_system or '').lower()
+    fuel = next((i for i, (_, words, _, _) in enumerate(heat_loss.FUELS) if any(w in fuel_text for w in words)),
+                len(heat_loss.FUELS))
+    efficiency = heating.efficiency or 0
+    efficiency = efficiency / 100 if efficiency > 1.5 else efficiency
+    if efficiency <= 0:
+        efficiency = heat_loss.DEFAULT_EFFICIENCY[fuel]
+    if not floor_area:
+        return fabric, ventilation, None
+    demand = (fabric + ventilation) * heat_loss.DEGREE_DAYS * 24 / 1000 + heat_loss.HOT_WATER_KWH
+    energy = demand / efficiency * heat_loss.PRIMARY_ENERGY_FACTOR[fuel] / floor_area
+    band = next((band for band, limit in zip(heat_loss.BER_BANDS, heat_loss.BER_BAND_LIMITS) if energy <= limit), 'G')
+    return fabric, ventilation, band
+
+
+class Command(BaseCommand):
+    help = (
+        "Time core.heat_loss on generated assessments against a per-row implementation over model "
+        "instances, and check both give the same results. Everything runs in a rolled back transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=20000, help='Assessments to generate.')
+        parser.add_argument('--naive-count', type=int, default=2000,
+                            help='Assessments given to the per-row implementation (it is extrapolated).')
+
+    def handle(self, *args, **options):
+        count, naive_count = options['count'], min(options['naive_count'], options['count'])
+        with transaction.atomic():
+            start = time.perf_counter()
+            ids = self._generate(count)
+            self.stdout.write(f"Generated {count} assessments in {time.perf_counter() - start:.1f}s")
+            # Generated in one statement, so nothing else was given ids in between
+            assessments = Assesment.objects.filter(id__range=(min(ids), max(ids)))
+
+            start = time.perf_counter()
+            inputs = heat_loss.load_inputs(assessments)
+            loaded = time.perf_counter() - start
+            start = time.perf_counter()
+            results = heat_loss.compute(inputs)
+            computed = time.perf_counter() - start
+
+            sample = sorted(ids)[:naive_count]
+            start = time.perf_counter()
+            naive = [naive_estimate(assessment) for assessment in
+                     Assesment.objects.filter(id__in=sample).order_by('id')
+                     .select_related('envelope', 'heating', 'rooms').prefetch_related('storeys__heat_loss_areas')]
+            naive_seconds = time.perf_counter() - start
+            transaction.set_rollback(True)
+
+        fabric, ventilation, bands = zip(*naive)
+        if not (np.allclose(results['fabric_heat_loss'][:naive_count], fabric)
+                and np.allclose(results['ventilation_heat_loss'][:naive_count], ventilation)
+                and list(results['ber_band'][:naive_count]) == list(bands)):
+            raise CommandError("The vectorized and per-row estimates differ.")
+
+        self.stdout.write(f"Heat loss estimate for {count} assessments (results identical on {naive_count})")
+        self.stdout.write(f"{'vectorized, loading':<28}{loaded:>8.2f}s")
+        self.stdout.write(f"{'vectorized, computing':<28}{computed:>8.2f}s")
+        self.stdout.write(f"{'per row (extrapolated)':<28}{naive_seconds * count / naive_count:>8.2f}s")
+
+    def _generate(self, count):
+        # The section tables are wide, so rows are cloned from a template in SQL rather than built
+        # as model instances; only the columns the estimate reads are varied.
+        template = Assesment.objects.create()
+        for model in (AssessmentEnvelope, AssessmentHeating, AssessmentRooms):
+            model.objects.create(assessment=template, **({'grate': ''} if model is AssessmentHeating else {}))
+
+        def pick(values):
+            return f"(ARRAY[{', '.join(values)}])[1 + floor(random() * {len(values)})::int]"
+
+        def quoted(values):
+            return [f"'{value}'" if value is not None else 'NULL' for value in values]
+
+        self._execute("SELECT setseed(0)")
+        ids = self._clone(Assesment, template.pk, 'generate_series(1, %s) g', [count], {
+            'age_band': pick(quoted(AGE_BANDS + [None])),
+        })
+        others = 'unnest(%s::int[]) a(id)'
+        self._clone(AssessmentEnvelope, template.pk, others, [ids], {
+            'assessment_id': 'a.id',
+            'wall_construction': pick(quoted(heat_loss.WALL_CONSTRUCTIONS + [None])),
+            'roof_construction': pick(['0', str(heat_loss.NO_HEAT_LOSS_ROOF)]),
+        })
+        self._clone(AssessmentHeating, template.pk, others, [ids], {
+            'assessment_id': 'a.id',
+            'fuel_type_heating_system': pick(quoted(['Mains gas', 'Heating oil', 'Electricity', 'Wood pellets', None])),
+            'efficiency': pick(['NULL', '0.9', '65.0', '92.0']) + '::float',
+        })
+        self._clone(AssessmentRooms, template.pk, others, [ids], {
+            'assessment_id': 'a.id',
+            'room_opening_dimensions_totaL': '5 + random() * 25',
+            'room_chimney_flueless_total': 'floor(random() * 3)',
+            'room_open_flues_total': 'floor(random() * 2)',
+        })
+        self._execute(
+            f"INSERT INTO {AssessmentStorey._meta.db_table} (assessment_id, storey, total_floor_area, storey_height) "
+            f"SELECT a.id, s.storey, 30 + random() * 60, {pick(['NULL', '2.4', '2.7'])}::float "
+            f"FROM {others}, unnest(ARRAY['ground', 'first']) s(storey)", [ids])
+        self._execute(
+            f"INSERT INTO {AssessmentHeatLossArea._meta.db_table} (storey_id, element, position, area) "
+            f"SELECT s.id, e.element, p.position, 5 + random() * 35 "
+            f"FROM {AssessmentStorey._meta.db_table} s, unnest(ARRAY['floor', 'wall', 'roof']) e(element), "
+            f"generate_series(1, 2) p(position) WHERE s.assessment_id = ANY(%s)", [ids])
+        template.delete()
+        # The new rows have no planner statistics yet
+        for model in (Assesment, AssessmentEnvelope, AssessmentHeating, AssessmentRooms, AssessmentStorey,
+                      AssessmentHeatLossArea):
+            self._execute(f"ANALYZE {connection.ops.quote_name(model._meta.db_table)}")
+        return ids
+
+    def _clone(self, model, template_pk, source, params, overrides):
+        # INSERT ... SELECT of the template row once per row of `source`, with `overrides` as SQL
+        qn = connection.ops.quote_name
+        columns = [f.column for f in model._meta.concrete_fields if not isinstance(f, models.AutoField)]
+        values = [overrides.get(column, f't.{qn(column)}') for column in columns]
+        pk = model._meta.pk.column
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {qn(model._meta.db_table)} ({', '.join(map(qn, columns))}) "
+                f"SELECT {', '.join(values)} FROM {qn(model._meta.db_table)} t, {source} "
+                f"WHERE t.{qn(pk)} = {int(template_pk)} RETURNING {qn(pk)}", params)
+            return [row[0] for row in cursor.fetchall()]
+
+    def _execute(self, sql, params=None):
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
@@ -0,0 +1,103 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from core.models import Client, Job, UserModel
+from core import search
+from core.search import SEARCH_LIMIT, search_jobs
+from core.quote_values import job_filters
+from core.serializers import JobSerializer
+
+# (town, county) pairs the generated jobs are spread over
+TOWNS = [
+    ('Mallow', 'Cork'), ('Bandon', 'Cork'), ('Youghal', 'Cork'), ('Midleton', 'Cork'), ('Skibbereen', 'Cork'),
+    ('Dungarvan', 'Waterford'), ('Tramore', 'Waterford'), ('Killarney', 'Kerry'), ('Tralee', 'Kerry'),
+    ('Listowel', 'Kerry'), ('Ennis', 'Clare'), ('Kilrush', 'Clare'), ('Nenagh', 'Tipperary'),
+    ('Clonmel', 'Tipperary'), ('Thurles', 'Tipperary'), ('Castlebar', 'Mayo'), ('Westport', 'Mayo'),
+    ('Ballina', 'Mayo'), ('Tuam', 'Galway'), ('Loughrea', 'Galway'), ('Athlone', 'Westmeath'),
+    ('Mullingar', 'Westmeath'), ('Navan', 'Meath'), ('Trim', 'Meath'), ('Drogheda', 'Louth'),
+    ('Dundalk', 'Louth'), ('Swords', 'Dublin'), ('Balbriggan', 'Dublin'), ('Naas', 'Kildare'),
+    ('Newbridge', 'Kildare'), ('Carlow', 'Carlow'), ('Gorey', 'Wexford'), ('Enniscorthy', 'Wexford'),
+    ('Letterkenny', 'Donegal'), ('Buncrana', 'Donegal'), ('Sligo', 'Sligo'), ('Longford', 'Longford'),
+    ('Tullamore', 'Offaly'), ('Portlaoise', 'Laois'), ('Cavan', 'Cavan'),
+]
+PROPERTY_TYPES = ['house', 'semi-detached house', 'apartment', 'bungalow', 'terraced house', 'duplex']
+
+
+def misspell(word, rng):
+    # Drops, doubles or swaps one letter
+    i = rng.randrange(1, len(word) - 1)
+    return rng.choice([word[:i] + word[i + 1:], word[:i] + word[i] + word[i:],
+                       word[:i] + word[i + 1] + word[i] + word[i + 2:]])
+
+
+def misspelt_with_county(rng):
+    town, county = rng.choice(TOWNS)
+    return {'nearest_town': misspell(town, rng), 'county': county}
+
+
+class Command(BaseCommand):
+    help = (
+        "Time JobSearchView's search (core.search) over --jobs generated jobs: the query and "
+        "serializing a page of results. Everything runs in a rolled back transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--jobs', type=int, default=1000000, help='Jobs to generate.')
+        parser.add_argument('--runs', type=int, default=200, help='Searches timed per kind.')
+
+    def handle(self, *args, **options):
+        rng = random.Random(0)
+        searches = {
+            'misspelt town': lambda: {'nearest_town': misspell(rng.choice(TOWNS)[0], rng)},
+            'town and county': lambda: dict(zip(('nearest_town', 'county'), rng.choice(TOWNS))),
+            'misspelt, with county': lambda: misspelt_with_county(rng),
+            'county, lower case': lambda: {'county': rng.choice(TOWNS)[1].lower()},
+            'property type': lambda: {'property_type': rng.choice(PROPERTY_TYPES).split()[0][:5]},
+            'bedrooms': lambda: {'filters': job_filters({'bedrooms': str(rng.randrange(1, 6))})},
+            'town, 3-4 bedrooms': lambda: {'nearest_town': rng.choice(TOWNS)[0],
+                                           'filters': job_filters({'bedrooms_min': '3', 'bedrooms_max': '4'})},
+            'date range, county': lambda: {'county': rng.choice(TOWNS)[1], 'filters': job_filters(
+                {'preferred_date_from': '2025-06-10', 'preferred_date_to': '2025-06-24'})},
+        }
+
+        with transaction.atomic():
+            self._generate(options['jobs'])
+            search._vocabularies.clear()
+            start = time.perf_counter()
+            towns = search.vocabulary('nearest_town')
+            self.stdout.write(f"{options['jobs']} jobs, {len(towns)} towns read in "
+                              f"{(time.perf_counter() - start) * 1000:.2f}ms")
+            for name, terms in searches.items():
+                times, found = [], 0
+                for _ in range(options['runs']):
+                    start = time.perf_counter()
+                    jobs, keys = search_jobs(**terms())
+                    data = JobSerializer(jobs[:SEARCH_LIMIT], many=True).data
+                    times.append(time.perf_counter() - start)
+                    found += bool(data)
+                times.sort()
+                self.stdout.write(f"{name:<22}median {times[len(times) // 2] * 1000:7.2f}ms  "
+                                  f"p95 {times[int(len(times) * 0.95)] * 1000:7.2f}ms  "
+                                  f"({found}/{len(times)} found jobs)")
+            transaction.set_rollback(True)
+        search._vocabularies.clear()
+
+    def _generate(self, count):
+        user = UserModel.objects.create_user(email='bench-search@example.com', first_name='Bench',
+                                             last_name='Search', phone_number='0870000000')
+        client = Client.objects.get(user=user)  # Made by the signal for new client users
+        towns, counties = zip(*TOWNS)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {Job._meta.db_table} (client_id, building_type, status, preferred_date, preferred_time, "
+                f"property_type, property_size, bedrooms, heat_pump_installed, county, nearest_town, ber_purpose, "
+                f"uploaded_at, created_at, updated_at, name, email_address, mobile_number, legacy_values) "
+                f"SELECT %s, 'detached', 'pending', DATE '2025-06-01' + i %% 90, TIME '09:00', (%s::text[])[1 + i %% %s], "
+                f"60 + i %% 140, 1 + i / 7 %% 5, 'no', (%s::text[])[1 + i %% %s], (%s::text[])[1 + i %% %s], "
+                f"'sale', now(), now() - i * interval '1 minute', now(), 'Bench', %s, %s, '{{}}' "
+                f"FROM generate_series(1, %s) i",
+                [client.pk, PROPERTY_TYPES, len(PROPERTY_TYPES), list(counties), len(TOWNS), list(towns), len(TOWNS),
+                 user.email, user.phone_number, count])
+            cursor.execute(f"ANALYZE {Job._meta.db_table}")
@@ -0,0 +1,68 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from rest_framework.test import APIRequestFactory, force_authenticate
+from core.models import Client, Job, UserModel
+from core import job_map
+from core.views import AccessorJobView
+from core.management.commands.bench_job_search import TOWNS
+
+
+class Command(BaseCommand):
+    help = (
+        "Time AccessorJobView's jobs within ?within_km= of a town (core.job_map) over --jobs generated "
+        "pending jobs: reading the map, then answering a page. Everything runs in a rolled back transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--jobs', type=int, default=100000, help='Pending jobs to generate.')
+        parser.add_argument('--runs', type=int, default=200, help='Pages timed per radius.')
+
+    def handle(self, *args, **options):
+        rng = random.Random(0)
+        factory = APIRequestFactory()
+        view = AccessorJobView.as_view()
+
+        with transaction.atomic():
+            accessor = self._generate(options['jobs'])
+            job_map.forget()
+            start = time.perf_counter()
+            job_map._map.sync()
+            self.stdout.write(f"{options['jobs']} jobs, {len(job_map._map.points)} placed, map read in "
+                              f"{(time.perf_counter() - start) * 1000:.2f}ms")
+            for km in (10, 30, 60, 100):
+                times, found = [], 0
+                for _ in range(options['runs']):
+                    request = factory.get('/api/jobs/', {'within_km': km, 'near': ', '.join(rng.choice(TOWNS))})
+                    force_authenticate(request, accessor)
+                    start = time.perf_counter()
+                    response = view(request)
+                    response.render()
+                    times.append(time.perf_counter() - start)
+                    found += bool(response.data['pending_jobs'])
+                times.sort()
+                self.stdout.write(f"within {km:>3}km  median {times[len(times) // 2] * 1000:7.2f}ms  "
+                                  f"p95 {times[int(len(times) * 0.95)] * 1000:7.2f}ms  "
+                                  f"({found}/{len(times)} found jobs)")
+            transaction.set_rollback(True)
+        job_map.forget()
+
+    def _generate(self, count):
+        user = UserModel.objects.create_user(email='bench-near@example.com', first_name='Bench',
+                                             last_name='Near', phone_number='0870000000')
+        client = Client.objects.get(user=user)  # Made by the signal for new client users
+        towns, counties = zip(*TOWNS)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {Job._meta.db_table} (client_id, building_type, status, property_type, heat_pump_installed, "
+                f"county, nearest_town, ber_purpose, uploaded_at, created_at, updated_at, name, email_address, "
+                f"mobile_number, legacy_values) "
+                f"SELECT %s, 'detached', 'pending', 'house', 'no', (%s::text[])[1 + i %% %s], (%s::text[])[1 + i %% %s], "
+                f"'sale', now(), now() - i * interval '1 minute', now(), 'Bench', %s, %s, '{{}}' "
+                f"FROM generate_series(1, %s) i",
+                [client.pk, list(counties), len(TOWNS), list(towns), len(TOWNS), user.email, user.phone_number, count])
+            cursor.execute(f"ANALYZE {Job._meta.db_table}")
+        # Not saved, so no sign up emails are sent: with ?near= nothing is read about them
+        return UserModel(email='bench-near-accessor@example.com', user_type='accessor')
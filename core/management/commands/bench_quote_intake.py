@@ -0,0 +1,56 @@
+import csv
+import io
+import json
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from core.quote_intake import CSV, FORMATS, JSONL, intake
+
+
+def sample_rows(count, clients):
+    # Complete quotes from `clients` distinct contacts, as a partner portal would send them
+    for i in range(count):
+        yield {
+            'name': f'Partner Client{i}', 'email_address': f'intake{i % clients}@example.com',
+            'mobile_number': f'087{i % 10 ** 7:07d}', 'building_type': 'semi-detached',
+            'preferred_date': '2025-06-01', 'preferred_time': 'morning', 'property_type': 'house',
+            'property_size': str(80 + i % 120), 'bedrooms': str(1 + i % 5), 'heat_pump_installed': 'no',
+            'county': 'Dublin', 'nearest_town': 'Swords', 'ber_purpose': 'sale',
+        }
+
+
+def encode(rows, file_format):
+    rows = list(rows)
+    if file_format == JSONL:
+        return [json.dumps(row).encode() + b'\n' for row in rows]
+    text = io.StringIO()
+    writer = csv.DictWriter(text, fieldnames=list(rows[0]))
+    writer.writeheader()
+    writer.writerows(rows)
+    return io.BytesIO(text.getvalue().encode()).readlines()
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the bulk quote intake (core.quote_intake) of a generated upload of complete quotes, "
+        "each promoted to a job. Everything runs in a rolled back transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000, help='Rows in the upload.')
+        parser.add_argument('--clients', type=int, default=3000, help='Distinct contacts among the rows.')
+        parser.add_argument('--input', choices=FORMATS, default=CSV, help='Format of the upload.')
+
+    def handle(self, *args, **options):
+        lines = encode(sample_rows(options['rows'], options['clients']), options['input'])
+        with transaction.atomic(), CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            summary = intake(lines, options['input'])
+            elapsed = time.perf_counter() - start
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"{summary['rows']} rows: {summary['quotes']} quotes, {summary['jobs']} jobs, "
+                          f"{summary['failed']} failed")
+        self.stdout.write(f"{elapsed:.2f}s, {summary['rows'] / elapsed:.0f} rows/s, {len(queries)} queries")
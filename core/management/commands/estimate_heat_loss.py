@@ -0,0 +1,39 @@
+import csv
+import time
+
+from django.core.management.base import BaseCommand
+from core.heat_loss import RESULT_COLUMNS, band_counts, estimate, results_as_rows
+from core.models import Assesment
+
+
+class Command(BaseCommand):
+    help = (
+        "Estimate the fabric heat loss, energy use and BER band of assessments (see core.heat_loss) "
+        "and print how many fall in each band. Indicative only, not a DEAP calculation."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--accessor', type=int, help='Only the assessments of this accessor id.')
+        parser.add_argument('--client', type=int, help='Only the assessments of this client id.')
+        parser.add_argument('--project', type=int, help='Only the assessments of this project id.')
+        parser.add_argument('--csv', help='Also write one row per assessment to this file.')
+
+    def handle(self, *args, **options):
+        assessments = Assesment.objects.all()
+        for name in ('accessor', 'client', 'project'):
+            if options[name] is not None:
+                assessments = assessments.filter(**{f'{name}_id': options[name]})
+
+        start = time.perf_counter()
+        results = estimate(assessments)
+        elapsed = time.perf_counter() - start
+
+        if options['csv']:
+            with open(options['csv'], 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=RESULT_COLUMNS)
+                writer.writeheader()
+                writer.writerows(results_as_rows(results))
+
+        self.stdout.write(f"{len(results['id'])} assessments estimated in {elapsed:.2f}s")
+        for band, count in band_counts(results).items():
+            self.stdout.write(f"{band or 'no floor area':<14}{count:>8}")
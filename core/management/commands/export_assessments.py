@@ -0,0 +1,43 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from core.export import FORMATS, TABLES, ExportError, default_format, export, filter_assessments
+
+
+class Command(BaseCommand):
+    help = (
+        "Export assessments for analytics, one column per stored field, as Parquet, Arrow IPC "
+        "(both need pyarrow) or CSV. Rows are streamed in chunks, so memory use stays flat."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', '-o', help='File to write, standard output if not given.')
+        parser.add_argument('--format', choices=FORMATS, help='Defaults to parquet, or csv without pyarrow.')
+        parser.add_argument('--table', choices=TABLES, default='assessments',
+                            help='assessments (with their sections), or their rooms, storeys or heat loss areas.')
+        parser.add_argument('--county', help="Only assessments whose quote or job is in this county.")
+        parser.add_argument('--since', help='Only assessments created on or after this date (YYYY-MM-DD).')
+        parser.add_argument('--until', help='Only assessments created on or before this date (YYYY-MM-DD).')
+        parser.add_argument('--accessor', type=int, help='Only the assessments of this accessor id.')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='Rows read and written at a time.')
+
+    def handle(self, *args, **options):
+        try:
+            assessments = filter_assessments(options['county'], options['since'], options['until'],
+                                             options['accessor'])
+            chunks = export(options['table'], assessments, options['format'] or default_format(),
+                            options['chunk_size'])
+        except ExportError as e:
+            raise CommandError(str(e))
+
+        out = open(options['output'], 'wb') if options['output'] else sys.stdout.buffer
+        try:
+            written = 0
+            for chunk in chunks:
+                out.write(chunk)
+                written += len(chunk)
+        finally:
+            if options['output']:
+                out.close()
+        if options['output']:
+            self.stdout.write(f"Wrote {written} bytes to {options['output']}")
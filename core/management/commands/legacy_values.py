@@ -0,0 +1,29 @@
+import csv
+
+from django.core.management.base import BaseCommand
+from core.models import Job, Quote
+
+
+class Command(BaseCommand):
+    help = (
+        "List, as CSV, the bedrooms, floor areas and preferred dates and times of jobs and quotes "
+        "whose free text didn't read when they became typed columns (kept in legacy_values), "
+        "so they can be fixed by hand. Values set since are left out unless --all is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help='Also list values that have been set since.')
+
+    def handle(self, *args, **options):
+        writer = csv.writer(self.stdout)
+        writer.writerow(['model', 'id', 'field', 'text', 'value'])
+        listed = 0
+        for model in (Job, Quote):
+            rows = model.objects.exclude(legacy_values={}).order_by('pk')
+            for row in rows.iterator():
+                for field, text in sorted(row.legacy_values.items()):
+                    value = getattr(row, field)
+                    if value is None or options['all']:
+                        writer.writerow([model._meta.model_name, row.pk, field, text, '' if value is None else value])
+                        listed += 1
+        self.stderr.write(f"{listed} values to fix")
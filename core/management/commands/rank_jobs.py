@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+from core.models import Accessor
+from core.recommendations import rank
+
+
+class Command(BaseCommand):
+    help = (
+        "Rank the pending jobs for every active accessor, or those given by --email, and cache the "
+        "rankings jobs/recommended/ pages through (core.recommendations). Run it more often than "
+        "RECOMMENDATIONS_SECONDS (the ranker service does), so rankings are read from the cache rather "
+        "than made on request."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--email', action='append', help='Only the accessor with this email (repeatable).')
+
+    def handle(self, *args, **options):
+        accessors = None
+        if options['email']:
+            accessors = Accessor.objects.filter(user__email__in=options['email'])
+        start = time.perf_counter()
+        rankings = rank(accessors)
+        self.stdout.write(f"Ranked jobs for {len(rankings)} accessors in {time.perf_counter() - start:.2f}s, "
+                          f"{sum(map(len, rankings.values()))} jobs cached")
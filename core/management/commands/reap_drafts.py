@@ -0,0 +1,113 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, IntegrityError, connection, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+from core.models import (ASSESSMENT_SECTIONS, Assesment, AssessmentHeatLossArea, AssessmentRevision, AssessmentRoom,
+                         AssessmentStorey, Bid, Quote)
+
+
+def abandoned_quotes(cutoff):
+    """
+    Quotes created before `cutoff` that never got contact details, a bid, or an assessment
+    that was written to: the empty rows GET get-quote/ used to insert on every visit.
+    """
+    worked_on = Assesment.objects.filter(quote=OuterRef('pk')).exclude(version=0, accessor=None, project=None)
+    return (Quote.objects.filter(created_at__lt=cutoff, name='', email_address='', mobile_number='')
+            .exclude(Exists(Bid.objects.filter(quote=OuterRef('pk'))))
+            .exclude(Exists(worked_on)))
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete abandoned quote drafts and their empty assessments, in short transactions of at "
+        "most --batch-size quotes paged by id. Drafts being written to are skipped, never waited on. "
+        "Reports the rows deleted and the bytes of row data freed (reused after VACUUM)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--older-than-days', type=int, default=settings.QUOTE_DRAFT_REAP_AFTER_DAYS,
+                            help='Only drafts created longer ago than this.')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Quotes deleted per transaction.')
+        parser.add_argument('--sleep', type=float, default=0.1, help='Seconds to pause between batches.')
+        parser.add_argument('--dry-run', action='store_true', help='Only count what would be deleted.')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['older_than_days'])
+        batch_size = options['batch_size']
+        totals = {'quotes': 0, 'assessments': 0, 'bytes': 0, 'skipped_batches': 0}
+        last_id = 0
+
+        while True:
+            ids = list(abandoned_quotes(cutoff).filter(id__gt=last_id).order_by('id')
+                       .values_list('id', flat=True)[:batch_size])
+            if not ids:
+                break
+            last_id = ids[-1]
+            try:
+                counts = self._count(ids) if options['dry_run'] else self._delete(cutoff, ids)
+            except (IntegrityError, DatabaseError) as e:
+                # A draft in the batch was written to meanwhile, or a lock wasn't granted in time
+                totals['skipped_batches'] += 1
+                self.stderr.write(f"Skipped the batch of quotes {ids[0]}-{ids[-1]}: {e}")
+                continue
+            for name, value in counts.items():
+                totals[name] += value
+            if options['sleep'] and not options['dry_run']:
+                time.sleep(options['sleep'])
+
+        verb = "Would delete" if options['dry_run'] else "Deleted"
+        self.stdout.write(
+            f"{verb} {totals['quotes']} quotes and {totals['assessments']} assessments older than "
+            f"{options['older_than_days']} days, {totals['bytes'] / 1024 / 1024:.1f} MiB of row data"
+            + (f" ({totals['skipped_batches']} batches skipped)" if totals['skipped_batches'] else ""))
+
+    def _delete(self, cutoff, ids):
+        with transaction.atomic(), connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute("SET LOCAL lock_timeout = '2s'")
+            # Checked again under lock, skipping drafts a request is writing to right now
+            ids = list(abandoned_quotes(cutoff).filter(id__in=ids).select_for_update(skip_locked=True)
+                       .values_list('id', flat=True))
+            if not ids:
+                return {'quotes': 0, 'assessments': 0, 'bytes': 0}
+            # A draft's assessment was never saved (version 0), so nothing else refers to it but
+            # its own rows: any sections (made when first written to, or copied by migration 0015
+            # from an assessment that held values), rooms, storeys and revisions, deleted first as
+            # the foreign keys are checked at commit
+            cursor.execute(f"SELECT id FROM {Assesment._meta.db_table} WHERE quote_id = ANY(%s) AND version = 0 "
+                           f"AND accessor_id IS NULL AND project_id IS NULL", [ids])
+            assessment_ids = [assessment_id for assessment_id, in cursor.fetchall()]
+            child_bytes = sum(self._execute(cursor, sql, assessment_ids)[1] for sql in self._child_deletes())
+            assessments, assessment_bytes = self._execute(
+                cursor, f"DELETE FROM {Assesment._meta.db_table} t WHERE id = ANY(%s) RETURNING pg_column_size(t.*)",
+                assessment_ids)
+            quotes, quote_bytes = self._execute(
+                cursor, f"DELETE FROM {Quote._meta.db_table} t WHERE id = ANY(%s) RETURNING pg_column_size(t.*)", ids)
+        return {'quotes': quotes, 'assessments': assessments, 'bytes': child_bytes + assessment_bytes + quote_bytes}
+
+    def _child_deletes(self):
+        # DELETEs of the rows of the assessments with ids %s, each returning the size of each row
+        storeys = f"SELECT id FROM {AssessmentStorey._meta.db_table} WHERE assessment_id = ANY(%s)"
+        yield (f"DELETE FROM {AssessmentHeatLossArea._meta.db_table} t WHERE storey_id IN ({storeys}) "
+               f"RETURNING pg_column_size(t.*)")
+        for model in (AssessmentStorey, AssessmentRoom, AssessmentRevision, *ASSESSMENT_SECTIONS.values()):
+            yield (f"DELETE FROM {model._meta.db_table} t WHERE assessment_id = ANY(%s) "
+                   f"RETURNING pg_column_size(t.*)")
+
+    def _count(self, ids):
+        with connection.cursor() as cursor:
+            assessments, assessment_bytes = self._execute(
+                cursor, f"SELECT pg_column_size(t.*) FROM {Assesment._meta.db_table} t WHERE quote_id = ANY(%s)", ids)
+            quotes, quote_bytes = self._execute(
+                cursor, f"SELECT pg_column_size(t.*) FROM {Quote._meta.db_table} t WHERE id = ANY(%s)", ids)
+        return {'quotes': quotes, 'assessments': assessments, 'bytes': assessment_bytes + quote_bytes}
+
+    def _execute(self, cursor, sql, ids):
+        # (rows, bytes) of a statement returning the size of each row
+        cursor.execute(sql, [ids])
+        sizes = [size for size, in cursor.fetchall()]
+        return len(sizes), sum(sizes)
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from core.models import Assesment, AssessmentRooms
+from core.room_totals import ROOM_TOTALS, compute_totals
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the room_*_total columns of every assessment from its rooms. The totals "
+        "copied over by migration 0019 are the ones the surveyors typed in, which may not "
+        "match their rooms. Runs in batches ordered by assessment id."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Assessments per transaction.')
+        parser.add_argument('--dry-run', action='store_true', help='Only count the assessments that would change.')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        total_columns = [total for _, total, _ in ROOM_TOTALS]
+        last_id, checked, changed = 0, 0, 0
+
+        while True:
+            assessments = list(
+                Assesment.objects.filter(id__gt=last_id, room_rows__isnull=False).distinct()
+                .order_by('id').select_related('rooms').only('id', *(f'rooms__{total}' for total in total_columns))
+                .prefetch_related('room_rows')[:batch_size]
+            )
+            if not assessments:
+                break
+            last_id = assessments[-1].id
+
+            to_create, to_update = [], []
+            for assessment in assessments:
+                row = assessment.section('rooms')
+                totals = compute_totals(assessment.rooms_by_position().values())
+                if all(getattr(row, total) == value for total, value in totals.items()):
+                    continue
+                for total, value in totals.items():
+                    setattr(row, total, value)
+                (to_create if row._state.adding else to_update).append(row)
+
+            checked += len(assessments)
+            changed += len(to_create) + len(to_update)
+            if not options['dry_run']:
+                with transaction.atomic():
+                    AssessmentRooms.objects.bulk_create(to_create)
+                    AssessmentRooms.objects.bulk_update(to_update, total_columns)
+
+        verb = "would change" if options['dry_run'] else "changed"
+        self.stdout.write(f"{checked} assessments with rooms checked, totals {verb} on {changed}.")
@@ -0,0 +1,36 @@
+"""Custom migration operations used by core's migrations."""
+from django.db import migrations
+
+
+class RemoveFields(migrations.operations.base.Operation):
+    """
+    RemoveField for many columns of one model. Re-rendering the model state once per
+    RemoveField made dropping hundreds of Assesment columns take minutes; this reloads it once.
+    """
+    reduces_to_sql = True
+    reversible = True
+
+    def __init__(self, model_name, names):
+        self.model_name = model_name
+        self.names = names
+
+    def state_forwards(self, app_label, state):
+        model_state = state.models[app_label, self.model_name]
+        for name in self.names:
+            model_state.fields.pop(name)
+        state.reload_model(app_label, self.model_name, delay=True)
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            for name in self.names:
+                schema_editor.remove_field(model, model._meta.get_field(name))
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            for name in self.names:
+                schema_editor.add_field(model, model._meta.get_field(name))
+
+    def describe(self):
+        return f"Remove {len(self.names)} fields from {self.model_name}"
@@ -0,0 +1,740 @@
+# Generated by Django 5.1.4 on 2026-10-18 12:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+SECTION_MODELS = ['AssessmentEnvelope', 'AssessmentVentilation', 'AssessmentHeating', 'AssessmentHotWater', 'AssessmentRooms']
+
+
+def _section_columns(section):
+    return [f.column for f in section._meta.concrete_fields if f.name != 'assessment']
+
+
+def copy_into_sections(apps, schema_editor):
+    """
+    Move the existing assessments' section columns with one INSERT ... SELECT per section, only
+    for assessments with some column of the section set: a section row is otherwise only made
+    when one of its fields is first written.
+    """
+    qn = schema_editor.quote_name
+    assessment_table = qn(apps.get_model('core', 'Assesment')._meta.db_table)
+    for name in SECTION_MODELS:
+        section = apps.get_model('core', name)
+        fields = [f for f in section._meta.concrete_fields if f.name != 'assessment']
+        columns = ', '.join(qn(f.column) for f in fields)
+        changed, params = [], []
+        for field in fields:
+            default = field.get_default()
+            if default is None:
+                changed.append(f"{qn(field.column)} IS NOT NULL")
+            else:
+                changed.append(f"{qn(field.column)} IS DISTINCT FROM %s")
+                params.append(field.get_db_prep_save(default, schema_editor.connection))
+        schema_editor.execute(
+            f"INSERT INTO {qn(section._meta.db_table)} ({qn('assessment_id')}, {columns}) "
+            f"SELECT {qn('id')}, {columns} FROM {assessment_table} WHERE {' OR '.join(changed)}",
+            params,
+        )
+
+
+def copy_back_from_sections(apps, schema_editor):
+    qn = schema_editor.quote_name
+    assessment_table = qn(apps.get_model('core', 'Assesment')._meta.db_table)
+    for name in SECTION_MODELS:
+        section = apps.get_model('core', name)
+        table = qn(section._meta.db_table)
+        columns = _section_columns(section)
+        schema_editor.execute(
+            f"UPDATE {assessment_table} SET ({', '.join(qn(c) for c in columns)}) = "
+            f"(SELECT {', '.join('s.' + qn(c) for c in columns)} FROM {table} s "
+            f"WHERE s.{qn('assessment_id')} = {assessment_table}.{qn('id')}) "
+            f"WHERE EXISTS (SELECT 1 FROM {table} s WHERE s.{qn('assessment_id')} = {assessment_table}.{qn('id')})"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_usermodel_pin_created_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AssessmentEnvelope',
+            fields=[
+                ('assessment', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='envelope', serialize=False, to='core.assesment')),
+                ('stone', models.BooleanField(default=False)),
+                ('solid_brick', models.BooleanField(default=False)),
+                ('cavity', models.BooleanField(default=False)),
+                ('solid_concrete', models.BooleanField(default=False)),
+                ('hollow_block', models.BooleanField(default=False)),
+                ('timber_frame', models.BooleanField(default=False)),
+                ('other_unknown', models.BooleanField(default=False)),
+                ('other_unknow_text', models.CharField(blank=True, max_length=255, null=True)),
+                ('insulation_thickness_observable', models.CharField(blank=True, max_length=255, null=True)),
+                ('pitched_insulation_btw_joists', models.BooleanField(default=False)),
+                ('pitched_insulation_in_rafters', models.BooleanField(default=False)),
+                ('Flat_insulation_integral', models.BooleanField(default=False)),
+                ('room_in_roof', models.BooleanField(default=False)),
+                ('no_heat_loss_roof', models.BooleanField(default=False)),
+                ('roof_Construction_Other', models.BooleanField(default=False)),
+                ('roof_Construction_Other_text', models.CharField(blank=True, max_length=255, null=True)),
+                ('thinkness', models.FloatField(blank=True, null=True)),
+                ('roof_construction_unknown', models.CharField(blank=True, null=True)),
+                ('fibre', models.BooleanField(default=False)),
+                ('warmcell', models.BooleanField(default=False)),
+                ('eps', models.BooleanField(default=False)),
+                ('dense', models.BooleanField(default=False)),
+                ('solid', models.BooleanField(default=False)),
+                ('suspended', models.BooleanField(default=False)),
+                ('above_unheated_basement', models.BooleanField(default=False)),
+                ('heated_basement', models.BooleanField(default=False)),
+                ('no_heat_loss_ground_floor', models.BooleanField(default=False)),
+                ('sealed', models.BooleanField(default=False)),
+                ('ground_Floor_Dwelling_other', models.BooleanField(default=False)),
+                ('floor_insulation', models.CharField(blank=True, max_length=255, null=True)),
+                ('ground_Floor_insulation_none', models.BooleanField(default=False)),
+                ('Ground_Floor_Construction_Main_Dwelling_eps', models.BooleanField(default=False)),
+                ('Ground_Floor_Construction_Main_Dwelling_min_fibre', models.BooleanField(default=False)),
+                ('Ground_Floor_Construction_Main_Dwelling_dense', models.BooleanField(default=False)),
+                ('Ground_Floor_Construction_Main_Dwelling_unknow', models.BooleanField(default=False)),
+                ('type_2_stone', models.BooleanField(default=False)),
+                ('Type_2_solid_brick', models.BooleanField(default=False)),
+                ('type_2_cavity', models.BooleanField(default=False)),
+                ('type_2_solid_concrete', models.BooleanField(default=False)),
+                ('type_2_hollow_block', models.BooleanField(default=False)),
+                ('type_2_timber_frame', models.BooleanField(default=False)),
+                ('type_2_other_unknown', models.BooleanField(default=False)),
+                ('type_2_other_text', models.CharField(blank=True, max_length=255, null=True)),
+                ('type_2_insulation_thickness_observable', models.CharField(blank=True, max_length=255, null=True)),
+                ('type_2_pitched_insulation_btw_joists', models.BooleanField(default=False)),
+                ('type_2_pitched_insulation_in_rafters', models.BooleanField(default=False)),
+                ('type_2_Flat_insulation_integral', models.BooleanField(default=False)),
+                ('type_2_room_in_roof', models.BooleanField(default=False)),
+                ('type_2_no_heat_loss_roof', models.BooleanField(default=False)),
+                ('type_2_roof_Construction_Other', models.BooleanField(default=False)),
+                ('type_2_roof_Construction_Other_text', models.CharField(blank=True, max_length=255, null=True)),
+                ('type_2_thinkness', models.FloatField(blank=True, null=True)),
+                ('type_2_roof_construction_unknown', models.CharField(blank=True, null=True)),
+                ('type_2_fibre', models.BooleanField(default=False)),
+                ('type_2_warmcell', models.BooleanField(default=False)),
+                ('type_2_eps', models.BooleanField(default=False)),
+                ('type_2_dense', models.BooleanField(default=False)),
+                ('type_2_solid', models.BooleanField(default=False)),
+                ('type_2_suspended', models.BooleanField(default=False)),
+                ('type_2_above_unheated_basement', models.BooleanField(default=False)),
+                ('type_2_heated_basement', models.BooleanField(default=False)),
+                ('type_2_no_heat_loss_ground_floor', models.BooleanField(default=False)),
+                ('type_2_sealed', models.BooleanField(default=False)),
+                ('type_2_ground_Floor_Dwelling_other', models.BooleanField(default=False)),
+                ('type_2_floor_insulation', models.CharField(blank=True, max_length=255, null=True)),
+                ('type_2_ground_Floor_insulation_none', models.BooleanField(default=False)),
+                ('type_2_ground_floor_construction_main_dwelling_eps', models.BooleanField(default=False)),
+                ('type_2_ground_floor_construction_main_dwelling_min_fibre', models.BooleanField(default=False)),
+                ('type_2_ground_floor_construction_main_dwelling_dense', models.BooleanField(default=False)),
+                ('type_2_ground_floor_construction_main_dwelling_unknow', models.BooleanField(default=False)),
+                ('type_3_stone', models.BooleanField(default=False)),
+                ('Type_3_solid_brick', models.BooleanField(default=False)),
+                ('type_3_cavity', models.BooleanField(default=False)),
+                ('type_3_solid_concrete', models.BooleanField(default=False)),
+                ('type_3_hollow_block', models.BooleanField(default=False)),
+                ('type_3_timber_frame', models.BooleanField(default=False)),
+                ('type_3_ther_unknown', models.BooleanField(default=False)),
+                ('type_3_ther_unknown_text', models.CharField(blank=True, max_length=255, null=True)),
+                ('type_3_insulation_thickness_observable', models.CharField(blank=True, max_length=255, null=True)),
+                ('type_3_pitched_insulation_btw_joists', models.BooleanField(default=False)),
+                ('type_3_pitched_insulation_in_rafters', models.BooleanField(default=False)),
+                ('type_3_Flat_insulation_integral', models.BooleanField(default=False)),
+                ('type_3_room_in_roof', models.BooleanField(default=False)),
+                ('type_3_no_heat_loss_roof', models.BooleanField(default=False)),
+                ('type_3_roof_Construction_Other', models.BooleanField(default=False)),
+                ('type_3_roof_Construction_Other_text', models.CharField(blank=True, max_length=255, null=True)),
+                ('type_3_thinkness', models.FloatField(blank=True, null=True)),
+                ('type_3_roof_construction_unknown', models.CharField(blank=True, null=True)),
+                ('type_3_fibre', models.BooleanField(default=False)),
+                ('type_3_warmcell', models.BooleanField(default=False)),
+                ('type_3_eps', models.BooleanField(default=False)),
+                ('type_3_dense', models.BooleanField(default=False)),
+                ('type_3_solid', models.BooleanField(default=False)),
+                ('type_3_suspended', models.BooleanField(default=False)),
+                ('type_3_above_unheated_basement', models.BooleanField(default=False)),
+                ('type_3_heated_basement', models.BooleanField(default=False)),
+                ('type_3_no_heat_loss_ground_floor', models.BooleanField(default=False)),
+                ('type_3_sealed', models.BooleanField(default=False)),
+                ('type_3_ground_Floor_Dwelling_other', models.BooleanField(default=False)),
+                ('type_3_floor_insulation', models.CharField(blank=True, max_length=255, null=True)),
+                ('type_3_ground_Floor_insulation_none', models.BooleanField(default=False)),
+                ('type_3_ground_floor_construction_main_dwelling_eps', models.BooleanField(default=False)),
+                ('type_3_ground_floor_construction_main_dwelling_min_fibre', models.BooleanField(default=False)),
+                ('type_3_ground_floor_construction_main_dwelling_dense', models.BooleanField(default=False)),
+                ('type_3_ground_floor_construction_main_dwelling_unknow', models.BooleanField(default=False)),
+                ('type_4_stone', models.BooleanField(default=False)),
+                ('Type_4_solid_brick', models.BooleanField(default=False)),
+                ('type_4_cavity', models.BooleanField(default=False)),
+                ('type_4_solid_concrete', models.BooleanField(default=False)),
+                ('type_4_hollow_block', models.BooleanField(default=False)),
+                ('type_4_timber_frame', models.BooleanField(default=False)),
+                ('type_4_ther_unknown', models.BooleanField(default=False)),
+                ('type_4_ther_unknown_text', models.CharField(blank=True, max_length=255, null=True)),
+                ('type_4_insulation_thickness_observable', models.CharField(blank=True, max_length=255, null=True)),
+                ('type_4_pitched_insulation_btw_joists', models.BooleanField(default=False)),
+                ('type_4_pitched_insulation_in_rafters', models.BooleanField(default=False)),
+                ('type_4_Flat_insulation_integral', models.BooleanField(default=False)),
+                ('type_4_room_in_roof', models.BooleanField(default=False)),
+                ('type_4_no_heat_loss_roof', models.BooleanField(default=False)),
+                ('type_4_roof_Construction_Other', models.BooleanField(default=False)),
+                ('type_4_roof_Construction_Other_text', models.CharField(blank=True, max_length=255, null=True)),
+                ('type_4_thinkness', models.FloatField(blank=True, null=True)),
+                ('type_4_roof_construction_unknown', models.CharField(blank=True, null=True)),
+                ('type_4_fibre', models.BooleanField(default=False)),
+                ('type_4_warmcell', models.BooleanField(default=False)),
+                ('type_4_eps', models.BooleanField(default=False)),
+                ('type_4_dense', models.BooleanField(default=False)),
+                ('type_4_solid', models.BooleanField(default=False)),
+                ('type_4_suspended', models.BooleanField(default=False)),
+                ('type_4_above_unheated_basement', models.BooleanField(default=False)),
+                ('type_4_heated_basement', models.BooleanField(default=False)),
+                ('type_4_no_heat_loss_ground_floor', models.BooleanField(default=False)),
+                ('type_4_sealed', models.BooleanField(default=False)),
+                ('type_4_ground_Floor_Dwelling_other', models.BooleanField(default=False)),
+                ('type_4_floor_insulation', models.CharField(blank=True, max_length=255, null=True)),
+                ('type_4_ground_Floor_insulation_none', models.BooleanField(default=False)),
+                ('type_4_ground_floor_construction_main_dwelling_eps', models.BooleanField(default=False)),
+                ('type_4_ground_floor_construction_main_dwelling_min_fibre', models.BooleanField(default=False)),
+                ('type_4_ground_floor_construction_main_dwelling_dense', models.BooleanField(default=False)),
+                ('type_4_ground_floor_construction_main_dwelling_unknow', models.BooleanField(default=False)),
+                ('ground_storey_heigh', models.FloatField(blank=True, null=True)),
+                ('ground_total_floor_area', models.FloatField(blank=True, null=True)),
+                ('ground_heatloss_floor_1', models.FloatField(blank=True, null=True)),
+                ('ground_heatloss_floor_2', models.FloatField(blank=True, null=True)),
+                ('ground_heatloss_floor_3', models.FloatField(blank=True, null=True)),
+                ('ground_heatloss_floor_4', models.FloatField(blank=True, null=True)),
+                ('ground_heatloss_perimeter', models.FloatField(blank=True, null=True)),
+                ('ground_heatloss_wall_1', models.FloatField(blank=True, null=True)),
+                ('ground_heatloss_wall_2', models.FloatField(blank=True, null=True)),
+                ('ground_heatloss_wall_3', models.FloatField(blank=True, null=True)),
+                ('ground_heatloss_wall_4', models.FloatField(blank=True, null=True)),
+                ('ground_heatloss_roof_1', models.FloatField(blank=True, null=True)),
+                ('ground_heatloss_roof_2', models.FloatField(blank=True, null=True)),
+                ('ground_heatloss_roof_3', models.FloatField(blank=True, null=True)),
+                ('ground_heatloss_roof_4', models.FloatField(blank=True, null=True)),
+                ('first_storey_heigh', models.FloatField(blank=True, null=True)),
+                ('first_total_floor_area', models.FloatField(blank=True, null=True)),
+                ('first_heatloss_floor_1', models.FloatField(blank=True, null=True)),
+                ('first_heatloss_floor_2', models.FloatField(blank=True, null=True)),
+                ('first_heatloss_floor_3', models.FloatField(blank=True, null=True)),
+                ('first_heatloss_floor_4', models.FloatField(blank=True, null=True)),
+                ('first_heatloss_perimeter', models.FloatField(blank=True, null=True)),
+                ('first_heatloss_wall_1', models.FloatField(blank=True, null=True)),
+                ('first_heatloss_wall_2', models.FloatField(blank=True, null=True)),
+                ('first_heatloss_wall_3', models.FloatField(blank=True, null=True)),
+                ('first_heatloss_wall_4', models.FloatField(blank=True, null=True)),
+                ('first_heatloss_roof_1', models.FloatField(blank=True, null=True)),
+                ('first_heatloss_roof_2', models.FloatField(blank=True, null=True)),
+                ('first_heatloss_roof_3', models.FloatField(blank=True, null=True)),
+                ('first_heatloss_roof_4', models.FloatField(blank=True, null=True)),
+                ('second_storey_heigh', models.FloatField(blank=True, null=True)),
+                ('second_total_floor_area', models.FloatField(blank=True, null=True)),
+                ('second_heatloss_floor_1', models.FloatField(blank=True, null=True)),
+                ('second_heatloss_floor_2', models.FloatField(blank=True, null=True)),
+                ('second_heatloss_floor_3', models.FloatField(blank=True, null=True)),
+                ('second_heatloss_floor_4', models.FloatField(blank=True, null=True)),
+                ('second_heatloss_perimeter', models.FloatField(blank=True, null=True)),
+                ('second_heatloss_wall_1', models.FloatField(blank=True, null=True)),
+                ('second_heatloss_wall_2', models.FloatField(blank=True, null=True)),
+                ('second_heatloss_wall_3', models.FloatField(blank=True, null=True)),
+                ('second_heatloss_wall_4', models.FloatField(blank=True, null=True)),
+                ('second_heatloss_roof_1', models.FloatField(blank=True, null=True)),
+                ('second_heatloss_roof_2', models.FloatField(blank=True, null=True)),
+                ('second_heatloss_roof_3', models.FloatField(blank=True, null=True)),
+                ('second_heatloss_roof_4', models.FloatField(blank=True, null=True)),
+                ('third_storey_heigh', models.FloatField(blank=True, null=True)),
+                ('third_total_floor_area', models.FloatField(blank=True, null=True)),
+                ('third_heatloss_floor_1', models.FloatField(blank=True, null=True)),
+                ('third_heatloss_floor_2', models.FloatField(blank=True, null=True)),
+                ('third_heatloss_floor_3', models.FloatField(blank=True, null=True)),
+                ('third_heatloss_floor_4', models.FloatField(blank=True, null=True)),
+                ('third_heatloss_perimeter', models.FloatField(blank=True, null=True)),
+                ('third_heatloss_wall_1', models.FloatField(blank=True, null=True)),
+                ('third_heatloss_wall_2', models.FloatField(blank=True, null=True)),
+                ('third_heatloss_wall_3', models.FloatField(blank=True, null=True)),
+                ('third_heatloss_wall_4', models.FloatField(blank=True, null=True)),
+                ('third_heatloss_roof_1', models.FloatField(blank=True, null=True)),
+                ('third_heatloss_roof_2', models.FloatField(blank=True, null=True)),
+                ('third_heatloss_roof_3', models.FloatField(blank=True, null=True)),
+                ('third_heatloss_roof_4', models.FloatField(blank=True, null=True)),
+                ('basement_storey_heigh', models.FloatField(blank=True, null=True)),
+                ('basement_total_floor_area', models.FloatField(blank=True, null=True)),
+                ('basement_heatloss_floor_1', models.FloatField(blank=True, null=True)),
+                ('basement_heatloss_floor_2', models.FloatField(blank=True, null=True)),
+                ('basement_heatloss_floor_3', models.FloatField(blank=True, null=True)),
+                ('basement_heatloss_floor_4', models.FloatField(blank=True, null=True)),
+                ('basement_heatloss_perimeter', models.FloatField(blank=True, null=True)),
+                ('basement_heatloss_wall_1', models.FloatField(blank=True, null=True)),
+                ('basement_heatloss_wall_2', models.FloatField(blank=True, null=True)),
+                ('basement_heatloss_wall_3', models.FloatField(blank=True, null=True)),
+                ('basement_heatloss_wall_4', models.FloatField(blank=True, null=True)),
+                ('basement_heatloss_roof_1', models.FloatField(blank=True, null=True)),
+                ('basement_heatloss_roof_2', models.FloatField(blank=True, null=True)),
+                ('basement_heatloss_roof_3', models.FloatField(blank=True, null=True)),
+                ('basement_heatloss_roof_4', models.FloatField(blank=True, null=True)),
+                ('living_area', models.FloatField(blank=True, null=True)),
+                ('room_in_roof_area', models.FloatField(blank=True, null=True)),
+                ('f_type_1', models.FloatField(blank=True, null=True)),
+                ('f_type_2', models.FloatField(blank=True, null=True)),
+                ('f_type_3', models.FloatField(blank=True, null=True)),
+                ('external_wall_light', models.BooleanField(default=False)),
+                ('external_wall_med', models.BooleanField(default=False)),
+                ('external_wall_heavy', models.BooleanField(default=False)),
+                ('floor_light', models.BooleanField(default=False)),
+                ('floor_med', models.BooleanField(default=False)),
+                ('floor_heavy', models.BooleanField(default=False)),
+                ('separating_wall_light', models.BooleanField(default=False)),
+                ('separating_wall_med', models.BooleanField(default=False)),
+                ('separating_wall_heavy', models.BooleanField(default=False)),
+                ('internal_wall_light', models.BooleanField(default=False)),
+                ('internal_wall_med', models.BooleanField(default=False)),
+                ('internal_wall_heavy', models.BooleanField(default=False)),
+                ('overall_thermall_mass', models.CharField(blank=True, max_length=50, null=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='AssessmentHeating',
+            fields=[
+                ('assessment', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='heating', serialize=False, to='core.assesment')),
+                ('radiator_system_primary', models.BooleanField(default=False)),
+                ('storage_heaters_primary', models.BooleanField(default=False)),
+                ('underfloor_primary', models.BooleanField(default=False)),
+                ('warm_air_primary', models.BooleanField(default=False)),
+                ('room_heaters_only_primary', models.BooleanField(default=False)),
+                ('communtiy_primary', models.BooleanField(default=False)),
+                ('fan_coil_radiator_primay', models.BooleanField(default=False)),
+                ('other_primary_heating', models.BooleanField(default=False)),
+                ('other_primary_heating_text', models.CharField(blank=True, max_length=255, null=True)),
+                ('radiator_system_secondary', models.BooleanField(default=False)),
+                ('storage_heaters_secondary', models.BooleanField(default=False)),
+                ('underfloor_secondary', models.BooleanField(default=False)),
+                ('warm_air_secondary', models.BooleanField(default=False)),
+                ('room_heaters_only_secondary', models.BooleanField(default=False)),
+                ('communtiy_secondary', models.BooleanField(default=False)),
+                ('fan_coil_radiator_secondary', models.BooleanField(default=False)),
+                ('other_secondary_heating', models.BooleanField(default=False)),
+                ('other_secondary_heating_text', models.CharField(blank=True, max_length=255, null=True)),
+                ('main_gas', models.BooleanField(default=False)),
+                ('bulk_lpg', models.BooleanField(default=False)),
+                ('bottled_lpg', models.BooleanField(default=False)),
+                ('heating_oil', models.BooleanField(default=False)),
+                ('electricity', models.BooleanField(default=False)),
+                ('heat_from_chp', models.BooleanField(default=False)),
+                ('bioethanol', models.BooleanField(default=False)),
+                ('housecoal', models.BooleanField(default=False)),
+                ('anthracite', models.BooleanField(default=False)),
+                ('smokeless', models.BooleanField(default=False)),
+                ('peat_briquettes', models.BooleanField(default=False)),
+                ('sod_peat', models.BooleanField(default=False)),
+                ('wood_pellets', models.BooleanField(default=False)),
+                ('wood_chips', models.BooleanField(default=False)),
+                ('biodiesel', models.BooleanField(default=False)),
+                ('other_heating_system', models.BooleanField(default=False)),
+                ('other_heating_system_text', models.CharField(blank=True, max_length=255, null=True)),
+                ('main_gas_s', models.BooleanField(default=False)),
+                ('bulk_lpg_s', models.BooleanField(default=False)),
+                ('bottled_lpg_s', models.BooleanField(default=False)),
+                ('heating_oil_s', models.BooleanField(default=False)),
+                ('electricity_s', models.BooleanField(default=False)),
+                ('heat_from_chp_s', models.BooleanField(default=False)),
+                ('bioethanol_s', models.BooleanField(default=False)),
+                ('housecoal_s', models.BooleanField(default=False)),
+                ('anthracite_s', models.BooleanField(default=False)),
+                ('smokeless_s', models.BooleanField(default=False)),
+                ('peat_briquettes_s', models.BooleanField(default=False)),
+                ('sod_peat_s', models.BooleanField(default=False)),
+                ('wood_pellets_s', models.BooleanField(default=False)),
+                ('wood_chips_s', models.BooleanField(default=False)),
+                ('biodiesel_s', models.BooleanField(default=False)),
+                ('other_heating_system_s', models.BooleanField(default=False)),
+                ('other_heating_system_s_text', models.CharField(blank=True, max_length=255, null=True)),
+                ('gas_oil_lpg', models.CharField(blank=True, max_length=255, null=True)),
+                ('standard', models.BooleanField(default=False)),
+                ('Combi', models.BooleanField(default=False)),
+                ('condensing', models.BooleanField(default=False)),
+                ('back_boiler', models.BooleanField(default=False)),
+                ('cpsu', models.BooleanField(default=False)),
+                ('range_cooker', models.BooleanField(default=False)),
+                ('single_burner', models.BooleanField(default=False)),
+                ('twin_burner', models.BooleanField(default=False)),
+                ('open', models.BooleanField(default=False)),
+                ('balanced', models.BooleanField(default=False)),
+                ('fan_assisted', models.BooleanField(default=False)),
+                ('pre_1998_or_later', models.BooleanField(default=False)),
+                ('pre_1998', models.BooleanField(default=False)),
+                ('oil_pre_1985', models.BooleanField(default=False)),
+                ('gas_lpg_pre_1979', models.BooleanField(default=False)),
+                ('wall', models.BooleanField(default=False)),
+                ('floor', models.BooleanField(default=False)),
+                ('auto', models.BooleanField(default=False)),
+                ('permanent_pilot', models.BooleanField(default=False)),
+                ('gas_oil_manufacturer', models.CharField(blank=True, max_length=255, null=True)),
+                ('solid_fuel_boilers', models.CharField(blank=True, max_length=255, null=True)),
+                ('open_fire_back_boiler', models.BooleanField(default=False)),
+                ('closed_room_heater_back_boiler', models.BooleanField(default=False)),
+                ('grate', models.CharField(choices=[('Rectangular', 'rectangular'), ('Trapezium', 'trapezium')])),
+                ('manual_feed_boiler', models.CharField(blank=True, max_length=255, null=True)),
+                ('auto_feed_boiler', models.BooleanField(default=False)),
+                ('mf_af_boiler_heated_space', models.BooleanField(default=False)),
+                ('interal_oven', models.BooleanField(default=False)),
+                ('independant_oven', models.BooleanField(default=False)),
+                ('biomass_boiler', models.BooleanField(default=False)),
+                ('wood_chips_pellet_boiler', models.BooleanField(default=False)),
+                ('solid_fuel_manufacturer', models.CharField(default=False)),
+                ('electric_boilers', models.CharField(blank=True, max_length=255, null=True)),
+                ('direct_acting', models.BooleanField(default=False)),
+                ('dry_core', models.BooleanField(default=False)),
+                ('electric_boilers_cpsu', models.BooleanField(default=False)),
+                ('water_storage', models.BooleanField(default=False)),
+                ('dry_core_water_storage', models.BooleanField(default=False)),
+                ('comments_on_heating_system', models.CharField(blank=True, max_length=255, null=True)),
+                ('electric_storage_heater', models.CharField(blank=True, max_length=255, null=True)),
+                ('modern_slimeline', models.BooleanField(default=False)),
+                ('converter', models.BooleanField(default=False)),
+                ('electric_storage_heater_fan_assisted', models.BooleanField(default=False)),
+                ('old_pre_1980_volume', models.BooleanField(default=False)),
+                ('integrated_storage_direct_acting', models.BooleanField(default=False)),
+                ('manual_charge_control', models.BooleanField(default=False)),
+                ('automatic_weather_dependant', models.BooleanField(default=False)),
+                ('celect_type', models.BooleanField(default=False)),
+                ('gas_room_heaters', models.CharField(blank=True, max_length=255, null=True)),
+                ('gas_room_pre_1980', models.BooleanField(default=False)),
+                ('coal_effect_sealed_flue', models.BooleanField(default=False)),
+                ('coal_effect_open_to_chimney', models.BooleanField(default=False)),
+                ('flueless', models.BooleanField(default=False)),
+                ('gas_room_condensing', models.BooleanField(default=False)),
+                ('gas_room_back_boiler', models.BooleanField(default=False)),
+                ('gas_room_other', models.BooleanField(default=False)),
+                ('open_fronted', models.BooleanField(default=False)),
+                ('glass_fronted', models.BooleanField(default=False)),
+                ('flue_type_open', models.BooleanField(default=False)),
+                ('flue_type_balanced', models.BooleanField(default=False)),
+                ('flue_type_fan_assisted', models.BooleanField(default=False)),
+                ('warm_air_syetem', models.CharField(blank=True, max_length=255, null=True)),
+                ('ducted_or_stud_ducted_on_off', models.BooleanField(default=False)),
+                ('ducted_or_stud_ducted_modulating', models.BooleanField(default=False)),
+                ('features_fan_assited', models.BooleanField(default=False)),
+                ('features_fan_condensing', models.BooleanField(default=False)),
+                ('features_fan_flue_heat_recovery', models.BooleanField(default=False)),
+                ('room_heater_with_in_floor_ducts', models.BooleanField(default=False)),
+                ('electric_electricaire', models.BooleanField(default=False)),
+                ('oil_room_heaters', models.CharField(blank=True, max_length=255, null=True)),
+                ('room_heater_range', models.BooleanField(default=False)),
+                ('room_heater_range_boiler', models.BooleanField(default=False)),
+                ('oil_room_heaters_pre_2000', models.BooleanField(default=False)),
+                ('oil_room_heaters_2000_later', models.BooleanField(default=False)),
+                ('solid_fuel_room_heaters', models.CharField(blank=True, max_length=255, null=True)),
+                ('open_fire_in_grate', models.BooleanField(default=False)),
+                ('solid_fuel_open_fire_back_boiler', models.BooleanField(default=False)),
+                ('closed_room_heater', models.BooleanField(default=False)),
+                ('closed_room_heater_with_back_boiler', models.BooleanField(default=False)),
+                ('stove', models.BooleanField(default=False)),
+                ('flueless_bioethanol', models.BooleanField(default=False)),
+                ('heat_pump', models.CharField(blank=True, max_length=255, null=True)),
+                ('air_to_air', models.BooleanField(default=False)),
+                ('air_to_water', models.BooleanField(default=False)),
+                ('gas_fired_ground_watered', models.BooleanField(default=False)),
+                ('ground_to_air', models.BooleanField(default=False)),
+                ('ground_to_water', models.BooleanField(default=False)),
+                ('water_to_air', models.BooleanField(default=False)),
+                ('water_to_water', models.BooleanField(default=False)),
+                ('gas_fired_air_source', models.BooleanField(default=False)),
+                ('heat_pump_includes_auxiliary_electric_heaters', models.BooleanField(default=False)),
+                ('heat_pump_manufacturer', models.CharField(blank=True, max_length=255, null=True)),
+                ('electric_room_heater', models.CharField(blank=True, max_length=255, null=True)),
+                ('panel_converter_radiant_heater', models.BooleanField(default=False)),
+                ('fan_heater', models.BooleanField(default=False)),
+                ('secondary_heating_manufacturer', models.BooleanField(default=False)),
+                ('individual_chp', models.BooleanField(default=False)),
+                ('percentage_heat_from_chp', models.IntegerField(blank=True, null=True)),
+                ('electrical', models.IntegerField(blank=True, null=True)),
+                ('thermal', models.IntegerField(blank=True, null=True)),
+                ('fuel', models.CharField(blank=True, null=True)),
+                ('no_controls', models.BooleanField(default=False)),
+                ('programmer_time_clock', models.BooleanField(default=False)),
+                ('room_thermostat', models.BooleanField(default=False)),
+                ('number', models.CharField(blank=True, max_length=50, null=True)),
+                ('trvs', models.BooleanField(default=False)),
+                ('per_rads_trvs', models.CharField(blank=True, max_length=50, null=True)),
+                ('bypass', models.BooleanField(default=False)),
+                ('load_compensator', models.BooleanField(default=False)),
+                ('weather_compersator', models.BooleanField(default=False)),
+                ('full_zone_control', models.BooleanField(default=False)),
+                ('boiler_energy_management', models.BooleanField(default=False)),
+                ('delay_start_thermostat', models.BooleanField(default=False)),
+                ('boiler_interlock', models.BooleanField(default=False)),
+                ('appliances_thermostat', models.BooleanField(default=False)),
+                ('appliances_time_clock', models.BooleanField(default=False)),
+                ('in_insulated_timber_floor', models.BooleanField(default=False)),
+                ('in_screed', models.BooleanField(default=False)),
+                ('in_concrete', models.BooleanField(default=False)),
+                ('whole_house_UFH', models.BooleanField(default=False)),
+                ('partial_UFH_including_living_area', models.BooleanField(default=False)),
+                ('partial_UFH_not_including_living_area', models.BooleanField(default=False)),
+                ('central_heating_pumps_for_space_heating', models.IntegerField(blank=True, null=True)),
+                ('central_heating_pumps_outdoors', models.IntegerField(blank=True, null=True)),
+                ('oil_boiler_fuel_pumps', models.IntegerField(blank=True, null=True)),
+                ('oil_fuel_pumps_outdoors', models.IntegerField(blank=True, null=True)),
+                ('gas_boiler_flue_fans', models.IntegerField(blank=True, null=True)),
+                ('comments_on_heating_controls', models.BooleanField(default=False)),
+                ('pre_1991_full_flow_mid_high_temp_not_pre_insulated', models.BooleanField(default=False)),
+                ('pre_1991_full_flow_low_temp_pre_insulated', models.BooleanField(default=False)),
+                ('from_1991_or_later_variable_flow_mid_temp_pre_insulated', models.BooleanField(default=False)),
+                ('from_1991_or_later_variable_flow_low_temp_pre_insulated', models.BooleanField(default=False)),
+                ('consumption_charged_flat_rate', models.BooleanField(default=False)),
+                ('linked_to_use', models.BooleanField(default=False)),
+                ('efficiency', models.FloatField(blank=True, null=True)),
+                ('proportion_of_group_heating', models.FloatField(blank=True, null=True)),
+                ('fuel_type_heating_system', models.CharField(blank=True, null=True)),
+                ('heating_system_1_make_model', models.CharField(blank=True, null=True)),
+                ('efficiency_2', models.FloatField(blank=True, null=True)),
+                ('proportion_of_group_heating_2', models.FloatField(blank=True, null=True)),
+                ('fuel_type_heating_system_2', models.CharField(blank=True, null=True)),
+                ('heating_system_1_make_model_2', models.CharField(blank=True, null=True)),
+                ('group_heating_heat_from_chp', models.FloatField(blank=True, max_length=20, null=True)),
+                ('group_heating_power_station', models.BooleanField(default=False)),
+                ('group_heating_chp', models.BooleanField(default=False)),
+                ('group_heating_electrical', models.BooleanField(default=False)),
+                ('group_heating_thermal', models.BooleanField(default=False)),
+                ('group_heating_fuel', models.CharField(blank=True, max_length=50, null=True)),
+                ('group_heating_any_other_comment', models.CharField(blank=True, max_length=50, null=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='AssessmentHotWater',
+            fields=[
+                ('assessment', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='hot_water', serialize=False, to='core.assesment')),
+                ('from_primamry_heating_system', models.BooleanField(default=False)),
+                ('electric_immersion', models.BooleanField(default=False)),
+                ('electric_instantaneoues', models.BooleanField(default=False)),
+                ('gas_instant_single_point', models.BooleanField(default=False)),
+                ('gas_instant_multi_point', models.BooleanField(default=False)),
+                ('gas_circulator_pre_1998', models.BooleanField(default=False)),
+                ('keep_hot_facility_controlled_by', models.BooleanField(default=False)),
+                ('less_than_55_liters', models.BooleanField(default=False)),
+                ('greater_than_50', models.BooleanField(default=False)),
+                ('backboiler_kitchen_rage', models.BooleanField(default=False)),
+                ('primamry_heating_gas', models.BooleanField(default=False)),
+                ('primamry_heating_oil', models.BooleanField(default=False)),
+                ('primamry_heating_sf', models.BooleanField(default=False)),
+                ('primamry_heating_gas_circulator_1998_later', models.BooleanField(default=False)),
+                ('time_clock', models.BooleanField(default=False)),
+                ('no_time_clock', models.BooleanField(default=False)),
+                ('hot_water_cylinder', models.CharField(blank=True, max_length=255, null=True)),
+                ('no_access', models.BooleanField(default=False)),
+                ('Capacity_liters_dimensions', models.CharField(blank=True, max_length=50, null=True)),
+                ('no_insulations', models.BooleanField(default=False)),
+                ('laggin_jacket', models.BooleanField(default=False)),
+                ('factory_fitted', models.BooleanField(default=False)),
+                ('hot_water_cylinder_pipework_insulated', models.BooleanField(default=False)),
+                ('insulation_thickness', models.CharField(blank=True, max_length=50, null=True)),
+                ('cylinder_thermostat', models.BooleanField(default=False)),
+                ('independant_timeer', models.BooleanField(default=False)),
+                ('storage_is_outdoors', models.BooleanField(default=False)),
+                ('solar_water_haeting', models.CharField(blank=True, max_length=255, null=True)),
+                ('evacuated_tube', models.BooleanField(default=False)),
+                ('flat_plate_glazed', models.BooleanField(default=False)),
+                ('flat_plate_unglazed', models.BooleanField(default=False)),
+                ('solar_collector_area', models.CharField(blank=True, max_length=50, null=True)),
+                ('very_little_less_20_per', models.BooleanField(default=False)),
+                ('significant_sixty_to_eighty_per', models.BooleanField(default=False)),
+                ('dedicated_solar_storage_volume', models.CharField(blank=True, max_length=50, null=True)),
+                ('contained_within_combained_cylinder', models.BooleanField(default=False)),
+                ('contained_within_separate_cylinder', models.BooleanField(default=False)),
+                ('orientation', models.CharField(blank=True, max_length=50, null=True)),
+                ('tilt', models.CharField(blank=True, max_length=50, null=True)),
+                ('area_is_gross', models.BooleanField(default=False)),
+                ('area_is_aperture', models.BooleanField(default=False)),
+                ('modest_twenty_to_sixty', models.BooleanField(default=False)),
+                ('heavy_more_than_eighty', models.BooleanField(default=False)),
+                ('solar_panel_make_model', models.CharField(blank=True, max_length=100, null=True)),
+                ('supplementary_hot_water_not_applicable', models.BooleanField(default=False)),
+                ('electric_heater_present_for_supplementary', models.BooleanField(default=False)),
+                ('Comments_on_water_heating', models.CharField(blank=True, max_length=200, null=True)),
+                ('shower_dwelling', models.BooleanField(default=False)),
+                ('shower_water_use_target', models.BooleanField(default=False)),
+                ('shower_1_flow_rate_known', models.CharField(blank=True, max_length=100, null=True)),
+                ('shower_1_type', models.CharField(blank=True, max_length=100, null=True)),
+                ('shower_1_flow_restrictor', models.CharField(blank=True, max_length=100, null=True)),
+                ('Shower_1_flow_rate', models.CharField(blank=True, max_length=100, null=True)),
+                ('Shower_1_whhr_1', models.CharField(blank=True, max_length=100, null=True)),
+                ('Shower_1_whhr_2', models.CharField(blank=True, max_length=100, null=True)),
+                ('shower_2_flow_rate_known', models.CharField(blank=True, max_length=100, null=True)),
+                ('shower_2_type', models.CharField(blank=True, max_length=100, null=True)),
+                ('shower_2_flow_restrictor', models.CharField(blank=True, max_length=100, null=True)),
+                ('Shower_2_flow_rate', models.CharField(blank=True, max_length=100, null=True)),
+                ('Shower_2_whhr_1', models.CharField(blank=True, max_length=100, null=True)),
+                ('Shower_2_whhr_2', models.CharField(blank=True, max_length=100, null=True)),
+                ('shower_3_flow_rate_known', models.CharField(blank=True, max_length=100, null=True)),
+                ('shower_3_type', models.CharField(blank=True, max_length=100, null=True)),
+                ('shower_3_flow_restrictor', models.CharField(blank=True, max_length=100, null=True)),
+                ('Shower_3_flow_rate', models.CharField(blank=True, max_length=100, null=True)),
+                ('Shower_3_whhr_1', models.CharField(blank=True, max_length=100, null=True)),
+                ('Shower_3_whhr_2', models.CharField(blank=True, max_length=100, null=True)),
+                ('shower_4_flow_rate_known', models.CharField(blank=True, max_length=100, null=True)),
+                ('shower_4_type', models.CharField(blank=True, max_length=100, null=True)),
+                ('shower_4_flow_restrictor', models.CharField(blank=True, max_length=100, null=True)),
+                ('Shower_4_flow_rate', models.CharField(blank=True, max_length=100, null=True)),
+                ('Shower_4_whhr_1', models.CharField(blank=True, max_length=100, null=True)),
+                ('Shower_4_whhr_2', models.CharField(blank=True, max_length=100, null=True)),
+                ('shower_5_flow_rate_known', models.CharField(blank=True, max_length=100, null=True)),
+                ('shower_5_type', models.CharField(blank=True, max_length=100, null=True)),
+                ('shower_5_flow_restrictor', models.CharField(blank=True, max_length=100, null=True)),
+                ('Shower_5_flow_rate', models.CharField(blank=True, max_length=100, null=True)),
+                ('Shower_5_whhr_1', models.CharField(blank=True, max_length=100, null=True)),
+                ('Shower_5_whhr_2', models.CharField(blank=True, max_length=100, null=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='AssessmentRooms',
+            fields=[
+                ('assessment', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='rooms', serialize=False, to='core.assesment')),
+                ('room_1_opening', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_1_opening_dimensions', models.FloatField(blank=True, null=True)),
+                ('room_1_glazing_details', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_1_frame', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_1_gap', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_1_over_shading', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_1_direction', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_1_wall_roof_type', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_1_openable_windows_doors', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_1_windows_doors', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_2_opening', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_2_opening_dimensions', models.FloatField(blank=True, null=True)),
+                ('room_2_glazing_details', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_2_frame', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_2_gap', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_2_over_shading', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_2_direction', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_2_wall_roof_type', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_2_openable_windows_doors', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_2_windows_doors', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_3_opening', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_3_opening_dimensions', models.FloatField(blank=True, null=True)),
+                ('room_3_glazing_details', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_3_frame', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_3_gap', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_3_over_shading', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_3_direction', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_3_wall_roof_type', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_3_openable_windows_doors', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_3_windows_doors', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_4_opening', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_4_opening_dimensions', models.FloatField(blank=True, null=True)),
+                ('room_4_glazing_details', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_4_frame', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_4_gap', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_4_over_shading', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_4_direction', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_4_wall_roof_type', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_4_openable_windows_doors', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_4_windows_doors', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_5_opening', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_5_opening_dimensions', models.FloatField(blank=True, null=True)),
+                ('room_5_glazing_details', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_5_frame', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_5_gap', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_5_over_shading', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_5_direction', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_5_wall_roof_type', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_5_openable_windows_doors', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_5_windows_doors', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_1_chimney_flueless', models.FloatField(blank=True, null=True)),
+                ('room_1_open_flues', models.FloatField(blank=True, null=True)),
+                ('room_1_fans_vents', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_1_rads_with_or_trvs', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_1_number_of_fixed_lights', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_1_type_of_fixed_light', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_2_chimney_flueless', models.FloatField(blank=True, null=True)),
+                ('room_2_open_flues', models.FloatField(blank=True, null=True)),
+                ('room_2_fans_vents', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_2_rads_with_or_trvs', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_2_number_of_fixed_lights', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_2_type_of_fixed_light', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_3_chimney_flueless', models.FloatField(blank=True, null=True)),
+                ('room_3_open_flues', models.FloatField(blank=True, null=True)),
+                ('room_3_fans_vents', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_3_rads_with_or_trvs', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_3_number_of_fixed_lights', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_3_type_of_fixed_light', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_4_chimney_flueless', models.FloatField(blank=True, null=True)),
+                ('room_4_open_flues', models.FloatField(blank=True, null=True)),
+                ('room_4_fans_vents', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_4_rads_with_or_trvs', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_4_number_of_fixed_lights', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_4_type_of_fixed_light', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_5_chimney_flueless', models.FloatField(blank=True, null=True)),
+                ('room_5_open_flues', models.FloatField(blank=True, null=True)),
+                ('room_5_fans_vents', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_5_rads_with_or_trvs', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_5_number_of_fixed_lights', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_5_type_of_fixed_light', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_opening_total', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_opening_dimensions_totaL', models.FloatField(blank=True, null=True)),
+                ('room_glazing_details_total', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_frame_total', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_gap_total', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_over_shading_total', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_direction_total', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_wall_roof_type_total', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_openable_windows_doors_total', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_windows_doors_total', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_chimney_flueless_total', models.FloatField(blank=True, null=True)),
+                ('room_open_flues_total', models.FloatField(blank=True, null=True)),
+                ('room_fans_vents_total', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_rads_with_or_trvs_total', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_number_of_fixed_lights_total', models.CharField(blank=True, max_length=20, null=True)),
+                ('room_type_of_fixed_light_total', models.CharField(blank=True, max_length=20, null=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='AssessmentVentilation',
+            fields=[
+                ('assessment', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='ventilation', serialize=False, to='core.assesment')),
+                ('draught_lobby_on_main_entrance', models.CharField(blank=True, max_length=255, null=True)),
+                ('pressure_test_results_available', models.BooleanField(blank=True, null=True)),
+                ('if_yes_enter_adjusted_results', models.CharField(blank=True, null=True)),
+                ('is_there_uninsulated_ductng_on_mvhr', models.CharField(blank=True, max_length=255, null=True)),
+                ('number_of_sides_sheltered', models.CharField(blank=True, null=True)),
+                ('pressure_test_resut_reference_number', models.CharField(blank=True, max_length=255, null=True)),
+                ('natural_ventilation', models.BooleanField(default=False)),
+                ('positive_input_ventilation_from_loft', models.BooleanField(default=False)),
+                ('positive_input_ventilation_from_outside', models.BooleanField(default=False)),
+                ('whole_house_extract_ventilation', models.BooleanField(default=False)),
+                ('balanceed_whole_mechanical_ventilation', models.BooleanField(default=False)),
+                ('exhaust_air_heat_pump', models.BooleanField(default=False)),
+                ('air_flow_rate_to_eahp', models.BooleanField(default=False)),
+                ('linear_flourescent', models.IntegerField(blank=True, null=True)),
+                ('led', models.IntegerField(blank=True, null=True)),
+                ('hologen_lv', models.IntegerField(blank=True, null=True)),
+                ('cfl', models.IntegerField(blank=True, null=True)),
+                ('halogen_lamps', models.IntegerField(blank=True, null=True)),
+                ('incadescent_unknown', models.CharField(blank=True, max_length=255, null=True)),
+                ('draughts_tripping', models.FloatField(blank=True, null=True)),
+                ('lighting_design', models.CharField(blank=True, max_length=50, null=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.RunPython(copy_into_sections, copy_back_from_sections),
+    ]
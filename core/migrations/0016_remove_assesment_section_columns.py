@@ -0,0 +1,651 @@
+# Generated by Django 5.1.4 on 2026-10-18 12:16
+
+from django.db import migrations
+
+from core.migration_operations import RemoveFields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_assessment_sections'),
+    ]
+
+    operations = [
+        RemoveFields(
+            model_name='assesment',
+            names=[
+                'Capacity_liters_dimensions',
+                'Combi',
+                'Comments_on_water_heating',
+                'Flat_insulation_integral',
+                'Ground_Floor_Construction_Main_Dwelling_dense',
+                'Ground_Floor_Construction_Main_Dwelling_eps',
+                'Ground_Floor_Construction_Main_Dwelling_min_fibre',
+                'Ground_Floor_Construction_Main_Dwelling_unknow',
+                'Shower_1_flow_rate',
+                'Shower_1_whhr_1',
+                'Shower_1_whhr_2',
+                'Shower_2_flow_rate',
+                'Shower_2_whhr_1',
+                'Shower_2_whhr_2',
+                'Shower_3_flow_rate',
+                'Shower_3_whhr_1',
+                'Shower_3_whhr_2',
+                'Shower_4_flow_rate',
+                'Shower_4_whhr_1',
+                'Shower_4_whhr_2',
+                'Shower_5_flow_rate',
+                'Shower_5_whhr_1',
+                'Shower_5_whhr_2',
+                'Type_2_solid_brick',
+                'Type_3_solid_brick',
+                'Type_4_solid_brick',
+                'above_unheated_basement',
+                'air_flow_rate_to_eahp',
+                'air_to_air',
+                'air_to_water',
+                'anthracite',
+                'anthracite_s',
+                'appliances_thermostat',
+                'appliances_time_clock',
+                'area_is_aperture',
+                'area_is_gross',
+                'auto',
+                'auto_feed_boiler',
+                'automatic_weather_dependant',
+                'back_boiler',
+                'backboiler_kitchen_rage',
+                'balanced',
+                'balanceed_whole_mechanical_ventilation',
+                'basement_heatloss_floor_1',
+                'basement_heatloss_floor_2',
+                'basement_heatloss_floor_3',
+                'basement_heatloss_floor_4',
+                'basement_heatloss_perimeter',
+                'basement_heatloss_roof_1',
+                'basement_heatloss_roof_2',
+                'basement_heatloss_roof_3',
+                'basement_heatloss_roof_4',
+                'basement_heatloss_wall_1',
+                'basement_heatloss_wall_2',
+                'basement_heatloss_wall_3',
+                'basement_heatloss_wall_4',
+                'basement_storey_heigh',
+                'basement_total_floor_area',
+                'biodiesel',
+                'biodiesel_s',
+                'bioethanol',
+                'bioethanol_s',
+                'biomass_boiler',
+                'boiler_energy_management',
+                'boiler_interlock',
+                'bottled_lpg',
+                'bottled_lpg_s',
+                'bulk_lpg',
+                'bulk_lpg_s',
+                'bypass',
+                'cavity',
+                'celect_type',
+                'central_heating_pumps_for_space_heating',
+                'central_heating_pumps_outdoors',
+                'cfl',
+                'closed_room_heater',
+                'closed_room_heater_back_boiler',
+                'closed_room_heater_with_back_boiler',
+                'coal_effect_open_to_chimney',
+                'coal_effect_sealed_flue',
+                'comments_on_heating_controls',
+                'comments_on_heating_system',
+                'communtiy_primary',
+                'communtiy_secondary',
+                'condensing',
+                'consumption_charged_flat_rate',
+                'contained_within_combained_cylinder',
+                'contained_within_separate_cylinder',
+                'converter',
+                'cpsu',
+                'cylinder_thermostat',
+                'dedicated_solar_storage_volume',
+                'delay_start_thermostat',
+                'dense',
+                'direct_acting',
+                'draught_lobby_on_main_entrance',
+                'draughts_tripping',
+                'dry_core',
+                'dry_core_water_storage',
+                'ducted_or_stud_ducted_modulating',
+                'ducted_or_stud_ducted_on_off',
+                'efficiency',
+                'efficiency_2',
+                'electric_boilers',
+                'electric_boilers_cpsu',
+                'electric_electricaire',
+                'electric_heater_present_for_supplementary',
+                'electric_immersion',
+                'electric_instantaneoues',
+                'electric_room_heater',
+                'electric_storage_heater',
+                'electric_storage_heater_fan_assisted',
+                'electrical',
+                'electricity',
+                'electricity_s',
+                'eps',
+                'evacuated_tube',
+                'exhaust_air_heat_pump',
+                'external_wall_heavy',
+                'external_wall_light',
+                'external_wall_med',
+                'f_type_1',
+                'f_type_2',
+                'f_type_3',
+                'factory_fitted',
+                'fan_assisted',
+                'fan_coil_radiator_primay',
+                'fan_coil_radiator_secondary',
+                'fan_heater',
+                'features_fan_assited',
+                'features_fan_condensing',
+                'features_fan_flue_heat_recovery',
+                'fibre',
+                'first_heatloss_floor_1',
+                'first_heatloss_floor_2',
+                'first_heatloss_floor_3',
+                'first_heatloss_floor_4',
+                'first_heatloss_perimeter',
+                'first_heatloss_roof_1',
+                'first_heatloss_roof_2',
+                'first_heatloss_roof_3',
+                'first_heatloss_roof_4',
+                'first_heatloss_wall_1',
+                'first_heatloss_wall_2',
+                'first_heatloss_wall_3',
+                'first_heatloss_wall_4',
+                'first_storey_heigh',
+                'first_total_floor_area',
+                'flat_plate_glazed',
+                'flat_plate_unglazed',
+                'floor',
+                'floor_heavy',
+                'floor_insulation',
+                'floor_light',
+                'floor_med',
+                'flue_type_balanced',
+                'flue_type_fan_assisted',
+                'flue_type_open',
+                'flueless',
+                'flueless_bioethanol',
+                'from_1991_or_later_variable_flow_low_temp_pre_insulated',
+                'from_1991_or_later_variable_flow_mid_temp_pre_insulated',
+                'from_primamry_heating_system',
+                'fuel',
+                'fuel_type_heating_system',
+                'fuel_type_heating_system_2',
+                'full_zone_control',
+                'gas_boiler_flue_fans',
+                'gas_circulator_pre_1998',
+                'gas_fired_air_source',
+                'gas_fired_ground_watered',
+                'gas_instant_multi_point',
+                'gas_instant_single_point',
+                'gas_lpg_pre_1979',
+                'gas_oil_lpg',
+                'gas_oil_manufacturer',
+                'gas_room_back_boiler',
+                'gas_room_condensing',
+                'gas_room_heaters',
+                'gas_room_other',
+                'gas_room_pre_1980',
+                'glass_fronted',
+                'grate',
+                'greater_than_50',
+                'ground_Floor_Dwelling_other',
+                'ground_Floor_insulation_none',
+                'ground_heatloss_floor_1',
+                'ground_heatloss_floor_2',
+                'ground_heatloss_floor_3',
+                'ground_heatloss_floor_4',
+                'ground_heatloss_perimeter',
+                'ground_heatloss_roof_1',
+                'ground_heatloss_roof_2',
+                'ground_heatloss_roof_3',
+                'ground_heatloss_roof_4',
+                'ground_heatloss_wall_1',
+                'ground_heatloss_wall_2',
+                'ground_heatloss_wall_3',
+                'ground_heatloss_wall_4',
+                'ground_storey_heigh',
+                'ground_to_air',
+                'ground_to_water',
+                'ground_total_floor_area',
+                'group_heating_any_other_comment',
+                'group_heating_chp',
+                'group_heating_electrical',
+                'group_heating_fuel',
+                'group_heating_heat_from_chp',
+                'group_heating_power_station',
+                'group_heating_thermal',
+                'halogen_lamps',
+                'heat_from_chp',
+                'heat_from_chp_s',
+                'heat_pump',
+                'heat_pump_includes_auxiliary_electric_heaters',
+                'heat_pump_manufacturer',
+                'heated_basement',
+                'heating_oil',
+                'heating_oil_s',
+                'heating_system_1_make_model',
+                'heating_system_1_make_model_2',
+                'heavy_more_than_eighty',
+                'hollow_block',
+                'hologen_lv',
+                'hot_water_cylinder',
+                'hot_water_cylinder_pipework_insulated',
+                'housecoal',
+                'housecoal_s',
+                'if_yes_enter_adjusted_results',
+                'in_concrete',
+                'in_insulated_timber_floor',
+                'in_screed',
+                'incadescent_unknown',
+                'independant_oven',
+                'independant_timeer',
+                'individual_chp',
+                'insulation_thickness',
+                'insulation_thickness_observable',
+                'integrated_storage_direct_acting',
+                'interal_oven',
+                'internal_wall_heavy',
+                'internal_wall_light',
+                'internal_wall_med',
+                'is_there_uninsulated_ductng_on_mvhr',
+                'keep_hot_facility_controlled_by',
+                'laggin_jacket',
+                'led',
+                'less_than_55_liters',
+                'lighting_design',
+                'linear_flourescent',
+                'linked_to_use',
+                'living_area',
+                'load_compensator',
+                'main_gas',
+                'main_gas_s',
+                'manual_charge_control',
+                'manual_feed_boiler',
+                'mf_af_boiler_heated_space',
+                'modern_slimeline',
+                'modest_twenty_to_sixty',
+                'natural_ventilation',
+                'no_access',
+                'no_controls',
+                'no_heat_loss_ground_floor',
+                'no_heat_loss_roof',
+                'no_insulations',
+                'no_time_clock',
+                'number',
+                'number_of_sides_sheltered',
+                'oil_boiler_fuel_pumps',
+                'oil_fuel_pumps_outdoors',
+                'oil_pre_1985',
+                'oil_room_heaters',
+                'oil_room_heaters_2000_later',
+                'oil_room_heaters_pre_2000',
+                'old_pre_1980_volume',
+                'open',
+                'open_fire_back_boiler',
+                'open_fire_in_grate',
+                'open_fronted',
+                'orientation',
+                'other_heating_system',
+                'other_heating_system_s',
+                'other_heating_system_s_text',
+                'other_heating_system_text',
+                'other_primary_heating',
+                'other_primary_heating_text',
+                'other_secondary_heating',
+                'other_secondary_heating_text',
+                'other_unknow_text',
+                'other_unknown',
+                'overall_thermall_mass',
+                'panel_converter_radiant_heater',
+                'partial_UFH_including_living_area',
+                'partial_UFH_not_including_living_area',
+                'peat_briquettes',
+                'peat_briquettes_s',
+                'per_rads_trvs',
+                'percentage_heat_from_chp',
+                'permanent_pilot',
+                'pitched_insulation_btw_joists',
+                'pitched_insulation_in_rafters',
+                'positive_input_ventilation_from_loft',
+                'positive_input_ventilation_from_outside',
+                'pre_1991_full_flow_low_temp_pre_insulated',
+                'pre_1991_full_flow_mid_high_temp_not_pre_insulated',
+                'pre_1998',
+                'pre_1998_or_later',
+                'pressure_test_results_available',
+                'pressure_test_resut_reference_number',
+                'primamry_heating_gas',
+                'primamry_heating_gas_circulator_1998_later',
+                'primamry_heating_oil',
+                'primamry_heating_sf',
+                'programmer_time_clock',
+                'proportion_of_group_heating',
+                'proportion_of_group_heating_2',
+                'radiator_system_primary',
+                'radiator_system_secondary',
+                'range_cooker',
+                'roof_Construction_Other',
+                'roof_Construction_Other_text',
+                'roof_construction_unknown',
+                'room_1_chimney_flueless',
+                'room_1_direction',
+                'room_1_fans_vents',
+                'room_1_frame',
+                'room_1_gap',
+                'room_1_glazing_details',
+                'room_1_number_of_fixed_lights',
+                'room_1_open_flues',
+                'room_1_openable_windows_doors',
+                'room_1_opening',
+                'room_1_opening_dimensions',
+                'room_1_over_shading',
+                'room_1_rads_with_or_trvs',
+                'room_1_type_of_fixed_light',
+                'room_1_wall_roof_type',
+                'room_1_windows_doors',
+                'room_2_chimney_flueless',
+                'room_2_direction',
+                'room_2_fans_vents',
+                'room_2_frame',
+                'room_2_gap',
+                'room_2_glazing_details',
+                'room_2_number_of_fixed_lights',
+                'room_2_open_flues',
+                'room_2_openable_windows_doors',
+                'room_2_opening',
+                'room_2_opening_dimensions',
+                'room_2_over_shading',
+                'room_2_rads_with_or_trvs',
+                'room_2_type_of_fixed_light',
+                'room_2_wall_roof_type',
+                'room_2_windows_doors',
+                'room_3_chimney_flueless',
+                'room_3_direction',
+                'room_3_fans_vents',
+                'room_3_frame',
+                'room_3_gap',
+                'room_3_glazing_details',
+                'room_3_number_of_fixed_lights',
+                'room_3_open_flues',
+                'room_3_openable_windows_doors',
+                'room_3_opening',
+                'room_3_opening_dimensions',
+                'room_3_over_shading',
+                'room_3_rads_with_or_trvs',
+                'room_3_type_of_fixed_light',
+                'room_3_wall_roof_type',
+                'room_3_windows_doors',
+                'room_4_chimney_flueless',
+                'room_4_direction',
+                'room_4_fans_vents',
+                'room_4_frame',
+                'room_4_gap',
+                'room_4_glazing_details',
+                'room_4_number_of_fixed_lights',
+                'room_4_open_flues',
+                'room_4_openable_windows_doors',
+                'room_4_opening',
+                'room_4_opening_dimensions',
+                'room_4_over_shading',
+                'room_4_rads_with_or_trvs',
+                'room_4_type_of_fixed_light',
+                'room_4_wall_roof_type',
+                'room_4_windows_doors',
+                'room_5_chimney_flueless',
+                'room_5_direction',
+                'room_5_fans_vents',
+                'room_5_frame',
+                'room_5_gap',
+                'room_5_glazing_details',
+                'room_5_number_of_fixed_lights',
+                'room_5_open_flues',
+                'room_5_openable_windows_doors',
+                'room_5_opening',
+                'room_5_opening_dimensions',
+                'room_5_over_shading',
+                'room_5_rads_with_or_trvs',
+                'room_5_type_of_fixed_light',
+                'room_5_wall_roof_type',
+                'room_5_windows_doors',
+                'room_chimney_flueless_total',
+                'room_direction_total',
+                'room_fans_vents_total',
+                'room_frame_total',
+                'room_gap_total',
+                'room_glazing_details_total',
+                'room_heater_range',
+                'room_heater_range_boiler',
+                'room_heater_with_in_floor_ducts',
+                'room_heaters_only_primary',
+                'room_heaters_only_secondary',
+                'room_in_roof',
+                'room_in_roof_area',
+                'room_number_of_fixed_lights_total',
+                'room_open_flues_total',
+                'room_openable_windows_doors_total',
+                'room_opening_dimensions_totaL',
+                'room_opening_total',
+                'room_over_shading_total',
+                'room_rads_with_or_trvs_total',
+                'room_thermostat',
+                'room_type_of_fixed_light_total',
+                'room_wall_roof_type_total',
+                'room_windows_doors_total',
+                'sealed',
+                'second_heatloss_floor_1',
+                'second_heatloss_floor_2',
+                'second_heatloss_floor_3',
+                'second_heatloss_floor_4',
+                'second_heatloss_perimeter',
+                'second_heatloss_roof_1',
+                'second_heatloss_roof_2',
+                'second_heatloss_roof_3',
+                'second_heatloss_roof_4',
+                'second_heatloss_wall_1',
+                'second_heatloss_wall_2',
+                'second_heatloss_wall_3',
+                'second_heatloss_wall_4',
+                'second_storey_heigh',
+                'second_total_floor_area',
+                'secondary_heating_manufacturer',
+                'separating_wall_heavy',
+                'separating_wall_light',
+                'separating_wall_med',
+                'shower_1_flow_rate_known',
+                'shower_1_flow_restrictor',
+                'shower_1_type',
+                'shower_2_flow_rate_known',
+                'shower_2_flow_restrictor',
+                'shower_2_type',
+                'shower_3_flow_rate_known',
+                'shower_3_flow_restrictor',
+                'shower_3_type',
+                'shower_4_flow_rate_known',
+                'shower_4_flow_restrictor',
+                'shower_4_type',
+                'shower_5_flow_rate_known',
+                'shower_5_flow_restrictor',
+                'shower_5_type',
+                'shower_dwelling',
+                'shower_water_use_target',
+                'significant_sixty_to_eighty_per',
+                'single_burner',
+                'smokeless',
+                'smokeless_s',
+                'sod_peat',
+                'sod_peat_s',
+                'solar_collector_area',
+                'solar_panel_make_model',
+                'solar_water_haeting',
+                'solid',
+                'solid_brick',
+                'solid_concrete',
+                'solid_fuel_boilers',
+                'solid_fuel_manufacturer',
+                'solid_fuel_open_fire_back_boiler',
+                'solid_fuel_room_heaters',
+                'standard',
+                'stone',
+                'storage_heaters_primary',
+                'storage_heaters_secondary',
+                'storage_is_outdoors',
+                'stove',
+                'supplementary_hot_water_not_applicable',
+                'suspended',
+                'thermal',
+                'thinkness',
+                'third_heatloss_floor_1',
+                'third_heatloss_floor_2',
+                'third_heatloss_floor_3',
+                'third_heatloss_floor_4',
+                'third_heatloss_perimeter',
+                'third_heatloss_roof_1',
+                'third_heatloss_roof_2',
+                'third_heatloss_roof_3',
+                'third_heatloss_roof_4',
+                'third_heatloss_wall_1',
+                'third_heatloss_wall_2',
+                'third_heatloss_wall_3',
+                'third_heatloss_wall_4',
+                'third_storey_heigh',
+                'third_total_floor_area',
+                'tilt',
+                'timber_frame',
+                'time_clock',
+                'trvs',
+                'twin_burner',
+                'type_2_Flat_insulation_integral',
+                'type_2_above_unheated_basement',
+                'type_2_cavity',
+                'type_2_dense',
+                'type_2_eps',
+                'type_2_fibre',
+                'type_2_floor_insulation',
+                'type_2_ground_Floor_Dwelling_other',
+                'type_2_ground_Floor_insulation_none',
+                'type_2_ground_floor_construction_main_dwelling_dense',
+                'type_2_ground_floor_construction_main_dwelling_eps',
+                'type_2_ground_floor_construction_main_dwelling_min_fibre',
+                'type_2_ground_floor_construction_main_dwelling_unknow',
+                'type_2_heated_basement',
+                'type_2_hollow_block',
+                'type_2_insulation_thickness_observable',
+                'type_2_no_heat_loss_ground_floor',
+                'type_2_no_heat_loss_roof',
+                'type_2_other_text',
+                'type_2_other_unknown',
+                'type_2_pitched_insulation_btw_joists',
+                'type_2_pitched_insulation_in_rafters',
+                'type_2_roof_Construction_Other',
+                'type_2_roof_Construction_Other_text',
+                'type_2_roof_construction_unknown',
+                'type_2_room_in_roof',
+                'type_2_sealed',
+                'type_2_solid',
+                'type_2_solid_concrete',
+                'type_2_stone',
+                'type_2_suspended',
+                'type_2_thinkness',
+                'type_2_timber_frame',
+                'type_2_warmcell',
+                'type_3_Flat_insulation_integral',
+                'type_3_above_unheated_basement',
+                'type_3_cavity',
+                'type_3_dense',
+                'type_3_eps',
+                'type_3_fibre',
+                'type_3_floor_insulation',
+                'type_3_ground_Floor_Dwelling_other',
+                'type_3_ground_Floor_insulation_none',
+                'type_3_ground_floor_construction_main_dwelling_dense',
+                'type_3_ground_floor_construction_main_dwelling_eps',
+                'type_3_ground_floor_construction_main_dwelling_min_fibre',
+                'type_3_ground_floor_construction_main_dwelling_unknow',
+                'type_3_heated_basement',
+                'type_3_hollow_block',
+                'type_3_insulation_thickness_observable',
+                'type_3_no_heat_loss_ground_floor',
+                'type_3_no_heat_loss_roof',
+                'type_3_pitched_insulation_btw_joists',
+                'type_3_pitched_insulation_in_rafters',
+                'type_3_roof_Construction_Other',
+                'type_3_roof_Construction_Other_text',
+                'type_3_roof_construction_unknown',
+                'type_3_room_in_roof',
+                'type_3_sealed',
+                'type_3_solid',
+                'type_3_solid_concrete',
+                'type_3_stone',
+                'type_3_suspended',
+                'type_3_ther_unknown',
+                'type_3_ther_unknown_text',
+                'type_3_thinkness',
+                'type_3_timber_frame',
+                'type_3_warmcell',
+                'type_4_Flat_insulation_integral',
+                'type_4_above_unheated_basement',
+                'type_4_cavity',
+                'type_4_dense',
+                'type_4_eps',
+                'type_4_fibre',
+                'type_4_floor_insulation',
+                'type_4_ground_Floor_Dwelling_other',
+                'type_4_ground_Floor_insulation_none',
+                'type_4_ground_floor_construction_main_dwelling_dense',
+                'type_4_ground_floor_construction_main_dwelling_eps',
+                'type_4_ground_floor_construction_main_dwelling_min_fibre',
+                'type_4_ground_floor_construction_main_dwelling_unknow',
+                'type_4_heated_basement',
+                'type_4_hollow_block',
+                'type_4_insulation_thickness_observable',
+                'type_4_no_heat_loss_ground_floor',
+                'type_4_no_heat_loss_roof',
+                'type_4_pitched_insulation_btw_joists',
+                'type_4_pitched_insulation_in_rafters',
+                'type_4_roof_Construction_Other',
+                'type_4_roof_Construction_Other_text',
+                'type_4_roof_construction_unknown',
+                'type_4_room_in_roof',
+                'type_4_sealed',
+                'type_4_solid',
+                'type_4_solid_concrete',
+                'type_4_stone',
+                'type_4_suspended',
+                'type_4_ther_unknown',
+                'type_4_ther_unknown_text',
+                'type_4_thinkness',
+                'type_4_timber_frame',
+                'type_4_warmcell',
+                'underfloor_primary',
+                'underfloor_secondary',
+                'very_little_less_20_per',
+                'wall',
+                'warm_air_primary',
+                'warm_air_secondary',
+                'warm_air_syetem',
+                'warmcell',
+                'water_storage',
+                'water_to_air',
+                'water_to_water',
+                'weather_compersator',
+                'whole_house_UFH',
+                'whole_house_extract_ventilation',
+                'wood_chips',
+                'wood_chips_pellet_boiler',
+                'wood_chips_s',
+                'wood_pellets',
+                'wood_pellets_s',
+            ],
+        ),
+    ]
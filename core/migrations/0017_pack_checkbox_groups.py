@@ -0,0 +1,596 @@
+# Generated by Django 5.1.4 on 2026-10-18 12:27
+
+from django.db import migrations, models
+
+# Checkbox groups as (model, packed field, [legacy keys in form order], [stored values] or None for bitmasks).
+# Frozen here on purpose: core.checkbox_groups may change after this migration.
+GROUPS = [
+    ('assesment', 'dwelling_type', ['detached_house', 'semi_detached_house', 'end_of_terrace', 'mid_terrace', 'ground_floor_apartment', 'mid_floor_apartment', 'top_floor_apartment', 'basement_apartment', 'maisonette'],
+     ['detached_house', 'semi_detached_house', 'end_of_terrace', 'mid_terrace', 'ground_floor_apartment', 'mid_floor_apartment', 'top_floor_apartment', 'basement_apartment', 'maisonette']),
+    ('assesment', 'age_band', ['pre_1900', 'between_1900_and_1929', 'between_1930_and_1949', 'between_1950_and_1966', 'between_1967_and_1977', 'between_1978_and_1982', 'between_1983_and_1993', 'between_1994_and_1999', 'from_2000_onwards'],
+     ['pre_1900', 'between_1900_and_1929', 'between_1930_and_1949', 'between_1950_and_1966', 'between_1967_and_1977', 'between_1978_and_1982', 'between_1983_and_1993', 'between_1994_and_1999', 'from_2000_onwards']),
+    ('assesment', 'extension_1_age_band', ['xpre_1900', 'xbetween_1900_and_1929', 'xbetween_1930_and_1949', 'xbetween_1950_and_1966', 'xbetween_1967_and_1977', 'xbetween_1978_and_1982', 'xbetween_1983_and_1993', 'xbetween_1994_and_1999', 'xfrom_2000_onwards'],
+     ['pre_1900', 'between_1900_and_1929', 'between_1930_and_1949', 'between_1950_and_1966', 'between_1967_and_1977', 'between_1978_and_1982', 'between_1983_and_1993', 'between_1994_and_1999', 'from_2000_onwards']),
+    ('assesment', 'extension_2_age_band', ['xxpre_1900', 'xxbetween_1900_and_1929', 'xxbetween_1930_and_1949', 'xxbetween_1950_and_1966', 'xxbetween_1967_and_1977', 'xxbetween_1978_and_1982', 'xxbetween_1983_and_1993', 'xxbetween_1994_and_1999', 'xxfrom_2000_onwards'],
+     ['pre_1900', 'between_1900_and_1929', 'between_1930_and_1949', 'between_1950_and_1966', 'between_1967_and_1977', 'between_1978_and_1982', 'between_1983_and_1993', 'between_1994_and_1999', 'from_2000_onwards']),
+    ('assesment', 'purpose_of_rating', ['new_owner_occupation', 'sale', 'private_letting', 'social_housing_letting', 'grant_support', 'major_renovation', 'purpose_of_rating_other'],
+     None),
+    ('assessmentenvelope', 'wall_construction', ['stone', 'solid_brick', 'cavity', 'solid_concrete', 'hollow_block', 'timber_frame', 'other_unknown'],
+     ['stone', 'solid_brick', 'cavity', 'solid_concrete', 'hollow_block', 'timber_frame', 'other_unknown']),
+    ('assessmentenvelope', 'type_2_wall_construction', ['type_2_stone', 'Type_2_solid_brick', 'type_2_cavity', 'type_2_solid_concrete', 'type_2_hollow_block', 'type_2_timber_frame', 'type_2_other_unknown'],
+     ['stone', 'solid_brick', 'cavity', 'solid_concrete', 'hollow_block', 'timber_frame', 'other_unknown']),
+    ('assessmentenvelope', 'type_3_wall_construction', ['type_3_stone', 'Type_3_solid_brick', 'type_3_cavity', 'type_3_solid_concrete', 'type_3_hollow_block', 'type_3_timber_frame', 'type_3_ther_unknown'],
+     ['stone', 'solid_brick', 'cavity', 'solid_concrete', 'hollow_block', 'timber_frame', 'other_unknown']),
+    ('assessmentenvelope', 'type_4_wall_construction', ['type_4_stone', 'Type_4_solid_brick', 'type_4_cavity', 'type_4_solid_concrete', 'type_4_hollow_block', 'type_4_timber_frame', 'type_4_ther_unknown'],
+     ['stone', 'solid_brick', 'cavity', 'solid_concrete', 'hollow_block', 'timber_frame', 'other_unknown']),
+    ('assessmentenvelope', 'roof_construction', ['pitched_insulation_btw_joists', 'pitched_insulation_in_rafters', 'Flat_insulation_integral', 'room_in_roof', 'no_heat_loss_roof', 'roof_Construction_Other'],
+     None),
+    ('assessmentenvelope', 'type_2_roof_construction', ['type_2_pitched_insulation_btw_joists', 'type_2_pitched_insulation_in_rafters', 'type_2_Flat_insulation_integral', 'type_2_room_in_roof', 'type_2_no_heat_loss_roof', 'type_2_roof_Construction_Other'],
+     None),
+    ('assessmentenvelope', 'type_3_roof_construction', ['type_3_pitched_insulation_btw_joists', 'type_3_pitched_insulation_in_rafters', 'type_3_Flat_insulation_integral', 'type_3_room_in_roof', 'type_3_no_heat_loss_roof', 'type_3_roof_Construction_Other'],
+     None),
+    ('assessmentenvelope', 'type_4_roof_construction', ['type_4_pitched_insulation_btw_joists', 'type_4_pitched_insulation_in_rafters', 'type_4_Flat_insulation_integral', 'type_4_room_in_roof', 'type_4_no_heat_loss_roof', 'type_4_roof_Construction_Other'],
+     None),
+    ('assessmentheating', 'boiler_type', ['standard', 'Combi', 'condensing', 'back_boiler', 'cpsu', 'range_cooker', 'single_burner', 'twin_burner'],
+     None),
+    ('assessmentheating', 'boiler_flue_type', ['open', 'balanced', 'fan_assisted'],
+     None),
+    ('assessmentheating', 'room_heater_flue_type', ['flue_type_open', 'flue_type_balanced', 'flue_type_fan_assisted'],
+     None),
+]
+
+
+def _table_updates(apps, schema_editor, assignments):
+    quote = schema_editor.quote_name
+    by_model = {}
+    for model_name, field, keys, values in GROUPS:
+        by_model.setdefault(model_name, []).extend(assignments(quote, field, keys, values))
+    for model_name, sets in by_model.items():
+        table = apps.get_model('core', model_name)._meta.db_table
+        schema_editor.execute(f"UPDATE {quote(table)} SET {', '.join(sets)}")
+
+
+def pack(apps, schema_editor):
+    # One UPDATE per table. An exclusive group keeps the first ticked box in form order.
+    def assignments(quote, field, keys, values):
+        if values:
+            whens = ' '.join(f"WHEN {quote(key)} THEN '{value}'" for key, value in zip(keys, values))
+            return [f"{quote(field)} = CASE {whens} END"]
+        bits = ' + '.join(f"CASE WHEN {quote(key)} THEN {1 << i} ELSE 0 END" for i, key in enumerate(keys))
+        return [f"{quote(field)} = {bits}"]
+    _table_updates(apps, schema_editor, assignments)
+
+
+def unpack(apps, schema_editor):
+    def assignments(quote, field, keys, values):
+        if values:
+            return [f"{quote(key)} = COALESCE({quote(field)} = '{value}', FALSE)" for key, value in zip(keys, values)]
+        return [f"{quote(key)} = ({quote(field)} & {1 << i}) <> 0" for i, key in enumerate(keys)]
+    _table_updates(apps, schema_editor, assignments)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_remove_assesment_section_columns'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assesment',
+            name='age_band',
+            field=models.CharField(blank=True, choices=[('pre_1900', 'Pre 1900'), ('between_1900_and_1929', '1900-1929'), ('between_1930_and_1949', '1930-1949'), ('between_1950_and_1966', '1950-1966'), ('between_1967_and_1977', '1967-1977'), ('between_1978_and_1982', '1978-1982'), ('between_1983_and_1993', '1983-1993'), ('between_1994_and_1999', '1994-1999'), ('from_2000_onwards', '2000 onwards')], db_index=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name='assesment',
+            name='dwelling_type',
+            field=models.CharField(blank=True, choices=[('detached_house', 'Detached house'), ('semi_detached_house', 'Semi-detached house'), ('end_of_terrace', 'End of terrace'), ('mid_terrace', 'Mid-terrace'), ('ground_floor_apartment', 'Ground floor apartment'), ('mid_floor_apartment', 'Mid-floor apartment'), ('top_floor_apartment', 'Top floor apartment'), ('basement_apartment', 'Basement apartment'), ('maisonette', 'Maisonette')], db_index=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name='assesment',
+            name='extension_1_age_band',
+            field=models.CharField(blank=True, choices=[('pre_1900', 'Pre 1900'), ('between_1900_and_1929', '1900-1929'), ('between_1930_and_1949', '1930-1949'), ('between_1950_and_1966', '1950-1966'), ('between_1967_and_1977', '1967-1977'), ('between_1978_and_1982', '1978-1982'), ('between_1983_and_1993', '1983-1993'), ('between_1994_and_1999', '1994-1999'), ('from_2000_onwards', '2000 onwards')], db_index=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name='assesment',
+            name='extension_2_age_band',
+            field=models.CharField(blank=True, choices=[('pre_1900', 'Pre 1900'), ('between_1900_and_1929', '1900-1929'), ('between_1930_and_1949', '1930-1949'), ('between_1950_and_1966', '1950-1966'), ('between_1967_and_1977', '1967-1977'), ('between_1978_and_1982', '1978-1982'), ('between_1983_and_1993', '1983-1993'), ('between_1994_and_1999', '1994-1999'), ('from_2000_onwards', '2000 onwards')], db_index=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name='assesment',
+            name='purpose_of_rating',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='assessmentenvelope',
+            name='roof_construction',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='assessmentenvelope',
+            name='type_2_roof_construction',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='assessmentenvelope',
+            name='type_2_wall_construction',
+            field=models.CharField(blank=True, choices=[('stone', 'Stone'), ('solid_brick', 'Solid brick'), ('cavity', 'Cavity'), ('solid_concrete', 'Solid concrete'), ('hollow_block', 'Hollow block'), ('timber_frame', 'Timber frame'), ('other_unknown', 'Other/unknown')], db_index=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name='assessmentenvelope',
+            name='type_3_roof_construction',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='assessmentenvelope',
+            name='type_3_wall_construction',
+            field=models.CharField(blank=True, choices=[('stone', 'Stone'), ('solid_brick', 'Solid brick'), ('cavity', 'Cavity'), ('solid_concrete', 'Solid concrete'), ('hollow_block', 'Hollow block'), ('timber_frame', 'Timber frame'), ('other_unknown', 'Other/unknown')], db_index=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name='assessmentenvelope',
+            name='type_4_roof_construction',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='assessmentenvelope',
+            name='type_4_wall_construction',
+            field=models.CharField(blank=True, choices=[('stone', 'Stone'), ('solid_brick', 'Solid brick'), ('cavity', 'Cavity'), ('solid_concrete', 'Solid concrete'), ('hollow_block', 'Hollow block'), ('timber_frame', 'Timber frame'), ('other_unknown', 'Other/unknown')], db_index=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name='assessmentenvelope',
+            name='wall_construction',
+            field=models.CharField(blank=True, choices=[('stone', 'Stone'), ('solid_brick', 'Solid brick'), ('cavity', 'Cavity'), ('solid_concrete', 'Solid concrete'), ('hollow_block', 'Hollow block'), ('timber_frame', 'Timber frame'), ('other_unknown', 'Other/unknown')], db_index=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name='assessmentheating',
+            name='boiler_flue_type',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='assessmentheating',
+            name='boiler_type',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='assessmentheating',
+            name='room_heater_flue_type',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.RunPython(pack, unpack),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='basement_apartment',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='between_1900_and_1929',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='between_1930_and_1949',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='between_1950_and_1966',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='between_1967_and_1977',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='between_1978_and_1982',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='between_1983_and_1993',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='between_1994_and_1999',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='detached_house',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='end_of_terrace',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='from_2000_onwards',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='grant_support',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='ground_floor_apartment',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='maisonette',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='major_renovation',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='mid_floor_apartment',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='mid_terrace',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='new_owner_occupation',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='pre_1900',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='private_letting',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='purpose_of_rating_other',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='sale',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='semi_detached_house',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='social_housing_letting',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='top_floor_apartment',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='xbetween_1900_and_1929',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='xbetween_1930_and_1949',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='xbetween_1950_and_1966',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='xbetween_1967_and_1977',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='xbetween_1978_and_1982',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='xbetween_1983_and_1993',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='xbetween_1994_and_1999',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='xfrom_2000_onwards',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='xpre_1900',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='xxbetween_1900_and_1929',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='xxbetween_1930_and_1949',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='xxbetween_1950_and_1966',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='xxbetween_1967_and_1977',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='xxbetween_1978_and_1982',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='xxbetween_1983_and_1993',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='xxbetween_1994_and_1999',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='xxfrom_2000_onwards',
+        ),
+        migrations.RemoveField(
+            model_name='assesment',
+            name='xxpre_1900',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='Flat_insulation_integral',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='Type_2_solid_brick',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='Type_3_solid_brick',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='Type_4_solid_brick',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='cavity',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='hollow_block',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='no_heat_loss_roof',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='other_unknown',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='pitched_insulation_btw_joists',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='pitched_insulation_in_rafters',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='roof_Construction_Other',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='room_in_roof',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='solid_brick',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='solid_concrete',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='stone',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='timber_frame',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_2_Flat_insulation_integral',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_2_cavity',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_2_hollow_block',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_2_no_heat_loss_roof',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_2_other_unknown',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_2_pitched_insulation_btw_joists',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_2_pitched_insulation_in_rafters',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_2_roof_Construction_Other',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_2_room_in_roof',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_2_solid_concrete',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_2_stone',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_2_timber_frame',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_3_Flat_insulation_integral',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_3_cavity',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_3_hollow_block',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_3_no_heat_loss_roof',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_3_pitched_insulation_btw_joists',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_3_pitched_insulation_in_rafters',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_3_roof_Construction_Other',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_3_room_in_roof',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_3_solid_concrete',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_3_stone',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_3_ther_unknown',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_3_timber_frame',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_4_Flat_insulation_integral',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_4_cavity',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_4_hollow_block',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_4_no_heat_loss_roof',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_4_pitched_insulation_btw_joists',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_4_pitched_insulation_in_rafters',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_4_roof_Construction_Other',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_4_room_in_roof',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_4_solid_concrete',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_4_stone',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_4_ther_unknown',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentenvelope',
+            name='type_4_timber_frame',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentheating',
+            name='Combi',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentheating',
+            name='back_boiler',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentheating',
+            name='balanced',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentheating',
+            name='condensing',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentheating',
+            name='cpsu',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentheating',
+            name='fan_assisted',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentheating',
+            name='flue_type_balanced',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentheating',
+            name='flue_type_fan_assisted',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentheating',
+            name='flue_type_open',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentheating',
+            name='open',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentheating',
+            name='range_cooker',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentheating',
+            name='single_burner',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentheating',
+            name='standard',
+        ),
+        migrations.RemoveField(
+            model_name='assessmentheating',
+            name='twin_burner',
+        ),
+    ]
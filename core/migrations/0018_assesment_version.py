@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-18 12:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_pack_checkbox_groups'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assesment',
+            name='version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
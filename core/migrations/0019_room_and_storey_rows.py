@@ -0,0 +1,316 @@
+# Generated by Django 5.1.4 on 2026-10-18 12:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from core.migration_operations import RemoveFields
+
+ROOM_COLUMNS = [
+    'opening', 'opening_dimensions', 'glazing_details', 'frame', 'gap', 'over_shading', 'direction',
+    'wall_roof_type', 'openable_windows_doors', 'windows_doors', 'chimney_flueless', 'open_flues',
+    'fans_vents', 'rads_with_or_trvs', 'number_of_fixed_lights', 'type_of_fixed_light',
+]
+STOREYS = ['basement', 'ground', 'first', 'second', 'third']
+# Storey columns as (old column suffix, new column)
+STOREY_COLUMNS = [('storey_heigh', 'storey_height'), ('total_floor_area', 'total_floor_area'),
+                  ('heatloss_perimeter', 'heatloss_perimeter')]
+ELEMENTS = ['floor', 'wall', 'roof']
+
+
+def _area_columns(storey):
+    return [(element, position, f'{storey}_heatloss_{element}_{position}')
+            for element in ELEMENTS for position in range(1, 5)]
+
+
+def copy_into_rows(apps, schema_editor):
+    # Rooms 1-5 and storeys that have any value become rows; one INSERT ... SELECT each.
+    quote = schema_editor.quote_name
+    for position in range(1, 6):
+        old = [quote(f'room_{position}_{column}') for column in ROOM_COLUMNS]
+        schema_editor.execute(
+            f"INSERT INTO core_assessmentroom (assessment_id, position, {', '.join(map(quote, ROOM_COLUMNS))}) "
+            f"SELECT assessment_id, {position}, {', '.join(old)} FROM core_assessmentrooms "
+            f"WHERE {' OR '.join(f'{column} IS NOT NULL' for column in old)}"
+        )
+
+    for storey in STOREYS:
+        old = [quote(f'{storey}_{suffix}') for suffix, _ in STOREY_COLUMNS]
+        areas = [quote(column) for _, _, column in _area_columns(storey)]
+        schema_editor.execute(
+            f"INSERT INTO core_assessmentstorey (assessment_id, storey, {', '.join(quote(new) for _, new in STOREY_COLUMNS)}) "
+            f"SELECT assessment_id, '{storey}', {', '.join(old)} FROM core_assessmentenvelope "
+            f"WHERE {' OR '.join(f'{column} IS NOT NULL' for column in old + areas)}"
+        )
+        for element, position, column in _area_columns(storey):
+            schema_editor.execute(
+                f"INSERT INTO core_assessmentheatlossarea (storey_id, element, position, area) "
+                f"SELECT s.id, '{element}', {position}, e.{quote(column)} FROM core_assessmentenvelope e "
+                f"JOIN core_assessmentstorey s ON s.assessment_id = e.assessment_id AND s.storey = '{storey}' "
+                f"WHERE e.{quote(column)} IS NOT NULL"
+            )
+
+
+def copy_back_from_rows(apps, schema_editor):
+    # Only what fits the old columns comes back: rooms 1-5, areas 1-4, and storeys of
+    # assessments that have an envelope row.
+    quote = schema_editor.quote_name
+    schema_editor.execute(
+        "INSERT INTO core_assessmentrooms (assessment_id) SELECT DISTINCT assessment_id FROM core_assessmentroom r "
+        "WHERE position <= 5 AND NOT EXISTS (SELECT 1 FROM core_assessmentrooms s WHERE s.assessment_id = r.assessment_id)"
+    )
+    for position in range(1, 6):
+        sets = ', '.join(f"{quote(f'room_{position}_{column}')} = r.{quote(column)}" for column in ROOM_COLUMNS)
+        schema_editor.execute(
+            f"UPDATE core_assessmentrooms SET {sets} FROM core_assessmentroom r "
+            f"WHERE r.assessment_id = core_assessmentrooms.assessment_id AND r.position = {position}"
+        )
+
+    for storey in STOREYS:
+        sets = ', '.join(f"{quote(f'{storey}_{suffix}')} = s.{quote(new)}" for suffix, new in STOREY_COLUMNS)
+        schema_editor.execute(
+            f"UPDATE core_assessmentenvelope SET {sets} FROM core_assessmentstorey s "
+            f"WHERE s.assessment_id = core_assessmentenvelope.assessment_id AND s.storey = '{storey}'"
+        )
+        for element, position, column in _area_columns(storey):
+            schema_editor.execute(
+                f"UPDATE core_assessmentenvelope SET {quote(column)} = a.area "
+                f"FROM core_assessmentheatlossarea a JOIN core_assessmentstorey s ON s.id = a.storey_id "
+                f"WHERE s.assessment_id = core_assessmentenvelope.assessment_id AND s.storey = '{storey}' "
+                f"AND a.element = '{element}' AND a.position = {position}"
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_assesment_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AssessmentStorey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('storey', models.CharField(choices=[('basement', 'Basement'), ('ground', 'Ground'), ('first', 'First'), ('second', 'Second'), ('third', 'Third')], max_length=20)),
+                ('storey_height', models.FloatField(blank=True, null=True)),
+                ('total_floor_area', models.FloatField(blank=True, null=True)),
+                ('heatloss_perimeter', models.FloatField(blank=True, null=True)),
+                ('assessment', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='storeys', to='core.assesment')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='AssessmentHeatLossArea',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('element', models.CharField(choices=[('floor', 'Floor'), ('wall', 'Wall'), ('roof', 'Roof')], max_length=10)),
+                ('position', models.PositiveSmallIntegerField()),
+                ('area', models.FloatField(blank=True, null=True)),
+                ('storey', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='heat_loss_areas', to='core.assessmentstorey')),
+            ],
+            options={
+                'ordering': ['element', 'position'],
+            },
+        ),
+        migrations.CreateModel(
+            name='AssessmentRoom',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveSmallIntegerField()),
+                ('opening', models.CharField(blank=True, max_length=20, null=True)),
+                ('opening_dimensions', models.FloatField(blank=True, null=True)),
+                ('glazing_details', models.CharField(blank=True, max_length=20, null=True)),
+                ('frame', models.CharField(blank=True, max_length=20, null=True)),
+                ('gap', models.CharField(blank=True, max_length=20, null=True)),
+                ('over_shading', models.CharField(blank=True, max_length=20, null=True)),
+                ('direction', models.CharField(blank=True, max_length=20, null=True)),
+                ('wall_roof_type', models.CharField(blank=True, max_length=20, null=True)),
+                ('openable_windows_doors', models.CharField(blank=True, max_length=20, null=True)),
+                ('windows_doors', models.CharField(blank=True, max_length=20, null=True)),
+                ('chimney_flueless', models.FloatField(blank=True, null=True)),
+                ('open_flues', models.FloatField(blank=True, null=True)),
+                ('fans_vents', models.CharField(blank=True, max_length=20, null=True)),
+                ('rads_with_or_trvs', models.CharField(blank=True, max_length=20, null=True)),
+                ('number_of_fixed_lights', models.CharField(blank=True, max_length=20, null=True)),
+                ('type_of_fixed_light', models.CharField(blank=True, max_length=20, null=True)),
+                ('assessment', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='room_rows', to='core.assesment')),
+            ],
+            options={
+                'ordering': ['position'],
+                'constraints': [models.UniqueConstraint(fields=('assessment', 'position'), name='unique_assessment_room_position')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='assessmentstorey',
+            constraint=models.UniqueConstraint(fields=('assessment', 'storey'), name='unique_assessment_storey'),
+        ),
+        migrations.AddConstraint(
+            model_name='assessmentheatlossarea',
+            constraint=models.UniqueConstraint(fields=('storey', 'element', 'position'), name='unique_heat_loss_area_position'),
+        ),
+        migrations.RunPython(copy_into_rows, copy_back_from_rows),
+        RemoveFields(
+            model_name='assessmentenvelope',
+            names=[
+                'basement_heatloss_floor_1',
+                'basement_heatloss_floor_2',
+                'basement_heatloss_floor_3',
+                'basement_heatloss_floor_4',
+                'basement_heatloss_perimeter',
+                'basement_heatloss_roof_1',
+                'basement_heatloss_roof_2',
+                'basement_heatloss_roof_3',
+                'basement_heatloss_roof_4',
+                'basement_heatloss_wall_1',
+                'basement_heatloss_wall_2',
+                'basement_heatloss_wall_3',
+                'basement_heatloss_wall_4',
+                'basement_storey_heigh',
+                'basement_total_floor_area',
+                'first_heatloss_floor_1',
+                'first_heatloss_floor_2',
+                'first_heatloss_floor_3',
+                'first_heatloss_floor_4',
+                'first_heatloss_perimeter',
+                'first_heatloss_roof_1',
+                'first_heatloss_roof_2',
+                'first_heatloss_roof_3',
+                'first_heatloss_roof_4',
+                'first_heatloss_wall_1',
+                'first_heatloss_wall_2',
+                'first_heatloss_wall_3',
+                'first_heatloss_wall_4',
+                'first_storey_heigh',
+                'first_total_floor_area',
+                'ground_heatloss_floor_1',
+                'ground_heatloss_floor_2',
+                'ground_heatloss_floor_3',
+                'ground_heatloss_floor_4',
+                'ground_heatloss_perimeter',
+                'ground_heatloss_roof_1',
+                'ground_heatloss_roof_2',
+                'ground_heatloss_roof_3',
+                'ground_heatloss_roof_4',
+                'ground_heatloss_wall_1',
+                'ground_heatloss_wall_2',
+                'ground_heatloss_wall_3',
+                'ground_heatloss_wall_4',
+                'ground_storey_heigh',
+                'ground_total_floor_area',
+                'second_heatloss_floor_1',
+                'second_heatloss_floor_2',
+                'second_heatloss_floor_3',
+                'second_heatloss_floor_4',
+                'second_heatloss_perimeter',
+                'second_heatloss_roof_1',
+                'second_heatloss_roof_2',
+                'second_heatloss_roof_3',
+                'second_heatloss_roof_4',
+                'second_heatloss_wall_1',
+                'second_heatloss_wall_2',
+                'second_heatloss_wall_3',
+                'second_heatloss_wall_4',
+                'second_storey_heigh',
+                'second_total_floor_area',
+                'third_heatloss_floor_1',
+                'third_heatloss_floor_2',
+                'third_heatloss_floor_3',
+                'third_heatloss_floor_4',
+                'third_heatloss_perimeter',
+                'third_heatloss_roof_1',
+                'third_heatloss_roof_2',
+                'third_heatloss_roof_3',
+                'third_heatloss_roof_4',
+                'third_heatloss_wall_1',
+                'third_heatloss_wall_2',
+                'third_heatloss_wall_3',
+                'third_heatloss_wall_4',
+                'third_storey_heigh',
+                'third_total_floor_area',
+            ],
+        ),
+        RemoveFields(
+            model_name='assessmentrooms',
+            names=[
+                'room_1_chimney_flueless',
+                'room_1_direction',
+                'room_1_fans_vents',
+                'room_1_frame',
+                'room_1_gap',
+                'room_1_glazing_details',
+                'room_1_number_of_fixed_lights',
+                'room_1_open_flues',
+                'room_1_openable_windows_doors',
+                'room_1_opening',
+                'room_1_opening_dimensions',
+                'room_1_over_shading',
+                'room_1_rads_with_or_trvs',
+                'room_1_type_of_fixed_light',
+                'room_1_wall_roof_type',
+                'room_1_windows_doors',
+                'room_2_chimney_flueless',
+                'room_2_direction',
+                'room_2_fans_vents',
+                'room_2_frame',
+                'room_2_gap',
+                'room_2_glazing_details',
+                'room_2_number_of_fixed_lights',
+                'room_2_open_flues',
+                'room_2_openable_windows_doors',
+                'room_2_opening',
+                'room_2_opening_dimensions',
+                'room_2_over_shading',
+                'room_2_rads_with_or_trvs',
+                'room_2_type_of_fixed_light',
+                'room_2_wall_roof_type',
+                'room_2_windows_doors',
+                'room_3_chimney_flueless',
+                'room_3_direction',
+                'room_3_fans_vents',
+                'room_3_frame',
+                'room_3_gap',
+                'room_3_glazing_details',
+                'room_3_number_of_fixed_lights',
+                'room_3_open_flues',
+                'room_3_openable_windows_doors',
+                'room_3_opening',
+                'room_3_opening_dimensions',
+                'room_3_over_shading',
+                'room_3_rads_with_or_trvs',
+                'room_3_type_of_fixed_light',
+                'room_3_wall_roof_type',
+                'room_3_windows_doors',
+                'room_4_chimney_flueless',
+                'room_4_direction',
+                'room_4_fans_vents',
+                'room_4_frame',
+                'room_4_gap',
+                'room_4_glazing_details',
+                'room_4_number_of_fixed_lights',
+                'room_4_open_flues',
+                'room_4_openable_windows_doors',
+                'room_4_opening',
+                'room_4_opening_dimensions',
+                'room_4_over_shading',
+                'room_4_rads_with_or_trvs',
+                'room_4_type_of_fixed_light',
+                'room_4_wall_roof_type',
+                'room_4_windows_doors',
+                'room_5_chimney_flueless',
+                'room_5_direction',
+                'room_5_fans_vents',
+                'room_5_frame',
+                'room_5_gap',
+                'room_5_glazing_details',
+                'room_5_number_of_fixed_lights',
+                'room_5_open_flues',
+                'room_5_openable_windows_doors',
+                'room_5_opening',
+                'room_5_opening_dimensions',
+                'room_5_over_shading',
+                'room_5_rads_with_or_trvs',
+                'room_5_type_of_fixed_light',
+                'room_5_wall_roof_type',
+                'room_5_windows_doors',
+            ],
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.1.4 on 2026-10-18 13:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def backfill_created_at(apps, schema_editor):
+    # Existing assessments get the creation time of their quote or project, when they have one
+    Assesment = apps.get_model('core', 'Assesment')
+    Quote = apps.get_model('core', 'Quote')
+    Project = apps.get_model('core', 'Project')
+    Assesment.objects.filter(project__isnull=False).update(
+        created_at=models.Subquery(Project.objects.filter(pk=models.OuterRef('project_id')).values('created_at')[:1]))
+    Assesment.objects.filter(quote__isnull=False).update(
+        created_at=models.Subquery(Quote.objects.filter(pk=models.OuterRef('quote_id')).values('created_at')[:1]))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_room_and_storey_rows'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assesment',
+            name='created_at',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now, editable=False),
+        ),
+        migrations.RunPython(backfill_created_at, migrations.RunPython.noop),
+    ]
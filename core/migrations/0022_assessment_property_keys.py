@@ -0,0 +1,22 @@
+# Generated by Django 5.1.4 on 2026-10-18 13:12
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0021_assessment_revision'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assesment',
+            index=models.Index(django.db.models.functions.text.Upper(django.db.models.functions.text.Replace(models.F('eircode'), models.Value(' '), models.Value(''))), name='assessment_eircode_key'),
+        ),
+        migrations.AddIndex(
+            model_name='assesment',
+            index=models.Index(django.db.models.functions.text.Upper(django.db.models.functions.text.Replace(models.F('mprn'), models.Value(' '), models.Value(''))), name='assessment_mprn_key'),
+        ),
+    ]
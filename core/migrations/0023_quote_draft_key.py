@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-18 13:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0022_assessment_property_keys'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quote',
+            name='draft_key',
+            field=models.CharField(blank=True, editable=False, max_length=32, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.4 on 2026-10-18 13:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0023_quote_draft_key'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='quote',
+            field=models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='job', to='core.quote'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.1.4 on 2026-10-18 13:35
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0024_job_quote'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(models.F('nearest_town'), models.OrderBy(models.F('created_at'), descending=True), models.OrderBy(models.F('id'), descending=True), name='job_town_newest'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(models.F('nearest_town'), django.db.models.functions.text.Upper('county'), models.OrderBy(models.F('created_at'), descending=True), models.OrderBy(models.F('id'), descending=True), name='job_town_county_newest'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['property_type'], name='job_property_type'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(django.db.models.functions.text.Upper('county'), name='job_county_upper'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(models.OrderBy(models.F('created_at'), descending=True), models.OrderBy(models.F('id'), descending=True), name='job_newest'),
+        ),
+    ]
@@ -0,0 +1,104 @@
+# Generated by Django 5.1.4 on 2026-10-18 16:05
+
+from django.db import migrations, models
+
+from core.quote_values import parse_bedrooms, parse_date, parse_floor_area, parse_time
+
+# Field: (typed field, parse function)
+FIELDS = {
+    'preferred_date': (models.DateField(null=True, blank=True), parse_date),
+    'preferred_time': (models.TimeField(null=True, blank=True), parse_time),
+    'property_size': (models.DecimalField(max_digits=8, decimal_places=2, null=True, blank=True), parse_floor_area),
+    'bedrooms': (models.PositiveSmallIntegerField(null=True, blank=True), parse_bedrooms),
+}
+MODELS = ['job', 'quote']
+BATCH_SIZE = 2000
+
+
+def _rows(model, columns):
+    # [(pk, *columns)] a batch at a time
+    batch = []
+    for row in model.objects.order_by('pk').values_list('pk', *columns).iterator(chunk_size=BATCH_SIZE):
+        batch.append(row)
+        if len(batch) == BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def convert(apps, schema_editor):
+    # Parses the text columns into the typed ones; text that doesn't read is kept in legacy_values
+    for model_name in MODELS:
+        model = apps.get_model('core', model_name)
+        failed = 0
+        for batch in _rows(model, [f'{field}_text' for field in FIELDS]):
+            updated = []
+            for pk, *texts in batch:
+                row = model(pk=pk, legacy_values={})
+                for (field, (_, parse)), text in zip(FIELDS.items(), texts):
+                    value = None
+                    if text and text.strip():
+                        try:
+                            value = parse(text)
+                        except ValueError:
+                            row.legacy_values[field] = text
+                    setattr(row, field, value)
+                failed += len(row.legacy_values)
+                updated.append(row)
+            model.objects.bulk_update(updated, [*FIELDS, 'legacy_values'])
+        if failed:
+            print(f"\n  {failed} {model_name} values didn't read and were kept in legacy_values, "
+                  f"list them with: manage.py legacy_values")
+
+
+def convert_back(apps, schema_editor):
+    for model_name in MODELS:
+        model = apps.get_model('core', model_name)
+        for batch in _rows(model, [*FIELDS, 'legacy_values']):
+            updated = []
+            for pk, *values, legacy_values in batch:
+                row = model(pk=pk)
+                for field, value in zip(FIELDS, values):
+                    text = legacy_values.get(field) or ('' if value is None else str(value))
+                    setattr(row, f'{field}_text', text)
+                updated.append(row)
+            model.objects.bulk_update(updated, [f'{field}_text' for field in FIELDS])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0025_job_search_indexes'),
+    ]
+
+    operations = [
+        *(migrations.AddField(
+            model_name=model_name,
+            name='legacy_values',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ) for model_name in MODELS),
+        *(migrations.RenameField(model_name=model_name, old_name=field, new_name=f'{field}_text')
+          for model_name in MODELS for field in FIELDS),
+        # A default, so that the text columns can be added back when this is unapplied
+        *(migrations.AlterField(model_name=model_name, name=f'{field}_text',
+                                field=models.CharField(max_length=255, default=''))
+          for model_name in MODELS for field in FIELDS),
+        *(migrations.AddField(model_name=model_name, name=field, field=typed_field.clone())
+          for model_name in MODELS for field, (typed_field, _) in FIELDS.items()),
+        migrations.RunPython(convert, convert_back),
+        *(migrations.RemoveField(model_name=model_name, name=f'{field}_text')
+          for model_name in MODELS for field in FIELDS),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['bedrooms'], name='job_bedrooms'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['property_size'], name='job_property_size'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['preferred_date'], name='job_preferred_date'),
+        ),
+    ]
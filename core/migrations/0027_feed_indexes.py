@@ -0,0 +1,46 @@
+# Generated by Django 5.1.4 on 2026-10-18 13:50
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+def lower_case_pending(apps, schema_editor):
+    # The pending job queries match status exactly now, as the choices spell it
+    Job = apps.get_model('core', 'Job')
+    Job.objects.filter(status__iexact='pending').exclude(status='pending').update(status='pending')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('core', '0026_typed_quote_values'),
+    ]
+
+    operations = [
+        migrations.RunPython(lower_case_pending, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='bid',
+            index=models.Index(models.F('assessor'), models.OrderBy(models.F('created_at'), descending=True), models.OrderBy(models.F('id'), descending=True), name='bid_assessor_newest'),
+        ),
+        migrations.AddIndex(
+            model_name='bid',
+            index=models.Index(fields=['job', 'amount'], name='bid_job_amount'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(django.db.models.functions.text.Upper('county'), models.OrderBy(models.F('created_at'), descending=True), models.OrderBy(models.F('id'), descending=True), condition=models.Q(('status', 'pending')), name='job_pending_county_newest'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(models.F('client'), models.OrderBy(models.F('created_at'), descending=True), models.OrderBy(models.F('id'), descending=True), name='job_client_newest'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(models.F('recipient'), models.OrderBy(models.F('created_at'), descending=True), models.OrderBy(models.F('id'), descending=True), name='notification_recipient_newest'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(models.F('accessor'), models.OrderBy(models.F('created_at'), descending=True), models.OrderBy(models.F('id'), descending=True), name='project_accessor_newest'),
+        ),
+    ]
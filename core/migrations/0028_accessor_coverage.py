@@ -0,0 +1,38 @@
+# Generated by Django 5.1.4 on 2026-10-18 14:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def cover_preferences(apps, schema_editor):
+    # Each accessor covers the counties of their preference ("Cork" or "Cork, Kerry") whole
+    Accessor = apps.get_model('core', 'Accessor')
+    AccessorCoverage = apps.get_model('core', 'AccessorCoverage')
+    rows = []
+    for accessor_id, preference in Accessor.objects.exclude(user__preference=None).values_list('pk', 'user__preference'):
+        counties = dict.fromkeys(county.strip().upper() for county in preference.split(','))
+        rows += [AccessorCoverage(accessor_id=accessor_id, county=county) for county in counties if county]
+    AccessorCoverage.objects.bulk_create(rows, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0027_feed_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccessorCoverage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('county', models.CharField(max_length=255)),
+                ('nearest_town', models.CharField(blank=True, default='', max_length=255)),
+                ('accessor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='coverage', to='core.accessor')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('county', 'nearest_town', 'accessor'), name='coverage_area_accessor')],
+            },
+        ),
+        migrations.RunPython(cover_preferences, migrations.RunPython.noop),
+    ]
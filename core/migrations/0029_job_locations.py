@@ -0,0 +1,28 @@
+# Generated by Django 5.1.4 on 2026-10-18 14:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0028_accessor_coverage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='accessor',
+            name='location',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='eircode',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='quote',
+            name='eircode',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+    ]
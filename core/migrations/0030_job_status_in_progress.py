@@ -0,0 +1,20 @@
+# Generated by Django 5.1.4 on 2026-10-18 16:00
+
+from django.db import migrations
+
+
+def fix_in_progress(apps, schema_editor):
+    # Accepting a bid used to set 'In Progress', which isn't one of Job.STATUS_CHOICES
+    Job = apps.get_model('core', 'Job')
+    Job.objects.filter(status='In Progress').update(status='in Progress')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0029_job_locations'),
+    ]
+
+    operations = [
+        migrations.RunPython(fix_in_progress, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.4 on 2026-10-18 16:30
+
+from django.db import migrations, models
+from django.db.models import Exists, OuterRef, Subquery
+
+
+def fill_lowest_bids(apps, schema_editor):
+    # Every job's lowest bid, as core.lowest_bids keeps it from now on
+    Bid = apps.get_model('core', 'Bid')
+    Job = apps.get_model('core', 'Job')
+    lowest = Bid.objects.filter(job=OuterRef('pk')).order_by('amount', 'id')
+    Job.objects.filter(Exists(Bid.objects.filter(job=OuterRef('pk')))).update(
+        lowest_bid_amount=Subquery(lowest.values('amount')[:1]),
+        lowest_bid_id=Subquery(lowest.values('id')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0030_job_status_in_progress'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='lowest_bid_amount',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='lowest_bid_id',
+            field=models.BigIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(fill_lowest_bids, migrations.RunPython.noop),
+    ]
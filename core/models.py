@@ -1,10 +1,13 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Q, Value
+from django.db.models.functions import Replace, Upper
 from django.core.validators import RegexValidator
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from django.utils import timezone
 from django.contrib.auth.hashers import make_password
 from django.utils.timezone import now
-from django.core.exceptions import ValidationError
+from django.core.exceptions import ValidationError, ObjectDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 # from torch.fx.experimental.symbolic_shapes import definitely_false
@@ -153,12 +156,29 @@ class Accessor(models.Model):
     phone_number = models.CharField()  # Duplicate field from UserModel
     first_name = models.CharField()  # Add first_name
     last_name = models.CharField()  # Add last_name
-
+    # An Eircode or town ("Mallow, Co. Cork") jobs/?within_km= measures from (core.places)
+    location = models.CharField(max_length=255, null=True, blank=True)
 
 
     def __str__(self):
         return f"Accessor: {self.user.email}"
 
+
+class AccessorCoverage(models.Model):
+    # A county an accessor takes jobs in, or one town of it (see core.coverage)
+    accessor = models.ForeignKey(Accessor, on_delete=models.CASCADE, related_name='coverage')
+    county = models.CharField(max_length=255)  # Upper case, as jobs are matched by Upper(county)
+    nearest_town = models.CharField(max_length=255, blank=True, default='')  # Upper case; '' is the whole county
+
+    class Meta:
+        constraints = [
+            # Also the index of the accessors covering a job's county and town
+            models.UniqueConstraint(fields=['county', 'nearest_town', 'accessor'], name='coverage_area_accessor'),
+        ]
+
+    def __str__(self):
+        return f"{self.accessor}: {self.nearest_town or 'all of'} {self.county}"
+
 class Job(models.Model):
     BUILDING_TYPES = [
         ('detached', 'Detached'),
@@ -178,18 +198,26 @@ class Job(models.Model):
     ]
     building_type = models.CharField(max_length=255, choices=BUILDING_TYPES)
     client = models.ForeignKey('Client', on_delete=models.CASCADE, related_name='job')
+    # The quote the job was promoted from, at most one job per quote (see core.quote_promotion)
+    quote = models.OneToOneField('Quote', on_delete=models.SET_NULL, related_name='job', null=True, blank=True)
 
     status = models.CharField(max_length=255, choices=STATUS_CHOICES, default='pending')
-    preferred_date = models.CharField(max_length=255)
-    preferred_time = models.CharField(max_length=255)
+    # Typed so jobs can be filtered by ranges of them, see core.quote_values. Null when left
+    # out, or when the free text they were converted from didn't read (kept in legacy_values).
+    preferred_date = models.DateField(null=True, blank=True)
+    preferred_time = models.TimeField(null=True, blank=True)
     property_type = models.CharField(max_length=255)
-    property_size = models.CharField(max_length=255)
-    bedrooms = models.CharField(max_length=255)
+    property_size = models.DecimalField(max_digits=8, decimal_places=2, null=True, blank=True)  # Floor area, m2
+    bedrooms = models.PositiveSmallIntegerField(null=True, blank=True)
     additional_features = models.CharField(max_length=255, blank=True, null=True)
     heat_pump_installed = models.CharField(max_length=255)
     county =models.CharField(max_length=255, blank=True, null=True)
     nearest_town = models.CharField(max_length=255)
+    eircode = models.CharField(max_length=255, blank=True, null=True)  # Placed by its routing key (core.places)
     ber_purpose = models.CharField(max_length=255)
+    # The job's lowest bid, kept up to date as bids are written (core.lowest_bids)
+    lowest_bid_amount = models.FloatField(null=True, blank=True, editable=False)
+    lowest_bid_id = models.BigIntegerField(null=True, blank=True, editable=False)
     lidar = models.FileField(upload_to='lidar_data/', blank=True, null=True)
     uploaded_at = models.DateTimeField(auto_now_add=True)
     created_at = models.DateTimeField(default=now, editable=False)
@@ -197,7 +225,42 @@ class Job(models.Model):
     name = models.CharField(max_length=255)
     email_address = models.CharField(max_length=255)
     mobile_number = models.CharField(max_length=255)
+    # {field: text} of the typed fields above whose free text didn't read when they were
+    # converted (migration 0026), see the legacy_values command
+    legacy_values = models.JSONField(default=dict, blank=True, editable=False)
+
+    class Meta:
+        indexes = [
+            # Job search, see core.search
+            models.Index(F('nearest_town'), F('created_at').desc(), F('id').desc(), name='job_town_newest'),
+            models.Index(F('nearest_town'), Upper('county'), F('created_at').desc(), F('id').desc(),
+                         name='job_town_county_newest'),
+            models.Index(fields=['property_type'], name='job_property_type'),
+            models.Index(Upper('county'), name='job_county_upper'),
+            models.Index(F('created_at').desc(), F('id').desc(), name='job_newest'),
+            # Range filters, see core.quote_values
+            models.Index(fields=['bedrooms'], name='job_bedrooms'),
+            models.Index(fields=['property_size'], name='job_property_size'),
+            models.Index(fields=['preferred_date'], name='job_preferred_date'),
+            # Accessor job feed (AccessorJobView) and the pending job count: only the pending jobs, so
+            # they cost what the pending jobs do rather than all the jobs ever posted
+            models.Index(Upper('county'), F('created_at').desc(), F('id').desc(), condition=Q(status='pending'),
+                         name='job_pending_county_newest'),
+            models.Index(F('client'), F('created_at').desc(), F('id').desc(), name='job_client_newest'),
+        ]
+
+    # Only written by core.lowest_bids
+    LOWEST_BID_FIELDS = ('lowest_bid_amount', 'lowest_bid_id')
 
+    def save(self, *args, **kwargs):
+        # A full save of a job read before its latest bid (the admin, the job update views) would
+        # put back the lowest bid it was read with, so it writes every other loaded field instead
+        full_update = not (self._state.adding or args or kwargs.get('force_insert'))
+        if full_update and kwargs.get('update_fields') is None:
+            skipped = {*self.LOWEST_BID_FIELDS, *self.get_deferred_fields()}
+            kwargs['update_fields'] = [field.name for field in self._meta.concrete_fields
+                                       if not field.primary_key and field.attname not in skipped]
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return self.BUILDING_TYPES
@@ -214,6 +277,13 @@ class Bid(models.Model):
     quote = models.ForeignKey('Quote', on_delete=models.CASCADE, related_name='bids', blank=True, null=True)
     created_at = models.DateTimeField(default=timezone.now, editable=False)
 
+    class Meta:
+        indexes = [
+            models.Index(F('assessor'), F('created_at').desc(), F('id').desc(), name='bid_assessor_newest'),
+            # A job's lowest bid
+            models.Index(fields=['job', 'amount'], name='bid_job_amount'),
+        ]
+
     def clean(self):
         # Ensure the job status is 'Pending'
         if self.job.status != 'pending':
@@ -238,6 +308,11 @@ class Notification(models.Model):
     sender = GenericForeignKey('sender_content_type', 'sender_object_id')
     created_at = models.DateTimeField(default=now)  # Add this field to store creation time
 
+    class Meta:
+        indexes = [
+            models.Index(F('recipient'), F('created_at').desc(), F('id').desc(), name='notification_recipient_newest'),
+        ]
+
     def __str__(self):
         return f"Notification for {self.recipient.email} about {self.notification_type}"
 
@@ -260,6 +335,11 @@ class Project(models.Model):
     client = models.ForeignKey(Client, on_delete=models.CASCADE, related_name='projects')
     accessor = models.ForeignKey(Accessor, on_delete=models.CASCADE, related_name='projects')
 
+    class Meta:
+        indexes = [
+            models.Index(F('accessor'), F('created_at').desc(), F('id').desc(), name='project_accessor_newest'),
+        ]
+
     def __str__(self):
         return f"Project for Job: {self.job.building_type} (Status: {self.status})"
 
@@ -283,15 +363,17 @@ class Quote(models.Model):
     ]
     building_type = models.CharField(max_length=50, choices=BUILDING_TYPES, blank=True, null=True)
     status = models.CharField(max_length=50, choices=STATUS_CHOICES, default='pending')
-    preferred_date = models.CharField(max_length=255)
-    preferred_time = models.CharField(max_length=255)
+    # Typed as on Job, see core.quote_values
+    preferred_date = models.DateField(null=True, blank=True)
+    preferred_time = models.TimeField(null=True, blank=True)
     property_type = models.CharField(max_length=255)
-    property_size = models.CharField(max_length=255)
-    bedrooms = models.CharField(max_length=255)
+    property_size = models.DecimalField(max_digits=8, decimal_places=2, null=True, blank=True)  # Floor area, m2
+    bedrooms = models.PositiveSmallIntegerField(null=True, blank=True)
     additional_features = models.CharField(max_length=255, blank=True, null=True)
     heat_pump_installed = models.CharField(max_length=255)
     county = models.CharField(max_length=255)
     nearest_town = models.CharField(max_length=255)
+    eircode = models.CharField(max_length=255, blank=True, null=True)  # Placed by its routing key (core.places)
     ber_purpose = models.CharField(max_length=255)
     lidar = models.FileField(upload_to='lidar_data/', blank=True, null=True)
     uploaded_at = models.DateTimeField(auto_now_add=True)
@@ -300,6 +382,11 @@ class Quote(models.Model):
     name = models.CharField(max_length=255)
     email_address = models.CharField(max_length=255)
     mobile_number = models.CharField(max_length=255)
+    # {field: text} of the typed fields above whose free text didn't read when they were
+    # converted (migration 0026), see the legacy_values command
+    legacy_values = models.JSONField(default=dict, blank=True, editable=False)
+    # Key of the draft token the quote was created from (see core.quote_drafts)
+    draft_key = models.CharField(max_length=32, unique=True, null=True, blank=True, editable=False)
 
 
     def __str__(self):
@@ -325,7 +412,51 @@ class Payment(models.Model):
         return f"Payment of {self.amount} {self.currency} for Job {self.job.building_type}"
 
 
+class AssessmentVersionConflict(Exception):
+    """The assessment was changed by someone else since the version the client sent."""
+
+    def __init__(self, current_version):
+        super().__init__(f"Assessment is at version {current_version}.")
+        self.current_version = current_version
+
+
+def property_key(field):
+    """
+    `field` (eircode or mprn) upper-cased without spaces, as it is indexed: 't12 ab34' and
+    'T12AB34' are the same property. See normalize_property_key() for the Python side.
+    """
+    return Upper(Replace(F(field), Value(' '), Value('')))
+
+
+def normalize_property_key(value):
+    return value.replace(' ', '').upper() if value else None
+
+
 class Assesment(models.Model):
+    DWELLING_TYPES = [
+        ('detached_house', 'Detached house'),
+        ('semi_detached_house', 'Semi-detached house'),
+        ('end_of_terrace', 'End of terrace'),
+        ('mid_terrace', 'Mid-terrace'),
+        ('ground_floor_apartment', 'Ground floor apartment'),
+        ('mid_floor_apartment', 'Mid-floor apartment'),
+        ('top_floor_apartment', 'Top floor apartment'),
+        ('basement_apartment', 'Basement apartment'),
+        ('maisonette', 'Maisonette'),
+    ]
+
+    AGE_BANDS = [
+        ('pre_1900', 'Pre 1900'),
+        ('between_1900_and_1929', '1900-1929'),
+        ('between_1930_and_1949', '1930-1949'),
+        ('between_1950_and_1966', '1950-1966'),
+        ('between_1967_and_1977', '1967-1977'),
+        ('between_1978_and_1982', '1978-1982'),
+        ('between_1983_and_1993', '1983-1993'),
+        ('between_1994_and_1999', '1994-1999'),
+        ('from_2000_onwards', '2000 onwards'),
+    ]
+
     quote = models.ForeignKey(Quote, on_delete=models.CASCADE, related_name="assessments", null=True, blank=True)
     project =models.ForeignKey(Project, on_delete=models.CASCADE, related_name='assesments', null=True, blank=True)
     #Link to Client and Accessor
@@ -345,84 +476,145 @@ class Assesment(models.Model):
     mprn = models.CharField(null=True, blank=True, max_length=255)
 
     #dwelling_type
-    # Type of Rating
-    detached_house = models.BooleanField(default=False)
-    semi_detached_house = models.BooleanField(default=False)
-    end_of_terrace = models.BooleanField(default=False)
-    mid_terrace = models.BooleanField(default=False)
-    ground_floor_apartment = models.BooleanField(default=False)
-    mid_floor_apartment = models.BooleanField(default=False)
-    top_floor_apartment = models.BooleanField(default=False)
-    basement_apartment = models.BooleanField(default=False)
-    maisonette = models.BooleanField(default=False)
+    dwelling_type = models.CharField(max_length=32, choices=DWELLING_TYPES, null=True, blank=True, db_index=True)
 
     #Age: Dwelling
-    # Age categories
-    pre_1900 = models.BooleanField(default=False)
-    between_1900_and_1929 = models.BooleanField(default=False)
-    between_1930_and_1949 = models.BooleanField(default=False)
-    between_1950_and_1966 = models.BooleanField(default=False)
-    between_1967_and_1977 = models.BooleanField(default=False)
-    between_1978_and_1982 = models.BooleanField(default=False)
-    between_1983_and_1993 = models.BooleanField(default=False)
-    between_1994_and_1999 = models.BooleanField(default=False)
-    from_2000_onwards = models.BooleanField(default=False)
-
-
-    #age_extension_1
-    xpre_1900 = models.BooleanField(default=False)
-    xbetween_1900_and_1929 = models. BooleanField(default=False)
-    xbetween_1930_and_1949 = models.BooleanField(default=False)
-    xbetween_1950_and_1966 = models.BooleanField(default=False)
-    xbetween_1967_and_1977 = models.BooleanField(default=False)
-    xbetween_1978_and_1982 = models.BooleanField(default=False)
-    xbetween_1983_and_1993 = models.BooleanField(default=False)
-    xbetween_1994_and_1999 = models.BooleanField(default=False)
-    xfrom_2000_onwards = models.BooleanField(default=False)
-
-
-    #age_extension_2
-    xxpre_1900 = models.BooleanField(default=False)
-    xxbetween_1900_and_1929 = models.BooleanField(default=False)
-    xxbetween_1930_and_1949 = models.BooleanField(default=False)
-    xxbetween_1950_and_1966 = models.BooleanField(default=False)
-    xxbetween_1967_and_1977 = models.BooleanField(default=False)
-    xxbetween_1978_and_1982 = models.BooleanField(default=False)
-    xxbetween_1983_and_1993 = models.BooleanField(default=False)
-    xxbetween_1994_and_1999 = models.BooleanField(default=False)
-    xxfrom_2000_onwards = models.BooleanField(default=False)
+    age_band = models.CharField(max_length=32, choices=AGE_BANDS, null=True, blank=True, db_index=True)
+    extension_1_age_band = models.CharField(max_length=32, choices=AGE_BANDS, null=True, blank=True, db_index=True)
+    extension_2_age_band = models.CharField(max_length=32, choices=AGE_BANDS, null=True, blank=True, db_index=True)
 
     #type of rating
     new_final_dwelling = models.BooleanField(default=False)
     existing_dwelling = models.BooleanField(default=False)
-    # Purpose of rating
-    new_owner_occupation = models.BooleanField(default=False)
-    sale = models.BooleanField(default=False)
-    private_letting = models.BooleanField(default=False)
-    social_housing_letting = models.BooleanField(default=False)
-    grant_support = models.BooleanField(default=False)
-    major_renovation = models.BooleanField(default=False)
-    purpose_of_rating_other = models.BooleanField(default=False)
+    # Purpose of rating, bit per box in form order (see core.checkbox_groups)
+    purpose_of_rating = models.PositiveSmallIntegerField(default=0)
     purpose_of_rating_other_text = models.CharField(null=True, blank=True, max_length=255)
 
+
+    lidar = models.FileField(upload_to='lidar_assesment/', blank=True, null=True)
+
+    # Bumped on every save_changes(); sent to clients as the ETag of the assessment
+    version = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(default=timezone.now, editable=False, db_index=True)
+
+    class Meta:
+        verbose_name = "Property Assessment"
+        verbose_name_plural = "Property Assessments"
+        indexes = [
+            # Earlier surveys of the same property, see core.prefill
+            models.Index(property_key('eircode'), name='assessment_eircode_key'),
+            models.Index(property_key('mprn'), name='assessment_mprn_key'),
+        ]
+
+    def section(self, name):
+        """
+        Return the `name` section row (see ASSESSMENT_SECTIONS). Sections are loaded on first
+        access; one that was never written is returned unsaved with its model defaults.
+        """
+        try:
+            return getattr(self, name)
+        except ObjectDoesNotExist:
+            section = ASSESSMENT_SECTIONS[name](assessment=self)
+            setattr(self, name, section)
+            return section
+
+    def rooms_by_position(self):
+        """The AssessmentRoom rows by position, loaded (or taken from prefetch_related) once."""
+        if '_rooms_by_position' not in self.__dict__:
+            rooms = self.room_rows.all() if self.pk else []
+            self._rooms_by_position = {room.position: room for room in rooms}
+        return self._rooms_by_position
+
+    def storeys_by_name(self):
+        """The AssessmentStorey rows by storey, loaded (or taken from prefetch_related) once."""
+        if '_storeys_by_name' not in self.__dict__:
+            storeys = self.storeys.all() if self.pk else []
+            self._storeys_by_name = {storey.storey: storey for storey in storeys}
+        return self._storeys_by_name
+
+    def save_changes(self, fields, sections=None, expected_version=None, children=(), deleted=(), changed_by=None):
+        """
+        Write the already-assigned `fields` of this row and of each section in `sections`
+        ({section name: [field names]}) as one new version, touching only those columns.
+        `children` are (row, [field names]) pairs of child rows (rooms, storeys) to save in
+        the same way, in order; `deleted` are child rows to delete. The new version is recorded
+        as an AssessmentRevision by `changed_by`.
+
+        With `expected_version`, raise AssessmentVersionConflict instead of writing when the
+        stored row is at another version.
+        """
+        sections = sections or {}
+        if not fields and not sections and not children and not deleted:
+            if expected_version is not None and expected_version != self.version:
+                raise AssessmentVersionConflict(self.version)
+            return
+
+        with transaction.atomic():
+            # The conditional UPDATE also locks the row until the section writes are done
+            rows = Assesment.objects.filter(pk=self.pk)
+            if expected_version is not None:
+                rows = rows.filter(version=expected_version)
+            if not rows.update(version=F('version') + 1):
+                raise AssessmentVersionConflict(
+                    Assesment.objects.filter(pk=self.pk).values_list('version', flat=True).first()
+                )
+            if expected_version is not None:
+                self.version = expected_version + 1
+            else:
+                self.version = Assesment.objects.filter(pk=self.pk).values_list('version', flat=True).get()
+
+            # What was written goes to the revision: new rows in full, others only the fields saved
+            changes = {}
+            if fields:
+                self.save(update_fields=fields)
+                changes['assessment'] = AssessmentRevision.row_values(self, fields)
+            rows = [(self.section(name), section_fields) for name, section_fields in sections.items()]
+            for row, row_fields in [*rows, *children]:
+                if row._state.adding:
+                    row.save(force_insert=True)
+                    changes[AssessmentRevision.row_key(row)] = AssessmentRevision.row_values(row)
+                elif row_fields:
+                    row.save(update_fields=row_fields)
+                    changes.setdefault(AssessmentRevision.row_key(row), {}).update(
+                        AssessmentRevision.row_values(row, row_fields))
+            for row in deleted:
+                changes[AssessmentRevision.row_key(row)] = None
+                row.delete()
+            AssessmentRevision.record(self, changes, changed_by)
+
+
+class AssessmentSection(models.Model):
+    """
+    Base for the tables split out of Assesment. A section row shares its primary key
+    with the assessment and is only created the first time one of its fields is written.
+    """
+
+    class Meta:
+        abstract = True
+
+
+class AssessmentEnvelope(AssessmentSection):
+    """Walls, roofs, floors, per-storey heat loss areas and thermal mass (pages 1-2)."""
+
+    WALL_CONSTRUCTIONS = [
+        ('stone', 'Stone'),
+        ('solid_brick', 'Solid brick'),
+        ('cavity', 'Cavity'),
+        ('solid_concrete', 'Solid concrete'),
+        ('hollow_block', 'Hollow block'),
+        ('timber_frame', 'Timber frame'),
+        ('other_unknown', 'Other/unknown'),
+    ]
+
+    assessment = models.OneToOneField(Assesment, on_delete=models.CASCADE, primary_key=True, related_name='envelope')
+
     #Wall construction main wall
-    stone = models.BooleanField(default=False)
-    solid_brick = models.BooleanField(default=False)
-    cavity = models.BooleanField(default=False)
-    solid_concrete = models.BooleanField(default=False)
-    hollow_block = models.BooleanField(default=False)
-    timber_frame = models.BooleanField(default=False)
-    other_unknown = models.BooleanField(default=False)
+    wall_construction = models.CharField(max_length=32, choices=WALL_CONSTRUCTIONS, null=True, blank=True, db_index=True)
     other_unknow_text = models.CharField(null=True, blank=True, max_length=255)
     insulation_thickness_observable = models.CharField(null=True, blank=True, max_length=255)
 
     # Roof Construction: Main Dwelling
-    pitched_insulation_btw_joists = models.BooleanField(default=False)
-    pitched_insulation_in_rafters = models.BooleanField(default=False)
-    Flat_insulation_integral = models.BooleanField(default=False)
-    room_in_roof = models.BooleanField(default=False)
-    no_heat_loss_roof = models.BooleanField(default=False)
-    roof_Construction_Other =models.BooleanField(default=False)
+    roof_construction = models.PositiveSmallIntegerField(default=0)  # bit per box, in form order
     roof_Construction_Other_text = models.CharField(null=True, blank=True, max_length=255)
     #Roof insulations : Main Dwelling
     thinkness = models.FloatField(blank = True, null = True)
@@ -450,23 +642,12 @@ class Assesment(models.Model):
     Ground_Floor_Construction_Main_Dwelling_unknow = models.BooleanField(default=False)
 
     # Wall construction main wall TYPE 2
-    type_2_stone = models.BooleanField(default=False)
-    Type_2_solid_brick = models.BooleanField(default=False)
-    type_2_cavity = models.BooleanField(default=False)
-    type_2_solid_concrete = models.BooleanField(default=False)
-    type_2_hollow_block = models.BooleanField(default=False)
-    type_2_timber_frame = models.BooleanField(default=False)
-    type_2_other_unknown = models.BooleanField(default=False)
+    type_2_wall_construction = models.CharField(max_length=32, choices=WALL_CONSTRUCTIONS, null=True, blank=True, db_index=True)
     type_2_other_text = models.CharField(null=True, blank=True, max_length=255)
     type_2_insulation_thickness_observable = models.CharField(null=True, blank=True, max_length=255)
 
     # Roof Construction: Type 2
-    type_2_pitched_insulation_btw_joists = models.BooleanField(default=False)
-    type_2_pitched_insulation_in_rafters = models.BooleanField(default=False)
-    type_2_Flat_insulation_integral = models.BooleanField(default=False)
-    type_2_room_in_roof = models.BooleanField(default=False)
-    type_2_no_heat_loss_roof = models.BooleanField(default=False)
-    type_2_roof_Construction_Other = models.BooleanField(default=False)
+    type_2_roof_construction = models.PositiveSmallIntegerField(default=0)  # bit per box, in form order
     type_2_roof_Construction_Other_text = models.CharField(null=True, blank=True, max_length=255)
     # Roof insulations : Main Dwelling TYPE 2
     type_2_thinkness = models.FloatField(blank=True, null=True)
@@ -494,23 +675,12 @@ class Assesment(models.Model):
     type_2_ground_floor_construction_main_dwelling_unknow = models.BooleanField(default=False)
 
     # Wall construction main wall TYPE 3
-    type_3_stone = models.BooleanField(default=False)
-    Type_3_solid_brick = models.BooleanField(default=False)
-    type_3_cavity = models.BooleanField(default=False)
-    type_3_solid_concrete = models.BooleanField(default=False)
-    type_3_hollow_block = models.BooleanField(default=False)
-    type_3_timber_frame = models.BooleanField(default=False)
-    type_3_ther_unknown = models.BooleanField(default=False)
+    type_3_wall_construction = models.CharField(max_length=32, choices=WALL_CONSTRUCTIONS, null=True, blank=True, db_index=True)
     type_3_ther_unknown_text = models.CharField(null=True, blank=True, max_length=255)
     type_3_insulation_thickness_observable = models.CharField(null=True, blank=True, max_length=255)
 
     # Roof Construction: Type 3
-    type_3_pitched_insulation_btw_joists = models.BooleanField(default=False)
-    type_3_pitched_insulation_in_rafters = models.BooleanField(default=False)
-    type_3_Flat_insulation_integral = models.BooleanField(default=False)
-    type_3_room_in_roof = models.BooleanField(default=False)
-    type_3_no_heat_loss_roof = models.BooleanField(default=False)
-    type_3_roof_Construction_Other = models.BooleanField(default=False)
+    type_3_roof_construction = models.PositiveSmallIntegerField(default=0)  # bit per box, in form order
     type_3_roof_Construction_Other_text = models.CharField(null=True, blank=True, max_length=255)
     # Roof insulations : Main Dwelling TYPE 3
     type_3_thinkness = models.FloatField(blank=True, null=True)
@@ -538,23 +708,12 @@ class Assesment(models.Model):
     type_3_ground_floor_construction_main_dwelling_unknow = models.BooleanField(default=False)
 
     # Wall construction main wall TYPE 3
-    type_4_stone = models.BooleanField(default=False)
-    Type_4_solid_brick = models.BooleanField(default=False)
-    type_4_cavity = models.BooleanField(default=False)
-    type_4_solid_concrete = models.BooleanField(default=False)
-    type_4_hollow_block = models.BooleanField(default=False)
-    type_4_timber_frame = models.BooleanField(default=False)
-    type_4_ther_unknown = models.BooleanField(default=False)
+    type_4_wall_construction = models.CharField(max_length=32, choices=WALL_CONSTRUCTIONS, null=True, blank=True, db_index=True)
     type_4_ther_unknown_text = models.CharField(null=True, blank=True, max_length=255)
     type_4_insulation_thickness_observable = models.CharField(null=True, blank=True, max_length=255)
 
     # Roof Construction: Type 3
-    type_4_pitched_insulation_btw_joists = models.BooleanField(default=False)
-    type_4_pitched_insulation_in_rafters = models.BooleanField(default=False)
-    type_4_Flat_insulation_integral = models.BooleanField(default=False)
-    type_4_room_in_roof = models.BooleanField(default=False)
-    type_4_no_heat_loss_roof = models.BooleanField(default=False)
-    type_4_roof_Construction_Other = models.BooleanField(default=False)
+    type_4_roof_construction = models.PositiveSmallIntegerField(default=0)  # bit per box, in form order
     type_4_roof_Construction_Other_text = models.CharField(null=True, blank=True, max_length=255)
     # Roof insulations : Main Dwelling TYPE 3
     type_4_thinkness = models.FloatField(blank=True, null=True)
@@ -581,6 +740,40 @@ class Assesment(models.Model):
     type_4_ground_floor_construction_main_dwelling_dense = models.BooleanField(default=False)
     type_4_ground_floor_construction_main_dwelling_unknow = models.BooleanField(default=False)
 
+    #################PAGE 2####################################
+    # Total floor areas and heat loss areas per storey are AssessmentStorey rows
+
+    living_area = models.FloatField(blank=True, null=True)
+    room_in_roof_area = models.FloatField(blank=True, null=True)
+    #########perimeter_total_ground_floor_(P/A)_ratio##################
+    f_type_1 = models.FloatField(blank=True, null=True)
+    f_type_2 = models.FloatField(blank=True, null=True)
+    f_type_3 = models.FloatField(blank=True, null=True)
+
+
+    #########THERMAL MASS##################
+    external_wall_light = models.BooleanField(default=False)
+    external_wall_med = models.BooleanField(default=False)
+    external_wall_heavy = models.BooleanField(default=False)
+
+    floor_light = models.BooleanField(default=False)
+    floor_med = models.BooleanField(default=False)
+    floor_heavy = models.BooleanField(default=False)
+
+    separating_wall_light = models.BooleanField(default=False)
+    separating_wall_med = models.BooleanField(default=False)
+    separating_wall_heavy = models.BooleanField(default=False)
+
+    internal_wall_light = models.BooleanField(default=False)
+    internal_wall_med = models.BooleanField(default=False)
+    internal_wall_heavy = models.BooleanField(default=False)
+
+    overall_thermall_mass = models.CharField(blank=True, null=True, max_length=50)
+
+
+class AssessmentVentilation(AssessmentSection):
+    """Ventilation factors and lighting summary (page 3)."""
+    assessment = models.OneToOneField(Assesment, on_delete=models.CASCADE, primary_key=True, related_name='ventilation')
 
     #########################PAGE 3###################################
     #VENTILATION FACTORS
@@ -608,6 +801,13 @@ class Assesment(models.Model):
     halogen_lamps = models.IntegerField(blank=True, null=True)
     incadescent_unknown = models.CharField(blank=True, null=True, max_length=255)
 
+    draughts_tripping = models.FloatField(blank=True, null=True)
+    lighting_design = models.CharField(blank=True, null=True, max_length=50)
+
+
+class AssessmentHeating(AssessmentSection):
+    """Space heating systems, fuels, controls and group heating (pages 3 and 5)."""
+    assessment = models.OneToOneField(Assesment, on_delete=models.CASCADE, primary_key=True, related_name='heating')
 
     #SPACE HEATING SYSTEM (GENERAL INFORMATION)
 
@@ -673,19 +873,10 @@ class Assesment(models.Model):
 
     #GAS_OIL_LPG BOILERS (PRIMAR/SECONDARY)
     gas_oil_lpg = models.CharField(null=True, blank=True, max_length=255)
-    #BOILER TYPE
-    standard = models.BooleanField(default=False)
-    Combi = models.BooleanField(default=False)
-    condensing = models.BooleanField(default=False)
-    back_boiler = models.BooleanField(default=False)
-    cpsu = models.BooleanField(default=False)
-    range_cooker = models.BooleanField(default=False)
-    single_burner = models.BooleanField(default=False)
-    twin_burner = models.BooleanField(default=False)
+    #BOILER TYPE, bit per box in form order (see core.checkbox_groups)
+    boiler_type = models.PositiveSmallIntegerField(default=0)
     #FLUE TYPE
-    open = models.BooleanField(default=False)
-    balanced = models.BooleanField(default=False)
-    fan_assisted = models.BooleanField(default=False)
+    boiler_flue_type = models.PositiveSmallIntegerField(default=0)
     #AGE
     pre_1998_or_later = models.BooleanField(default=False)
     pre_1998 = models.BooleanField(default=False)
@@ -750,9 +941,7 @@ class Assesment(models.Model):
     open_fronted = models.BooleanField(default=False)
     glass_fronted = models.BooleanField(default=False)
     ##FLUE TYPE
-    flue_type_open = models.BooleanField(default=False)
-    flue_type_balanced = models.BooleanField(default=False)
-    flue_type_fan_assisted = models.BooleanField(default=False)
+    room_heater_flue_type = models.PositiveSmallIntegerField(default=0)
 
     ##WARM AIR SYSTEM
     warm_air_syetem = models.CharField(blank=True, null=True, max_length=255)
@@ -812,6 +1001,81 @@ class Assesment(models.Model):
     thermal = models.IntegerField(blank=True, null=True,)
     fuel = models.CharField(blank=True, null=True,)
 
+    ###################### Page 5 ################################
+
+    #HEATING CONTROL #####
+    no_controls = models.BooleanField(default=False)
+    programmer_time_clock = models.BooleanField(default=False)
+    room_thermostat = models.BooleanField(default=False)
+    number = models.CharField(blank=True, null=True, max_length=50)
+    trvs = models.BooleanField(default=False)
+    per_rads_trvs = models.CharField(blank=True, null=True, max_length=50)
+    bypass = models.BooleanField(default=False)
+    load_compensator = models.BooleanField(default=False)
+    weather_compersator = models.BooleanField(default=False)
+    full_zone_control = models.BooleanField(default=False)
+    boiler_energy_management = models.BooleanField(default=False)
+    delay_start_thermostat = models.BooleanField(default=False)
+    boiler_interlock = models.BooleanField(default=False)
+    appliances_thermostat = models.BooleanField(default=False)
+    appliances_time_clock = models.BooleanField(default=False)
+
+    ###HEATING SYSTEM CONTROLS##########
+    in_insulated_timber_floor = models.BooleanField(default=False)
+    in_screed = models.BooleanField(default=False)
+    in_concrete = models.BooleanField(default=False)
+    whole_house_UFH = models.BooleanField(default=False)
+    partial_UFH_including_living_area = models.BooleanField(default=False)
+    partial_UFH_not_including_living_area = models.BooleanField(default=False)
+
+    #######PUMPS##########
+    central_heating_pumps_for_space_heating = models.IntegerField(blank = True, null = True)
+    central_heating_pumps_outdoors = models.IntegerField(blank = True, null = True)
+    oil_boiler_fuel_pumps = models.IntegerField(blank = True, null = True)
+    oil_fuel_pumps_outdoors = models.IntegerField(blank = True, null = True)
+    gas_boiler_flue_fans = models.IntegerField(blank = True, null = True)
+
+    #######COMMENTS ON HEATING CONTROLS#########
+    comments_on_heating_controls = models.BooleanField(default=False)
+
+
+    ########GROUP HEATING############
+    #####DISTRIBUTION LOSS FACTOR AND CHARGE METHOD############
+    pre_1991_full_flow_mid_high_temp_not_pre_insulated = models.BooleanField(default=False)
+    pre_1991_full_flow_low_temp_pre_insulated = models.BooleanField(default=False)
+    from_1991_or_later_variable_flow_mid_temp_pre_insulated = models.BooleanField(default=False)
+    from_1991_or_later_variable_flow_low_temp_pre_insulated = models.BooleanField(default=False)
+    consumption_charged_flat_rate = models.BooleanField(default=False)
+    linked_to_use = models.BooleanField(default=False)
+
+    ###########HEATING SYSTEM #1####################
+    efficiency = models.FloatField(blank = True, null = True)
+    proportion_of_group_heating = models.FloatField(blank = True, null = True)
+    fuel_type_heating_system = models.CharField(blank = True, null = True)
+    heating_system_1_make_model = models.CharField(blank = True, null = True)
+
+    ###########HEATING SYSTEM #2####################
+    efficiency_2 = models.FloatField(blank=True, null=True)
+    proportion_of_group_heating_2 = models.FloatField(blank=True, null=True)
+    fuel_type_heating_system_2 = models.CharField(blank=True, null=True)
+    heating_system_1_make_model_2 = models.CharField(blank=True, null=True)
+
+    ############CHP WASTE HEAT ########################
+    group_heating_heat_from_chp = models.FloatField(blank=True, null=True, max_length=20)
+    group_heating_power_station = models.BooleanField(default=False)
+    group_heating_chp = models.BooleanField(default=False)
+    ################CHP EFFFICIENCIES###############
+    group_heating_electrical = models.BooleanField(default=False)
+    group_heating_thermal = models.BooleanField(default=False)
+    group_heating_fuel = models.CharField(blank=True, null=True, max_length=50)
+
+    group_heating_any_other_comment = models.CharField(blank=True, null=True, max_length=50)
+
+
+class AssessmentHotWater(AssessmentSection):
+    """Hot water system, cylinder, solar and showers (page 4)."""
+    assessment = models.OneToOneField(Assesment, on_delete=models.CASCADE, primary_key=True, related_name='hot_water')
+
 ##############################PAGE 4######################################
     ##HEATING SYSTEM
     ##PRIMARY HOT WATER SYSTEM
@@ -915,282 +1179,14 @@ class Assesment(models.Model):
     Shower_5_flow_rate = models.CharField(blank=True, null=True, max_length=100)
     Shower_5_whhr_1 = models.CharField(blank=True, null=True, max_length=100)
     Shower_5_whhr_2 = models.CharField(blank=True, null=True, max_length=100)
-    ###################### Page 5 ################################
 
-    #HEATING CONTROL #####
-    no_controls = models.BooleanField(default=False)
-    programmer_time_clock = models.BooleanField(default=False)
-    room_thermostat = models.BooleanField(default=False)
-    number = models.CharField(blank=True, null=True, max_length=50)
-    trvs = models.BooleanField(default=False)
-    per_rads_trvs = models.CharField(blank=True, null=True, max_length=50)
-    bypass = models.BooleanField(default=False)
-    load_compensator = models.BooleanField(default=False)
-    weather_compersator = models.BooleanField(default=False)
-    full_zone_control = models.BooleanField(default=False)
-    boiler_energy_management = models.BooleanField(default=False)
-    delay_start_thermostat = models.BooleanField(default=False)
-    boiler_interlock = models.BooleanField(default=False)
-    appliances_thermostat = models.BooleanField(default=False)
-    appliances_time_clock = models.BooleanField(default=False)
-
-    ###HEATING SYSTEM CONTROLS##########
-    in_insulated_timber_floor = models.BooleanField(default=False)
-    in_screed = models.BooleanField(default=False)
-    in_concrete = models.BooleanField(default=False)
-    whole_house_UFH = models.BooleanField(default=False)
-    partial_UFH_including_living_area = models.BooleanField(default=False)
-    partial_UFH_not_including_living_area = models.BooleanField(default=False)
-
-    #######PUMPS##########
-    central_heating_pumps_for_space_heating = models.IntegerField(blank = True, null = True)
-    central_heating_pumps_outdoors = models.IntegerField(blank = True, null = True)
-    oil_boiler_fuel_pumps = models.IntegerField(blank = True, null = True)
-    oil_fuel_pumps_outdoors = models.IntegerField(blank = True, null = True)
-    gas_boiler_flue_fans = models.IntegerField(blank = True, null = True)
-
-    #######COMMENTS ON HEATING CONTROLS#########
-    comments_on_heating_controls = models.BooleanField(default=False)
-
-
-    ########GROUP HEATING############
-    #####DISTRIBUTION LOSS FACTOR AND CHARGE METHOD############
-    pre_1991_full_flow_mid_high_temp_not_pre_insulated = models.BooleanField(default=False)
-    pre_1991_full_flow_low_temp_pre_insulated = models.BooleanField(default=False)
-    from_1991_or_later_variable_flow_mid_temp_pre_insulated = models.BooleanField(default=False)
-    from_1991_or_later_variable_flow_low_temp_pre_insulated = models.BooleanField(default=False)
-    consumption_charged_flat_rate = models.BooleanField(default=False)
-    linked_to_use = models.BooleanField(default=False)
-
-    ###########HEATING SYSTEM #1####################
-    efficiency = models.FloatField(blank = True, null = True)
-    proportion_of_group_heating = models.FloatField(blank = True, null = True)
-    fuel_type_heating_system = models.CharField(blank = True, null = True)
-    heating_system_1_make_model = models.CharField(blank = True, null = True)
-
-    ###########HEATING SYSTEM #2####################
-    efficiency_2 = models.FloatField(blank=True, null=True)
-    proportion_of_group_heating_2 = models.FloatField(blank=True, null=True)
-    fuel_type_heating_system_2 = models.CharField(blank=True, null=True)
-    heating_system_1_make_model_2 = models.CharField(blank=True, null=True)
-
-    ############CHP WASTE HEAT ########################
-    group_heating_heat_from_chp = models.FloatField(blank=True, null=True, max_length=20)
-    group_heating_power_station = models.BooleanField(default=False)
-    group_heating_chp = models.BooleanField(default=False)
-    ################CHP EFFFICIENCIES###############
-    group_heating_electrical = models.BooleanField(default=False)
-    group_heating_thermal = models.BooleanField(default=False)
-    group_heating_fuel = models.CharField(blank=True, null=True, max_length=50)
-
-    group_heating_any_other_comment = models.CharField(blank=True, null=True, max_length=50)
-
-
-    #################PAGE 2####################################
-    #############TOTAL FLOOR AREAS, HEAT LOSS FLOOR AREAS##########################
-    ground_storey_heigh = models.FloatField(blank=True, null=True)
-    ground_total_floor_area = models.FloatField(blank=True, null=True)
-    ground_heatloss_floor_1 = models.FloatField(blank=True, null=True)
-    ground_heatloss_floor_2 = models.FloatField(blank=True, null=True)
-    ground_heatloss_floor_3 = models.FloatField(blank=True, null=True)
-    ground_heatloss_floor_4 = models.FloatField(blank=True, null=True)
-    ground_heatloss_perimeter = models.FloatField(blank=True, null=True)
-    ground_heatloss_wall_1 = models.FloatField(blank=True, null=True)
-    ground_heatloss_wall_2 = models.FloatField(blank=True, null=True)
-    ground_heatloss_wall_3 = models.FloatField(blank=True, null=True)
-    ground_heatloss_wall_4 = models.FloatField(blank=True, null=True)
-    ground_heatloss_roof_1 = models.FloatField(blank=True, null=True)
-    ground_heatloss_roof_2 = models.FloatField(blank=True, null=True)
-    ground_heatloss_roof_3 = models.FloatField(blank=True, null=True)
-    ground_heatloss_roof_4 = models.FloatField(blank=True, null=True)
-
-    first_storey_heigh = models.FloatField(blank=True, null=True)
-    first_total_floor_area = models.FloatField(blank=True, null=True)
-    first_heatloss_floor_1 = models.FloatField(blank=True, null=True)
-    first_heatloss_floor_2 = models.FloatField(blank=True, null=True)
-    first_heatloss_floor_3 = models.FloatField(blank=True, null=True)
-    first_heatloss_floor_4 = models.FloatField(blank=True, null=True)
-    first_heatloss_perimeter = models.FloatField(blank=True, null=True)
-    first_heatloss_wall_1 = models.FloatField(blank=True, null=True)
-    first_heatloss_wall_2 = models.FloatField(blank=True, null=True)
-    first_heatloss_wall_3 = models.FloatField(blank=True, null=True)
-    first_heatloss_wall_4 = models.FloatField(blank=True, null=True)
-    first_heatloss_roof_1 = models.FloatField(blank=True, null=True)
-    first_heatloss_roof_2 = models.FloatField(blank=True, null=True)
-    first_heatloss_roof_3 = models.FloatField(blank=True, null=True)
-    first_heatloss_roof_4 = models.FloatField(blank=True, null=True)
-
-    second_storey_heigh = models.FloatField(blank=True, null=True)
-    second_total_floor_area = models.FloatField(blank=True, null=True)
-    second_heatloss_floor_1 = models.FloatField(blank=True, null=True)
-    second_heatloss_floor_2 = models.FloatField(blank=True, null=True)
-    second_heatloss_floor_3 = models.FloatField(blank=True, null=True)
-    second_heatloss_floor_4 = models.FloatField(blank=True, null=True)
-    second_heatloss_perimeter = models.FloatField(blank=True, null=True)
-    second_heatloss_wall_1 = models.FloatField(blank=True, null=True)
-    second_heatloss_wall_2 = models.FloatField(blank=True, null=True)
-    second_heatloss_wall_3 = models.FloatField(blank=True, null=True)
-    second_heatloss_wall_4 = models.FloatField(blank=True, null=True)
-    second_heatloss_roof_1 = models.FloatField(blank=True, null=True)
-    second_heatloss_roof_2 = models.FloatField(blank=True, null=True)
-    second_heatloss_roof_3 = models.FloatField(blank=True, null=True)
-    second_heatloss_roof_4 = models.FloatField(blank=True, null=True)
-
-    third_storey_heigh = models.FloatField(blank=True, null=True)
-    third_total_floor_area = models.FloatField(blank=True, null=True)
-    third_heatloss_floor_1 = models.FloatField(blank=True, null=True)
-    third_heatloss_floor_2 = models.FloatField(blank=True, null=True)
-    third_heatloss_floor_3 = models.FloatField(blank=True, null=True)
-    third_heatloss_floor_4 = models.FloatField(blank=True, null=True)
-    third_heatloss_perimeter = models.FloatField(blank=True, null=True)
-    third_heatloss_wall_1 = models.FloatField(blank=True, null=True)
-    third_heatloss_wall_2 = models.FloatField(blank=True, null=True)
-    third_heatloss_wall_3 = models.FloatField(blank=True, null=True)
-    third_heatloss_wall_4 = models.FloatField(blank=True, null=True)
-    third_heatloss_roof_1 = models.FloatField(blank=True, null=True)
-    third_heatloss_roof_2 = models.FloatField(blank=True, null=True)
-    third_heatloss_roof_3 = models.FloatField(blank=True, null=True)
-    third_heatloss_roof_4 = models.FloatField(blank=True, null=True)
-
-    basement_storey_heigh = models.FloatField(blank=True, null=True)
-    basement_total_floor_area = models.FloatField(blank=True, null=True)
-    basement_heatloss_floor_1 = models.FloatField(blank=True, null=True)
-    basement_heatloss_floor_2 = models.FloatField(blank=True, null=True)
-    basement_heatloss_floor_3 = models.FloatField(blank=True, null=True)
-    basement_heatloss_floor_4 = models.FloatField(blank=True, null=True)
-    basement_heatloss_perimeter = models.FloatField(blank=True, null=True)
-    basement_heatloss_wall_1 = models.FloatField(blank=True, null=True)
-    basement_heatloss_wall_2 = models.FloatField(blank=True, null=True)
-    basement_heatloss_wall_3 = models.FloatField(blank=True, null=True)
-    basement_heatloss_wall_4 = models.FloatField(blank=True, null=True)
-    basement_heatloss_roof_1 = models.FloatField(blank=True, null=True)
-    basement_heatloss_roof_2 = models.FloatField(blank=True, null=True)
-    basement_heatloss_roof_3 = models.FloatField(blank=True, null=True)
-    basement_heatloss_roof_4 = models.FloatField(blank=True, null=True)
-
-    ############
-
-    living_area = models.FloatField(blank=True, null=True)
-    room_in_roof_area = models.FloatField(blank=True, null=True)
-    #########perimeter_total_ground_floor_(P/A)_ratio##################
-    f_type_1 = models.FloatField(blank=True, null=True)
-    f_type_2 = models.FloatField(blank=True, null=True)
-    f_type_3 = models.FloatField(blank=True, null=True)
-
-    draughts_tripping = models.FloatField(blank=True, null=True)
-    lighting_design = models.CharField(blank=True, null=True, max_length=50)
-
-    #########THERMAL MASS##################
-    external_wall_light = models.BooleanField(default=False)
-    external_wall_med = models.BooleanField(default=False)
-    external_wall_heavy = models.BooleanField(default=False)
-
-    floor_light = models.BooleanField(default=False)
-    floor_med = models.BooleanField(default=False)
-    floor_heavy = models.BooleanField(default=False)
-
-    separating_wall_light = models.BooleanField(default=False)
-    separating_wall_med = models.BooleanField(default=False)
-    separating_wall_heavy = models.BooleanField(default=False)
-
-    internal_wall_light = models.BooleanField(default=False)
-    internal_wall_med = models.BooleanField(default=False)
-    internal_wall_heavy = models.BooleanField(default=False)
-
-    overall_thermall_mass = models.CharField(blank=True, null=True, max_length=50)
-
-    room_1_opening = models.CharField(blank=True, null=True, max_length=20)
-    room_1_opening_dimensions = models.FloatField(blank=True, null=True)
-    room_1_glazing_details = models.CharField(blank=True, null=True, max_length=20)
-    room_1_frame = models.CharField(blank=True, null=True, max_length=20)
-    room_1_gap = models.CharField(blank=True, null=True, max_length=20)
-    room_1_over_shading = models.CharField(blank=True, null=True, max_length=20)
-    room_1_direction = models.CharField(blank=True, null=True, max_length=20)
-    room_1_wall_roof_type = models.CharField(blank=True, null=True, max_length=20)
-    room_1_openable_windows_doors = models.CharField(blank=True, null=True, max_length=20)
-    room_1_windows_doors = models.CharField(blank=True, null=True, max_length=20)
-
-    room_2_opening = models.CharField(blank=True, null=True, max_length=20)
-    room_2_opening_dimensions = models.FloatField(blank=True, null=True)
-    room_2_glazing_details = models.CharField(blank=True, null=True, max_length=20)
-    room_2_frame = models.CharField(blank=True, null=True, max_length=20)
-    room_2_gap = models.CharField(blank=True, null=True, max_length=20)
-    room_2_over_shading = models.CharField(blank=True, null=True, max_length=20)
-    room_2_direction = models.CharField(blank=True, null=True, max_length=20)
-    room_2_wall_roof_type = models.CharField(blank=True, null=True, max_length=20)
-    room_2_openable_windows_doors = models.CharField(blank=True, null=True, max_length=20)
-    room_2_windows_doors = models.CharField(blank=True, null=True, max_length=20)
-
-    room_3_opening = models.CharField(blank=True, null=True, max_length=20)
-    room_3_opening_dimensions = models.FloatField(blank=True, null=True)
-    room_3_glazing_details = models.CharField(blank=True, null=True, max_length=20)
-    room_3_frame = models.CharField(blank=True, null=True, max_length=20)
-    room_3_gap = models.CharField(blank=True, null=True, max_length=20)
-    room_3_over_shading = models.CharField(blank=True, null=True, max_length=20)
-    room_3_direction = models.CharField(blank=True, null=True, max_length=20)
-    room_3_wall_roof_type = models.CharField(blank=True, null=True, max_length=20)
-    room_3_openable_windows_doors = models.CharField(blank=True, null=True, max_length=20)
-    room_3_windows_doors = models.CharField(blank=True, null=True, max_length=20)
-
-    room_4_opening = models.CharField(blank=True, null=True, max_length=20)
-    room_4_opening_dimensions = models.FloatField(blank=True, null=True)
-    room_4_glazing_details = models.CharField(blank=True, null=True, max_length=20)
-    room_4_frame = models.CharField(blank=True, null=True, max_length=20)
-    room_4_gap = models.CharField(blank=True, null=True, max_length=20)
-    room_4_over_shading = models.CharField(blank=True, null=True, max_length=20)
-    room_4_direction = models.CharField(blank=True, null=True, max_length=20)
-    room_4_wall_roof_type = models.CharField(blank=True, null=True, max_length=20)
-    room_4_openable_windows_doors = models.CharField(blank=True, null=True, max_length=20)
-    room_4_windows_doors = models.CharField(blank=True, null=True, max_length=20)
-
-    room_5_opening = models.CharField(blank=True, null=True, max_length=20)
-    room_5_opening_dimensions = models.FloatField(blank=True, null=True)
-    room_5_glazing_details = models.CharField(blank=True, null=True, max_length=20)
-    room_5_frame = models.CharField(blank=True, null=True, max_length=20)
-    room_5_gap = models.CharField(blank=True, null=True, max_length=20)
-    room_5_over_shading = models.CharField(blank=True, null=True, max_length=20)
-    room_5_direction = models.CharField(blank=True, null=True, max_length=20)
-    room_5_wall_roof_type = models.CharField(blank=True, null=True, max_length=20)
-    room_5_openable_windows_doors = models.CharField(blank=True, null=True, max_length=20)
-    room_5_windows_doors = models.CharField(blank=True, null=True, max_length=20)
-
-    ###########ROOM DATA##########################
-
-    room_1_chimney_flueless = models.FloatField(blank=True, null=True)
-    room_1_open_flues = models.FloatField(blank=True, null=True)
-    room_1_fans_vents = models.CharField(blank=True, null=True, max_length=20)
-    room_1_rads_with_or_trvs = models.CharField(blank=True, null=True, max_length=20)
-    room_1_number_of_fixed_lights = models.CharField(blank=True, null=True, max_length=20)
-    room_1_type_of_fixed_light = models.CharField(blank=True, null=True, max_length=20)
-
-    room_2_chimney_flueless = models.FloatField(blank=True, null=True)
-    room_2_open_flues = models.FloatField(blank=True, null=True)
-    room_2_fans_vents = models.CharField(blank=True, null=True, max_length=20)
-    room_2_rads_with_or_trvs = models.CharField(blank=True, null=True, max_length=20)
-    room_2_number_of_fixed_lights = models.CharField(blank=True, null=True, max_length=20)
-    room_2_type_of_fixed_light = models.CharField(blank=True, null=True, max_length=20)
-
-    room_3_chimney_flueless = models.FloatField(blank=True, null=True)
-    room_3_open_flues = models.FloatField(blank=True, null=True)
-    room_3_fans_vents = models.CharField(blank=True, null=True, max_length=20)
-    room_3_rads_with_or_trvs = models.CharField(blank=True, null=True, max_length=20)
-    room_3_number_of_fixed_lights = models.CharField(blank=True, null=True, max_length=20)
-    room_3_type_of_fixed_light = models.CharField(blank=True, null=True, max_length=20)
-
-    room_4_chimney_flueless = models.FloatField(blank=True, null=True)
-    room_4_open_flues = models.FloatField(blank=True, null=True)
-    room_4_fans_vents = models.CharField(blank=True, null=True, max_length=20)
-    room_4_rads_with_or_trvs = models.CharField(blank=True, null=True, max_length=20)
-    room_4_number_of_fixed_lights = models.CharField(blank=True, null=True, max_length=20)
-    room_4_type_of_fixed_light = models.CharField(blank=True, null=True, max_length=20)
-
-    room_5_chimney_flueless = models.FloatField(blank=True, null=True)
-    room_5_open_flues = models.FloatField(blank=True, null=True)
-    room_5_fans_vents = models.CharField(blank=True, null=True, max_length=20)
-    room_5_rads_with_or_trvs = models.CharField(blank=True, null=True, max_length=20)
-    room_5_number_of_fixed_lights = models.CharField(blank=True, null=True, max_length=20)
-    room_5_type_of_fixed_light = models.CharField(blank=True, null=True, max_length=20)
 
+class AssessmentRooms(AssessmentSection):
+    """
+    Totals over the assessment's AssessmentRoom rows. They are computed by the server
+    (core.room_totals) whenever a room changes.
+    """
+    assessment = models.OneToOneField(Assesment, on_delete=models.CASCADE, primary_key=True, related_name='rooms')
 
     room_opening_total = models.CharField(blank=True, null=True, max_length=20)
     room_opening_dimensions_totaL = models.FloatField(blank=True, null=True)
@@ -1211,11 +1207,193 @@ class Assesment(models.Model):
     room_type_of_fixed_light_total = models.CharField(blank=True, null=True, max_length=20)
 
 
-    lidar = models.FileField(upload_to='lidar_assesment/', blank=True, null=True)
+# Section name (the reverse accessor on Assesment) -> section model.
+ASSESSMENT_SECTIONS = {
+    'envelope': AssessmentEnvelope,
+    'ventilation': AssessmentVentilation,
+    'heating': AssessmentHeating,
+    'hot_water': AssessmentHotWater,
+    'rooms': AssessmentRooms,
+}
+
+
+class AssessmentRoom(models.Model):
+    """One room of the assessment: its openings and room data. Numbered from 1 by `position`."""
+    assessment = models.ForeignKey(Assesment, on_delete=models.CASCADE, related_name='room_rows')
+    position = models.PositiveSmallIntegerField()
+
+    # Openings
+    opening = models.CharField(blank=True, null=True, max_length=20)
+    opening_dimensions = models.FloatField(blank=True, null=True)
+    glazing_details = models.CharField(blank=True, null=True, max_length=20)
+    frame = models.CharField(blank=True, null=True, max_length=20)
+    gap = models.CharField(blank=True, null=True, max_length=20)
+    over_shading = models.CharField(blank=True, null=True, max_length=20)
+    direction = models.CharField(blank=True, null=True, max_length=20)
+    wall_roof_type = models.CharField(blank=True, null=True, max_length=20)
+    openable_windows_doors = models.CharField(blank=True, null=True, max_length=20)
+    windows_doors = models.CharField(blank=True, null=True, max_length=20)
+
+    # Room data
+    chimney_flueless = models.FloatField(blank=True, null=True)
+    open_flues = models.FloatField(blank=True, null=True)
+    fans_vents = models.CharField(blank=True, null=True, max_length=20)
+    rads_with_or_trvs = models.CharField(blank=True, null=True, max_length=20)
+    number_of_fixed_lights = models.CharField(blank=True, null=True, max_length=20)
+    type_of_fixed_light = models.CharField(blank=True, null=True, max_length=20)
 
     class Meta:
-        verbose_name = "Property Assessment"
-        verbose_name_plural = "Property Assessments"
+        ordering = ['position']
+        constraints = [
+            models.UniqueConstraint(fields=['assessment', 'position'], name='unique_assessment_room_position'),
+        ]
+
+    def __str__(self):
+        return f"Room {self.position} of assessment {self.assessment_id}"
+
+
+class AssessmentStorey(models.Model):
+    """Floor area and heat loss figures of one storey (page 2)."""
+    STOREYS = [
+        ('basement', 'Basement'),
+        ('ground', 'Ground'),
+        ('first', 'First'),
+        ('second', 'Second'),
+        ('third', 'Third'),
+    ]
+
+    assessment = models.ForeignKey(Assesment, on_delete=models.CASCADE, related_name='storeys')
+    storey = models.CharField(max_length=20, choices=STOREYS)
+    storey_height = models.FloatField(blank=True, null=True)
+    total_floor_area = models.FloatField(blank=True, null=True)
+    heatloss_perimeter = models.FloatField(blank=True, null=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['assessment', 'storey'], name='unique_assessment_storey'),
+        ]
+
+    def __str__(self):
+        return f"{self.get_storey_display()} storey of assessment {self.assessment_id}"
+
+    def areas_by_position(self):
+        """The AssessmentHeatLossArea rows by (element, position), loaded once."""
+        if '_areas_by_position' not in self.__dict__:
+            areas = self.heat_loss_areas.all() if self.pk else []
+            self._areas_by_position = {(area.element, area.position): area for area in areas}
+        return self._areas_by_position
+
+
+class AssessmentHeatLossArea(models.Model):
+    """One heat loss floor, wall or roof area of a storey, numbered from 1 per element."""
+    ELEMENTS = [
+        ('floor', 'Floor'),
+        ('wall', 'Wall'),
+        ('roof', 'Roof'),
+    ]
+
+    storey = models.ForeignKey(AssessmentStorey, on_delete=models.CASCADE, related_name='heat_loss_areas')
+    element = models.CharField(max_length=10, choices=ELEMENTS)
+    position = models.PositiveSmallIntegerField()
+    area = models.FloatField(blank=True, null=True)
+
+    class Meta:
+        ordering = ['element', 'position']
+        constraints = [
+            models.UniqueConstraint(fields=['storey', 'element', 'position'], name='unique_heat_loss_area_position'),
+        ]
+
+
+class AssessmentRevision(models.Model):
+    """
+    One version of an assessment, recorded by Assesment.save_changes(). `changes` holds only
+    what that save wrote: {row key: {field: new value}}, or {row key: None} for a deleted
+    child row (see row_key()). Every CHECKPOINT_EVERY versions, and for the first version
+    recorded, `snapshot` also holds every stored value of the assessment after the save, so
+    that a past version is rebuilt from the nearest checkpoint (see core.history).
+
+    Revisions are append-only: they are never updated, and only deleted with their assessment.
+    """
+    CHECKPOINT_EVERY = 50
+    # Fields that identify a row rather than hold data: they are part of its key
+    KEY_FIELDS = {'id', 'version', 'assessment', 'storey', 'element', 'position'}
+
+    assessment = models.ForeignKey(Assesment, on_delete=models.CASCADE, related_name='revisions')
+    version = models.PositiveIntegerField()
+    changed_by = models.ForeignKey(UserModel, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
+    changes = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    snapshot = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+
+    class Meta:
+        ordering = ['assessment', 'version']
+        constraints = [
+            models.UniqueConstraint(fields=['assessment', 'version'], name='unique_assessment_revision'),
+        ]
+
+    def __str__(self):
+        return f"Version {self.version} of assessment {self.assessment_id}"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError("Assessment revisions are append-only.")
+        super().save(*args, **kwargs)
+
+    @staticmethod
+    def row_key(row):
+        """'assessment', a section name, 'room:<position>', 'storey:<storey>' or 'area:<storey>:<element>:<position>'."""
+        if isinstance(row, Assesment):
+            return 'assessment'
+        if isinstance(row, AssessmentRoom):
+            return f'room:{row.position}'
+        if isinstance(row, AssessmentStorey):
+            return f'storey:{row.storey}'
+        if isinstance(row, AssessmentHeatLossArea):
+            return f'area:{row.storey.storey}:{row.element}:{row.position}'
+        return next(name for name, model in ASSESSMENT_SECTIONS.items() if isinstance(row, model))
+
+    @classmethod
+    def row_values(cls, row, fields=None):
+        """The stored values of `fields` (all of them by default) of a row, as JSON-ready values."""
+        if fields is None:
+            fields = [field.name for field in row._meta.concrete_fields if field.name not in cls.KEY_FIELDS]
+        values = {}
+        for name in fields:
+            field = row._meta.get_field(name)
+            value = field.get_prep_value(field.value_from_object(row))
+            # isoformat() keeps the microseconds, which DjangoJSONEncoder drops
+            values[name] = value.isoformat() if hasattr(value, 'isoformat') else value
+        return values
+
+    @classmethod
+    def snapshot_of(cls, assessment_id):
+        """Every stored value of the assessment, by row key, read from the database."""
+        assessment = (Assesment.objects.select_related(*ASSESSMENT_SECTIONS)
+                      .prefetch_related('room_rows', 'storeys__heat_loss_areas').get(pk=assessment_id))
+        rows = [assessment]
+        for name in ASSESSMENT_SECTIONS:
+            try:
+                rows.append(getattr(assessment, name))
+            except ObjectDoesNotExist:
+                pass
+        rows += assessment.room_rows.all()
+        for storey in assessment.storeys.all():
+            rows.append(storey)
+            rows += storey.heat_loss_areas.all()
+        return {cls.row_key(row): cls.row_values(row) for row in rows}
+
+    @classmethod
+    def record(cls, assessment, changes, changed_by=None):
+        """Append the revision for the version the assessment was just saved as."""
+        checkpoint = (assessment.version % cls.CHECKPOINT_EVERY == 0
+                      or not cls.objects.filter(assessment=assessment, version__lt=assessment.version).exists())
+        return cls.objects.create(
+            assessment=assessment,
+            version=assessment.version,
+            changed_by=changed_by,
+            changes=changes,
+            snapshot=cls.snapshot_of(assessment.pk) if checkpoint else None,
+        )
 
 
         ########################## NOT USED ############################################
@@ -0,0 +1,112 @@
+"""
+Keyset (cursor) pagination for the list endpoints.
+
+A page is read in a stable order, by default newest first on (created_at, id), and holds at
+most ?limit= rows (PAGE_LIMIT by default, MAX_PAGE_LIMIT at most). The next page starts
+after the last row of this one: its sort key goes in an opaque, signed cursor, sent back as
+the X-Next-Cursor header and a Link header with rel="next", and passed as ?cursor=.
+Reading a page is one indexed range scan whatever its depth, where OFFSET would read and
+drop every row before it. Response bodies keep their shape; an endpoint with two lists
+pages each one by its own ?<name>_cursor= and ?<name>_limit=.
+"""
+from datetime import date, datetime, time
+
+from django.core import signing
+from django.db.models import Q
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 200
+NEWEST_FIRST = ('-created_at', '-id')
+
+SALT = 'core.pagination'
+
+
+class PaginationError(Exception):
+    pass
+
+
+def keyset_filter(keys, values):
+    """
+    Rows after `values` in the order of `keys` (order_by() names). The first key is also
+    bounded on its own, so the database can start an index scan there instead of filtering.
+    """
+    after, equal = Q(), {}
+    for key, value in zip(keys, values):
+        name = key.lstrip('-')
+        after |= Q(**equal, **{f"{name}__{'lt' if key.startswith('-') else 'gt'}": value})
+        equal[name] = value
+    first = keys[0].lstrip('-')
+    return Q(**{f"{first}__{'lte' if keys[0].startswith('-') else 'gte'}": values[0]}) & after
+
+
+def _value(row, key):
+    # The value of an order_by() name in a model instance or a values() dict
+    name = key.lstrip('-')
+    if isinstance(row, dict):
+        value = row[name]
+    else:
+        value = row
+        for part in name.split('__'):
+            value = getattr(value, part)
+    return value.isoformat() if isinstance(value, (date, datetime, time)) else value
+
+
+class Page:
+    def __init__(self, request, name=None):
+        """The page asked for by ?cursor= and ?limit=, or ?<name>_cursor= and ?<name>_limit=."""
+        self.request = request
+        self.name = name
+        self.cursor_param = f'{name}_cursor' if name else 'cursor'
+        self.next_cursor = None
+        try:
+            self.limit = min(int(request.query_params.get(f'{name}_limit' if name else 'limit', PAGE_LIMIT)),
+                             MAX_PAGE_LIMIT)
+        except ValueError:
+            raise PaginationError("limit must be an integer.")
+        if self.limit < 1:
+            raise PaginationError("limit must be positive.")
+        cursor = request.query_params.get(self.cursor_param)
+        try:
+            self.cursor = signing.loads(cursor, salt=SALT) if cursor else None
+        except signing.BadSignature:
+            raise PaginationError("Invalid cursor.")
+
+    def after(self, keys):
+        """The sort key values of the cursor, None on the first page."""
+        if self.cursor is None:
+            return None
+        if self.cursor['keys'] != list(keys):
+            raise PaginationError("Invalid cursor.")
+        return self.cursor['after']
+
+    def order(self, queryset, keys=NEWEST_FIRST):
+        """`queryset` from the cursor on, in the order of `keys`."""
+        after = self.after(keys)
+        if after is not None:
+            queryset = queryset.filter(keyset_filter(keys, after))
+        return queryset.order_by(*keys)
+
+    def rows(self, queryset, keys=NEWEST_FIRST):
+        """The rows of the page from an ordered `queryset`, one query."""
+        rows = list(queryset[:self.limit + 1])
+        if len(rows) > self.limit:
+            rows = rows[:self.limit]
+            self.next_cursor = signing.dumps(
+                {'keys': list(keys), 'after': [_value(rows[-1], key) for key in keys]}, salt=SALT)
+        return rows
+
+    def add_headers(self, response):
+        """Add the cursor of the next page, if there is one, to `response`."""
+        if self.next_cursor is not None:
+            label = f'{self.name.title()}-' if self.name else ''
+            response[f'X-Next-{label}Cursor'] = self.next_cursor
+            url = replace_query_param(self.request.build_absolute_uri(), self.cursor_param, self.next_cursor)
+            rel = f'next-{self.name}' if self.name else 'next'
+            links = [response['Link']] if response.has_header('Link') else []
+            response['Link'] = ', '.join([*links, f'<{url}>; rel="{rel}"'])
+        return response
+
+    def response(self, data, status=200):
+        return self.add_headers(Response(data, status=status))
@@ -0,0 +1,201 @@
+"""
+Where jobs and accessors are: a local lookup table of Irish towns and Eircode routing keys.
+
+TOWNS holds the centre of each town by county, to about a kilometre, and ROUTING_KEYS the
+post town of each Eircode routing key (its first three characters), which is as close as an
+Eircode is placed without the full Eircode database. locate() places a job by its Eircode,
+else by its nearest town, read as typed: any case, "Co. Cork" for Cork, one typo allowed.
+"""
+import math
+import re
+
+from .search import edit_distance
+
+# County: {town: (latitude, longitude)}
+TOWNS = {
+    'CARLOW': {'CARLOW': (52.8365, -6.9341), 'MUINE BHEAG': (52.7003, -6.9578), 'BAGENALSTOWN': (52.7003, -6.9578),
+               'TULLOW': (52.8006, -6.7372)},
+    'CAVAN': {'CAVAN': (53.9908, -7.3606), 'BELTURBET': (54.1000, -7.4500), 'COOTEHILL': (54.0736, -7.0817),
+              'BAILIEBOROUGH': (53.9167, -6.9667), 'VIRGINIA': (53.8333, -7.0833)},
+    'CLARE': {'ENNIS': (52.8436, -8.9864), 'KILRUSH': (52.6397, -9.4833), 'SHANNON': (52.7036, -8.8642),
+              'KILKEE': (52.6814, -9.6461), 'ENNISTYMON': (52.9403, -9.2933), 'SIXMILEBRIDGE': (52.7411, -8.7739)},
+    'CORK': {'CORK': (51.8985, -8.4756), 'MALLOW': (52.1390, -8.6451), 'BANDON': (51.7460, -8.7425),
+             'YOUGHAL': (51.9536, -7.8506), 'MIDLETON': (51.9153, -8.1754), 'SKIBBEREEN': (51.5500, -9.2667),
+             'COBH': (51.8503, -8.2967), 'KINSALE': (51.7059, -8.5222), 'FERMOY': (52.1381, -8.2758),
+             'MACROOM': (51.9040, -8.9570), 'CLONAKILTY': (51.6231, -8.8706), 'BANTRY': (51.6800, -9.4528),
+             'CHARLEVILLE': (52.3558, -8.6836), 'MITCHELSTOWN': (52.2656, -8.2681),
+             'CARRIGALINE': (51.8117, -8.3986), 'BALLINCOLLIG': (51.8879, -8.5893),
+             'DUNMANWAY': (51.7206, -9.1126), 'GLANMIRE': (51.9167, -8.4000), 'CARRIGNAVAR': (51.9833, -8.4833),
+             'WATERGRASSHILL': (52.0117, -8.3436), 'CROOKSTOWN': (51.8433, -8.8317),
+             'KANTURK': (52.1711, -8.9050), 'MILLSTREET': (52.0597, -9.0661)},
+    'DONEGAL': {'LETTERKENNY': (54.9500, -7.7333), 'BUNCRANA': (55.1333, -7.4500), 'DONEGAL': (54.6540, -8.1100),
+                'LIFFORD': (54.8340, -7.4840), 'BALLYSHANNON': (54.5036, -8.1892), 'BUNDORAN': (54.4778, -8.2806),
+                'DUNGLOE': (54.9500, -8.3667)},
+    'DUBLIN': {'DUBLIN': (53.3498, -6.2603), 'SWORDS': (53.4597, -6.2181), 'BALBRIGGAN': (53.6128, -6.1819),
+               'MALAHIDE': (53.4508, -6.1544), 'SKERRIES': (53.5828, -6.1083), 'LUCAN': (53.3572, -6.4486),
+               'RUSH': (53.5228, -6.0933), 'LUSK': (53.5272, -6.1664), 'BLACKROCK': (53.3015, -6.1778),
+               'TALLAGHT': (53.2859, -6.3733), 'DUN LAOGHAIRE': (53.2940, -6.1340),
+               'GLENAGEARY': (53.2800, -6.1300), 'BALLYBOUGHAL': (53.5200, -6.2670),
+               'GARRISTOWN': (53.5656, -6.3847), 'OLDTOWN': (53.5250, -6.3150), 'CLONDALKIN': (53.3203, -6.3944),
+               'BLANCHARDSTOWN': (53.3881, -6.3775), 'DONABATE': (53.4853, -6.1506)},
+    'GALWAY': {'GALWAY': (53.2707, -9.0568), 'TUAM': (53.5150, -8.8510), 'LOUGHREA': (53.1969, -8.5669),
+               'BALLINASLOE': (53.3275, -8.2194), 'ATHENRY': (53.2964, -8.7431), 'CLIFDEN': (53.4894, -10.0189),
+               'GORT': (53.0667, -8.8167), 'ORANMORE': (53.2683, -8.9283), 'PORTUMNA': (53.0889, -8.2181)},
+    'KERRY': {'TRALEE': (52.2713, -9.6999), 'KILLARNEY': (52.0599, -9.5044), 'LISTOWEL': (52.4464, -9.4852),
+              'CAHERCIVEEN': (51.9480, -10.2220), 'KENMARE': (51.8801, -9.5831), 'DINGLE': (52.1408, -10.2689),
+              'CASTLEISLAND': (52.2328, -9.4636), 'KILLORGLIN': (52.1061, -9.7844)},
+    'KILDARE': {'NAAS': (53.2159, -6.6669), 'NEWBRIDGE': (53.1819, -6.7967), 'KILDARE': (53.1589, -6.9097),
+                'ATHY': (52.9917, -6.9861), 'CELBRIDGE': (53.3400, -6.5389), 'MAYNOOTH': (53.3813, -6.5918),
+                'MONASTEREVIN': (53.1420, -7.0640), 'CURRAGH': (53.1500, -6.8300), 'LEIXLIP': (53.3658, -6.4956),
+                'CLANE': (53.2914, -6.6869)},
+    'KILKENNY': {'KILKENNY': (52.6541, -7.2448), 'CALLAN': (52.5447, -7.3908), 'CASTLECOMER': (52.8058, -7.2103),
+                 'THOMASTOWN': (52.5264, -7.1372)},
+    'LAOIS': {'PORTLAOISE': (53.0344, -7.2998), 'PORTARLINGTON': (53.1622, -7.1911),
+              'MOUNTMELLICK': (53.1136, -7.3203), 'ABBEYLEIX': (52.9153, -7.3475)},
+    'LEITRIM': {'CARRICK-ON-SHANNON': (53.9469, -8.0900), 'MOHILL': (53.9217, -7.8656),
+                'MANORHAMILTON': (54.3050, -8.1775)},
+    'LIMERICK': {'LIMERICK': (52.6638, -8.6267), 'NEWCASTLE WEST': (52.4492, -9.0611),
+                 'KILMALLOCK': (52.4000, -8.5772), 'ABBEYFEALE': (52.3856, -9.3008), 'RATHKEALE': (52.5236, -8.9392)},
+    'LONGFORD': {'LONGFORD': (53.7276, -7.7932), 'GRANARD': (53.7781, -7.4944), 'BALLYMAHON': (53.5650, -7.7650)},
+    'LOUTH': {'DROGHEDA': (53.7179, -6.3561), 'DUNDALK': (54.0090, -6.4049), 'ARDEE': (53.8597, -6.5386)},
+    'MAYO': {'CASTLEBAR': (53.8550, -9.2880), 'WESTPORT': (53.8000, -9.5167), 'BALLINA': (54.1149, -9.1551),
+             'CLAREMORRIS': (53.7200, -9.0000), 'BALLINROBE': (53.6333, -9.2333), 'BALLYHAUNIS': (53.7633, -8.7650),
+             'SWINFORD': (53.9431, -8.9514), 'BELMULLET': (54.2250, -9.9900)},
+    'MEATH': {'NAVAN': (53.6528, -6.6814), 'TRIM': (53.5550, -6.7917), 'KELLS': (53.7264, -6.8792),
+              'ASHBOURNE': (53.5111, -6.3981), 'DUNBOYNE': (53.4194, -6.4750), 'DUNSHAUGHLIN': (53.5125, -6.5400),
+              'ENFIELD': (53.4150, -6.8333), 'RATOATH': (53.5064, -6.4656)},
+    'MONAGHAN': {'MONAGHAN': (54.2492, -6.9683), 'CASTLEBLAYNEY': (54.1200, -6.7400),
+                 'CARRICKMACROSS': (53.9778, -6.7192), 'CLONES': (54.1833, -7.2333)},
+    'OFFALY': {'TULLAMORE': (53.2739, -7.4889), 'BIRR': (53.0914, -7.9133), 'EDENDERRY': (53.3450, -7.0497),
+               'BANAGHER': (53.1886, -7.9856)},
+    'ROSCOMMON': {'ROSCOMMON': (53.6333, -8.1833), 'BOYLE': (53.9667, -8.3000), 'CASTLEREA': (53.7667, -8.4833),
+                  'STROKESTOWN': (53.7833, -8.1000), 'BALLAGHADERREEN': (53.9006, -8.5775)},
+    'SLIGO': {'SLIGO': (54.2766, -8.4761), 'BALLYMOTE': (54.0900, -8.5170), 'TUBBERCURRY': (54.0556, -8.7281),
+              'ENNISCRONE': (54.2144, -9.0944)},
+    'TIPPERARY': {'NENAGH': (52.8619, -8.1967), 'CLONMEL': (52.3550, -7.7039), 'THURLES': (52.6800, -7.8100),
+                  'CASHEL': (52.5159, -7.8855), 'CAHIR': (52.3750, -7.9250), 'TIPPERARY': (52.4736, -8.1558),
+                  'ROSCREA': (52.9511, -7.8017), 'CARRICK-ON-SUIR': (52.3492, -7.4131),
+                  'TEMPLEMORE': (52.7950, -7.8333)},
+    'WATERFORD': {'WATERFORD': (52.2593, -7.1101), 'DUNGARVAN': (52.0845, -7.6397), 'TRAMORE': (52.1624, -7.1524),
+                  'KILMACTHOMAS': (52.2030, -7.4210), 'LISMORE': (52.1369, -7.9311), 'DUNMORE EAST': (52.1511, -6.9931)},
+    'WESTMEATH': {'ATHLONE': (53.4239, -7.9407), 'MULLINGAR': (53.5259, -7.3381), 'MOATE': (53.3958, -7.7181),
+                  'KINNEGAD': (53.4581, -7.1033)},
+    'WEXFORD': {'WEXFORD': (52.3369, -6.4633), 'GOREY': (52.6747, -6.2925), 'ENNISCORTHY': (52.5008, -6.5578),
+                'NEW ROSS': (52.3961, -6.9367), 'BUNCLODY': (52.6553, -6.6508), 'ROSSLARE': (52.2531, -6.3842)},
+    'WICKLOW': {'WICKLOW': (52.9808, -6.0446), 'BRAY': (53.2028, -6.0983), 'ARKLOW': (52.7977, -6.1599),
+                'GREYSTONES': (53.1440, -6.0720), 'BLESSINGTON': (53.1700, -6.5325), 'BALTINGLASS': (52.9408, -6.7108)},
+}
+
+# Eircode routing key: (post town, county)
+ROUTING_KEYS = {
+    'A41': ('BALLYBOUGHAL', 'DUBLIN'), 'A42': ('GARRISTOWN', 'DUBLIN'), 'A45': ('OLDTOWN', 'DUBLIN'),
+    'A63': ('GREYSTONES', 'WICKLOW'), 'A67': ('WICKLOW', 'WICKLOW'), 'A75': ('CASTLEBLAYNEY', 'MONAGHAN'),
+    'A81': ('CARRICKMACROSS', 'MONAGHAN'), 'A82': ('KELLS', 'MEATH'), 'A83': ('ENFIELD', 'MEATH'),
+    'A84': ('ASHBOURNE', 'MEATH'), 'A85': ('DUNBOYNE', 'MEATH'), 'A86': ('DUNSHAUGHLIN', 'MEATH'),
+    'A91': ('DUNDALK', 'LOUTH'), 'A92': ('DROGHEDA', 'LOUTH'), 'A94': ('BLACKROCK', 'DUBLIN'),
+    'A96': ('GLENAGEARY', 'DUBLIN'), 'A98': ('BRAY', 'WICKLOW'), 'C15': ('NAVAN', 'MEATH'),
+    **{f'D{district:02}': ('DUBLIN', 'DUBLIN') for district in range(1, 25)}, 'D6W': ('DUBLIN', 'DUBLIN'),
+    'E21': ('CAHIR', 'TIPPERARY'), 'E25': ('CASHEL', 'TIPPERARY'), 'E32': ('CARRICK-ON-SUIR', 'TIPPERARY'),
+    'E34': ('TIPPERARY', 'TIPPERARY'), 'E41': ('THURLES', 'TIPPERARY'), 'E45': ('NENAGH', 'TIPPERARY'),
+    'E53': ('ROSCREA', 'TIPPERARY'), 'E91': ('CLONMEL', 'TIPPERARY'),
+    'F12': ('CLAREMORRIS', 'MAYO'), 'F23': ('CASTLEBAR', 'MAYO'), 'F26': ('BALLINA', 'MAYO'),
+    'F28': ('WESTPORT', 'MAYO'), 'F31': ('BALLINROBE', 'MAYO'), 'F35': ('BALLYHAUNIS', 'MAYO'),
+    'F42': ('BOYLE', 'ROSCOMMON'), 'F45': ('CASTLEREA', 'ROSCOMMON'), 'F52': ('STROKESTOWN', 'ROSCOMMON'),
+    'F56': ('BALLYMOTE', 'SLIGO'), 'F91': ('SLIGO', 'SLIGO'), 'F92': ('LETTERKENNY', 'DONEGAL'),
+    'F93': ('LIFFORD', 'DONEGAL'), 'F94': ('DONEGAL', 'DONEGAL'),
+    'H12': ('CAVAN', 'CAVAN'), 'H14': ('BELTURBET', 'CAVAN'), 'H16': ('COOTEHILL', 'CAVAN'),
+    'H18': ('MONAGHAN', 'MONAGHAN'), 'H23': ('CLONES', 'MONAGHAN'), 'H53': ('BALLINASLOE', 'GALWAY'),
+    'H54': ('TUAM', 'GALWAY'), 'H62': ('LOUGHREA', 'GALWAY'), 'H65': ('ATHENRY', 'GALWAY'),
+    'H71': ('CLIFDEN', 'GALWAY'), 'H91': ('GALWAY', 'GALWAY'),
+    'K32': ('BALBRIGGAN', 'DUBLIN'), 'K34': ('SKERRIES', 'DUBLIN'), 'K36': ('MALAHIDE', 'DUBLIN'),
+    'K45': ('LUSK', 'DUBLIN'), 'K56': ('RUSH', 'DUBLIN'), 'K67': ('SWORDS', 'DUBLIN'), 'K78': ('LUCAN', 'DUBLIN'),
+    'N37': ('ATHLONE', 'WESTMEATH'), 'N39': ('LONGFORD', 'LONGFORD'), 'N41': ('CARRICK-ON-SHANNON', 'LEITRIM'),
+    'N91': ('MULLINGAR', 'WESTMEATH'),
+    'P12': ('MACROOM', 'CORK'), 'P14': ('CROOKSTOWN', 'CORK'), 'P17': ('KINSALE', 'CORK'), 'P24': ('COBH', 'CORK'),
+    'P25': ('MIDLETON', 'CORK'), 'P31': ('BALLINCOLLIG', 'CORK'), 'P32': ('BALLINCOLLIG', 'CORK'),
+    'P36': ('YOUGHAL', 'CORK'), 'P43': ('CARRIGALINE', 'CORK'), 'P47': ('DUNMANWAY', 'CORK'),
+    'P51': ('MALLOW', 'CORK'), 'P56': ('CHARLEVILLE', 'CORK'), 'P61': ('FERMOY', 'CORK'),
+    'P67': ('MITCHELSTOWN', 'CORK'), 'P72': ('BANDON', 'CORK'), 'P75': ('BANTRY', 'CORK'),
+    'P81': ('SKIBBEREEN', 'CORK'), 'P85': ('CLONAKILTY', 'CORK'),
+    'R14': ('ATHY', 'KILDARE'), 'R21': ('MUINE BHEAG', 'CARLOW'), 'R32': ('PORTLAOISE', 'LAOIS'),
+    'R35': ('TULLAMORE', 'OFFALY'), 'R42': ('BIRR', 'OFFALY'), 'R45': ('EDENDERRY', 'OFFALY'),
+    'R51': ('KILDARE', 'KILDARE'), 'R56': ('CURRAGH', 'KILDARE'), 'R93': ('CARLOW', 'CARLOW'),
+    'R95': ('KILKENNY', 'KILKENNY'),
+    'T12': ('CORK', 'CORK'), 'T23': ('CORK', 'CORK'), 'T34': ('CARRIGNAVAR', 'CORK'), 'T45': ('GLANMIRE', 'CORK'),
+    'T56': ('WATERGRASSHILL', 'CORK'),
+    'V14': ('SHANNON', 'CLARE'), 'V15': ('KILRUSH', 'CLARE'), 'V23': ('CAHERCIVEEN', 'KERRY'),
+    'V31': ('LISTOWEL', 'KERRY'), 'V35': ('KILMALLOCK', 'LIMERICK'), 'V42': ('NEWCASTLE WEST', 'LIMERICK'),
+    'V92': ('TRALEE', 'KERRY'), 'V93': ('KILLARNEY', 'KERRY'), 'V94': ('LIMERICK', 'LIMERICK'),
+    'V95': ('ENNIS', 'CLARE'),
+    'W12': ('NEWBRIDGE', 'KILDARE'), 'W23': ('CELBRIDGE', 'KILDARE'), 'W34': ('MONASTEREVIN', 'KILDARE'),
+    'W91': ('NAAS', 'KILDARE'),
+    'X35': ('DUNGARVAN', 'WATERFORD'), 'X42': ('KILMACTHOMAS', 'WATERFORD'), 'X91': ('WATERFORD', 'WATERFORD'),
+    'Y14': ('ARKLOW', 'WICKLOW'), 'Y21': ('ENNISCORTHY', 'WEXFORD'), 'Y25': ('GOREY', 'WEXFORD'),
+    'Y34': ('NEW ROSS', 'WEXFORD'), 'Y35': ('WEXFORD', 'WEXFORD'),
+}
+
+EARTH_RADIUS_KM = 6371.0
+MAX_LOCATED = 100000
+EIRCODE = re.compile(r'([AC-FHKNPRTV-Y]\d{2}|D6W)\s*([0-9AC-FHKNPRTV-Y]{4})?')
+
+# Town: its points in every county, for a town given without its county
+_ANY_COUNTY = {}
+for county_towns in TOWNS.values():
+    for town, point in county_towns.items():
+        _ANY_COUNTY.setdefault(town, []).append(point)
+# (town, county) as typed: point, so each spelling is only matched once
+_located = {}
+
+
+def _name(value):
+    # "Co. Cork", "county cork " and "Cork" are CORK
+    name = ' '.join(re.sub(r'[^\w\s-]', ' ', value or '').upper().split())
+    return re.sub(r'^(?:CO|COUNTY) ', '', name)
+
+
+def _town(town, county):
+    towns = TOWNS.get(county)
+    if towns is not None:
+        if town in towns:
+            return towns[town]
+        # One typo in a town of the county, if only one town is that close
+        close = [name for name in towns if edit_distance(town, name) <= 1]
+        if len(close) == 1:
+            return towns[close[0]]
+    elif len(_ANY_COUNTY.get(town, ())) == 1:
+        return _ANY_COUNTY[town][0]  # No county, or not one of these, but only one town of the name
+    return None
+
+
+def locate(eircode=None, nearest_town=None, county=None):
+    """
+    The (latitude, longitude) of an Eircode's routing key, else of a town of a county, else
+    None.
+    """
+    match = EIRCODE.fullmatch((eircode or '').strip().upper())
+    if match and match.group(1) in ROUTING_KEYS:
+        town, county = ROUTING_KEYS[match.group(1)]
+        return TOWNS[county][town]
+    key = (nearest_town, county)
+    if key not in _located:
+        if len(_located) > MAX_LOCATED:
+            _located.clear()
+        _located[key] = _town(_name(nearest_town), _name(county)) if nearest_town else None
+    return _located[key]
+
+
+def locate_text(text):
+    """
+    The (latitude, longitude) of "T12 X2Y3", "T12", "Mallow" or "Mallow, Co. Cork", or None.
+    """
+    if EIRCODE.fullmatch((text or '').strip().upper()):
+        return locate(eircode=text)
+    town, _, county = (text or '').partition(',')
+    return locate(nearest_town=town, county=county)
+
+
+def distance_km(a, b):
+    """The great circle distance between two (latitude, longitude) points."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (*a, *b))
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(h))
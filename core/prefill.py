@@ -0,0 +1,108 @@
+"""
+Prefilling a new assessment from an earlier survey of the same property.
+
+Repeat surveys of a dwelling find the same fabric, so the parts of an assessment that don't
+change between surveys (PREFILL_FIELDS, the envelope section, the storeys and their heat
+loss areas) can be copied from the latest assessment with the same Eircode or MPRN. Rows
+are copied with INSERT ... SELECT inside the database, a statement per table.
+"""
+from django.db import connection, models, transaction
+from django.db.models import F, Q, Subquery
+from django.db.models.functions import Coalesce
+
+from .models import (Assesment, AssessmentEnvelope, AssessmentStorey, AssessmentHeatLossArea, AssessmentRevision,
+                     AssessmentVersionConflict, property_key, normalize_property_key)
+
+# Fields of the assessment itself describing the dwelling; only copied where they're empty
+PREFILL_FIELDS = ['property_address', 'eircode', 'mprn', 'num_storeys', 'num_bedrooms', 'dwelling_type', 'age_band',
+                  'extension_1_age_band', 'extension_2_age_band']
+PREFILL_SECTIONS = ['envelope']
+
+
+class PrefillError(Exception):
+    pass
+
+
+def latest_survey(eircode=None, mprn=None, exclude=None):
+    """
+    The most recent assessment with this Eircode or MPRN (compared without spaces or case)
+    that has envelope data to copy, other than `exclude`. None when there is none.
+    """
+    match = Q()
+    if normalize_property_key(eircode):
+        match |= Q(eircode_key=normalize_property_key(eircode))
+    if normalize_property_key(mprn):
+        match |= Q(mprn_key=normalize_property_key(mprn))
+    if not match:
+        return None
+    surveys = (Assesment.objects.alias(eircode_key=property_key('eircode'), mprn_key=property_key('mprn'))
+               .filter(match, envelope__isnull=False))
+    if exclude is not None:
+        surveys = surveys.exclude(pk=exclude)
+    return surveys.order_by('-created_at', '-id').first()
+
+
+def qn(name):
+    return connection.ops.quote_name(name)
+
+
+def _insert_select(cursor, model, params, overrides, joins='', where='s.assessment_id = %s'):
+    # INSERT ... SELECT of the model's rows matched by `where` in the source table `s`, with
+    # `overrides` as SQL for some columns. Returns the number of rows copied.
+    table = qn(model._meta.db_table)
+    columns = [f.column for f in model._meta.concrete_fields if not isinstance(f, models.AutoField)]
+    values = [overrides.get(column, f's.{qn(column)}') for column in columns]
+    cursor.execute(
+        f"INSERT INTO {table} ({', '.join(map(qn, columns))}) "
+        f"SELECT {', '.join(values)} FROM {table} s {joins} WHERE {where}", params)
+    return cursor.rowcount
+
+
+def prefill(assessment, source, expected_version=None, changed_by=None):
+    """
+    Copy the unchanging parts of the `source` assessment into `assessment` as one new version,
+    recorded like any other save. `assessment` must not have envelope data or storeys yet
+    (PrefillError otherwise); its own PREFILL_FIELDS are kept where already filled in.
+
+    With `expected_version`, raise AssessmentVersionConflict instead of writing when the
+    stored row is at another version. Returns what was copied.
+    """
+    with transaction.atomic():
+        rows = Assesment.objects.filter(pk=assessment.pk)
+        if expected_version is not None:
+            rows = rows.filter(version=expected_version)
+        source_row = Assesment.objects.filter(pk=source.pk)
+        # Also locks the row, as Assesment.save_changes() does
+        if not rows.update(version=F('version') + 1, **{
+            field: Coalesce(F(field), Subquery(source_row.values(field)[:1])) for field in PREFILL_FIELDS
+        }):
+            raise AssessmentVersionConflict(
+                Assesment.objects.filter(pk=assessment.pk).values_list('version', flat=True).first()
+            )
+        if (AssessmentEnvelope.objects.filter(assessment=assessment).exists()
+                or AssessmentStorey.objects.filter(assessment=assessment).exists()):
+            raise PrefillError("This assessment already has envelope data or storeys.")
+
+        with connection.cursor() as cursor:
+            _insert_select(cursor, AssessmentEnvelope, [assessment.pk, source.pk], {'assessment_id': '%s'})
+            storeys = _insert_select(cursor, AssessmentStorey, [assessment.pk, source.pk], {'assessment_id': '%s'})
+            areas = _insert_select(
+                cursor, AssessmentHeatLossArea, [assessment.pk, source.pk], {'storey_id': 't.id'},
+                joins=(f"JOIN {qn(AssessmentStorey._meta.db_table)} o ON s.storey_id = o.id "
+                       f"JOIN {qn(AssessmentStorey._meta.db_table)} t ON t.storey = o.storey AND t.assessment_id = %s"),
+                where='o.assessment_id = %s')
+
+        # Forget what was loaded before the copy
+        assessment.refresh_from_db(fields=[*PREFILL_FIELDS, 'version'])
+        for name in PREFILL_SECTIONS:
+            assessment._state.fields_cache.pop(name, None)
+        assessment.__dict__.pop('_storeys_by_name', None)
+
+        snapshot = AssessmentRevision.snapshot_of(assessment.pk)
+        changes = {key: values for key, values in snapshot.items()
+                   if key in PREFILL_SECTIONS or key.startswith(('storey:', 'area:'))}
+        changes['assessment'] = AssessmentRevision.row_values(assessment, PREFILL_FIELDS)
+        AssessmentRevision.record(assessment, changes, changed_by)
+
+    return {"source": source.pk, "fields": PREFILL_FIELDS, "sections": PREFILL_SECTIONS,
+            "storeys": storeys, "heat_loss_areas": areas}
@@ -0,0 +1,43 @@
+"""
+Draft quotes for the booking page.
+
+GET get-quote/ is public, and used to insert a Quote and an Assesment for every visit.
+It now only hands out a signed draft token. The rows are created together by the first
+PUT of the draft that carries data, and the token's key is stored in Quote.draft_key:
+later PUTs with the same token, including a retry racing the first one, update that quote.
+"""
+import uuid
+
+from django.conf import settings
+from django.core import signing
+from django.db import transaction
+
+from .models import Assesment, Quote
+
+SALT = 'core.quote_drafts'
+
+
+def new_draft_token():
+    return signing.TimestampSigner(salt=SALT).sign(uuid.uuid4().hex)
+
+
+def draft_key(token):
+    """
+    The key of a draft token. Raises signing.BadSignature for a token that wasn't issued
+    here, or signing.SignatureExpired once it is older than QUOTE_DRAFT_MAX_AGE_SECONDS.
+    """
+    return signing.TimestampSigner(salt=SALT).unsign(token, max_age=settings.QUOTE_DRAFT_MAX_AGE_SECONDS)
+
+
+def has_data(values):
+    """Whether validated quote values hold anything beyond blanks."""
+    return any(value not in (None, '') for value in values.values())
+
+
+def draft_quote(key):
+    """The quote of a draft, created along with its assessment the first time. Returns (quote, created)."""
+    with transaction.atomic():
+        quote, created = Quote.objects.get_or_create(draft_key=key)
+        if created:
+            Assesment.objects.create(quote=quote)
+    return quote, created
@@ -0,0 +1,166 @@
+"""
+Bulk intake of quote requests from partner portals (estate agents, mortgage brokers).
+
+An upload is JSON Lines (an object per line) or CSV (a header row of quote field names).
+Rows are read one at a time and validated with QuoteSerializer's rules, and the valid ones
+are saved QUOTE_INTAKE_CHUNK_SIZE at a time: one bulk insert of the quotes, then the client
+users, clients and jobs of the complete ones (core.quote_promotion), four statements per
+chunk in a transaction. A chunk the database turns down is saved again row by row, so only
+the rows at fault fail. Each row gets a result: its quote and job ids, or its errors.
+"""
+import codecs
+import csv
+import json
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, transaction
+from rest_framework import serializers
+
+from .models import Quote, UserModel
+from .quote_promotion import REQUIRED_FIELDS, is_complete, promote_quotes
+from .serializers import QuoteSerializer
+
+JSONL, CSV = 'jsonl', 'csv'
+FORMATS = [JSONL, CSV]
+CONTENT_TYPES = {
+    'application/x-ndjson': JSONL,
+    'application/jsonl': JSONL,
+    'application/x-jsonlines': JSONL,
+    'text/csv': CSV,
+}
+FILE_EXTENSIONS = {'jsonl': JSONL, 'ndjson': JSONL, 'csv': CSV}
+
+# Quote fields checked against the user fields they are copied to when a quote is promoted
+CONTACT_FIELDS = {'email_address': 'email', 'mobile_number': 'phone_number'}
+
+
+class IntakeError(Exception):
+    pass
+
+
+def input_format(content_type, filename=None):
+    """The format of an upload, from its file extension or else its content type."""
+    if filename and '.' in filename:
+        extension = filename.rsplit('.', 1)[1].lower()
+        if extension in FILE_EXTENSIONS:
+            return FILE_EXTENSIONS[extension]
+    content_type = (content_type or '').split(';')[0].strip().lower()
+    if content_type in CONTENT_TYPES:
+        return CONTENT_TYPES[content_type]
+    raise IntakeError(f"Upload JSON Lines or CSV, as {', '.join(CONTENT_TYPES)} or a .jsonl or .csv file.")
+
+
+def read_rows(lines, file_format):
+    """
+    The rows of an upload, given as an iterable of byte lines, as (row, values or None). Rows
+    are numbered from 1 without the CSV header; blank JSON lines are skipped but counted.
+    """
+    text = codecs.iterdecode(lines, 'utf-8-sig')
+    if file_format == CSV:
+        for row, values in enumerate(csv.DictReader(text), 1):
+            # Empty cells count as missing; cells past the header are dropped
+            yield row, {name: value.strip() for name, value in values.items()
+                        if name is not None and value is not None and value.strip()}
+        return
+
+    for row, line in enumerate(text, 1):
+        if not line.strip():
+            continue
+        try:
+            values = json.loads(line)
+        except ValueError:
+            values = None
+        yield row, values if isinstance(values, dict) else None
+
+
+class RowValidator:
+    # One QuoteSerializer for every row, so its fields are only built once
+
+    def __init__(self):
+        self.serializer = QuoteSerializer()
+        self.contact_fields = {name: UserModel._meta.get_field(field) for name, field in CONTACT_FIELDS.items()}
+
+    def __call__(self, values):
+        """The validated values of a row, and None; or None and its errors."""
+        if values is None:
+            return None, {"non_field_errors": ["Each row must be a JSON object."]}
+        values.pop('lidar', None)
+        try:
+            values = self.serializer.run_validation(values)
+        except serializers.ValidationError as e:
+            return None, e.detail
+        # A complete quote is promoted, so its contact details must also suit the user it gets
+        errors = {}
+        if all(values.get(field) not in (None, '') for field in REQUIRED_FIELDS):
+            for name, field in self.contact_fields.items():
+                try:
+                    field.clean(values[name], None)
+                except ValidationError as e:
+                    errors[name] = e.messages
+        return (None, errors) if errors else (values, None)
+
+
+def _save(chunk):
+    # Saves [(row, validated values)], returns their results
+    quotes = [Quote(**values) for _, values in chunk]
+    with transaction.atomic():
+        Quote.objects.bulk_create(quotes)
+        complete = [quote for quote in quotes if is_complete(quote)]
+        jobs = {job.quote_id: job.pk for job in promote_quotes(complete)} if complete else {}
+    return [{"row": row, "quote": quote.pk, "job": jobs.get(quote.pk)} for (row, _), quote in zip(chunk, quotes)]
+
+
+def save_chunk(chunk):
+    """Save [(row, validated values)] together, or one by one if the database refuses some."""
+    try:
+        return _save(chunk)
+    except DatabaseError as e:
+        if len(chunk) == 1:
+            return [{"row": chunk[0][0], "errors": {"non_field_errors": [f"Could not be saved: {e}"]}}]
+    return [result for item in chunk for result in save_chunk([item])]
+
+
+def intake(lines, file_format):
+    """
+    Validate and save the rows of an upload. Returns a summary and the result of each row,
+    in order. Reading stops after QUOTE_INTAKE_MAX_ROWS rows, or at bytes that aren't UTF-8;
+    the rows before are saved all the same.
+    """
+    validate = RowValidator()
+    results, chunk, error = [], [], None
+    chunk_size, max_rows = settings.QUOTE_INTAKE_CHUNK_SIZE, settings.QUOTE_INTAKE_MAX_ROWS
+
+    def flush():
+        results.extend(save_chunk(chunk))
+        chunk.clear()
+
+    count = 0
+    try:
+        for row, values in read_rows(lines, file_format):
+            count += 1
+            if count > max_rows:
+                error = f"Only the first {max_rows} rows are read, upload the rest separately."
+                break
+            values, errors = validate(values)
+            if errors:
+                results.append({"row": row, "errors": errors})
+                continue
+            chunk.append((row, values))
+            if len(chunk) >= chunk_size:
+                flush()
+    except (UnicodeDecodeError, csv.Error) as e:
+        error = f"Reading stopped after row {count}: {e}"
+    if chunk:
+        flush()
+
+    results.sort(key=lambda result: result["row"])
+    summary = {
+        "rows": len(results),
+        "quotes": sum(1 for result in results if "quote" in result),
+        "jobs": sum(1 for result in results if result.get("job")),
+        "failed": sum(1 for result in results if "errors" in result),
+    }
+    if error:
+        summary["error"] = error
+    return {**summary, "results": results}
@@ -0,0 +1,79 @@
+"""
+Promoting a complete quote to a client's job.
+
+Once every field in REQUIRED_FIELDS is filled in, the quote's contact gets a client user and
+the quote a Job. This is done in one transaction with an upsert per table (INSERT ... ON
+CONFLICT), keyed on the user's email, the client's user and the job's quote, so a double
+submitted or retried PUT updates the same rows instead of racing to insert them, and each
+quote has exactly one job however many times it is promoted. Three queries in all.
+"""
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+from . import job_feed, job_map
+from .models import Client, Job, UserModel
+
+# The quote fields a job needs; lidar, additional_features and eircode are optional
+REQUIRED_FIELDS = [
+    'name', 'email_address', 'mobile_number',
+    'building_type', 'preferred_date', 'preferred_time',
+    'property_type', 'property_size', 'bedrooms',
+    'heat_pump_installed', 'county', 'nearest_town', 'ber_purpose'
+]
+
+# Job fields copied from the quote, and updated on each promotion
+JOB_FIELDS = [
+    'building_type', 'preferred_date', 'preferred_time', 'property_type', 'property_size', 'bedrooms',
+    'additional_features', 'heat_pump_installed', 'county', 'nearest_town', 'eircode', 'ber_purpose',
+    'name', 'email_address', 'mobile_number'
+]
+
+
+def is_complete(quote):
+    # No bedrooms (a studio) is filled in
+    return all(getattr(quote, field) not in (None, '') for field in REQUIRED_FIELDS)
+
+
+def promote_quote(quote):
+    """
+    Create or update the client user, Client and Job of a complete quote. A user that already
+    has the quote's email is reused as is, and so is their Client; the job keeps its status.
+    Returns the job.
+    """
+    return promote_quotes([quote])[0]
+
+
+def promote_quotes(quotes):
+    """
+    promote_quote() for many complete quotes at once, still an upsert per table. Quotes
+    sharing an email share a user and client, with the names of the first. Returns the jobs,
+    in the order of `quotes`.
+    """
+    users, clients = {}, {}
+    for quote in quotes:
+        if quote.email_address not in users:
+            names = quote.name.split()
+            # The user signs in after a password reset, so don't pay for hashing a password nobody knows
+            users[quote.email_address] = UserModel(
+                email=quote.email_address, first_name=names[0] if names else "",
+                last_name=names[1] if len(names) > 1 else "", phone_number=quote.mobile_number,
+                password=make_password(None), user_type='client')
+
+    with transaction.atomic():
+        # The no-op update of an existing user makes the statement return its id
+        UserModel.objects.bulk_create(users.values(), update_conflicts=True, unique_fields=['email'],
+                                      update_fields=['email'])
+        for user in users.values():
+            clients.setdefault(user.pk, Client(user_id=user.pk, email=user.email, phone_number=user.phone_number,
+                                               first_name=user.first_name, last_name=user.last_name))
+        Client.objects.bulk_create(clients.values(), update_conflicts=True, unique_fields=['user'],
+                                   update_fields=['user'])
+
+        jobs = [Job(quote=quote, client=clients[users[quote.email_address].pk], status='pending',
+                    **{field: getattr(quote, field) for field in JOB_FIELDS}) for quote in quotes]
+        Job.objects.bulk_create(jobs, update_conflicts=True, unique_fields=['quote'],
+                                update_fields=['client', *JOB_FIELDS, 'updated_at'])
+        # bulk_create() sends no signals to update the accessors' job feeds and maps
+        job_feed.jobs_changed([job.pk for job in jobs])
+        job_map.jobs_changed([job.pk for job in jobs])
+    return jobs
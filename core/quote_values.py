@@ -0,0 +1,151 @@
+"""
+Bedrooms, floor area and preferred date and time of quotes and jobs.
+
+These are typed columns, so jobs can be filtered by ranges of them through B-tree indexes
+(Job.Meta.indexes). The quote form has always taken them as free text, so the parse_*()
+functions still read what people type ("3 bed", "120 m2", "1,300 sq ft", "01/03/2025",
+"2:30pm", "morning") as well as plain values; they raise ValueError for anything else.
+job_filters() turns the range query parameters of the job lists into filter() lookups.
+"""
+import re
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal, InvalidOperation
+
+from django.utils import timezone
+
+MAX_BEDROOMS = 50
+MAX_FLOOR_AREA = Decimal('100000')
+SQUARE_FOOT = Decimal('0.09290304')  # m2
+MAX_WITHIN_DAYS = 366
+
+NUMBER_WORDS = {
+    'studio': 0, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
+    'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10,
+}
+BEDROOMS = re.compile(r'(\d+|[a-z]+)\s*\+?\s*(?:bed(?:room)?s?|br)?')
+FLOOR_AREA = re.compile(r'(\d{1,3}(?:,\d{3})+|\d+(?:[.,]\d+)?)\s*'
+                        r'(m2|m²|sqm|sq\.?\s*m|square\s*met(?:re|er)s?|m|'
+                        r'ft2|ft²|sqft|sq\.?\s*ft|square\s*f(?:ee|oo)t)?')
+DATE_FORMATS = ['%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y', '%d.%m.%Y', '%d/%m/%y', '%d %B %Y', '%d %b %Y', '%B %d %Y',
+                '%b %d %Y']
+TIME = re.compile(r'(\d{1,2})(?:[:.](\d{2}))?(?::(\d{2}))?\s*(am|pm|a\.m\.|p\.m\.)?')
+# When a part of the day starts, for forms that ask for one rather than a time
+TIMES_OF_DAY = {'morning': time(9), 'afternoon': time(14), 'evening': time(18)}
+
+
+def parse_bedrooms(value):
+    """The number of bedrooms in 3, "3", "3 bed", "3 bedrooms", "three" or "studio"."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        bedrooms = value
+    else:
+        match = BEDROOMS.fullmatch(str(value).strip().lower())
+        if not match:
+            raise ValueError(f"Not a number of bedrooms: {value!r}.")
+        number = match.group(1)
+        if not number.isdigit() and number not in NUMBER_WORDS:
+            raise ValueError(f"Not a number of bedrooms: {value!r}.")
+        bedrooms = int(number) if number.isdigit() else NUMBER_WORDS[number]
+    if not 0 <= bedrooms <= MAX_BEDROOMS:
+        raise ValueError(f"Bedrooms must be between 0 and {MAX_BEDROOMS}.")
+    return bedrooms
+
+
+def parse_floor_area(value):
+    """The floor area in m2, to the cm2, of 120, "120.5", "120 m2", "120sqm" or "1,300 sq ft"."""
+    if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+        area = Decimal(str(value))
+    else:
+        match = FLOOR_AREA.fullmatch(str(value).strip().lower())
+        if not match:
+            raise ValueError(f"Not a floor area: {value!r}.")
+        number, unit = match.groups()
+        # A comma is a thousands separator before three digits, else a decimal comma
+        number = number.replace(',', '') if re.fullmatch(r'\d{1,3}(,\d{3})+', number) else number.replace(',', '.')
+        try:
+            area = Decimal(number)
+        except InvalidOperation:
+            raise ValueError(f"Not a floor area: {value!r}.")
+        if unit and 'f' in unit:
+            area *= SQUARE_FOOT
+    if not area.is_finite() or not 0 < area < MAX_FLOOR_AREA:
+        raise ValueError(f"Floor area must be more than 0 and less than {MAX_FLOOR_AREA} m2.")
+    return area.quantize(Decimal('0.01'))
+
+
+def parse_date(value):
+    """The date of a date, "2025-03-01", "01/03/2025" (day first), "1st March 2025" or "March 1, 2025"."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = re.sub(r'(\d)(st|nd|rd|th)\b', r'\1', str(value).strip().replace(',', ' '), flags=re.IGNORECASE)
+    text = ' '.join(text.split())
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, date_format).date()
+        except ValueError:
+            pass
+    raise ValueError(f"Not a date: {value!r}.")
+
+
+def parse_time(value):
+    """The time of a time, "14:30", "2:30pm", "9am" or "morning", "afternoon" or "evening"."""
+    if isinstance(value, time):
+        return value
+    text = str(value).strip().lower()
+    if text in TIMES_OF_DAY:
+        return TIMES_OF_DAY[text]
+    match = TIME.fullmatch(text)
+    if not match:
+        raise ValueError(f"Not a time: {value!r}.")
+    hour, minute, second, half = match.groups()
+    hour, minute, second = int(hour), int(minute or 0), int(second or 0)
+    if half:
+        if not 1 <= hour <= 12:
+            raise ValueError(f"Not a time: {value!r}.")
+        hour = hour % 12 + (12 if half.startswith('p') else 0)
+    elif not match.group(2):
+        raise ValueError(f"Not a time: {value!r}.")  # A bare number could be anything
+    try:
+        return time(hour, minute, second)
+    except ValueError:
+        raise ValueError(f"Not a time: {value!r}.")
+
+
+# Query parameter: (filter() lookup, parse function)
+FILTERS = {
+    'bedrooms': ('bedrooms', parse_bedrooms),
+    'bedrooms_min': ('bedrooms__gte', parse_bedrooms),
+    'bedrooms_max': ('bedrooms__lte', parse_bedrooms),
+    'property_size': ('property_size', parse_floor_area),
+    'property_size_min': ('property_size__gte', parse_floor_area),
+    'property_size_max': ('property_size__lte', parse_floor_area),
+    'preferred_date_from': ('preferred_date__gte', parse_date),
+    'preferred_date_to': ('preferred_date__lte', parse_date),
+}
+
+
+def job_filters(params):
+    """
+    The Job lookups of the typed filters in `params`, query parameters: ?bedrooms=, ?bedrooms_min=
+    and _max=, ?property_size= (m2), _min= and _max=, ?preferred_date_from= and _to=,
+    and ?preferred_within_days=, a preferred date from today to that many days on.
+    Raises ValueError naming the parameter at fault.
+    """
+    lookups = {}
+    for name, (lookup, parse) in FILTERS.items():
+        value = params.get(name)
+        if value not in (None, ''):
+            try:
+                lookups[lookup] = parse(value)
+            except ValueError as e:
+                raise ValueError(f"{name}: {e}")
+    days = params.get('preferred_within_days')
+    if days not in (None, ''):
+        if not days.isdigit() or int(days) > MAX_WITHIN_DAYS:
+            raise ValueError(f"preferred_within_days must be a number of days up to {MAX_WITHIN_DAYS}.")
+        today = timezone.localdate()
+        until = today + timedelta(int(days))
+        lookups['preferred_date__gte'] = max(lookups.get('preferred_date__gte', today), today)
+        lookups['preferred_date__lte'] = min(lookups.get('preferred_date__lte', until), until)
+    return lookups
@@ -0,0 +1,198 @@
+"""
+Pending jobs ranked for each accessor, for jobs/recommended/.
+
+A job's score for an accessor is the WEIGHTS sum of features between 0 and 1:
+
+- nearness: 1 at the accessor's location (Accessor.location, placed by core.places) down to 0
+  at RANGE_KM, or UNKNOWN_NEARNESS when the accessor or the job can't be placed;
+- win_rate: the share of the accessor's bids on jobs of the same building and property type
+  that were won (a project followed), smoothed towards their share on the building type, that
+  towards their share on every job, and that towards everyone's, over SMOOTHING_BIDS bids;
+- competition: 1 / (1 + the bids on the job);
+- freshness: halving with every FRESHNESS_HALF_LIFE_DAYS of the job's age.
+
+An accessor is ranked the pending jobs of the areas they cover (core.coverage) and those
+within RANGE_KM of them, less the jobs they have bid on.
+
+rank() reads the features of every pending job and accessor in a few queries, in bulk, and
+caches each accessor's RECOMMENDATIONS_SIZE best jobs for RECOMMENDATIONS_SECONDS in the cache
+the server processes share (CACHES in settings); the rank_jobs command runs it more often than
+that (the ranker service of docker-compose.yml). A page of jobs/recommended/ is then one cache
+read and one query for the jobs still pending and not bid on; an accessor whose ranking has
+expired is ranked alone when next asked. Jobs posted since the last ranking wait for the next
+one.
+"""
+import heapq
+from itertools import islice
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Exists, OuterRef, Q
+from django.utils import timezone
+
+from .coverage import areas_by_accessor
+from .models import Accessor, Bid, Job, Project
+from .places import distance_km, locate, locate_text
+
+WEIGHTS = {'nearness': 0.4, 'win_rate': 0.25, 'competition': 0.2, 'freshness': 0.15}
+RANGE_KM = 60
+UNKNOWN_NEARNESS = 0.5
+FRESHNESS_HALF_LIFE_DAYS = 7
+SMOOTHING_BIDS = 5
+PRIOR_WIN_RATE = 0.2  # Until any bid has been won
+RANKED_FIRST = ('-score', '-id')
+SCORE_PLACES = 6
+
+
+def _key(user_id):
+    return f'recommendations:{user_id}'
+
+
+def _smoothed(wins, bids, prior):
+    return (wins + SMOOTHING_BIDS * prior) / (bids + SMOOTHING_BIDS)
+
+
+class _WinRates:
+    # The smoothed share of bids won, by accessor and by the building and property type of the job
+    def __init__(self, accessors):
+        won = Project.objects.filter(job=OuterRef('job'), accessor=OuterRef('assessor'))
+        rows = (Bid.objects.filter(job__isnull=False)
+                .values_list('assessor', 'job__building_type', 'job__property_type')
+                .annotate(bids=Count('id'), wins=Count('id', filter=Q(Exists(won)))))
+        ranked = set(accessors)
+        total = [0, 0]
+        self.counts = {}  # accessor id: {key: [wins, bids]}, keys () and (building type,) and (building, property)
+        for accessor_id, building_type, property_type, bids, wins in rows:
+            total[0] += wins
+            total[1] += bids
+            if accessor_id in ranked:
+                counts = self.counts.setdefault(accessor_id, {})
+                for key in ((), (building_type,), (building_type, property_type)):
+                    count = counts.setdefault(key, [0, 0])
+                    count[0] += wins
+                    count[1] += bids
+        self.prior = total[0] / total[1] if total[1] else PRIOR_WIN_RATE
+
+    def rate(self, accessor_id, building_type, property_type):
+        counts = self.counts.get(accessor_id, {})
+        rate = self.prior
+        for key in ((), (building_type,), (building_type, property_type)):
+            rate = _smoothed(*counts.get(key, (0, 0)), rate)
+        return rate
+
+
+def _jobs(now):
+    # The pending jobs: {(point, county, town, building type, property type): [(score, job id)]},
+    # each list by the part of the score that is the job's own, best first
+    groups = {}
+    rows = (Job.objects.filter(status='pending').annotate(bid_count=Count('bids'))
+            .values_list('id', 'created_at', 'eircode', 'nearest_town', 'county', 'building_type',
+                         'property_type', 'bid_count'))
+    for job_id, created_at, eircode, town, county, building_type, property_type, bids in rows.iterator(chunk_size=5000):
+        age_days = max((now - created_at).total_seconds(), 0) / 86400
+        score = (WEIGHTS['competition'] / (1 + bids)
+                 + WEIGHTS['freshness'] * 0.5 ** (age_days / FRESHNESS_HALF_LIFE_DAYS))
+        key = (locate(eircode, town, county), (county or '').upper(), (town or '').upper(), building_type, property_type)
+        groups.setdefault(key, []).append((score, job_id))
+    for group in groups.values():
+        group.sort(reverse=True)
+    return groups
+
+
+def _scored(group, offset, distance):
+    # The jobs of a group with the accessor's part of their score added
+    for score, job_id in group:
+        yield round(score + offset, SCORE_PLACES), job_id, distance
+
+
+def _ranking(accessor_id, point, areas, groups, by_point, by_county, rates, bid_on):
+    # The best RECOMMENDATIONS_SIZE [score, job id, km or None] for an accessor
+    distances = {}
+    if point is not None:
+        for other in by_point:
+            distance = distance_km(point, other)
+            if distance <= RANGE_KM:
+                distances[other] = round(distance, 1)
+    keys = {key for other in distances for key in by_point[other]}
+    for county, towns in areas.items():
+        keys.update(key for key in by_county.get(county, ()) if not towns or key[2] in towns)
+
+    scored = []
+    for key in keys:
+        job_point, _, _, building_type, property_type = key
+        distance = distances.get(job_point)
+        if distance is not None:
+            nearness = 1 - distance / RANGE_KM
+        else:
+            # Covered, but too far away or not placed
+            nearness = UNKNOWN_NEARNESS if point is None or job_point is None else 0
+        offset = (WEIGHTS['nearness'] * nearness
+                  + WEIGHTS['win_rate'] * rates.rate(accessor_id, building_type, property_type))
+        scored.append(_scored(groups[key], offset, distance))
+    best = heapq.merge(*scored, reverse=True)
+    return [list(row) for row in islice((row for row in best if row[1] not in bid_on), settings.RECOMMENDATIONS_SIZE)]
+
+
+def rank(accessors=None):
+    """
+    Rank the pending jobs for the `accessors` queryset (every active accessor by default) and
+    cache each one's ranking. Returns {user id: [[score, job id, km or None]]}, best first.
+    """
+    if accessors is None:
+        accessors = Accessor.objects.filter(user__is_active=True)
+    now = timezone.now()
+    accessors = list(accessors.values_list('id', 'user_id', 'location'))
+    if not accessors:
+        return {}
+    ids = [accessor_id for accessor_id, _, _ in accessors]
+    groups = _jobs(now)
+    by_point, by_county = {}, {}
+    for key in groups:
+        if key[0] is not None:
+            by_point.setdefault(key[0], []).append(key)
+        by_county.setdefault(key[1], []).append(key)
+    rates = _WinRates(ids)
+    areas = areas_by_accessor(ids)
+    bid_on = {}
+    for accessor_id, job_id in Bid.objects.filter(assessor__in=ids, job__status='pending').values_list('assessor', 'job'):
+        bid_on.setdefault(accessor_id, set()).add(job_id)
+
+    rankings = {}
+    for accessor_id, user_id, location in accessors:
+        point = locate_text(location) if location else None
+        rankings[user_id] = _ranking(accessor_id, point, areas.get(accessor_id, {}), groups, by_point, by_county,
+                                     rates, bid_on.get(accessor_id, set()))
+    cache.set_many({_key(user_id): ranking for user_id, ranking in rankings.items()},
+                   settings.RECOMMENDATIONS_SECONDS)
+    return rankings
+
+
+def ranking_of(accessor_user):
+    """The cached ranking of the accessor of a user, ranking them now if it has expired."""
+    ranking = cache.get(_key(accessor_user.pk))
+    if ranking is None:
+        ranking = rank(Accessor.objects.filter(user=accessor_user)).get(accessor_user.pk, [])
+    return ranking
+
+
+def recommended(accessor_user, page):
+    """
+    The page (a core.pagination.Page, RANKED_FIRST) of the jobs ranked for the accessor of a
+    user that are still pending and they haven't bid on, best first: (job, score, km or None).
+    """
+    ranking = ranking_of(accessor_user)
+    after = page.after(RANKED_FIRST)
+    rows = [{'score': score, 'id': job_id, 'distance': distance} for score, job_id, distance in ranking
+            if after is None or (score, job_id) < tuple(after)]
+    wanted = page.limit + 1
+    kept, jobs, start = [], {}, 0
+    # Read with some to spare for the jobs taken or bid on since the ranking
+    while len(kept) < wanted and start < len(rows):
+        chunk = rows[start:start + wanted * 2]
+        start += len(chunk)
+        found = (Job.objects.filter(status='pending').exclude(bids__assessor__user=accessor_user)
+                 .in_bulk([row['id'] for row in chunk]))
+        jobs.update(found)
+        kept += [row for row in chunk if row['id'] in found]
+    return [(jobs[row['id']], row['score'], row['distance']) for row in page.rows(kept[:wanted], RANKED_FIRST)]
+
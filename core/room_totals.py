@@ -0,0 +1,95 @@
+"""
+Totals over an assessment's rooms (AssessmentRoom rows), stored in the room_*_total
+columns of AssessmentRooms.
+
+A numeric room column is totalled by summing the rooms' values; text that isn't a number
+is left out. A descriptive column (glazing, frame, direction, ...) is totalled by counting
+the rooms that have a value. Totals are null while the assessment has no rooms.
+
+compute_totals() recomputes everything in one pass over the rows; update_totals() applies
+the change of a single room to the stored totals without reading the other rooms.
+"""
+
+SUM, COUNT = 'sum', 'count'
+
+# (room column, total column on AssessmentRooms, how it is totalled)
+ROOM_TOTALS = [
+    ('opening', 'room_opening_total', COUNT),
+    ('opening_dimensions', 'room_opening_dimensions_totaL', SUM),
+    ('glazing_details', 'room_glazing_details_total', COUNT),
+    ('frame', 'room_frame_total', COUNT),
+    ('gap', 'room_gap_total', COUNT),
+    ('over_shading', 'room_over_shading_total', COUNT),
+    ('direction', 'room_direction_total', COUNT),
+    ('wall_roof_type', 'room_wall_roof_type_total', COUNT),
+    ('openable_windows_doors', 'room_openable_windows_doors_total', SUM),
+    ('windows_doors', 'room_windows_doors_total', SUM),
+    ('chimney_flueless', 'room_chimney_flueless_total', SUM),
+    ('open_flues', 'room_open_flues_total', SUM),
+    ('fans_vents', 'room_fans_vents_total', SUM),
+    ('rads_with_or_trvs', 'room_rads_with_or_trvs_total', SUM),
+    ('number_of_fixed_lights', 'room_number_of_fixed_lights_total', SUM),
+    ('type_of_fixed_light', 'room_type_of_fixed_light_total', COUNT),
+]
+ROOM_COLUMNS = [column for column, _, _ in ROOM_TOTALS]
+
+# Total columns stored as text (the form had them as CharFields)
+TEXT_TOTALS = {
+    'room_opening_total', 'room_glazing_details_total', 'room_frame_total', 'room_gap_total',
+    'room_over_shading_total', 'room_direction_total', 'room_wall_roof_type_total',
+    'room_openable_windows_doors_total', 'room_windows_doors_total', 'room_fans_vents_total',
+    'room_rads_with_or_trvs_total', 'room_number_of_fixed_lights_total', 'room_type_of_fixed_light_total',
+}
+
+
+def _number(value):
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _filled(value):
+    return value is not None and value != ''
+
+
+def _stored(total_column, value):
+    value = round(value, 6)
+    return f'{value:.15g}' if total_column in TEXT_TOTALS else value
+
+
+def compute_totals(rooms):
+    """Every total column for the given rooms (AssessmentRoom or anything with the same attributes)."""
+    # Rooms x columns, then reduce each column
+    matrix = [tuple(getattr(room, column) for column in ROOM_COLUMNS) for room in rooms]
+    if not matrix:
+        return {total_column: None for _, total_column, _ in ROOM_TOTALS}
+
+    totals = {}
+    for (_, total_column, how), values in zip(ROOM_TOTALS, zip(*matrix)):
+        if how == SUM:
+            total = sum(number for number in map(_number, values) if number is not None)
+        else:
+            total = sum(1 for value in values if _filled(value))
+        totals[total_column] = _stored(total_column, total)
+    return totals
+
+
+def update_totals(totals, old, new):
+    """
+    The total columns that change when one existing room goes from `old` to `new` (both
+    {room column: value}, only the changed columns are needed), given the current `totals`.
+    """
+    changed = {}
+    for column, total_column, how in ROOM_TOTALS:
+        if column not in new:
+            continue
+        if how == SUM:
+            delta = (_number(new[column]) or 0) - (_number(old.get(column)) or 0)
+        else:
+            delta = _filled(new[column]) - _filled(old.get(column))
+        if delta:
+            changed[total_column] = _stored(total_column, (_number(totals[total_column]) or 0) + delta)
+    return changed
@@ -0,0 +1,152 @@
+"""
+Job search for JobSearchView.
+
+Jobs come from a few hundred towns and a handful of property types, repeated across every
+job. So a town or property type term is first matched against the distinct values of its
+column (its vocabulary, re-read every JOB_SEARCH_VOCABULARY_SECONDS), and the jobs are
+then read by exact value through B-tree indexes (Job.Meta.indexes), newest first, instead
+of comparing the term with every row.
+
+A town that isn't one is matched by trigrams, as PostgreSQL's pg_trgm does it, or edit
+distance, so a misspelt town ("Malow", "Dungarven", "Swrods") still finds its jobs, those
+of the most similar towns first. Property types are matched as case-insensitive substrings,
+and county exactly but case-insensitively (on UPPER(county) indexes). This works the same
+on any database and needs no extension.
+"""
+import re
+import time
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Case, FloatField, Value, When
+
+from .models import Job
+from .pagination import NEWEST_FIRST, keyset_filter
+
+SEARCH_LIMIT = 50
+# Order of jobs found in several towns
+RANKED = ('-town_match', *NEWEST_FIRST)
+
+# Share of a town term's trigrams that must be found in a town for it to match, like
+# pg_trgm.word_similarity_threshold
+TOWN_MATCH_THRESHOLD = 0.6
+# Towns a misspelt town is looked for in at most, each one an index scan
+TOWN_MATCHES = 3
+
+_vocabularies = {}
+
+
+def trigrams(text):
+    """The trigrams of each word in `text`, padded as pg_trgm does."""
+    found = set()
+    for word in re.findall(r'[^\W_]+', text.lower()):
+        padded = f'  {word} '
+        found.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return found
+
+
+def vocabulary(field):
+    """
+    The distinct values of a Job column with their trigrams, read by skipping through its
+    index one value at a time rather than scanning the table, and kept for a while.
+    """
+    expires, values = _vocabularies.get(field, (0, None))
+    if time.monotonic() < expires:
+        return values
+    table, column = connection.ops.quote_name(Job._meta.db_table), connection.ops.quote_name(field)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"WITH RECURSIVE v (value) AS ("
+            f"(SELECT {column} FROM {table} ORDER BY {column} LIMIT 1) UNION ALL "
+            f"SELECT (SELECT {column} FROM {table} WHERE {column} > v.value ORDER BY {column} LIMIT 1) "
+            f"FROM v WHERE v.value IS NOT NULL"
+            f") SELECT value FROM v WHERE value IS NOT NULL")
+        values = {value: trigrams(value) for value, in cursor.fetchall()}
+    _vocabularies[field] = (time.monotonic() + settings.JOB_SEARCH_VOCABULARY_SECONDS, values)
+    return values
+
+
+def edit_distance(a, b):
+    """Letters inserted, deleted, replaced or swapped with their neighbour to turn `a` into `b`."""
+    previous, current = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        before, previous, current = previous, current, [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], before[j - 2] + 1)
+    return current[-1]
+
+
+def matching_towns(term):
+    """
+    {town: score} of the towns matching `term`: only the town itself when it is one (score 1.0),
+    else the TOWN_MATCHES most similar towns with most of its trigrams or a typo away (two
+    typos for longer terms), scored by trigram similarity.
+    """
+    wanted = trigrams(term)
+    if not wanted:
+        return {}
+    term = term.strip().lower()
+    towns = vocabulary('nearest_town')
+    exact = [town for town in towns if town.lower() == term]
+    if exact:
+        return dict.fromkeys(exact, 1.0)
+
+    typos = 1 if len(term) <= 7 else 2
+    matches = {}
+    for town, town_trigrams in towns.items():
+        common = len(wanted & town_trigrams)
+        if common / len(wanted) >= TOWN_MATCH_THRESHOLD or edit_distance(term, town.lower()) <= typos:
+            # Ranked by similarity, so "Enis" finds Ennis before Enniscorthy
+            matches[town] = common / len(wanted | town_trigrams)
+    return dict(sorted(matches.items(), key=lambda match: -match[1])[:TOWN_MATCHES])
+
+
+def search_jobs(property_type=None, county=None, nearest_town=None, filters=None, page=None, limit=SEARCH_LIMIT):
+    """
+    The jobs matching every given term and `filters` (filter() lookups, such as the ranges of
+    core.quote_values.job_filters()), best match first, and the order_by() keys they are
+    sorted by. With a core.pagination.Page they start from its cursor, and each town gives
+    at most a page of jobs; else at most `limit`.
+    """
+    jobs = Job.objects.filter(**filters or {})
+    if property_type:
+        jobs = jobs.filter(property_type__in=[property_type, *(value for value in vocabulary('property_type')
+                                                               if property_type.lower() in value.lower())])
+    if county:
+        jobs = jobs.filter(county__iexact=county)
+
+    def ordered(jobs, keys):
+        return (page.order(jobs, keys) if page else jobs.order_by(*keys)), keys
+
+    if not nearest_town:
+        return ordered(jobs, NEWEST_FIRST)
+    # A town new since the vocabulary was read still matches as typed
+    towns = matching_towns(nearest_town) or {nearest_town: 1.0}
+    if len(towns) == 1:
+        return ordered(jobs.filter(nearest_town__in=towns), NEWEST_FIRST)
+    if not connection.features.supports_slicing_ordering_in_compound:
+        return ordered(jobs.filter(nearest_town__in=towns).annotate(town_match=Case(
+            *[When(nearest_town=town, then=Value(score)) for town, score in towns.items()], output_field=FloatField()
+        )), RANKED)
+
+    # The newest jobs of each town in turn, each read in the order of the job_town_newest index,
+    # rather than sorting every job of the matching towns
+    after = page.after(RANKED) if page else None
+    per_town = page.limit + 1 if page else limit
+    ranked = []
+    for town, score in towns.items():
+        town_jobs = jobs.filter(nearest_town=town)
+        if after is not None:
+            if score > after[0]:
+                continue  # On earlier pages
+            if score == after[0]:
+                town_jobs = town_jobs.filter(keyset_filter(NEWEST_FIRST, after[1:]))
+        ranked.append(town_jobs.annotate(town_match=Value(score, output_field=FloatField())))
+    if not ranked:
+        return Job.objects.none(), RANKED
+    if len(ranked) == 1:
+        return ranked[0].order_by(*RANKED), RANKED
+    ranked = [town_jobs.order_by(*NEWEST_FIRST)[:per_town] for town_jobs in ranked]
+    return ranked[0].union(*ranked[1:], all=True).order_by(*RANKED), RANKED
@@ -1,6 +1,21 @@
 from rest_framework import serializers
+from rest_framework.fields import SkipField, get_error_detail
+from rest_framework.settings import api_settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import models
 from .models import UserModel, Job, Client, Accessor, Bid, Notification, Project, Quote, File, Assesment, Payment
+from .models import ASSESSMENT_SECTIONS
+from .models import AssessmentEnvelope, AssessmentVentilation, AssessmentHeating, AssessmentHotWater, AssessmentRooms
+from .models import AssessmentRoom, AssessmentStorey, AssessmentHeatLossArea
+from .checkbox_groups import CHECKBOX_GROUPS, CHECKBOX_KEYS
+from .child_rows import CHILD_KEYS, CHILD_KEYS_BEFORE, ROOM, STOREY, AREA, assign_child_values, refresh_room_totals
+from .room_totals import ROOM_TOTALS
+from .quote_values import parse_bedrooms, parse_date, parse_floor_area, parse_time
+from .coverage import MAX_AREAS, areas_of
+from .places import locate_text
 from django.contrib.contenttypes.models import ContentType
+from collections.abc import Mapping
+import copy
 import os
 
 
@@ -39,7 +54,72 @@ class AccessorSerializer(serializers.ModelSerializer):
         model = Accessor
         fields = ['id', 'first_name', 'last_name', 'email', 'phone_number']
 
-class JobSerializer(serializers.ModelSerializer):
+
+class CoverageAreaSerializer(serializers.Serializer):
+    county = serializers.CharField(max_length=255)
+    towns = serializers.ListField(child=serializers.CharField(max_length=255), required=False, default=list)
+
+
+class CoverageSerializer(serializers.Serializer):
+    # What an accessor covers (core.coverage): counties, each whole or only some of its towns, and
+    # where they work from, for jobs/?within_km= (core.places)
+    areas = CoverageAreaSerializer(many=True, required=False)
+    location = serializers.CharField(max_length=255, required=False, allow_null=True)
+
+    def validate_location(self, value):
+        if value is not None and locate_text(value) is None:
+            raise serializers.ValidationError("Give an Eircode, or a town and its county.")
+        return value
+
+    def validate_areas(self, value):
+        if len(value) > MAX_AREAS:
+            raise serializers.ValidationError(f"At most {MAX_AREAS} counties can be covered.")
+        areas = {}
+        for area in value:
+            county = area['county'].upper()
+            towns = areas.setdefault(county, set())
+            if towns is not None:
+                towns.update(town.upper() for town in area['towns'])
+                # A county given without towns covers the whole of it
+                if not area['towns']:
+                    areas[county] = None
+        return {county: sorted(towns or ()) for county, towns in areas.items()}
+
+    @staticmethod
+    def of(user):
+        # What an accessor user covers, as the API shows it
+        return {
+            'areas': [{'county': county.title(), 'towns': sorted(town.title() for town in towns)}
+                      for county, towns in sorted(areas_of(user).items())],
+            'location': user.accessor.location,
+        }
+
+class QuoteValueField(serializers.Field):
+    # A typed quote or job value, given plainly or as typed into the quote form (core.quote_values)
+
+    def __init__(self, parse, **kwargs):
+        self.parse = parse
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        try:
+            return self.parse(data)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e))
+
+    def to_representation(self, value):
+        return value.isoformat() if hasattr(value, 'isoformat') else value
+
+
+class QuoteValuesSerializer(serializers.ModelSerializer):
+    # The typed fields shared by quotes and jobs
+    preferred_date = QuoteValueField(parse_date)
+    preferred_time = QuoteValueField(parse_time)
+    property_size = QuoteValueField(parse_floor_area)
+    bedrooms = QuoteValueField(parse_bedrooms)
+
+
+class JobSerializer(QuoteValuesSerializer):
     client_id = serializers.PrimaryKeyRelatedField(queryset=Client.objects.all(), source='client', write_only=True)
 
     class Meta:
@@ -58,6 +138,7 @@ class JobSerializer(serializers.ModelSerializer):
             'heat_pump_installed',
             'nearest_town',
             'county',
+            'eircode',
             'ber_purpose',
             'created_at',
             'updated_at',
@@ -68,7 +149,7 @@ class JobSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at', 'client']
 
-class TableJob(serializers.ModelSerializer):
+class TableJob(QuoteValuesSerializer):
     class Meta:
         model = Job
         fields = ['id', 'building_type', 'property_size', 'bedrooms',
@@ -171,20 +252,432 @@ class ProjectSerializer(serializers.ModelSerializer):
 #     return value
 
 
-class QuoteSerializer(serializers.ModelSerializer):
+class QuoteSerializer(QuoteValuesSerializer):
     assessments = serializers.SerializerMethodField()
     class Meta:
         model = Quote
-        fields = '__all__'
+        exclude = ['draft_key', 'legacy_values']
 
     def get_assessments(self, obj):
+        # From prefetch_related('assessments') when the quotes were loaded with it
+        return [assessment.id for assessment in obj.assessments.all()]
+
+class AssessmentEnvelopeSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = AssessmentEnvelope
+        exclude = ['assessment']
+
+
+class AssessmentVentilationSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = AssessmentVentilation
+        exclude = ['assessment']
+
+
+class AssessmentHeatingSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = AssessmentHeating
+        exclude = ['assessment']
+
+
+class AssessmentHotWaterSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = AssessmentHotWater
+        exclude = ['assessment']
+
+
+class AssessmentRoomsSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = AssessmentRooms
+        exclude = ['assessment']
+        # Computed from the rooms (core.room_totals)
+        read_only_fields = [total for _, total, _ in ROOM_TOTALS]
+
+
+class AssessmentRoomSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = AssessmentRoom
+        exclude = ['id', 'assessment']
+        read_only_fields = ['position']
+
+
+class AssessmentHeatLossAreaSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = AssessmentHeatLossArea
+        fields = ['element', 'position', 'area']
+
+
+class AssessmentStoreySerializer(serializers.ModelSerializer):
+    heat_loss_areas = AssessmentHeatLossAreaSerializer(many=True, required=False)
+
+    class Meta:
+        model = AssessmentStorey
+        fields = ['storey', 'storey_height', 'total_floor_area', 'heatloss_perimeter', 'heat_loss_areas']
+        read_only_fields = ['storey']
+
+
+class CheckboxField(serializers.BooleanField):
+    """One legacy boolean key of a packed checkbox group (see core.checkbox_groups)."""
+
+    def __init__(self, key, **kwargs):
+        self.key = key
+        self.group = CHECKBOX_KEYS[key]
+        super().__init__(source='*', required=False, **kwargs)
+
+    def to_representation(self, instance):
+        return self.group.is_checked(self.group.stored_value(instance), self.key)
+
+    def to_internal_value(self, data):
+        # Kept under the legacy key; AssessmentSerializer packs it before saving
+        return {self.key: super().to_internal_value(data)}
+
+
+class ChildRowField(serializers.Field):
+    """One legacy flat key backed by a room, storey or heat loss area row (see core.child_rows)."""
+
+    def __init__(self, key, **kwargs):
+        self.key = key
+        self.child = CHILD_KEYS[key]
+        field_class, field_kwargs = serializers.ModelSerializer().build_standard_field(key, self.child.model_field)
+        self.inner = field_class(**field_kwargs)
+        super().__init__(source='*', required=False, **kwargs)
+
+    def bind(self, field_name, parent):
+        super().bind(field_name, parent)
+        self.inner.bind(field_name, parent)
+
+    def run_validation(self, data=serializers.empty):
+        # Kept under the legacy key; AssessmentSerializer assigns it to the rows before saving
+        return {self.key: self.inner.run_validation(data)}
+
+    def to_representation(self, instance):
+        value = self.child.read(instance)
+        return None if value is None else self.inner.to_representation(value)
+
+
+ASSESSMENT_SECTION_SERIALIZERS = {
+    'envelope': AssessmentEnvelopeSerializer,
+    'ventilation': AssessmentVentilationSerializer,
+    'heating': AssessmentHeatingSerializer,
+    'hot_water': AssessmentHotWaterSerializer,
+    'rooms': AssessmentRoomsSerializer,
+}
 
-        return obj.assessments.values_list('id', flat=True)
 
 class AssessmentSerializer(serializers.ModelSerializer):
+    """
+    Flat view over an Assesment and its section tables. Section columns keep their
+    original top-level keys, so the payload has the same shape as before the split;
+    a write only touches the sections whose keys are present. Packed checkbox groups
+    are also read and written through their original boolean keys, and rooms 1-5 and
+    the per-storey heat loss areas through their original room_1_*, ground_heatloss_*
+    keys (the room totals are then recomputed, and read-only).
+
+    An update only writes the columns whose value changed, as a new version of the
+    assessment. Pass `expected_version` in the context to make it conditional on the
+    version the client last saw (AssessmentVersionConflict is raised otherwise).
+    """
     class Meta:
         model = Assesment
         fields = '__all__'
+        read_only_fields = ['version']
+
+    def get_fields(self):
+        fields = super().get_fields()
+        for section, serializer_class in ASSESSMENT_SECTION_SERIALIZERS.items():
+            for name, field in serializer_class().get_fields().items():
+                field.source = f'{section}.{name}'
+                fields[name] = field
+
+        # Each group's boolean keys go just before its packed field, and the child row keys
+        # before the field that followed them, where the columns used to be
+        with_legacy_keys = {}
+        for name, field in fields.items():
+            for group in CHECKBOX_GROUPS:
+                if group.field == name:
+                    with_legacy_keys.update((key, CheckboxField(key)) for key in group.keys)
+            with_legacy_keys.update((key, ChildRowField(key)) for key in CHILD_KEYS_BEFORE.get(name, ()))
+            with_legacy_keys[name] = field
+        return with_legacy_keys
+
+    def validate(self, attrs):
+        for group in CHECKBOX_GROUPS:
+            ticked = [key for key in group.keys if attrs.get(key)]
+            if group.exclusive and len(ticked) > 1:
+                raise serializers.ValidationError({
+                    key: f"Only one of {', '.join(ticked)} can be ticked." for key in ticked
+                })
+        return attrs
+
+    def to_representation(self, instance):
+        for section in ASSESSMENT_SECTION_SERIALIZERS:
+            instance.section(section)
+        return super().to_representation(instance)
+
+    def create(self, validated_data):
+        sections = self._pop_sections(validated_data)
+        child_values = self._pop_child_values(validated_data)
+        self._pack_checkboxes(None, validated_data, sections)
+        instance = super().create(validated_data)
+        self._save_sections(instance, sections)
+        if child_values:
+            children, room_changes = assign_child_values(instance, child_values)
+            totals = refresh_room_totals(instance, room_changes, added_or_removed=bool(room_changes))
+            instance.save_changes([], {'rooms': totals} if totals else None, children=children,
+                                 changed_by=self.context.get('changed_by'))
+        return instance
+
+    def update(self, instance, validated_data):
+        sections = self._pop_sections(validated_data)
+        child_values = self._pop_child_values(validated_data)
+        self._pack_checkboxes(instance, validated_data, sections)
+        changed = self._assign_changed(instance, validated_data)
+        changed_sections = {}
+        for section, values in sections.items():
+            row = instance.section(section)
+            section_changed = self._assign_changed(row, values)
+            if section_changed or row._state.adding:
+                changed_sections[section] = section_changed
+
+        children, room_changes = assign_child_values(instance, child_values)
+        added = any(row._state.adding for row, _ in children if isinstance(row, AssessmentRoom))
+        totals = refresh_room_totals(instance, room_changes, added_or_removed=added)
+        if totals:
+            changed_sections.setdefault('rooms', []).extend(totals)
+
+        instance.save_changes(changed, changed_sections, self.context.get('expected_version'), children=children,
+                             changed_by=self.context.get('changed_by'))
+        return instance
+
+    def _assign_changed(self, obj, values):
+        # Set the values that differ from obj and return their names
+        changed = []
+        for attr, value in values.items():
+            field = obj._meta.get_field(attr)
+            if field.is_relation:
+                current, new = getattr(obj, field.attname), getattr(value, 'pk', value)
+            else:
+                current, new = getattr(obj, attr), value
+            if isinstance(field, models.FileField) or current != new:
+                setattr(obj, attr, value)
+                changed.append(attr)
+        return changed
+
+    def _pop_sections(self, validated_data):
+        return {
+            section: validated_data.pop(section)
+            for section in ASSESSMENT_SECTION_SERIALIZERS
+            if section in validated_data
+        }
+
+    def _pop_child_values(self, validated_data):
+        return {key: validated_data.pop(key) for key in list(validated_data) if key in CHILD_KEYS}
+
+    def _pack_checkboxes(self, instance, validated_data, sections):
+        for group in CHECKBOX_GROUPS:
+            flags = {key: validated_data.pop(key) for key in group.keys if key in validated_data}
+            if not flags:
+                continue
+            target = sections.setdefault(group.section, {}) if group.section else validated_data
+            if group.field in target:
+                stored = target[group.field]
+            else:
+                stored = group.stored_value(instance) if instance else group.default
+            target[group.field] = group.encode(flags, stored)
+
+    def _save_sections(self, instance, sections):
+        for section, values in sections.items():
+            row = instance.section(section)
+            for attr, value in values.items():
+                setattr(row, attr, value)
+            row.save(force_insert=row._state.adding)
+
+
+# Name of the Assesment row itself among the sections, for ?section=
+GENERAL_SECTION = 'general'
+
+# How CompiledAssessmentSerializer turns each attribute into its output value
+_AS_IS, _PK, _CHECKBOX, _FIELD, _BOUND_FIELD, _CHILD = range(6)
+_EXACT_TYPES = {
+    serializers.BooleanField: bool,
+    serializers.CharField: str,
+    serializers.IntegerField: int,
+    serializers.FloatField: float,
+}
+
+
+def _compile_assessment_plan():
+    """
+    Flatten AssessmentSerializer into (key, row, attribute, kind, arg) entries, row being an
+    index into [assessment, *sections]. Also returns the writable fields by key, and the
+    (section, model field) each key is read from, section being 'general' for the
+    Assesment row itself and the model field None for keys kept in child rows.
+    """
+    template = AssessmentSerializer(partial=True)
+    assert not template.validators, "serializer-level validators are not run by the compiled serializer"
+    rows = [None, *ASSESSMENT_SECTION_SERIALIZERS]
+    plan, writable, columns = [], {}, {}
+    for key, field in template.fields.items():
+        if not field.read_only:
+            writable[key] = field
+        if field.write_only:
+            continue
+
+        if isinstance(field, CheckboxField):
+            plan.append((key, rows.index(field.group.section), field.group.field, _CHECKBOX, field.group))
+            columns[key] = (field.group.section or GENERAL_SECTION, field.group.field)
+            continue
+        if isinstance(field, ChildRowField):
+            plan.append((key, 0, None, _CHILD, field))
+            columns[key] = ('rooms' if field.child.kind == ROOM else 'envelope', None)
+            continue
+        section, attr = (None, field.source) if len(field.source_attrs) == 1 else field.source_attrs
+        columns[key] = (section or GENERAL_SECTION, attr)
+        model = ASSESSMENT_SECTIONS[section] if section else Assesment
+        if isinstance(field, serializers.PrimaryKeyRelatedField):
+            # Same as DRF's pk-only optimisation: the output is the raw foreign key
+            plan.append((key, rows.index(section), model._meta.get_field(attr).attname, _PK, None))
+        elif isinstance(field, serializers.FileField):
+            # Builds absolute URLs from the request in the context, so it is bound per serializer
+            plan.append((key, rows.index(section), attr, _BOUND_FIELD, None))
+        elif type(field) in _EXACT_TYPES:
+            plan.append((key, rows.index(section), attr, _AS_IS, (_EXACT_TYPES[type(field)], field)))
+        else:
+            plan.append((key, rows.index(section), attr, _FIELD, field))
+    return plan, writable, columns
+
+
+class CompiledAssessmentSerializer(AssessmentSerializer):
+    """
+    AssessmentSerializer with the per-request field setup done once, at import time.
+
+    Output is identical to AssessmentSerializer, but values are read straight off the rows
+    and only converted when the stored type differs from the output type. Partial updates
+    only validate the keys that were sent; anything else (creates, full updates) goes
+    through AssessmentSerializer unchanged. Saving is the same for both.
+    """
+
+    def to_representation(self, instance):
+        # context['fields']: only these keys (see select_assessment_keys)
+        # context['omit_defaults']: leave out keys still at their model default
+        fields = self.context.get('fields')
+        plan = ASSESSMENT_PLAN if fields is None else [entry for entry in ASSESSMENT_PLAN if entry[0] in fields]
+        omit_defaults = self.context.get('omit_defaults', False)
+
+        # Only touch the section rows that are needed, the others may not have been loaded
+        needed = {entry[1] for entry in plan}
+        rows = [instance, *(instance.section(section) if i in needed else None
+                            for i, section in enumerate(ASSESSMENT_SECTION_SERIALIZERS, start=1))]
+        ret = {}
+        for key, row, attr, kind, arg in plan:
+            value = getattr(rows[row], attr) if attr else None
+            if kind == _CHECKBOX:
+                ret[key] = arg.is_checked(value, key)
+            elif kind == _PK:
+                ret[key] = value
+            elif kind == _AS_IS:
+                exact_type, field = arg
+                ret[key] = value if value is None or type(value) is exact_type else field.to_representation(value)
+            elif kind == _FIELD:
+                ret[key] = None if value is None else arg.to_representation(value)
+            elif kind == _CHILD:
+                ret[key] = arg.to_representation(instance)
+            else:
+                ret[key] = None if value is None else self._bound_field(key).to_representation(value)
+            if omit_defaults and ret[key] == ASSESSMENT_DEFAULTS[key] and type(ret[key]) is type(ASSESSMENT_DEFAULTS[key]):
+                del ret[key]
+        return ret
+
+    def run_validation(self, data=serializers.empty):
+        if not self.partial:
+            return super().run_validation(data)
+
+        is_empty, data = self.validate_empty_values(data)
+        if is_empty:
+            return data
+        value = self.to_internal_value(data)
+        try:
+            value = self.validate(value)
+        except (serializers.ValidationError, DjangoValidationError) as exc:
+            raise serializers.ValidationError(detail=serializers.as_serializer_error(exc))
+        return value
+
+    def to_internal_value(self, data):
+        if not self.partial:
+            return super().to_internal_value(data)
+        if not isinstance(data, Mapping):
+            message = self.error_messages['invalid'].format(datatype=type(data).__name__)
+            raise serializers.ValidationError({api_settings.NON_FIELD_ERRORS_KEY: [message]}, code='invalid')
+
+        ret, errors = {}, {}
+        for key in data:
+            field = ASSESSMENT_WRITABLE_FIELDS.get(key)
+            if field is None:
+                continue
+            try:
+                validated_value = field.run_validation(field.get_value(data))
+            except serializers.ValidationError as exc:
+                errors[key] = exc.detail
+            except DjangoValidationError as exc:
+                errors[key] = get_error_detail(exc)
+            except SkipField:
+                pass
+            else:
+                self.set_value(ret, field.source_attrs, validated_value)
+        if errors:
+            # In field order, like AssessmentSerializer reports them
+            raise serializers.ValidationError({key: errors[key] for key in ASSESSMENT_WRITABLE_FIELDS if key in errors})
+        return ret
+
+    def _bound_field(self, key):
+        bound_fields = self.__dict__.setdefault('_bound_fields', {})
+        if key not in bound_fields:
+            bound_fields[key] = copy.deepcopy(ASSESSMENT_WRITABLE_FIELDS[key])
+            bound_fields[key].bind(key, self)
+        return bound_fields[key]
+
+
+ASSESSMENT_PLAN, ASSESSMENT_WRITABLE_FIELDS, ASSESSMENT_COLUMNS = _compile_assessment_plan()
+
+# What each key of a fresh assessment serializes to
+ASSESSMENT_DEFAULTS = CompiledAssessmentSerializer().to_representation(Assesment())
+
+
+# What to prefetch for the keys of each kind of child row
+CHILD_ROW_PREFETCHES = {ROOM: 'room_rows', STOREY: 'storeys__heat_loss_areas', AREA: 'storeys__heat_loss_areas'}
+
+
+def select_assessment_keys(sections=(), fields=()):
+    """
+    The keys of the given sections plus the given fields, for the 'fields' context of
+    CompiledAssessmentSerializer. Raises ValueError for unknown names.
+    """
+    unknown = [name for name in sections if name != GENERAL_SECTION and name not in ASSESSMENT_SECTION_SERIALIZERS]
+    unknown += [name for name in fields if name not in ASSESSMENT_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown section or field: {', '.join(unknown)}")
+    return {'id'} | set(fields) | {key for key, (section, _) in ASSESSMENT_COLUMNS.items() if section in sections}
+
+
+def assessment_queryset(keys=None):
+    """
+    Assessments with their section rows joined in, and their rooms and storeys prefetched.
+    When `keys` is given, only the columns behind those keys (and the version) are loaded,
+    and only their sections and child rows.
+    """
+    if keys is None:
+        return (Assesment.objects.select_related(*ASSESSMENT_SECTIONS)
+                .prefetch_related(*set(CHILD_ROW_PREFETCHES.values())))
+    keys = [key for key in keys if key in ASSESSMENT_COLUMNS]
+    kinds = {CHILD_KEYS[key].kind for key in keys if key in CHILD_KEYS}
+    if ROOM in kinds:
+        # Writing a room updates the totals
+        keys += [total for _, total, _ in ROOM_TOTALS]
+    columns = [ASSESSMENT_COLUMNS[key] for key in keys if key not in CHILD_KEYS]
+    sections = {section for section, _ in columns} - {GENERAL_SECTION}
+    paths = [attr if section == GENERAL_SECTION else f'{section}__{attr}' for section, attr in columns]
+    return (Assesment.objects.select_related(*sections).only('version', *paths)
+            .prefetch_related(*{CHILD_ROW_PREFETCHES[kind] for kind in kinds}))
 
 
 class PaymentSerializer(serializers.ModelSerializer):
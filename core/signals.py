@@ -56,13 +56,15 @@
 
 
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.utils.timezone import now
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 import logging
-from .models import UserModel, Notification
+from .models import UserModel, Notification, Job, Accessor, Bid
+from . import job_feed, job_map, lowest_bids
+from .coverage import preference_counties, set_areas
 from core.email_backend import send_gmail_api  # Assuming send_gmail_api is a function to send emails
 
 logger = logging.getLogger(__name__)
@@ -160,3 +162,41 @@ def handle_password_reset_request(sender, instance, created, **kwargs):
         logger.info(f"📨 Sending password reset email to {instance.email}")
         send_gmail_api(subject, reset_message, instance.email)
         logger.info(f"✅ Password reset email sent to {instance.email}")
+
+
+@receiver(post_save, sender=Job)
+def update_job_feeds(sender, instance, **kwargs):
+    """Applies a saved job to the accessors' cached job feeds (core.job_feed) and job maps (core.job_map)."""
+    job_feed.job_saved(instance)
+    job_map.jobs_changed([instance.pk])
+
+
+@receiver(post_delete, sender=Job)
+def remove_from_job_feeds(sender, instance, **kwargs):
+    job_feed.job_deleted(instance.pk)
+    job_map.jobs_changed([instance.pk])
+
+
+@receiver(pre_save, sender=Bid)
+def note_bid_job(sender, instance, **kwargs):
+    # The job a bid being updated was saved on, in case it moves to another
+    instance._saved_job_id = None if instance._state.adding else (
+        Bid.objects.filter(pk=instance.pk).values_list('job_id', flat=True).first())
+
+
+@receiver(post_save, sender=Bid)
+def update_lowest_bid(sender, instance, **kwargs):
+    """Refreshes the lowest bid of the bid's job (core.lowest_bids), and of the job it moved from."""
+    lowest_bids.refresh([instance.job_id, getattr(instance, '_saved_job_id', None)])
+
+
+@receiver(post_delete, sender=Bid)
+def remove_lowest_bid(sender, instance, **kwargs):
+    lowest_bids.refresh([instance.job_id])
+
+
+@receiver(post_save, sender=Accessor)
+def cover_preferred_counties(sender, instance, created, **kwargs):
+    """Covers the counties of a new accessor's preference (core.coverage)."""
+    if created and instance.user.preference:
+        set_areas(instance, {county: () for county in preference_counties(instance.user.preference)})
@@ -183,4 +183,947 @@
 #         self.api_client.force_authenticate(user=self.client_user)  # Log in as client
 #         response = self.api_client.get(url)
 #         self.assertEqual(response.status_code, status.HTTP_200_OK)
-#         self.assertEqual(len(response.data), 1)
\ No newline at end of file
+#         self.assertEqual(len(response.data), 1)
+
+import csv
+import io
+import json
+import threading
+from datetime import timedelta
+from unittest import mock, skipUnless
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient, APITestCase
+from .models import (ASSESSMENT_SECTIONS, Assesment, AssessmentEnvelope, AssessmentHeating, AssessmentHeatLossArea,
+                     AssessmentRevision, AssessmentRoom, AssessmentStorey, Bid, Client, Job, Notification, Project,
+                     Quote, UserModel)
+from . import export as assessment_export, job_map, search
+from .checkbox_groups import CHECKBOX_KEYS
+from .coverage import accessors_covering
+from .heat_loss import BER_BANDS
+from .quote_promotion import promote_quote
+from .quote_values import parse_bedrooms, parse_date, parse_floor_area, parse_time
+from .serializers import AssessmentSerializer, CompiledAssessmentSerializer, JobSerializer
+
+QUOTE = {
+    'name': 'Aoife Byrne', 'email_address': 'aoife@example.com', 'mobile_number': '0871234567',
+    'building_type': 'detached', 'preferred_date': '2025-03-01', 'preferred_time': '09:00',
+    'property_type': 'house', 'property_size': '120', 'bedrooms': '3', 'heat_pump_installed': 'no',
+    'county': 'Cork', 'nearest_town': 'Mallow', 'ber_purpose': 'grant',
+}
+
+
+def create_accessor(email='ciara@example.com', first_name='Ciara', last_name='Nolan', **fields):
+    with mock.patch('core.signals.send_gmail_api'):  # Accessor sign up emails
+        return UserModel.objects.create_user(email=email, first_name=first_name, last_name=last_name,
+                                             phone_number='0871234568', user_type='accessor', **fields)
+
+
+class ClearedCacheMixin:
+    # Each test starts and ends with an empty cache, which a TransactionTestCase's flush doesn't empty
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+
+class AssessmentTestCase(ClearedCacheMixin, APITestCase):
+    # An accessor with an assessment of theirs, for the assessment endpoints
+    def setUp(self):
+        super().setUp()
+        self.user = create_accessor()
+        self.client.force_authenticate(self.user)
+        self.assessment = Assesment.objects.create(accessor=self.user.accessor)
+        self.url = f'/api/assessment/{self.assessment.pk}/'
+
+    def put(self, data, version=None, url=None):
+        headers = {} if version is None else {'HTTP_IF_MATCH': f'"{version}"'}
+        return self.client.put(url or self.url, data, format='json', **headers)
+
+
+class AssessmentSectionTest(AssessmentTestCase):
+    def test_put_makes_only_the_sections_written_to(self):
+        response = self.put({'eircode': 'D02 X285', 'radiator_system_primary': True})
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertTrue(AssessmentHeating.objects.get(assessment=self.assessment).radiator_system_primary)
+        self.assertFalse(AssessmentEnvelope.objects.filter(assessment=self.assessment).exists())
+
+        # Still read as one flat assessment, the missing sections at their defaults
+        data = AssessmentSerializer(Assesment.objects.get(pk=self.assessment.pk)).data
+        self.assertEqual((data['eircode'], data['radiator_system_primary']), ('D02 X285', True))
+        self.assertIs(data['storage_heaters_primary'], False)
+        self.assertIs(data['stone'], False)
+
+
+class CheckboxGroupTest(AssessmentTestCase):
+    def test_codec(self):
+        walls, roofs = CHECKBOX_KEYS['cavity'], CHECKBOX_KEYS['room_in_roof']
+        self.assertEqual(walls.encode({'cavity': True}), 'cavity')
+        self.assertEqual(walls.encode({'stone': True}, 'cavity'), 'stone')
+        self.assertIsNone(walls.encode({'cavity': False}, 'cavity'))
+        self.assertEqual(walls.encode({'stone': False}, 'cavity'), 'cavity')
+        self.assertEqual([key for key, checked in walls.decode('cavity').items() if checked], ['cavity'])
+
+        packed = roofs.encode({'pitched_insulation_btw_joists': True, 'room_in_roof': True})
+        self.assertEqual(packed, 0b1001)
+        self.assertEqual(roofs.encode({'room_in_roof': False}, packed), 0b1)
+        self.assertEqual([key for key, checked in roofs.decode(packed).items() if checked],
+                         ['pitched_insulation_btw_joists', 'room_in_roof'])
+
+    def test_legacy_keys_round_trip(self):
+        response = self.put({'cavity': True, 'pitched_insulation_btw_joists': True, 'room_in_roof': True})
+        self.assertEqual(response.status_code, 200, response.data)
+        envelope = AssessmentEnvelope.objects.get(assessment=self.assessment)
+        self.assertEqual((envelope.wall_construction, envelope.roof_construction), ('cavity', 0b1001))
+
+        # Ticking another box of an exclusive group unticks the first
+        self.put({'stone': True, 'room_in_roof': False})
+        data = AssessmentSerializer(Assesment.objects.get(pk=self.assessment.pk)).data
+        self.assertEqual((data['stone'], data['cavity']), (True, False))
+        self.assertEqual((data['pitched_insulation_btw_joists'], data['room_in_roof']), (True, False))
+
+        response = self.put({'stone': True, 'cavity': True})
+        self.assertEqual(response.status_code, 400)
+
+
+class IfMatchTest(AssessmentTestCase):
+    def test_stale_version_is_refused(self):
+        response = self.put({'eircode': 'D02 X285'}, version=0)
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(response['ETag'], '"1"')
+
+        # Another device still at version 0
+        response = self.put({'eircode': 'T12 AB34'}, version=0)
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual((response.data['version'], response['ETag']), (1, '"1"'))
+        self.assertEqual(Assesment.objects.get(pk=self.assessment.pk).eircode, 'D02 X285')
+
+        response = self.client.put(self.url, {'eircode': 'T12 AB34'}, format='json', HTTP_IF_MATCH='yesterday')
+        self.assertEqual(response.status_code, 400)
+        # Without If-Match the write goes through, as before
+        self.assertEqual(self.put({'eircode': 'T12 AB34'})['ETag'], '"2"')
+
+
+class CompiledAssessmentSerializerTest(AssessmentTestCase):
+    def assertSameOutput(self):
+        assessment = Assesment.objects.get(pk=self.assessment.pk)
+        self.assertEqual(CompiledAssessmentSerializer(assessment).data, AssessmentSerializer(assessment).data)
+
+    def test_same_output_as_assessment_serializer(self):
+        self.assertSameOutput()
+        response = self.put({
+            'eircode': 'D02 X285', 'num_bedrooms': 3, 'semi_detached_house': True, 'sale': True, 'cavity': True,
+            'room_in_roof': True, 'radiator_system_primary': True, 'Combi': True, 'room_1_opening': 'door',
+            'room_2_opening_dimensions': 1.5, 'ground_storey_heigh': 2.4, 'ground_heatloss_wall_1': 40,
+        })
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertSameOutput()
+
+
+class AssessmentSelectionTest(AssessmentTestCase):
+    def test_sections_and_fields(self):
+        self.put({'eircode': 'D02 X285', 'radiator_system_primary': True, 'cavity': True})
+        full = self.client.get(self.url).data
+
+        data = self.client.get(self.url, {'section': 'heating'}).data
+        self.assertIn('radiator_system_primary', data)
+        self.assertNotIn('eircode', data)
+        self.assertNotIn('cavity', data)
+        self.assertEqual(data, {key: full[key] for key in data})
+
+        data = self.client.get(self.url, {'fields': 'eircode,mprn', 'section': 'envelope'}).data
+        self.assertEqual((data['eircode'], data['mprn'], data['cavity']), ('D02 X285', None, True))
+        self.assertNotIn('radiator_system_primary', data)
+
+        response = self.client.get(self.url, {'section': 'garden'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_omit_defaults(self):
+        self.put({'eircode': 'D02 X285', 'radiator_system_primary': True, 'cavity': True})
+        data = self.client.get(self.url, {'omit_defaults': '1'}).data
+        for key in ('eircode', 'radiator_system_primary', 'cavity'):
+            self.assertIn(key, data)
+        for key in ('mprn', 'stone', 'storage_heaters_primary'):
+            self.assertNotIn(key, data)
+
+
+class AutosaveTest(AssessmentTestCase):
+    def autosave(self, seq, changes, commit=False, version=None):
+        headers = {} if version is None else {'HTTP_IF_MATCH': f'"{version}"'}
+        return self.client.post(f'{self.url}autosave/', {'seq': seq, 'changes': changes, 'commit': commit},
+                                format='json', **headers)
+
+    def test_deltas_are_merged_and_committed(self):
+        ack = self.autosave(1, {'eircode': 'D02 X285'}).data
+        self.assertEqual(ack, {'received_seq': 1, 'committed_seq': 0, 'pending': 1})
+        # A retry, or an older delta, is ignored
+        self.assertEqual(self.autosave(1, {'eircode': 'T12 AB34'}).data['received_seq'], 1)
+        self.assertIsNone(Assesment.objects.get(pk=self.assessment.pk).eircode)
+
+        ack = self.autosave(2, {'mprn': '10001234567'}, commit=True).data
+        self.assertEqual(ack, {'received_seq': 2, 'committed_seq': 2, 'pending': 0, 'version': 1})
+        assessment = Assesment.objects.get(pk=self.assessment.pk)
+        self.assertEqual((assessment.eircode, assessment.mprn, assessment.version), ('D02 X285', '10001234567', 1))
+
+    def test_conflict_keeps_the_buffer(self):
+        self.autosave(1, {'eircode': 'D02 X285'}, commit=True, version=0)
+        # Saved from another device meanwhile
+        self.put({'mprn': '10001234567'}, version=1)
+
+        response = self.autosave(2, {'num_bedrooms': 3}, commit=True, version=1)
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response['ETag'], '"2"')
+        self.assertEqual((response.data['committed_seq'], response.data['pending']), (1, 1))
+        self.assertIsNone(Assesment.objects.get(pk=self.assessment.pk).num_bedrooms)
+
+        # Sent again once reloaded
+        response = self.autosave(2, {'num_bedrooms': 3}, commit=True, version=2)
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual((response.data['committed_seq'], response.data['version']), (2, 3))
+        assessment = Assesment.objects.get(pk=self.assessment.pk)
+        self.assertEqual((assessment.mprn, assessment.num_bedrooms), ('10001234567', 3))
+
+        response = self.client.post(f'{self.url}autosave/', {'seq': 3, 'changes': {}}, format='json',
+                                    HTTP_IF_MATCH='latest')
+        self.assertEqual(response.status_code, 400)
+
+
+class RoomTotalsTest(AssessmentTestCase):
+    def totals(self, response):
+        self.assertIn(response.status_code, (200, 201), response.data)
+        totals = response.data['totals']
+        return (totals['room_opening_total'], totals['room_opening_dimensions_totaL'],
+                totals['room_windows_doors_total'])
+
+    def test_totals_follow_the_rooms(self):
+        rooms = f'{self.url}rooms/'
+        self.assertEqual(self.totals(self.client.get(rooms)), (None, None, None))
+        self.client.post(rooms, {'opening': 'door', 'opening_dimensions': 1.5, 'windows_doors': '2'}, format='json')
+        # Text that isn't a number isn't summed
+        response = self.client.post(rooms, {'opening_dimensions': 2.0, 'windows_doors': 'two'}, format='json')
+        self.assertEqual(self.totals(response), ('1', 3.5, '2'))
+
+        response = self.client.put(f'{rooms}2/', {'opening': 'window', 'windows_doors': '3'}, format='json')
+        self.assertEqual(self.totals(response), ('2', 3.5, '5'))
+        response = self.client.delete(f'{rooms}1/')
+        self.assertEqual(self.totals(response), ('1', 2.0, '3'))
+
+        # Also through the assessment's own room keys
+        self.put({'room_1_opening_dimensions': 0.5})
+        data = self.client.get(self.url).data
+        self.assertEqual(data['room_opening_dimensions_totaL'], 2.5)
+        self.assertEqual([room['position'] for room in self.client.get(rooms).data['rooms']], [1, 2])
+
+
+class HeatLossTest(AssessmentTestCase):
+    def dwelling(self, age_band, wall_construction):
+        assessment = Assesment.objects.create(accessor=self.user.accessor, age_band=age_band)
+        AssessmentEnvelope.objects.create(assessment=assessment, wall_construction=wall_construction)
+        storey = AssessmentStorey.objects.create(assessment=assessment, storey='ground', total_floor_area=100,
+                                                 storey_height=2.5)
+        for element, area in [('floor', 100), ('wall', 120), ('roof', 100)]:
+            AssessmentHeatLossArea.objects.create(storey=storey, element=element, position=1, area=area)
+        return assessment
+
+    def test_bands(self):
+        old, new = self.dwelling('pre_1900', 'solid_brick'), self.dwelling('from_2000_onwards', 'cavity')
+        with mock.patch('core.signals.send_gmail_api'):
+            admin = UserModel.objects.create_superuser('admin@example.com', 'Aoife', 'Byrne', '0871234569', 'pw')
+        self.client.force_authenticate(admin)
+
+        response = self.client.get('/api/admin/heat-loss/')
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(response.data['count'], 3)
+        results = {row['id']: row for row in response.data['results']}
+        # Default U-values of a dwelling built since 2000: 0.37 walls, 0.25 roof, 0.41 floor, 0.15 bridging
+        self.assertAlmostEqual(results[new.pk]['fabric_heat_loss'], 0.37 * 120 + 0.25 * 100 + 0.41 * 100 + 0.15 * 320)
+        self.assertAlmostEqual(results[new.pk]['ventilation_heat_loss'], 0.33 * 0.35 * 250, places=1)
+        self.assertLess(results[new.pk]['energy_kwh_m2'], results[old.pk]['energy_kwh_m2'])
+        self.assertLess(BER_BANDS.index(results[new.pk]['ber_band']), BER_BANDS.index(results[old.pk]['ber_band']))
+        # No floor area, no band
+        self.assertIsNone(results[self.assessment.pk]['ber_band'])
+        self.assertEqual(sum(response.data['bands'].values()), 3)
+        self.assertEqual(response.data['bands'][None], 1)
+
+        response = self.client.get('/api/admin/heat-loss/', {'results': '0', 'accessor': self.user.accessor.pk})
+        self.assertNotIn('results', response.data)
+        self.assertEqual(response.data['count'], 3)
+
+
+class AssessmentExportTest(AssessmentTestCase):
+    def setUp(self):
+        super().setUp()
+        self.put({'eircode': 'D02 X285', 'cavity': True, 'room_1_opening': 'door', 'room_2_opening': 'window'})
+        with mock.patch('core.signals.send_gmail_api'):
+            admin = UserModel.objects.create_superuser('admin@example.com', 'Aoife', 'Byrne', '0871234569', 'pw')
+        self.client.force_authenticate(admin)
+
+    def export(self, **params):
+        response = self.client.get('/api/admin/assessments/export/', params)
+        self.assertEqual(response.status_code, 200)
+        return response, b''.join(response.streaming_content)
+
+    def test_csv(self):
+        response, content = self.export(output='csv')
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        rows = list(csv.DictReader(io.StringIO(content.decode())))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual((rows[0]['id'], rows[0]['eircode'], rows[0]['wall_construction']),
+                         (str(self.assessment.pk), 'D02 X285', 'cavity'))
+
+        _, content = self.export(output='csv', table='rooms')
+        rooms = list(csv.DictReader(io.StringIO(content.decode())))
+        self.assertEqual([(room['position'], room['opening']) for room in rooms], [('1', 'door'), ('2', 'window')])
+
+        _, content = self.export(output='csv', since='2000-01-01', until='2000-12-31')
+        self.assertEqual(len(content.decode().splitlines()), 1)  # Only the header
+        for params in ({'output': 'xlsx'}, {'table': 'bids'}, {'since': 'last week'}):
+            self.assertEqual(self.client.get('/api/admin/assessments/export/', params).status_code, 400)
+
+    @skipUnless(assessment_export.pa is not None, "Needs pyarrow")
+    def test_parquet_and_arrow(self):
+        _, content = self.export(output='parquet')
+        table = assessment_export.pq.read_table(io.BytesIO(content))
+        self.assertEqual(table.column('eircode').to_pylist(), ['D02 X285'])
+        _, content = self.export(output='arrow', table='rooms')
+        table = assessment_export.pa.ipc.open_stream(content).read_all()
+        self.assertEqual(table.column('opening').to_pylist(), ['door', 'window'])
+
+
+class AssessmentHistoryTest(AssessmentTestCase):
+    @mock.patch.object(AssessmentRevision, 'CHECKPOINT_EVERY', 3)
+    def test_versions_rebuilt_from_checkpoints(self):
+        for bedrooms in range(1, 7):
+            self.put({'num_bedrooms': bedrooms, 'cavity': bedrooms % 2 == 0}, version=bedrooms - 1)
+        self.client.post(f'{self.url}rooms/', {'opening': 'door'}, format='json')
+        self.client.delete(f'{self.url}rooms/1/')
+        checkpoints = AssessmentRevision.objects.filter(assessment=self.assessment, snapshot__isnull=False)
+        self.assertEqual(sorted(checkpoints.values_list('version', flat=True)), [1, 3, 6])
+
+        for version in range(1, 7):
+            response = self.client.get(f'{self.url}versions/{version}/')
+            self.assertEqual(response.status_code, 200, response.data)
+            data = response.data['assessment']
+            self.assertEqual((data['num_bedrooms'], data['cavity']), (version, version % 2 == 0))
+        self.assertEqual([room['opening'] for room in self.client.get(f'{self.url}versions/7/').data['rooms']],
+                         ['door'])
+        self.assertEqual(self.client.get(f'{self.url}versions/8/').data['rooms'], [])
+        self.assertEqual(self.client.get(f'{self.url}versions/9/').status_code, 404)
+
+        history = self.client.get(f'{self.url}history/', {'limit': 2}).data
+        self.assertEqual([revision['version'] for revision in history['revisions']], [8, 7])
+        self.assertEqual(history['revisions'][0]['changed_by_email'], self.user.email)
+
+
+class PrefillTest(AssessmentTestCase):
+    def test_prefill_from_the_latest_survey(self):
+        earlier = Assesment.objects.create(eircode='D02 X285', property_address='1 Main Street', num_bedrooms=3)
+        AssessmentEnvelope.objects.create(assessment=earlier, wall_construction='cavity')
+        storey = AssessmentStorey.objects.create(assessment=earlier, storey='ground', total_floor_area=80)
+        AssessmentHeatLossArea.objects.create(storey=storey, element='wall', position=1, area=95)
+        Assesment.objects.filter(pk=self.assessment.pk).update(eircode='d02x285', num_bedrooms=4)
+
+        url = f'{self.url}prefill/'
+        self.assertEqual(self.client.get(url).data['source']['id'], earlier.pk)
+        response = self.client.post(url, {}, format='json', HTTP_IF_MATCH='"0"')
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual((response.data['storeys'], response.data['heat_loss_areas']), (1, 1))
+        self.assertEqual(response['ETag'], '"1"')
+
+        data = self.client.get(self.url).data
+        # Filled in where empty, kept where not
+        self.assertEqual((data['property_address'], data['eircode'], data['num_bedrooms']),
+                         ('1 Main Street', 'd02x285', 4))
+        self.assertIs(data['cavity'], True)
+        storeys = self.client.get(f'{self.url}storeys/').data
+        self.assertEqual([area['area'] for area in storeys[0]['heat_loss_areas']], [95])
+        self.assertEqual(AssessmentRevision.objects.get(assessment=self.assessment).version, 1)
+
+        self.assertEqual(self.client.post(url, {}, format='json').status_code, 409)
+
+
+class QuoteDraftTest(APITestCase):
+    def test_draft_saved_on_first_put_with_data(self):
+        token = self.client.get('/api/get-quote/').data['draft_token']
+        url = f'/api/get-quote/draft/{token}/'
+        self.assertEqual(self.client.put(url, {}, format='json').status_code, 200)
+        self.assertFalse(Quote.objects.exists())
+
+        response = self.client.put(url, {'county': 'Cork'}, format='json')
+        self.assertEqual(response.status_code, 201, response.data)
+        response = self.client.put(url, {'nearest_town': 'Mallow'}, format='json')
+        self.assertEqual(response.status_code, 200, response.data)
+        quote = Quote.objects.get()
+        self.assertEqual((quote.county, quote.nearest_town), ('Cork', 'Mallow'))
+        self.assertEqual(Assesment.objects.get().quote, quote)
+
+        self.assertEqual(self.client.put(url[:-2] + '/', {'county': 'Kerry'}, format='json').status_code, 404)
+        with override_settings(QUOTE_DRAFT_MAX_AGE_SECONDS=-1):
+            self.assertEqual(self.client.put(url, {'county': 'Kerry'}, format='json').status_code, 400)
+        self.assertEqual(Quote.objects.count(), 1)
+
+
+@skipUnless(connection.vendor == 'postgresql', "The reaper's deletes are written for PostgreSQL")
+class ReapDraftsTest(TransactionTestCase):
+    # Foreign keys are only checked when the command's transaction commits, so not in a TestCase
+    def draft(self, **quote):
+        assessment = Assesment.objects.create(quote=Quote.objects.create(**quote))
+        # Section rows as migration 0015 made them, and child rows
+        for model in ASSESSMENT_SECTIONS.values():
+            model.objects.create(assessment=assessment)
+        AssessmentRoom.objects.create(assessment=assessment, position=1)
+        storey = AssessmentStorey.objects.create(assessment=assessment, storey='ground')
+        AssessmentHeatLossArea.objects.create(storey=storey, element='wall', position=1, area=40)
+        return assessment
+
+    def test_reaps_old_empty_drafts_with_their_rows(self):
+        abandoned, contacted = self.draft(), self.draft(name='Aoife Byrne')
+        recent = self.draft()
+        Quote.objects.exclude(pk=recent.quote_id).update(created_at=timezone.now() - timedelta(days=40))
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        call_command('reap_drafts', older_than_days=30, sleep=0, stdout=stdout, stderr=stderr)
+        self.assertEqual(stderr.getvalue(), '')
+        self.assertIn('Deleted 1 quotes and 1 assessments', stdout.getvalue())
+        self.assertEqual(set(Assesment.objects.values_list('pk', flat=True)), {contacted.pk, recent.pk})
+        self.assertEqual(set(Quote.objects.values_list('pk', flat=True)), {contacted.quote_id, recent.quote_id})
+        for model in (*ASSESSMENT_SECTIONS.values(), AssessmentRoom, AssessmentStorey):
+            self.assertFalse(model.objects.filter(assessment=abandoned).exists(), model.__name__)
+        self.assertEqual(AssessmentHeatLossArea.objects.count(), 2)
+
+
+class QuotePromotionTest(APITestCase):
+    def test_promotion_queries(self):
+        quote = Quote.objects.create(**QUOTE)
+        # An upsert each for the user, client and job; the rest is the test's savepoint
+        with CaptureQueriesContext(connection) as queries:
+            job = promote_quote(quote)
+        statements = [q['sql'] for q in queries if not q['sql'].startswith(('SAVEPOINT', 'RELEASE SAVEPOINT'))]
+        self.assertEqual(len(statements), 3, statements)
+        self.assertTrue(all(sql.startswith('INSERT') and 'ON CONFLICT' in sql for sql in statements))
+        self.assertEqual(Job.objects.get(quote=quote).pk, job.pk)
+
+    def test_double_submit_makes_one_job(self):
+        quote = Quote.objects.create()
+        for _ in range(2):
+            response = self.client.put(f'/api/get-quote/{quote.pk}/', QUOTE, format='json')
+            self.assertEqual(response.status_code, 200)
+        job = Job.objects.get(quote=quote)
+        self.assertEqual(job.client.user.email, QUOTE['email_address'])
+        self.assertEqual(UserModel.objects.filter(email=QUOTE['email_address']).count(), 1)
+        self.assertEqual(Client.objects.count(), 1)
+
+    def test_quotes_of_one_client_keep_their_jobs(self):
+        first, second = Quote.objects.create(**QUOTE), Quote.objects.create(**{**QUOTE, 'county': 'Kerry'})
+        promote_quote(first)
+        promote_quote(second)
+        self.assertEqual(Job.objects.filter(client__user__email=QUOTE['email_address']).count(), 2)
+        self.assertEqual(Job.objects.get(quote=first).county, 'Cork')
+
+    def test_promotion_keeps_job_status(self):
+        quote = Quote.objects.create(**QUOTE)
+        job = promote_quote(quote)
+        Job.objects.filter(pk=job.pk).update(status='in Progress')
+        quote.bedrooms = 4
+        self.assertEqual(promote_quote(quote).pk, job.pk)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.bedrooms), ('in Progress', 4))
+
+
+class QuoteIntakeTest(APITestCase):
+    def setUp(self):
+        self.partner = UserModel.objects.create_user(
+            email='partner@example.com', first_name='Estate', last_name='Agent', phone_number='0870000000')
+        self.client.force_authenticate(self.partner)
+
+    def test_csv_rows_get_their_own_results(self):
+        header = ','.join(QUOTE)
+        rows = [
+            ','.join(QUOTE.values()),
+            ','.join({**QUOTE, 'email_address': 'brian@example.com', 'county': ''}.values()),
+            ','.join({**QUOTE, 'email_address': 'ciara@example.com', 'building_type': ''}.values()),
+            ','.join(QUOTE.values()),
+        ]
+        response = self.client.post('/api/get-quote/bulk/', '\n'.join([header, *rows]), content_type='text/csv')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual({k: response.data[k] for k in ('rows', 'quotes', 'jobs', 'failed')},
+                         {'rows': 4, 'quotes': 3, 'jobs': 2, 'failed': 1})
+        first, missing, incomplete, again = response.data['results']
+        self.assertIn('county', missing['errors'])
+        self.assertIsNone(incomplete['job'])
+        # The same contact twice: two jobs for one client
+        self.assertNotEqual(first['job'], again['job'])
+        self.assertEqual(Job.objects.get(pk=first['job']).client_id, Job.objects.get(pk=again['job']).client_id)
+
+    def test_jsonl_rejects_rows_that_are_not_objects(self):
+        body = json.dumps(QUOTE) + '\n\n[1, 2]\n{not json\n'
+        response = self.client.post('/api/get-quote/bulk/', body, content_type='application/x-ndjson')
+        self.assertEqual([result['row'] for result in response.data['results']], [1, 3, 4])
+        self.assertEqual(response.data['failed'], 2)
+        self.assertEqual(Quote.objects.get(pk=response.data['results'][0]['quote']).job.pk,
+                         response.data['results'][0]['job'])
+
+    def test_empty_body(self):
+        response = self.client.post('/api/get-quote/bulk/', '', content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data['rows'], response.data['results']), (0, []))
+
+
+class JobSearchTest(APITestCase):
+    def setUp(self):
+        search._vocabularies.clear()
+        for town, county, property_type in [('Mallow', 'Cork', 'semi-detached house'), ('Ennis', 'Clare', 'bungalow'),
+                                            ('Enniscorthy', 'Wexford', 'apartment')]:
+            quote = Quote.objects.create(**{**QUOTE, 'email_address': f'{town}@example.com', 'nearest_town': town,
+                                            'county': county, 'property_type': property_type})
+            promote_quote(quote)
+
+    def search(self, **params):
+        response = self.client.get('/api/job-search/', params)
+        self.assertEqual(response.status_code, 200)
+        return [job['nearest_town'] for job in response.data]
+
+    def test_misspelt_town(self):
+        self.assertEqual(self.search(nearest_town='Malow'), ['Mallow'])
+        self.assertEqual(self.search(nearest_town='Enis'), ['Ennis', 'Enniscorthy'])
+        self.assertEqual(self.search(nearest_town='ennis'), ['Ennis'])
+
+    def test_county_and_property_type(self):
+        self.assertEqual(self.search(county='clare'), ['Ennis'])
+        self.assertEqual(self.search(property_type='Detached'), ['Mallow'])
+        self.assertEqual(self.search(nearest_town='Enis', county='Wexford'), ['Enniscorthy'])
+
+    def test_pages(self):
+        for town in ['Ennis', 'Enniscorthy', 'Ennis']:
+            promote_quote(Quote.objects.create(**{**QUOTE, 'email_address': 'more@example.com', 'nearest_town': town}))
+        towns, params = [], {'nearest_town': 'Enis', 'limit': 2}
+        while True:
+            response = self.client.get('/api/job-search/', params)
+            towns += [job['nearest_town'] for job in response.data]
+            if 'X-Next-Cursor' not in response:
+                break
+            self.assertIn('rel="next"', response['Link'])
+            params['cursor'] = response['X-Next-Cursor']
+        self.assertEqual(towns, ['Ennis'] * 3 + ['Enniscorthy'] * 2)
+        self.assertEqual(self.client.get('/api/job-search/', {'cursor': 'nope'}).status_code, 400)
+
+
+class QuoteValuesTest(APITestCase):
+    def test_form_text(self):
+        self.assertEqual([parse_bedrooms(text) for text in ['3', '3 bed', 'Three bedrooms', 'studio']], [3, 3, 3, 0])
+        self.assertEqual(str(parse_floor_area('1,300 sq ft')), '120.77')
+        self.assertEqual(parse_date('1st March 2025'), parse_date('01/03/2025'))
+        self.assertEqual(str(parse_time('2:30pm')), '14:30:00')
+        for parse, text in [(parse_bedrooms, 'lots'), (parse_floor_area, '0'), (parse_time, '14')]:
+            with self.assertRaises(ValueError):
+                parse(text)
+
+    def test_range_filters(self):
+        for bedrooms, day in [(2, '2025-03-01'), (3, '2025-03-10'), (5, '2025-03-20')]:
+            promote_quote(Quote.objects.create(**{**QUOTE, 'bedrooms': bedrooms, 'preferred_date': day}))
+
+        def bedrooms(**params):
+            response = self.client.get('/api/job-search/', params)
+            self.assertEqual(response.status_code, 200)
+            return [job['bedrooms'] for job in response.data]
+        self.assertEqual(bedrooms(bedrooms_min='3 bed', bedrooms_max=4), [3])
+        self.assertEqual(bedrooms(preferred_date_from='2025-03-05'), [5, 3])
+        response = self.client.get('/api/job-search/', {'bedrooms_min': 'lots'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('bedrooms_min', response.data['error'])
+
+
+@skipUnless(connection.vendor == 'postgresql', "Reads PostgreSQL query plans")
+class AdminJobTableTest(APITestCase):
+    def test_same_types_as_the_job_endpoints(self):
+        job = promote_quote(Quote.objects.create(**QUOTE))
+        with mock.patch('core.signals.send_gmail_api'):
+            admin = UserModel.objects.create_superuser('admin@example.com', 'Aoife', 'Byrne', '0871234569', 'pw')
+        self.client.force_authenticate(admin)
+        response = self.client.get('/api/admin/ejobs/')
+        self.assertEqual(response.status_code, 200)
+        row = response.data['jobs'][0]
+        self.assertEqual((row['property_size'], row['bedrooms'], row['preferred_date']), (120, 3, '2025-03-01'))
+        listed = JobSerializer(Job.objects.get(pk=job.pk)).data
+        self.assertEqual(row, {key: listed[key] for key in row})
+        self.assertEqual(json.loads(response.content)['jobs'][0]['property_size'], 120)
+
+
+class FeedIndexTest(ClearedCacheMixin, APITestCase):
+    def setUp(self):
+        super().setUp()  # So jobs/ reads its feed (core.job_feed) from the table
+        self.accessor = create_accessor(preference='cork')
+        self.admin = UserModel.objects.create_user(
+            email='admin@example.com', first_name='Admin', last_name='User', phone_number='0871234569',
+            user_type='admin', is_staff=True)
+        job = promote_quote(Quote.objects.create(**QUOTE))
+        self.client_user = job.client.user
+        Bid.objects.create(amount=250, availability='next week', assessor=self.accessor.accessor, job=job)
+        Project.objects.create(job=job, client=job.client, accessor=self.accessor.accessor)
+        Notification.objects.create(message='New bid', notification_type='bid', recipient=self.client_user,
+                                    sender=self.accessor.accessor)
+        with connection.cursor() as cursor:
+            # A few rows are read quickest by scanning and sorting them, so plan as for a big table:
+            # a plan that still scans the table or sorts has no index to do otherwise
+            cursor.execute("SET LOCAL enable_seqscan = off; SET LOCAL enable_bitmapscan = off; "
+                           "SET LOCAL enable_sort = off")
+
+    def plan(self, user, url, table):
+        # The query plan of the first query an endpoint makes on `table`
+        self.client.force_authenticate(user)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(url).status_code, 200)
+        sql = next(query['sql'] for query in queries if f'FROM "{table}"' in query['sql'])
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN {sql}")
+            return '\n'.join(line for line, in cursor.fetchall())
+
+    def test_hot_queries_scan_indexes(self):
+        for user, url, table, index in [
+            (self.accessor, '/api/jobs/', 'core_job', 'job_pending_county_newest'),
+            (self.admin, '/api/admin/total-pending-jobs/', 'core_job', 'job_pending_county_newest'),
+            (self.client_user, '/api/client/jobs/', 'core_job', 'job_client_newest'),
+            (self.client_user, '/api/notifications/', 'core_notification', 'notification_recipient_newest'),
+            (self.accessor, '/api/my-quotes/', 'core_bid', 'bid_assessor_newest'),
+            (self.accessor, '/api/projects/', 'core_project', 'project_accessor_newest'),
+        ]:
+            with self.subTest(url=url):
+                plan = self.plan(user, url, table)
+                self.assertIn(f'Index Scan using {index}', plan.replace('Index Only Scan', 'Index Scan'), plan)
+                self.assertNotIn('Sort', plan, plan)
+
+
+class JobFeedTest(ClearedCacheMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(create_accessor(preference='cork'))
+
+    def add_job(self, email, **values):
+        # Committed, as far as the feeds are concerned
+        with self.captureOnCommitCallbacks(execute=True):
+            return promote_quote(Quote.objects.create(**{**QUOTE, 'email_address': email, **values}))
+
+    def feed(self, **params):
+        return self.client.get('/api/jobs/', params)
+
+    def test_polls_are_answered_from_the_feed(self):
+        job = self.add_job('aoife@example.com')
+        self.add_job('sean@example.com', county='Kerry')
+        first = self.feed()
+        self.assertEqual([row['id'] for row in first.data['pending_jobs']], [job.pk])
+        with CaptureQueriesContext(connection) as queries:
+            again = self.feed()
+            unchanged = self.client.get('/api/jobs/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(again.data, first.data)
+        self.assertEqual(unchanged.status_code, 304)
+        self.assertFalse([q for q in queries if 'core_job' in q['sql']])
+
+        new = self.add_job('niamh@example.com')
+        changed = self.client.get('/api/jobs/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed['ETag'], first['ETag'])
+        self.assertEqual([row['id'] for row in changed.data['pending_jobs']], [new.pk, job.pk])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            job.status = 'in Progress'
+            job.save()
+            new.delete()
+        self.assertEqual(self.feed().data['pending_jobs'], [])
+
+    @override_settings(JOB_FEED_SIZE=2)
+    def test_pages_past_the_feed(self):
+        for i in range(5):
+            self.add_job(f'client{i}@example.com')
+        jobs = list(Job.objects.filter(status='pending').order_by('-created_at', '-id').values_list('id', flat=True))
+        ids, params = [], {'limit': 1}
+        while True:
+            response = self.feed(**params)
+            ids += [row['id'] for row in response.data['pending_jobs']]
+            if 'X-Next-Cursor' not in response:
+                break
+            params['cursor'] = response['X-Next-Cursor']
+        self.assertEqual(ids, jobs)
+        self.assertNotIn('ETag', self.feed(bedrooms_min='2'))
+
+
+class CoverageTest(ClearedCacheMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.accessor = create_accessor(preference='cork, Kerry')
+        self.other = create_accessor('liam@example.com', 'Liam', 'Walsh', preference='Kerry')
+        self.client.force_authenticate(self.accessor)
+        self.jobs = {}
+        with self.captureOnCommitCallbacks(execute=True):
+            for i, (county, town) in enumerate([('Cork', 'Mallow'), ('Kerry', 'Tralee'), ('Clare', 'Ennis'),
+                                                ('kerry', 'Killarney'), ('CORK', 'Bandon')]):
+                quote = Quote.objects.create(**{**QUOTE, 'email_address': f'client{i}@example.com',
+                                                'county': county, 'nearest_town': town})
+                self.jobs[town] = promote_quote(quote).pk
+
+    def feed(self, **params):
+        # The ids of every page of jobs/, newest first
+        ids, params = [], {'limit': 1, **params}
+        while True:
+            response = self.client.get('/api/jobs/', params)
+            self.assertEqual(response.status_code, 200, response.data)
+            ids += [row['id'] for row in response.data['pending_jobs']]
+            if 'X-Next-Cursor' not in response:
+                return ids
+            params['cursor'] = response['X-Next-Cursor']
+
+    def test_jobs_of_covered_counties(self):
+        newest = [self.jobs[town] for town in ('Bandon', 'Killarney', 'Tralee', 'Mallow')]
+        self.assertEqual(self.feed(), newest)
+        self.assertEqual(self.feed(bedrooms_min=0), newest)  # Filtered, so read from the table
+
+        response = self.client.put('/api/coverage/', {'areas': [
+            {'county': 'Cork'}, {'county': 'kerry', 'towns': ['tralee']},
+        ]}, format='json')
+        self.assertEqual(response.data['areas'], [{'county': 'Cork', 'towns': []},
+                                                  {'county': 'Kerry', 'towns': ['Tralee']}])
+        newest = [self.jobs[town] for town in ('Bandon', 'Tralee', 'Mallow')]
+        self.assertEqual(self.feed(), newest)
+        self.assertEqual(self.feed(bedrooms_min=0), newest)
+
+        self.client.put('/api/preference/', {'preference': 'Clare'}, format='json')
+        self.assertEqual(self.client.get('/api/coverage/').data['areas'], [{'county': 'Clare', 'towns': []}])
+        self.assertEqual(self.feed(), [self.jobs['Ennis']])
+
+    def test_accessors_covering_a_job(self):
+        self.client.put('/api/coverage/', {'areas': [{'county': 'Kerry', 'towns': ['Tralee']}]}, format='json')
+        for town, emails in [('Tralee', ['ciara@example.com', 'liam@example.com']),
+                             ('Killarney', ['liam@example.com']), ('Ennis', [])]:
+            job = Job.objects.get(pk=self.jobs[town])
+            self.assertEqual(sorted(accessors_covering(job).values_list('user__email', flat=True)), emails)
+
+
+class JobsNearTest(ClearedCacheMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        job_map.forget()  # It may hold jobs of other tests, rolled back
+        self.client.force_authenticate(create_accessor(preference='Cork'))
+        self.jobs = {}
+        self.add_jobs([('Cork', 'Mallow', None), ('Limerick', 'Kilmallock', None), ('Cork', 'Fermoy', None),
+                       ('Co. Kerry', 'killarney', None), ('Clare', 'Ennis', None), ('Cork', 'Cork', 'T12 AB12')])
+
+    def add_jobs(self, places):
+        with self.captureOnCommitCallbacks(execute=True):
+            for county, town, eircode in places:
+                quote = Quote.objects.create(**{**QUOTE, 'email_address': f'{town.lower()}@example.com',
+                                                'county': county, 'nearest_town': town, 'eircode': eircode})
+                self.jobs[town] = promote_quote(quote).pk
+
+    def near(self, **params):
+        # (town, distance) of every page, nearest first
+        found, params = [], {'limit': 2, **params}
+        while True:
+            response = self.client.get('/api/jobs/', params)
+            self.assertEqual(response.status_code, 200, response.data)
+            found += [(row['nearest_town'], row['distance_km']) for row in response.data['pending_jobs']]
+            if 'X-Next-Cursor' not in response:
+                return found
+            params['cursor'] = response['X-Next-Cursor']
+
+    def test_jobs_within_a_distance(self):
+        self.assertEqual(self.client.get('/api/jobs/', {'within_km': 50}).status_code, 400)  # No location yet
+        self.client.put('/api/coverage/', {'location': 'P51 X2Y3'}, format='json')  # Mallow
+        found = self.near(within_km=60)
+        self.assertEqual([town for town, _ in found], ['Mallow', 'Fermoy', 'Cork', 'Kilmallock', 'killarney'])
+        self.assertEqual(found, sorted(found, key=lambda job: job[1]))
+        self.assertEqual(self.near(within_km=30, near='Ennis, Co. Clare'), [('Ennis', 0.0)])
+
+        # Changes reach the map once committed
+        with self.captureOnCommitCallbacks(execute=True):
+            Job.objects.get(pk=self.jobs['Fermoy']).delete()
+            job = Job.objects.get(pk=self.jobs['Kilmallock'])
+            job.status = 'in Progress'
+            job.save()
+        self.add_jobs([('Cork', 'Charleville', None)])
+        self.assertEqual([town for town, _ in self.near(within_km=30, near='Mallow')], ['Mallow', 'Charleville', 'Cork'])
+
+    def test_bad_distances(self):
+        for params in [{'within_km': 'far'}, {'within_km': 0}, {'within_km': 500}, {'within_km': 10, 'near': 'Atlantis'}]:
+            self.assertEqual(self.client.get('/api/jobs/', params).status_code, 400)
+
+
+class RecommendationTest(ClearedCacheMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.accessor = create_accessor(preference='Cork')
+        self.other = create_accessor('sean@example.com', 'Sean', 'Walsh')
+        self.accessor.accessor.location = 'Mallow, Co. Cork'
+        self.accessor.accessor.save()
+        self.client.force_authenticate(self.accessor)
+        self.jobs = {}
+        for county, town in [('Clare', 'Ennis'), ('Kerry', 'Killarney'), ('Cork', 'Cork'), ('Cork', 'Mallow')]:
+            quote = Quote.objects.create(**{**QUOTE, 'email_address': f'{town.lower()}@example.com',
+                                            'county': county, 'nearest_town': town})
+            self.jobs[town] = promote_quote(quote)
+
+    def recommended(self, **params):
+        # Towns of every page, best first
+        found, params = [], {'limit': 1, **params}
+        while True:
+            response = self.client.get('/api/jobs/recommended/', params)
+            self.assertEqual(response.status_code, 200, response.data)
+            found += [row['nearest_town'] for row in response.data['recommended_jobs']]
+            if 'X-Next-Cursor' not in response:
+                return found
+            params['cursor'] = response['X-Next-Cursor']
+
+    def test_jobs_ranked_nearest_and_least_bid_on_first(self):
+        # Ennis is neither covered nor in range; Killarney isn't covered but is in range
+        self.assertEqual(self.recommended(), ['Mallow', 'Cork', 'Killarney'])
+
+        # Ranked again once the cached ranking expires, where bids count against a job
+        newer = promote_quote(Quote.objects.create(**{**QUOTE, 'email_address': 'newer@example.com'}))
+        for _ in range(3):
+            Bid.objects.create(amount=250, availability='next week', assessor=self.other.accessor, job=newer)
+        cache.clear()
+        response = self.client.get('/api/jobs/recommended/')
+        self.assertEqual([row['id'] for row in response.data['recommended_jobs']],
+                         [self.jobs['Mallow'].pk, newer.pk, self.jobs['Cork'].pk, self.jobs['Killarney'].pk])
+
+        # Served from the cache, less the jobs taken or bid on since: a cache read and one query
+        Bid.objects.create(amount=300, availability='next week', assessor=self.accessor.accessor, job=self.jobs['Cork'])
+        Job.objects.filter(pk__in=[newer.pk, self.jobs['Killarney'].pk]).update(status='in progress')
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/jobs/recommended/')
+        self.assertEqual([row['nearest_town'] for row in response.data['recommended_jobs']], ['Mallow'])
+        self.assertEqual(response.data['recommended_jobs'][0]['distance_km'], 0.0)
+
+    def test_past_wins_rank_their_kind_of_job_higher(self):
+        won = self.jobs['Ennis']
+        Bid.objects.create(amount=250, availability='next week', assessor=self.accessor.accessor, job=won)
+        for _ in range(4):
+            Bid.objects.create(amount=200, availability='next week', assessor=self.other.accessor, job=won)
+        Project.objects.create(job=won, client=won.client, accessor=self.accessor.accessor)
+        Job.objects.filter(pk=won.pk).update(status='completed')
+        # The same place, but newer and of a kind they haven't won
+        flat = promote_quote(Quote.objects.create(**{**QUOTE, 'email_address': 'flat@example.com',
+                                                     'building_type': 'apartment'}))
+        response = self.client.get('/api/jobs/recommended/', {'limit': 2})
+        self.assertEqual([row['id'] for row in response.data['recommended_jobs']], [self.jobs['Mallow'].pk, flat.pk])
+
+    def test_only_accessors(self):
+        client = UserModel.objects.create_user(email='aoife@example.com', first_name='Aoife', last_name='Byrne',
+                                               phone_number='0871234567')
+        self.client.force_authenticate(client)
+        self.assertEqual(self.client.get('/api/jobs/recommended/').status_code, 403)
+
+
+class MyBidsTest(APITestCase):
+    def setUp(self):
+        self.accessor, self.other = create_accessor(), create_accessor('sean@example.com', 'Sean')
+        self.client.force_authenticate(self.accessor)
+
+    def bid(self, accessor, job, amount):
+        return Bid.objects.create(amount=amount, availability='next week', assessor=accessor.accessor, job=job)
+
+    def lowest_bids(self):
+        response = self.client.get('/api/my-quotes/')
+        self.assertEqual(response.status_code, 200, response.data)
+        return {row['job']['job_id']: row['job']['lowest_bid'] for row in response.data}
+
+    def test_lowest_bid_in_constant_queries(self):
+        jobs = [promote_quote(Quote.objects.create(**{**QUOTE, 'email_address': f'{n}@example.com'})) for n in range(6)]
+        for job in jobs[:2]:
+            self.bid(self.accessor, job, 300)
+        with CaptureQueriesContext(connection) as few:
+            self.lowest_bids()
+        for job in jobs[2:]:
+            self.bid(self.accessor, job, 300)
+            self.bid(self.other, job, 250)
+        with CaptureQueriesContext(connection) as many:
+            lowest = self.lowest_bids()
+        self.assertEqual(len(many), len(few))
+        self.assertEqual(lowest[jobs[0].pk]['amount'], 300)
+        self.assertEqual(lowest[jobs[5].pk]['amount'], 250)
+
+    def test_lowest_bid_follows_bid_writes(self):
+        job, other_job = [promote_quote(Quote.objects.create(**{**QUOTE, 'email_address': f'{n}@example.com'}))
+                          for n in range(2)]
+        mine = self.bid(self.accessor, job, 300)
+        theirs = self.bid(self.other, job, 250)
+        self.assertEqual(self.lowest_bids()[job.pk], {'bid_id': theirs.pk, 'amount': 250})
+
+        # Updated through the API, outbid and moved away from the job
+        self.client.put(f'/api/bids/{mine.pk}/', {'amount': 200}, format='json')
+        self.assertEqual(self.lowest_bids()[job.pk], {'bid_id': mine.pk, 'amount': 200})
+        theirs.amount = 150
+        theirs.save()
+        self.assertEqual(self.lowest_bids()[job.pk], {'bid_id': theirs.pk, 'amount': 150})
+        theirs.job = other_job
+        theirs.save()
+        self.assertEqual(self.lowest_bids()[job.pk], {'bid_id': mine.pk, 'amount': 200})
+        other_job.refresh_from_db()
+        self.assertEqual((other_job.lowest_bid_id, other_job.lowest_bid_amount), (theirs.pk, 150))
+
+        mine.delete()
+        job.refresh_from_db()
+        self.assertEqual((job.lowest_bid_id, job.lowest_bid_amount), (None, None))
+
+    def test_job_saves_keep_the_lowest_bid(self):
+        job = promote_quote(Quote.objects.create(**QUOTE))
+        stale = Job.objects.get(pk=job.pk)
+        bid = self.bid(self.other, job, 250)
+
+        # As the admin would, and the client through the job update view
+        stale.county = 'Kerry'
+        stale.save()
+        self.client.force_authenticate(job.client.user)
+        response = self.client.put(f'/api/job/{job.pk}/update/', {'nearest_town': 'Tralee'}, format='json')
+        self.assertEqual(response.status_code, 200, response.data)
+        job.refresh_from_db()
+        self.assertEqual((job.county, job.nearest_town), ('Kerry', 'Tralee'))
+        self.assertEqual((job.lowest_bid_id, job.lowest_bid_amount), (bid.pk, 250))
+
+
+@skipUnless(connection.vendor == 'postgresql', "Needs a connection per thread")
+class AcceptBidTest(ClearedCacheMixin, TransactionTestCase):
+    client_class = APIClient
+
+    def setUp(self):
+        super().setUp()
+        self.job = promote_quote(Quote.objects.create(**QUOTE))
+        self.owner = self.job.client.user
+        self.bids = []
+        for n in range(8):
+            accessor = create_accessor(f'accessor{n}@example.com')
+            self.bids.append(Bid.objects.create(amount=200 + n, availability='next week',
+                                                assessor=accessor.accessor, job=self.job))
+
+    def accept(self, bid, results):
+        client = APIClient()
+        client.force_authenticate(self.owner)
+        try:
+            self.ready.wait()
+            results.append(client.post(f'/api/bids/{bid.pk}/accept/').status_code)
+        finally:
+            connection.close()
+
+    def test_concurrent_accepts_make_one_project(self):
+        results = []
+        self.ready = threading.Barrier(len(self.bids))
+        threads = [threading.Thread(target=self.accept, args=(bid, results)) for bid in self.bids]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(results), [200] + [409] * (len(self.bids) - 1))
+        self.assertEqual(Project.objects.filter(job=self.job).count(), 1)
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, 'in Progress')
+
+        # Then the job can only be completed
+        self.client.force_authenticate(self.owner)
+        response = self.client.post(f'/api/bids/{self.bids[0].pk}/accept/')
+        self.assertEqual(response.status_code, 409)
+        for job_status, code in [('pending', 400), ('In Progress', 400), ('completed', 200), ('completed', 400)]:
+            response = self.client.patch(f'/api/client/jobs/{self.job.pk}/', {'status': job_status}, format='json')
+            self.assertEqual(response.status_code, code, response.data)
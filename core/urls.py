@@ -2,7 +2,10 @@ from django.urls import path
 from .views import UserCreateAPIView, UserLoginAPIView, BidCreateView, AcceptBidView, NotificationListView, MarkNotificationAsReadView, ClientJobListView, ClientJobCreateView, BidDetailView, CreateCheckoutSessionView
 from .views import GetQuoteView, JobSearchView, ProjectListView, ProjectDetailView, FileDetailView, JobListView, AccessorJobView, JobsAndBidsView, AssessmentView, AssessmentQuoteView, UpdateUserView
 from .views import TotalAccessorsView, TotalClientsView, TotalPendingJobsView, ACDetailsView, ClientDetailView, AdminJobAndQuoteView, ListAccessorBidsView, PlaceBidView, MyBidsView, BerMemberView, BMDetailsView
-from .views import ActivateAccessorAPIView, ResetPasswordAPIView, ForgotPasswordRequestAPIView
+from .views import ActivateAccessorAPIView, ResetPasswordAPIView, ForgotPasswordRequestAPIView, AssessmentAutosaveView
+from .views import AssessmentRoomListView, AssessmentRoomView, AssessmentStoreyView, AdminHeatLossView, AdminAssessmentExportView
+from .views import AssessmentHistoryView, AssessmentVersionView, AssessmentPrefillView, QuoteIntakeView, AccessorCoverageView
+from .views import RecommendedJobView
 from django.conf import settings
 from django.conf.urls.static import static
 
@@ -18,10 +21,14 @@ urlpatterns = [
 
     path('signin/', UserLoginAPIView.as_view(), name = 'user-login'),
 
-    path('get-quote/', GetQuoteView.as_view()),  # For GET request to create a new instance
+    path('get-quote/', GetQuoteView.as_view()),  # For GET request of a draft token for a new quote, nothing is saved
 
     path('get-quote/<int:pk>/', GetQuoteView.as_view()),  # For PUT request to update an instance
 
+    path('get-quote/draft/<str:token>/', GetQuoteView.as_view()),  # PUT of a draft from GET get-quote/, creates the quote with data in it
+
+    path('get-quote/bulk/', QuoteIntakeView.as_view(), name='quote-intake'),  # POST of many quotes as JSON Lines or CSV, from partner portals
+
 
                                             #HOME OWNER SCREEN
     path('client/jobs/', ClientJobListView.as_view(), name='client-job-list'), #list all the jobs made by client
@@ -45,6 +52,7 @@ urlpatterns = [
 
                                             #ACCESSORS SCREENS
     path('jobs/', AccessorJobView.as_view(), name='job-accessor'), ####list all the jobs that or quotes that have a pending status
+    path('jobs/recommended/', RecommendedJobView.as_view(), name='job-recommended'), ### the pending jobs ranked for the accessor, best first
 
     path('quotes/<int:quote_id>/bid/', PlaceBidView.as_view(), name='place-bid'), ###for placing a bid on quote instead of job
 
@@ -63,9 +71,26 @@ urlpatterns = [
 
     path('assessment/<int:assessment_id>/', AssessmentView.as_view(), name='update-assessment'), ### endpoint to updating the attributs of accesment
 
+    path('assessment/<int:assessment_id>/autosave/', AssessmentAutosaveView.as_view(), name='autosave-assessment'), ### buffered field deltas, flushed every few seconds or on commit
+
+    path('assessment/<int:assessment_id>/rooms/', AssessmentRoomListView.as_view(), name='assessment-rooms'), ### all the rooms and their totals, POST adds a room
+
+    path('assessment/<int:assessment_id>/rooms/<int:position>/', AssessmentRoomView.as_view(), name='assessment-room'), ### update or delete one room
+
+    path('assessment/<int:assessment_id>/storeys/', AssessmentStoreyView.as_view(), name='assessment-storeys'), ### every storey with its heat loss areas
+
+    path('assessment/<int:assessment_id>/storeys/<str:storey>/', AssessmentStoreyView.as_view(), name='assessment-storey'), ### update a storey and any number of its heat loss areas
+
+    path('assessment/<int:assessment_id>/prefill/', AssessmentPrefillView.as_view(), name='assessment-prefill'), ### copy the envelope and storeys of the latest earlier survey of the same Eircode/MPRN
+
+    path('assessment/<int:assessment_id>/history/', AssessmentHistoryView.as_view(), name='assessment-history'), ### who changed which fields in each version
+
+    path('assessment/<int:assessment_id>/versions/<int:version>/', AssessmentVersionView.as_view(), name='assessment-version'), ### the assessment as it was at a past version
+
     path('assess/<int:assessment_id>/', AssessmentQuoteView.as_view(), name='assessment-update'), ##### endpoint for using a quote id to add assesment for get quote ber certificate
 
     path('preference/', UpdateUserView.as_view(), name='update-preference'), ### endpoint for setting the preference
+    path('coverage/', AccessorCoverageView.as_view(), name='accessor-coverage'), ### the counties and towns an accessor takes jobs in
 
 
                                             # ADMIN SCREEN
@@ -83,6 +108,10 @@ urlpatterns = [
 
     path('admin/brmembers/', BMDetailsView.as_view(), name='admin-c-data'), #will the list the total number of ber members
 
+    path('admin/heat-loss/', AdminHeatLossView.as_view(), name='admin-heat-loss'), #### indicative heat loss and BER band of the assessments
+
+    path('admin/assessments/export/', AdminAssessmentExportView.as_view(), name='admin-assessment-export'), #### streams the assessments as parquet, arrow or csv
+
     ##### Ber Member will list all the the quotes with same email and username ##############
     path('bermember/', BerMemberView.as_view(), name='ber-member'),
 
@@ -1,6 +1,28 @@
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
-from .models import UserModel, Job, Client, Accessor, Notification, Bid, Project, File, Quote, Assesment, Payment
-from .serializers import UserModelSerializer, JobSerializer, BidSerializer, NotificationSerializer, QuoteSerializer, FileSerializer, ProjectSerializer, ClientSerializer, AccessorSerializer, TableJob, AssessmentSerializer, PaymentSerializer
+from .models import UserModel, Job, Client, Accessor, Notification, Bid, Project, File, Quote, Assesment, Payment, AssessmentVersionConflict
+from .models import AssessmentRoom, AssessmentStorey, AssessmentHeatLossArea, AssessmentRevision
+from .serializers import UserModelSerializer, JobSerializer, BidSerializer, NotificationSerializer, QuoteSerializer, FileSerializer, ProjectSerializer, ClientSerializer, AccessorSerializer, TableJob, AssessmentSerializer, CompiledAssessmentSerializer, PaymentSerializer
+from .serializers import AssessmentRoomSerializer, AssessmentStoreySerializer, AssessmentHeatLossAreaSerializer
+from .serializers import assessment_queryset, select_assessment_keys
+from .serializers import CoverageSerializer
+from .child_rows import refresh_room_totals
+from .room_totals import ROOM_TOTALS
+from . import export as assessment_export
+from . import quote_intake
+from .heat_loss import estimate as estimate_heat_loss, band_counts as heat_loss_band_counts, results_as_rows as heat_loss_rows
+from .autosave import autosave, AutosaveBusy, AutosaveConflict
+from .history import assessment_at
+from .prefill import PrefillError, latest_survey, prefill
+from .quote_drafts import new_draft_token, draft_key, has_data, draft_quote
+from .quote_promotion import is_complete, promote_quote
+from .search import search_jobs
+from .pagination import Page, PaginationError
+from .quote_values import job_filters
+from . import job_feed, job_states
+from .coverage import areas_of, pending_jobs, preference_counties, set_areas
+from .job_map import MAX_RADIUS_KM, jobs_near
+from .places import locate_text
+from .recommendations import recommended
 from rest_framework import status, permissions
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -14,19 +36,21 @@ from django.contrib.contenttypes.models import ContentType
 from rest_framework.exceptions import PermissionDenied
 from django.utils import timezone
 from django.utils.timezone import now
+from django.utils.http import parse_etags
 from rest_framework.authentication import TokenAuthentication
 import logging
-from django.db.models import Count, Q
+from django.db.models import Count, Prefetch, Q
+from django.db import transaction
+from django.core import signing
 from django.conf import settings
 import stripe
 from django.http import JsonResponse
 from drf_yasg.utils import swagger_auto_schema
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from core.email_backend import send_gmail_api
 from django.contrib.auth.hashers import make_password
 import random
 from datetime import timedelta
-import uuid
 
 
 
@@ -46,21 +70,11 @@ class GetQuoteView(APIView):
     authentication_classes = []
     def get(self, request):
         """
-        Handle GET request to create a new GetQuote instance with an auto-generated ID.
+        Handle GET request for a new quote: a signed draft token, PUT to get-quote/draft/<token>/.
+        Nothing is saved until the draft is first PUT with data (see core.quote_drafts).
         """
-        quote = Quote.objects.create()
-        assessment = Assesment.objects.create(
-            quote=quote,  # Use the primary key of the created Quote as a foreign key
-        )
-
-        # Serialize the Quote data along with the Assessment ID
-        quote_serializer = QuoteSerializer(quote)
-        response_data = {
-            "quote": quote_serializer.data,
-            "assessment_id": assessment.id,
-        }
-
-        return Response(response_data, status=status.HTTP_201_CREATED)
+        return Response({"draft_token": new_draft_token(), "quote": None, "assessment_id": None},
+                        status=status.HTTP_200_OK)
 
     @swagger_auto_schema(request_body=QuoteSerializer)
     # def put(self, request, pk):
@@ -80,75 +94,76 @@ class GetQuoteView(APIView):
     #         return Response(serializer.data, status=status.HTTP_200_OK)
     #
     #     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-    def put(self, request, pk):
+    def put(self, request, pk=None, token=None):
         """
         Update the Quote instance and create a user and job if all attributes except lidar are provided.
+        A draft (get-quote/draft/<token>/) gets its Quote and Assesment on the first PUT with data.
         """
-        quote = get_object_or_404(Quote, pk=pk)
-
-        serializer = QuoteSerializer(quote, data=request.data, partial=True)
-        if serializer.is_valid():
-            serializer.save()
+        if token is None:
+            quote = get_object_or_404(Quote, pk=pk)
+            return self.update_quote(quote, request.data)
 
-            # Check if all required attributes except lidar are filled
-            required_fields = [
-                'name', 'email_address', 'mobile_number',
-                'building_type', 'preferred_date', 'preferred_time',
-                'property_type', 'property_size', 'bedrooms',
-                'heat_pump_installed', 'county', 'nearest_town', 'ber_purpose'
-            ]
-
-            if all(getattr(quote, field) for field in required_fields):
-                # Update or create UserModel with user_type explicitly set to 'client'
-                email = quote.email_address
-                user, created = UserModel.objects.get_or_create(
-                    email=email,
-                    defaults={
-                        "first_name": quote.name.split()[0] if quote.name else "",
-                        "last_name": quote.name.split()[1] if quote.name and len(quote.name.split()) > 1 else "",
-                        "phone_number": quote.mobile_number,
-                        "password": str(uuid.uuid4())[:8],
-                        "user_type": "client"  # Ensure user_type is client
-                    }
-                )
+        try:
+            key = draft_key(token)
+        except signing.SignatureExpired:
+            return Response({"error": "This quote has expired, please start a new one."},
+                            status=status.HTTP_400_BAD_REQUEST)
+        except signing.BadSignature:
+            return Response({"error": "Quote not found."}, status=status.HTTP_404_NOT_FOUND)
 
-                # Ensure the Client instance exists and is linked to the user
-                client, client_created = Client.objects.get_or_create(
-                    user=user,
-                    defaults={
-                        "email": email,
-                        "phone_number": quote.mobile_number,
-                        "first_name": user.first_name,
-                        "last_name": user.last_name
-                    }
-                )
+        serializer = QuoteSerializer(data=request.data, partial=True)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        if not has_data(serializer.validated_data):
+            # Still nothing to save
+            return Response({"draft_token": token, "quote": None, "assessment_id": None}, status=status.HTTP_200_OK)
+
+        with transaction.atomic():
+            quote, created = draft_quote(key)
+            response = self.update_quote(quote, request.data)
+        if created and response.status_code == status.HTTP_200_OK:
+            response.status_code = status.HTTP_201_CREATED
+        return response
+
+    def update_quote(self, quote, data):
+        serializer = QuoteSerializer(quote, data=data, partial=True)
+        if serializer.is_valid():
+            with transaction.atomic():
+                serializer.save()
 
-                # Update or create Job linked to the correct Client
-                job, job_created = Job.objects.update_or_create(
-                    client=client,
-                    defaults={
-                        "building_type": quote.building_type,
-                        "preferred_date": quote.preferred_date,
-                        "preferred_time": quote.preferred_time,
-                        "property_type": quote.property_type,
-                        "property_size": quote.property_size,
-                        "bedrooms": quote.bedrooms,
-                        "additional_features": quote.additional_features,
-                        "heat_pump_installed": quote.heat_pump_installed,
-                        "county": quote.county,
-                        "nearest_town": quote.nearest_town,
-                        "ber_purpose": quote.ber_purpose,
-                        "name": quote.name,
-                        "email_address": quote.email_address,
-                        "mobile_number": quote.mobile_number,
-                        "status": "pending"
-                    }
-                )
+                # Once all attributes except lidar are filled, the quote becomes the client's job
+                if is_complete(quote):
+                    promote_quote(quote)
 
             return Response(serializer.data, status=status.HTTP_200_OK)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+class QuoteIntakeView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        """
+        Bulk quote requests from a partner portal, see core.quote_intake. The body is JSON Lines
+        (application/x-ndjson) or CSV (text/csv), or either as a multipart `file` upload.
+        Returns the quote and job ids or the errors of each row.
+        """
+        if request.content_type.startswith('multipart/'):
+            upload = request.FILES.get('file')
+            if upload is None:
+                return Response({"error": "Upload the rows as `file`."}, status=status.HTTP_400_BAD_REQUEST)
+            content_type, filename, lines = upload.content_type, upload.name, upload
+        else:
+            # Read as a stream rather than request.body, which is capped at DATA_UPLOAD_MAX_MEMORY_SIZE.
+            # request.stream is None for an empty body.
+            content_type, filename, lines = request.content_type, None, request.stream or []
+        try:
+            file_format = quote_intake.input_format(content_type, filename)
+        except quote_intake.IntakeError as e:
+            return Response({"error": str(e)}, status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+
+        return Response(quote_intake.intake(lines, file_format), status=status.HTTP_200_OK)
+
 class UserCreateAPIView(APIView):
     permission_classes = [AllowAny]
 
@@ -280,11 +295,41 @@ class UpdateUserView(APIView):
 
         serializer = UserModelSerializer(user, data=request.data, partial=True)  # Allow partial updates
         if serializer.is_valid():
-            user = serializer.save()
+            with transaction.atomic():
+                user = serializer.save()
+                # A preference ("Cork" or "Cork, Kerry") covers those counties whole (core.coverage)
+                if 'preference' in serializer.validated_data:
+                    set_areas(user.accessor, {county: () for county in preference_counties(user.preference)})
             return Response(UserModelSerializer(user).data, status=status.HTTP_200_OK)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+
+class AccessorCoverageView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        if request.user.user_type != 'accessor':
+            return Response({"error": "Only accessors cover counties."}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(CoverageSerializer.of(request.user), status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(request_body=CoverageSerializer)
+    def put(self, request):
+        # Replaces the counties, and towns of them, the accessor takes jobs in, and their location
+        user = request.user
+        if user.user_type != 'accessor':
+            return Response({"error": "Only accessors cover counties."}, status=status.HTTP_400_BAD_REQUEST)
+        serializer = CoverageSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        with transaction.atomic():
+            if 'areas' in serializer.validated_data:
+                set_areas(user.accessor, serializer.validated_data['areas'])
+            if 'location' in serializer.validated_data:
+                user.accessor.location = serializer.validated_data['location']
+                user.accessor.save(update_fields=['location'])
+        return Response(CoverageSerializer.of(user), status=status.HTTP_200_OK)
+
 class NotificationListView(APIView):
     permission_classes = [IsAuthenticated]  # Only authenticated users can view their notifications
 
@@ -294,19 +339,26 @@ class NotificationListView(APIView):
         # Check if the user is an Accessor or Client
         try:
             accessor = Accessor.objects.get(user=user)
-            notifications = Notification.objects.filter(recipient=user).order_by('-created_at')
+            notifications = Notification.objects.filter(recipient=user)
         except Accessor.DoesNotExist:
             try:
                 client = Client.objects.get(user=user)
-                notifications = Notification.objects.filter(recipient=user).order_by('-created_at')
+                notifications = Notification.objects.filter(recipient=user)
             except Client.DoesNotExist:
                 return Response({"error": "User is not a client or accessor."},
                                 status=status.HTTP_400_BAD_REQUEST)
 
+        # Newest first, paged by ?cursor= and ?limit= (see core.pagination)
+        try:
+            page = Page(request)
+            notifications = page.order(notifications)
+        except PaginationError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
         # Serialize the notifications
-        serializer = NotificationSerializer(notifications, many=True)
+        serializer = NotificationSerializer(page.rows(notifications), many=True)
 
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return page.response(serializer.data, status=status.HTTP_200_OK)
 
 class MarkNotificationAsReadView(APIView):
     permission_classes = [IsAuthenticated]  # Ensure only authenticated users can access
@@ -345,10 +397,14 @@ class ClientJobListView(APIView):
         except Client.DoesNotExist:
             return Response({"error": "You do not have any associated jobs."}, status=status.HTTP_400_BAD_REQUEST)
 
-        # Filter jobs created by the client
-        jobs = Job.objects.filter(client=client)
-        serializer = JobSerializer(jobs, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        # Filter jobs created by the client, newest first and paged by ?cursor= and ?limit=
+        try:
+            page = Page(request)
+            jobs = page.order(Job.objects.filter(client=client))
+        except PaginationError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        serializer = JobSerializer(page.rows(jobs), many=True)
+        return page.response(serializer.data, status=status.HTTP_200_OK)
 
     @swagger_auto_schema(request_body=JobSerializer)
     def patch(self, request, pk):
@@ -366,12 +422,18 @@ class ClientJobListView(APIView):
             return Response({"error": "Job not found or you do not have permission to update this job."}, status=status.HTTP_404_NOT_FOUND)
 
         job_status = request.data.get('status')  # Renamed to avoid conflict with model field
-        if job_status:
-            job.status = job_status
-            job.save()
-            return Response(JobSerializer(job).data, status=status.HTTP_200_OK)
-        else:
+        if not job_status:
             return Response({"error": "Status is required."}, status=status.HTTP_400_BAD_REQUEST)
+        if job_status == job_states.IN_PROGRESS:
+            return Response({"error": "A job starts when you accept a bid on it."}, status=status.HTTP_400_BAD_REQUEST)
+        # Only the moves of core.job_states, made once however many requests ask at the same time
+        try:
+            moved = job_states.move(job, job_status)
+        except job_states.InvalidTransition as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        if not moved:
+            return Response({"error": "The job's status was changed meanwhile."}, status=status.HTTP_409_CONFLICT)
+        return Response(JobSerializer(job).data, status=status.HTTP_200_OK)
 
 class ClientJobCreateView(APIView):
     permission_classes = [IsAuthenticated]
@@ -416,29 +478,22 @@ class JobSearchView(APIView):
     """
 
     def get(self, request):
-        # Retrieve query parameters
-        property_type = request.query_params.get('property_type')
-        property_size = request.query_params.get('property_size')
-        bedrooms = request.query_params.get('bedrooms')
-        county = request.query_params.get('county')
-        nearest_town = request.query_params.get('nearest_town')
-
-        # Build queryset dynamically based on provided parameters
-        queryset = Job.objects.all()
-        if property_type:
-            queryset = queryset.filter(property_type__icontains=property_type)
-        if property_size:
-            queryset = queryset.filter(property_size__icontains=property_size)
-        if bedrooms:
-            queryset = queryset.filter(bedrooms__icontains=bedrooms)
-        if county:
-            queryset = queryset.filter(location__icontains=county)
-        if nearest_town:
-            queryset = queryset.filter(nearest_town__icontains=nearest_town)
+        # Filters by ?property_type=, ?county= and ?nearest_town= (typos allowed), best match first,
+        # see core.search, and by bedrooms, floor area and preferred date ranges, see
+        # core.quote_values.job_filters(); paged by ?cursor= and ?limit=
+        params = request.query_params
+        try:
+            page = Page(request)
+            queryset, keys = search_jobs(
+                property_type=params.get('property_type'), county=params.get('county'),
+                nearest_town=params.get('nearest_town'), filters=job_filters(params), page=page,
+            )
+        except (PaginationError, ValueError) as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
         # Serialize the filtered queryset
-        serializer = JobSerializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        serializer = JobSerializer(page.rows(queryset, keys), many=True)
+        return page.response(serializer.data, status=status.HTTP_200_OK)
 
 
 class JobsAndBidsView(APIView):
@@ -552,7 +607,9 @@ class BidDetailView(APIView):
         serializer = BidSerializer(bid, data=request.data, partial=True)
 
         if serializer.is_valid():
-            updated_bid = serializer.save()
+            # With the lowest bid of its job (core.lowest_bids)
+            with transaction.atomic():
+                updated_bid = serializer.save()
 
             # Optionally, create notifications or perform other actions after the bid is updated.
             # If the bid amount has changed, create a notification for the client
@@ -599,19 +656,26 @@ class AcceptBidView(APIView):
             client = Client.objects.get(user=user)
         except Client.DoesNotExist:
             return Response({"error": "User is not a client."}, status=status.HTTP_400_BAD_REQUEST)
-        client = Client.objects.get(user=user)
-
 
         try:
-            bid = Bid.objects.get(id=bid_id)
-            job = bid.job
+            bid = Bid.objects.select_related('job', 'assessor__user').get(id=bid_id)
+        except Bid.DoesNotExist:
+            return Response({"error": "Bid not found."}, status=status.HTTP_404_NOT_FOUND)
+        job = bid.job
+        if job is None:
+            return Response({"error": "Only bids on jobs can be accepted."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if job.client_id != client.id:
+            return Response({"error": "You are not the client who posted this job."}, status=status.HTTP_400_BAD_REQUEST)
 
-            if job.client != client:
-                return Response({"error": "You are not the client who posted this job."}, status=status.HTTP_400_BAD_REQUEST)
+        already_taken = Response({"error": "A bid on this job has already been accepted."}, status=status.HTTP_409_CONFLICT)
+        if job.status != job_states.PENDING:
+            return already_taken
 
-            # Accept the bid and change the job status to 'Completed'
-            job.status = 'In Progress'
-            job.save()
+        with transaction.atomic():
+            # Accept the bid: only one request moves the job out of pending (core.job_states)
+            if not job_states.move(job, job_states.IN_PROGRESS, source=job_states.PENDING):
+                return already_taken
 
             # Create the project
             project = Project.objects.create(
@@ -631,34 +695,30 @@ class AcceptBidView(APIView):
 
             sender_content_type = ContentType.objects.get_for_model(client)
             notification = Notification.objects.create(
-                message=f"Your bid of {bid.amount} for job  has been accepted by {client.user.first_name} {client.user.last_name}.",
+                message=f"Your bid of {bid.amount} for job  has been accepted by {user.first_name} {user.last_name}.",
                 notification_type='bid_accepted',
                 sender_content_type=sender_content_type,
                 sender_object_id=client.id,
                 recipient=bid.assessor.user,  # The assessor will be the recipient
             )
 
-            # Find all users that are admin
-            Usermodel = UserModel.objects.filter(is_staff=True)
-
             # Send notification to all admins
-            for admin in Usermodel:
-                Notification.objects.create(
-                    message=f"Home Owner {client.user.first_name} {client.user.last_name} has accepted a bid for the job by Accessor {bid.assessor.user.first_name} {bid.assessor.user.last_name}.",
+            Notification.objects.bulk_create([
+                Notification(
+                    message=f"Home Owner {user.first_name} {user.last_name} has accepted a bid for the job by Accessor {bid.assessor.user.first_name} {bid.assessor.user.last_name}.",
                     notification_type='admin_bid_accepted',
                     sender_content_type=sender_content_type,
                     sender_object_id=client.id,  # Client is the sender
                     recipient=admin,  # Admin is the recipient
                 )
+                for admin in UserModel.objects.filter(is_staff=True)
+            ])
 
-            return Response({
-                "message": "Bid accepted successfully. A project and assessment have been created.",
-                "project_id": project.id,
-                "assessment_id": assessment.id,
-            }, status=status.HTTP_200_OK)
-
-        except Bid.DoesNotExist:
-            return Response({"error": "Bid not found."}, status=status.HTTP_404_NOT_FOUND)
+        return Response({
+            "message": "Bid accepted successfully. A project and assessment have been created.",
+            "project_id": project.id,
+            "assessment_id": assessment.id,
+        }, status=status.HTTP_200_OK)
 
 
 class CreateCheckoutSessionView(APIView):
@@ -751,24 +811,109 @@ class AccessorJobView(APIView):
             return Response({"error": "You do not have permission to access this endpoint."},
                             status=status.HTTP_403_FORBIDDEN)
 
-        # Get the preference set by the user
-        preference = user.preference
-        if not preference:
+        # ?within_km= lists the jobs that far from ?near= or the user's location, whatever their county
+        if request.query_params.get('within_km'):
+            return self.jobs_near(request, user)
+
+        # Get the counties (and towns) the user covers (core.coverage)
+        areas = areas_of(user)
+        if not areas:
             return Response({"error": "User preference is not set."},
                             status=status.HTTP_400_BAD_REQUEST)
 
-        # Filter jobs based on the user's preference and 'pending' status
-        jobs = Job.objects.filter(status='pending', county__iexact=preference)  # Case-insensitive match
+        # Filter jobs based on the user's counties and 'pending' status, and the bedrooms, floor
+        # area and preferred date ranges asked for (core.quote_values.job_filters())
+        try:
+            filters = job_filters(request.query_params)
+            page = Page(request)
+            # Unfiltered pages come from the counties' cached feeds while they hold them (core.job_feed)
+            snapshot = None if filters else job_feed.view(areas)
+            rows = job_feed.page_rows(snapshot, page) if snapshot else None
+            if rows is None:
+                jobs = pending_jobs(Job.objects.filter(status='pending', **filters), areas, page)
+        except (PaginationError, ValueError) as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        if rows is not None:
+            # Versioned: a poll with the ETag it was last sent is answered 304 while its feeds are unchanged
+            etag = snapshot['etag']
+            known = parse_etags(request.headers.get('If-None-Match', ''))
+            if etag in known or '*' in known:
+                response = Response(status=status.HTTP_304_NOT_MODIFIED)
+            else:
+                response = page.response({"pending_jobs": rows}, status=status.HTTP_200_OK)
+            response['ETag'] = etag
+            response['Cache-Control'] = 'private, no-cache'
+            return response
 
         # Serialize the filtered jobs and quotes
-        job_serializer = JobSerializer(jobs, many=True)
+        job_serializer = JobSerializer(page.rows(jobs), many=True)
 
         # Combine the serialized data into one response
         response_data = {
             "pending_jobs": job_serializer.data,
         }
 
-        return Response(response_data, status=status.HTTP_200_OK)
+        return page.response(response_data, status=status.HTTP_200_OK)
+
+    def jobs_near(self, request, user):
+        # The pending jobs within ?within_km= of ?near= (an Eircode or town) or else the user's location,
+        # nearest first, from the job map (core.job_map)
+        params = request.query_params
+        try:
+            km = float(params['within_km'])
+        except ValueError:
+            km = None
+        if km is None or not 0 < km <= MAX_RADIUS_KM:
+            return Response({"error": f"within_km must be a distance in km up to {MAX_RADIUS_KM}."},
+                            status=status.HTTP_400_BAD_REQUEST)
+        location = params.get('near') or Accessor.objects.filter(user=user).values_list('location', flat=True).first()
+        point = locate_text(location)
+        if point is None:
+            return Response({"error": "Set your location at coverage/, or pass ?near=, as an Eircode or town."
+                             if not location else f"Can't place {location!r}: give an Eircode or a town and county."},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            filters = job_filters(params)
+            page = Page(request)
+            accept = None
+            if filters:
+                def accept(ids):
+                    return set(Job.objects.filter(pk__in=ids, **filters).values_list('id', flat=True))
+            nearest = jobs_near(point, km, page, accept)
+        except (PaginationError, ValueError) as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        # A job taken since the map was synced is left out
+        jobs = Job.objects.filter(status='pending').in_bulk([row['id'] for row in nearest])
+        rows = [row for row in nearest if row['id'] in jobs]
+        pending_jobs = JobSerializer([jobs[row['id']] for row in rows], many=True).data
+        for job, row in zip(pending_jobs, rows):
+            job['distance_km'] = row['distance']
+        return page.response({"pending_jobs": pending_jobs}, status=status.HTTP_200_OK)
+
+
+class RecommendedJobView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        # The pending jobs ranked for the accessor, best first, from their cached ranking (core.recommendations)
+        user = request.user
+        if user.user_type != 'accessor':
+            return Response({"error": "You do not have permission to access this endpoint."},
+                            status=status.HTTP_403_FORBIDDEN)
+        try:
+            page = Page(request)
+            rows = recommended(user, page)
+        except PaginationError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        recommended_jobs = JobSerializer([job for job, _, _ in rows], many=True).data
+        for job, (_, score, distance) in zip(recommended_jobs, rows):
+            job['score'] = score
+            job['distance_km'] = distance
+        return page.response({"recommended_jobs": recommended_jobs}, status=status.HTTP_200_OK)
 
 
 
@@ -800,7 +945,9 @@ class BidCreateView(APIView):
 
         serializer = BidSerializer(data=data)
         if serializer.is_valid():
-            bid = serializer.save()
+            # With the job's lowest bid (core.lowest_bids)
+            with transaction.atomic():
+                bid = serializer.save()
 
             # Create a notification for the client about the new bid
             notification = Notification.objects.create(
@@ -823,42 +970,46 @@ class MyBidsView(APIView):
         # Retrieve the accessor instance from the logged-in user
         accessor = request.user.accessor
 
-        # Fetch all bids placed by the accessor
-        bids = Bid.objects.filter(assessor=accessor)
+        # Fetch the bids placed by the accessor, newest first and paged by ?cursor= and ?limit=
+        try:
+            page = Page(request)
+            bids = page.order(Bid.objects.filter(assessor=accessor))
+        except PaginationError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
         bid_data = []
 
-        # Iterate over all the bids and construct the response
-        for bid in bids:
-            # Find the lowest bid for the job
-            lowest_bid = Bid.objects.filter(job=bid.job).order_by('amount').first()
+        # Iterate over all the bids and construct the response: their jobs are read with them, and
+        # each job's lowest bid is kept on it (core.lowest_bids), so the page is one query
+        for bid in page.rows(bids.select_related('job')):
+            job = bid.job
 
             # Append the required data for the response
             bid_data.append({
                 "bid_id": bid.id,  # Include the bid ID
                 "amount": bid.amount,
                 "availability": bid.availability,  # Include bid availability
-                "job": {
-                    "job_id": bid.job.id,
-                    "status": bid.job.status,  # Ensure "job.status" exists
-                    "nearest_town": bid.job.nearest_town,
-                    "county": bid.job.county,
-                    "property_type": bid.job.property_type,
-                    "property_size": bid.job.property_size,
-                    "bedrooms": bid.job.bedrooms,
-                    "heat_pump_installed": bid.job.heat_pump_installed,
-                    "ber_purpose": bid.job.ber_purpose,
-                    "additional_features": bid.job.additional_features,
-                    "preferred_date": bid.job.preferred_date,
-                    "client_id": bid.job.client_id,
+                "job": None if job is None else {  # None for bids on quotes
+                    "job_id": job.id,
+                    "status": job.status,  # Ensure "job.status" exists
+                    "nearest_town": job.nearest_town,
+                    "county": job.county,
+                    "property_type": job.property_type,
+                    "property_size": job.property_size,
+                    "bedrooms": job.bedrooms,
+                    "heat_pump_installed": job.heat_pump_installed,
+                    "ber_purpose": job.ber_purpose,
+                    "additional_features": job.additional_features,
+                    "preferred_date": job.preferred_date,
+                    "client_id": job.client_id,
                     "lowest_bid": {
-                        "bid_id": lowest_bid.id if lowest_bid else None,
-                        "amount": lowest_bid.amount if lowest_bid else None,
+                        "bid_id": job.lowest_bid_id,
+                        "amount": job.lowest_bid_amount,
                     }
                 },
             })
 
-        return Response(bid_data, status=status.HTTP_200_OK)
+        return page.response(bid_data, status=status.HTTP_200_OK)
 
 class ListAccessorBidsView(APIView):
     permission_classes = [IsAuthenticated]
@@ -914,8 +1065,8 @@ class ProjectListView(APIView):
         except Accessor.DoesNotExist:
             return Response({"error": "You are not an Accessor."}, status=status.HTTP_403_FORBIDDEN)
 
-        # Get all projects related to the accessor (i.e., where the accessor is assigned)
-        projects = Project.objects.filter(accessor=accessor)
+        # Get all projects related to the accessor (i.e., where the accessor is assigned), newest first
+        projects = Project.objects.filter(accessor=accessor).order_by('-created_at', '-id')
 
 
         # Prepare project data along with assessment IDs
@@ -1006,10 +1157,79 @@ class ProjectDetailView(APIView):
 
         return Response(project_data, status=status.HTTP_200_OK)
 
+def assessment_etag(assessment):
+    return f'"{assessment.version}"'
+
+
+def if_match_version(request):
+    """
+    The assessment version from the If-Match header (an ETag we sent earlier), or None when
+    the client did not send one. Raises ValueError for anything else.
+    """
+    header = request.headers.get('If-Match', '').strip()
+    if not header or header == '*':
+        return None
+    return int(header.removeprefix('W/').strip('"'))
+
+
+def assessment_selection(request):
+    """
+    The keys asked for with ?section=heating,hot_water and/or ?fields=eircode,mprn (None for
+    all of them), and the serializer context for them. ?omit_defaults=1 leaves out the keys
+    still at their default. Raises ValueError for unknown sections or fields.
+    """
+    sections = [name for name in request.query_params.get('section', '').split(',') if name]
+    fields = [name for name in request.query_params.get('fields', '').split(',') if name]
+    keys = select_assessment_keys(sections, fields) if sections or fields else None
+    context = {'fields': keys, 'omit_defaults': request.query_params.get('omit_defaults') in ('1', 'true')}
+    return keys, context
+
+
+def assessment_detail(request, **lookup):
+    # GET of one assessment, loading only the columns that were asked for
+    try:
+        keys, context = assessment_selection(request)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        assessment = assessment_queryset(keys).get(**lookup)
+    except Assesment.DoesNotExist:
+        return Response({"error": "Assessment not found."}, status=status.HTTP_404_NOT_FOUND)
+
+    serializer = CompiledAssessmentSerializer(assessment, context=context)
+    return Response(serializer.data, status=status.HTTP_200_OK, headers={"ETag": assessment_etag(assessment)})
+
+
+def save_assessment(serializer, request, **kwargs):
+    # Shared by the assessment PUT views: conditional on If-Match, 409 when it is stale
+    try:
+        expected_version = if_match_version(request)
+    except ValueError:
+        return Response({"error": "If-Match must be an ETag returned for this assessment."},
+                        status=status.HTTP_400_BAD_REQUEST)
+
+    serializer.context['expected_version'] = expected_version
+    serializer.context['changed_by'] = request.user
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        assessment = serializer.save(**kwargs)
+    except AssessmentVersionConflict as e:
+        return version_conflict(e)
+    return Response(serializer.data, status=status.HTTP_200_OK, headers={"ETag": assessment_etag(assessment)})
+
+
+def version_conflict(e):
+    return Response({"error": "This assessment was changed on another device. Reload it and try again.",
+                     "version": e.current_version},
+                    status=status.HTTP_409_CONFLICT, headers={"ETag": f'"{e.current_version}"'})
+
+
 class AssessmentView(APIView):
     permission_classes = [IsAuthenticated]
 
-    def get(self, request):
+    def get(self, request, assessment_id=None):
         # Ensure the user is an accessor
         try:
             accessor = Accessor.objects.get(user=request.user)
@@ -1019,22 +1239,36 @@ class AssessmentView(APIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
+        # assessment/<id>/ returns the accessor's assessment, see assessment_selection for the parameters
+        if assessment_id is not None:
+            return assessment_detail(request, id=assessment_id, accessor=accessor)
+
         # Retrieve the first project associated with the accessor
-        project = Project.objects.filter(client=accessor.client).first()  # Or customize this query as needed
+        project = Project.objects.filter(accessor=accessor).first()  # Or customize this query as needed
         if not project:
             return Response(
-                {"error": "No project associated with your client."},
+                {"error": "No project associated with your account."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Create a new Assessment object
+        # Create a new Assessment object. ?eircode= and/or ?mprn= identify the property; with
+        # ?prefill=latest its latest earlier survey is copied in (see core.prefill)
+        eircode, mprn = request.query_params.get('eircode') or None, request.query_params.get('mprn') or None
         assessment = Assesment.objects.create(
             accessor=accessor,
             project=project,
-            client=accessor.client,  # You could also link this based on specific criteria
+            client=project.client,  # You could also link this based on specific criteria
+            eircode=eircode,
+            mprn=mprn,
         )
 
-        return Response({"assessment_id": assessment.id}, status=status.HTTP_201_CREATED)
+        data = {"assessment_id": assessment.id}
+        if request.query_params.get('prefill') == 'latest':
+            source = latest_survey(eircode, mprn, exclude=assessment.id)
+            if source is not None:
+                prefill(assessment, source, changed_by=request.user)
+            data["prefilled_from"] = source.id if source is not None else None
+        return Response(data, status=status.HTTP_201_CREATED, headers={"ETag": assessment_etag(assessment)})
 
     @swagger_auto_schema(request_body=AssessmentSerializer)
     def put(self, request, assessment_id):
@@ -1046,23 +1280,36 @@ class AssessmentView(APIView):
                             status=status.HTTP_403_FORBIDDEN)
 
         try:
-            # Retrieve the Assessment object
-            assessment = Assesment.objects.get(id=assessment_id, accessor=accessor)
+            keys, context = assessment_selection(request)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            # Retrieve the Assessment object along with its section rows in one query. With a
+            # selection, only the columns to return or write are loaded.
+            loaded = None if keys is None else keys | set(request.data)
+            assessment = assessment_queryset(loaded).get(id=assessment_id, accessor=accessor)
         except Assesment.DoesNotExist:
             return Response({"error": "Assessment not found or you do not have permission to update it."},
                             status=status.HTTP_404_NOT_FOUND)
 
-        # Update the Assessment with provided data
-        serializer = AssessmentSerializer(assessment, data=request.data, partial=True)
-        if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        # Update the Assessment with provided data, only if the client has the latest version
+        serializer = CompiledAssessmentSerializer(assessment, data=request.data, partial=True, context=context)
+        return save_assessment(serializer, request)
 
 
 class AssessmentQuoteView(APIView):
     permission_classes = [IsAuthenticated] # Ensure the user is authenticated via Bearer token
 
+    def get(self, request, assessment_id):
+        # Same parameters as the PUT response, see assessment_selection
+        try:
+            Accessor.objects.get(user=request.user)
+        except Accessor.DoesNotExist:
+            return Response({"error": "Accessor not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        return assessment_detail(request, id=assessment_id)
+
     @swagger_auto_schema(request_body=AssessmentSerializer)
     def put(self, request, assessment_id):
         # Extract accessor_id from the authenticated user
@@ -1072,32 +1319,373 @@ class AssessmentQuoteView(APIView):
         except Accessor.DoesNotExist:
             return Response({"error": "Accessor not found."}, status=status.HTTP_404_NOT_FOUND)
 
-        # Fetch the assessment by id
         try:
-            assessment = Assesment.objects.get(id=assessment_id)
+            keys, context = assessment_selection(request)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Fetch the assessment by id, with only the columns to return or write when there is a selection
+        try:
+            loaded = None if keys is None else keys | set(request.data) | {'accessor', 'quote'}
+            assessment = assessment_queryset(loaded).get(id=assessment_id)
         except Assesment.DoesNotExist:
             return Response({"error": "Assessment not found."}, status=status.HTTP_404_NOT_FOUND)
 
+        # Update the accessor in the assessment
+        links = {"accessor": accessor}
+
         # Check if quote_id is provided, and if so, link it to the assessment
         if 'quote_id' in request.data:
             try:
-                quote = Quote.objects.get(id=request.data['quote_id'])
                 # Associate quote with the assessment
-                assessment.quote = quote
+                links["quote"] = Quote.objects.get(id=request.data['quote_id'])
             except Quote.DoesNotExist:
                 return Response({"error": "Quote not found."}, status=status.HTTP_404_NOT_FOUND)
 
-        # Update the accessor in the assessment
-        assessment.accessor = accessor
+        # Update other fields with the provided data, only if the client has the latest version
+        serializer = CompiledAssessmentSerializer(assessment, data=request.data, partial=True, context=context)
+        return save_assessment(serializer, request, **links)
 
-        # Update other fields with the provided data
-        serializer = AssessmentSerializer(assessment, data=request.data, partial=True)
-        if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_200_OK)
+
+class AssessmentAutosaveView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, assessment_id):
+        # Body: {"seq": 12, "changes": {"led": 3}, "commit": false, "device": "tablet-1"}, see core.autosave.
+        # The device is cut to 100 characters, it is part of a cache key.
+        try:
+            accessor = Accessor.objects.get(user=request.user)
+        except Accessor.DoesNotExist:
+            return Response({"error": "You are not authorized to access this endpoint."},
+                            status=status.HTTP_403_FORBIDDEN)
+
+        if not Assesment.objects.filter(id=assessment_id, accessor=accessor).exists():
+            return Response({"error": "Assessment not found or you do not have permission to update it."},
+                            status=status.HTTP_404_NOT_FOUND)
+
+        seq = request.data.get('seq')
+        changes = request.data.get('changes') or {}
+        if not isinstance(changes, dict):
+            return Response({"error": "changes must be an object of assessment fields."},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if changes and (not isinstance(seq, int) or isinstance(seq, bool) or seq < 1):
+            return Response({"error": "seq must be a positive integer."}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Validate each delta as it arrives, so the buffered ones always flush cleanly
+        serializer = CompiledAssessmentSerializer(data=changes, partial=True)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        # With If-Match, the buffered deltas are only flushed onto that version
+        try:
+            expected_version = if_match_version(request)
+        except ValueError:
+            return Response({"error": "If-Match must be an ETag returned for this assessment."},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            ack = autosave(assessment_id, seq, changes, commit=bool(request.data.get('commit')),
+                           device=str(request.data.get('device', ''))[:100], user=request.user,
+                           expected_version=expected_version)
+        except AutosaveBusy:
+            return Response({"error": "The assessment is being saved, try again."},
+                            status=status.HTTP_503_SERVICE_UNAVAILABLE, headers={"Retry-After": "1"})
+        except AutosaveConflict as e:
+            # Nothing was lost: the deltas stay buffered until sent again with the new ETag
+            response = version_conflict(e)
+            response.data.update(e.ack)
+            return response
+        return Response(ack, status=status.HTTP_200_OK)
+
+
+def accessor_assessment(request, assessment_id, *prefetch):
+    # The accessor's assessment with its rooms totals and the given child rows, or an error response
+    try:
+        accessor = Accessor.objects.get(user=request.user)
+    except Accessor.DoesNotExist:
+        return None, Response({"error": "You are not authorized to access this endpoint."},
+                              status=status.HTTP_403_FORBIDDEN)
+    try:
+        assessment = (Assesment.objects.select_related('rooms').prefetch_related(*prefetch)
+                      .get(id=assessment_id, accessor=accessor))
+    except Assesment.DoesNotExist:
+        return None, Response({"error": "Assessment not found or you do not have permission to update it."},
+                              status=status.HTTP_404_NOT_FOUND)
+    return assessment, None
+
+
+def save_child_rows(request, assessment, children=(), deleted=(), totals=()):
+    # Write child rows (and the room totals they changed) as a new version of the assessment.
+    # Returns an error response, or None once saved.
+    try:
+        expected_version = if_match_version(request)
+    except ValueError:
+        return Response({"error": "If-Match must be an ETag returned for this assessment."},
+                        status=status.HTTP_400_BAD_REQUEST)
+    try:
+        assessment.save_changes([], {'rooms': totals} if totals else None, expected_version,
+                                children=children, deleted=deleted, changed_by=request.user)
+    except AssessmentVersionConflict as e:
+        return version_conflict(e)
+    return None
+
+
+def room_totals_data(assessment):
+    totals_row = assessment.section('rooms')
+    return {total: getattr(totals_row, total) for _, total, _ in ROOM_TOTALS}
+
+
+class AssessmentRoomListView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, assessment_id):
+        # All the rooms, not only the five the assessment form has keys for, and their totals
+        assessment, error = accessor_assessment(request, assessment_id, 'room_rows')
+        if error:
+            return error
+        rooms = assessment.rooms_by_position().values()
+        return Response({"rooms": AssessmentRoomSerializer(rooms, many=True).data,
+                         "totals": room_totals_data(assessment)},
+                        status=status.HTTP_200_OK, headers={"ETag": assessment_etag(assessment)})
+
+    @swagger_auto_schema(request_body=AssessmentRoomSerializer)
+    def post(self, request, assessment_id):
+        # Add a room after the last one; the totals are recomputed from all the rooms
+        assessment, error = accessor_assessment(request, assessment_id, 'room_rows')
+        if error:
+            return error
+        serializer = AssessmentRoomSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        rooms = assessment.rooms_by_position()
+        position = max(rooms, default=0) + 1
+        room = AssessmentRoom(assessment=assessment, position=position, **serializer.validated_data)
+        rooms[position] = room
+        totals = refresh_room_totals(assessment, {}, added_or_removed=True)
+        error = save_child_rows(request, assessment, children=[(room, [])], totals=totals)
+        if error:
+            return error
+        return Response({"room": AssessmentRoomSerializer(room).data,
+                         "totals": room_totals_data(assessment)},
+                        status=status.HTTP_201_CREATED, headers={"ETag": assessment_etag(assessment)})
+
+
+class AssessmentRoomView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(request_body=AssessmentRoomSerializer)
+    def put(self, request, assessment_id, position):
+        # Partial update of one room; the totals are adjusted by the difference
+        assessment, error = accessor_assessment(request, assessment_id, 'room_rows')
+        if error:
+            return error
+        room = assessment.rooms_by_position().get(position)
+        if room is None:
+            return Response({"error": "Room not found."}, status=status.HTTP_404_NOT_FOUND)
+        serializer = AssessmentRoomSerializer(room, data=request.data, partial=True)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        old = {}
+        for attr, value in serializer.validated_data.items():
+            if getattr(room, attr) != value:
+                old[attr] = getattr(room, attr)
+                setattr(room, attr, value)
+        totals = refresh_room_totals(assessment, {position: old} if old else {})
+        error = save_child_rows(request, assessment, children=[(room, list(old))] if old else (), totals=totals)
+        if error:
+            return error
+        return Response({"room": AssessmentRoomSerializer(room).data,
+                         "totals": room_totals_data(assessment)},
+                        status=status.HTTP_200_OK, headers={"ETag": assessment_etag(assessment)})
+
+    def delete(self, request, assessment_id, position):
+        # The other rooms keep their positions; the totals are recomputed from them
+        assessment, error = accessor_assessment(request, assessment_id, 'room_rows')
+        if error:
+            return error
+        room = assessment.rooms_by_position().pop(position, None)
+        if room is None:
+            return Response({"error": "Room not found."}, status=status.HTTP_404_NOT_FOUND)
+        totals = refresh_room_totals(assessment, {}, added_or_removed=True)
+        error = save_child_rows(request, assessment, deleted=[room], totals=totals)
+        if error:
+            return error
+        return Response({"totals": room_totals_data(assessment)},
+                        status=status.HTTP_200_OK, headers={"ETag": assessment_etag(assessment)})
+
+
+class AssessmentStoreyView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, assessment_id, storey=None):
+        # assessment/<id>/storeys/ lists every storey with all its heat loss areas
+        assessment, error = accessor_assessment(request, assessment_id, 'storeys__heat_loss_areas')
+        if error:
+            return error
+        storeys = assessment.storeys_by_name()
+        if storey is not None:
+            if storey not in storeys:
+                return Response({"error": "Storey not found."}, status=status.HTTP_404_NOT_FOUND)
+            data = AssessmentStoreySerializer(storeys[storey]).data
         else:
+            data = AssessmentStoreySerializer(storeys.values(), many=True).data
+        return Response(data, status=status.HTTP_200_OK, headers={"ETag": assessment_etag(assessment)})
+
+    @swagger_auto_schema(request_body=AssessmentStoreySerializer)
+    def put(self, request, assessment_id, storey):
+        # Partial update of a storey. The heat loss areas sent are added or replaced by
+        # (element, position), any number of them; the others are kept.
+        if storey not in dict(AssessmentStorey.STOREYS):
+            return Response({"error": "Storey not found."}, status=status.HTTP_404_NOT_FOUND)
+        assessment, error = accessor_assessment(request, assessment_id, 'storeys__heat_loss_areas')
+        if error:
+            return error
+        storeys = assessment.storeys_by_name()
+        row = storeys.get(storey) or AssessmentStorey(assessment=assessment, storey=storey)
+        serializer = AssessmentStoreySerializer(row, data=request.data, partial=True)
+        if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+        values = dict(serializer.validated_data)
+        areas = values.pop('heat_loss_areas', [])
+        changed = [attr for attr, value in values.items() if getattr(row, attr) != value]
+        for attr in changed:
+            setattr(row, attr, values[attr])
+        children = [(row, changed)] if changed or row._state.adding else []
+        storeys[storey] = row
+        existing = row.areas_by_position()
+        for area in areas:
+            key = (area['element'], area['position'])
+            if key not in existing:
+                existing[key] = AssessmentHeatLossArea(storey=row, **area)
+                children.append((existing[key], []))
+            elif existing[key].area != area['area']:
+                existing[key].area = area['area']
+                children.append((existing[key], ['area']))
+
+        error = save_child_rows(request, assessment, children=children)
+        if error:
+            return error
+        # The prefetched areas don't have the ones just added
+        getattr(row, '_prefetched_objects_cache', {}).pop('heat_loss_areas', None)
+        return Response(AssessmentStoreySerializer(row).data,
+                        status=status.HTTP_200_OK, headers={"ETag": assessment_etag(assessment)})
+
+def prefill_source(request, assessment):
+    # Latest earlier survey of the property given by eircode/mprn in the request, or the assessment's own
+    values = request.data if request.method == 'POST' else request.query_params
+    eircode, mprn = values.get('eircode'), values.get('mprn')
+    if not eircode and not mprn:
+        eircode, mprn = assessment.eircode, assessment.mprn
+    return latest_survey(eircode, mprn, exclude=assessment.id)
+
+
+class AssessmentPrefillView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, assessment_id):
+        # The survey a POST would copy from, to show before prefilling
+        assessment, error = accessor_assessment(request, assessment_id)
+        if error:
+            return error
+        source = prefill_source(request, assessment)
+        if source is None:
+            return Response({"error": "No earlier survey of this property was found."},
+                            status=status.HTTP_404_NOT_FOUND)
+        return Response({"source": {
+            "id": source.id,
+            "created_at": source.created_at,
+            "survey_date": source.survey_date,
+            "property_address": source.property_address,
+            "eircode": source.eircode,
+            "mprn": source.mprn,
+        }}, status=status.HTTP_200_OK)
+
+    def post(self, request, assessment_id):
+        # Copy the property details, envelope, storeys and heat loss areas of the latest earlier
+        # survey of the same Eircode or MPRN into this assessment, which must not have them yet
+        assessment, error = accessor_assessment(request, assessment_id)
+        if error:
+            return error
+        try:
+            expected_version = if_match_version(request)
+        except ValueError:
+            return Response({"error": "If-Match must be an ETag returned for this assessment."},
+                            status=status.HTTP_400_BAD_REQUEST)
+        source = prefill_source(request, assessment)
+        if source is None:
+            return Response({"error": "No earlier survey of this property was found."},
+                            status=status.HTTP_404_NOT_FOUND)
+        try:
+            copied = prefill(assessment, source, expected_version, changed_by=request.user)
+        except AssessmentVersionConflict as e:
+            return version_conflict(e)
+        except PrefillError as e:
+            return Response({"error": str(e)}, status=status.HTTP_409_CONFLICT)
+        return Response(copied, status=status.HTTP_200_OK, headers={"ETag": assessment_etag(assessment)})
+
+
+class AssessmentHistoryView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, assessment_id):
+        # Who changed which fields in each version, newest first: ?before=<version> pages back, ?limit= (at most 200)
+        assessment, error = accessor_assessment(request, assessment_id)
+        if error:
+            return error
+        try:
+            before = int(request.query_params['before']) if 'before' in request.query_params else None
+            limit = min(int(request.query_params.get('limit', 50)), 200)
+        except ValueError:
+            return Response({"error": "before and limit must be integers."}, status=status.HTTP_400_BAD_REQUEST)
+        if limit < 1:
+            return Response({"error": "limit must be positive."}, status=status.HTTP_400_BAD_REQUEST)
+
+        revisions = (AssessmentRevision.objects.filter(assessment=assessment).select_related('changed_by')
+                     .defer('snapshot').order_by('-version'))
+        if before is not None:
+            revisions = revisions.filter(version__lt=before)
+        data = [{
+            "version": revision.version,
+            "created_at": revision.created_at,
+            "changed_by": revision.changed_by_id,
+            "changed_by_email": revision.changed_by.email if revision.changed_by else None,
+            "changes": revision.changes,
+        } for revision in revisions[:limit]]
+        return Response({"version": assessment.version, "revisions": data}, status=status.HTTP_200_OK,
+                        headers={"ETag": assessment_etag(assessment)})
+
+
+class AssessmentVersionView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, assessment_id, version):
+        # The assessment as it was at a past version, in the same form as assessment/<id>/, with all its rooms and storeys
+        assessment, error = accessor_assessment(request, assessment_id)
+        if error:
+            return error
+        past = assessment_at(assessment.id, version)
+        if past is None:
+            return Response({"error": "This version of the assessment was not recorded."},
+                            status=status.HTTP_404_NOT_FOUND)
+        # The rebuilt rows have no primary key, so the areas are read from areas_by_position()
+        storeys = []
+        for storey in past.storeys_by_name().values():
+            data = {field: getattr(storey, field) for field in AssessmentStoreySerializer.Meta.fields
+                    if field != 'heat_loss_areas'}
+            data['heat_loss_areas'] = AssessmentHeatLossAreaSerializer(storey.areas_by_position().values(),
+                                                                       many=True).data
+            storeys.append(data)
+        return Response({
+            "version": version,
+            "assessment": CompiledAssessmentSerializer(past, context={'request': request}).data,
+            "rooms": AssessmentRoomSerializer(past.rooms_by_position().values(), many=True).data,
+            "storeys": storeys,
+        }, status=status.HTTP_200_OK)
+
+
 class PlaceBidView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -1160,7 +1748,8 @@ class TotalPendingJobsView(APIView):
     permission_classes = [IsAdminUser]  # Restrict access to admins only
 
     def get(self, request):
-        total_pending_jobs = Job.objects.filter(status__iexact="Pending").count()  # Count jobs with status 'Pending'
+        # Count jobs with status 'pending', on the partial index of pending jobs
+        total_pending_jobs = Job.objects.filter(status='pending').count()
         return Response({"total_pending_jobs": total_pending_jobs}, status=status.HTTP_200_OK)
 
 
@@ -1168,10 +1757,16 @@ class ACDetailsView(APIView):
     permission_classes = [IsAdminUser]  # Restrict access to admins only
 
     def get(self, request):
-        # Annotate clients with the count of jobs they have
-        clients = Client.objects.annotate(job_count=Count('job', filter=Q(job__status='pending'))).values(
+        # Annotate clients with the count of jobs they have; newest first (clients have no
+        # created_at, ids are given in order) and paged by ?cursor= and ?limit=
+        try:
+            page = Page(request)
+            clients = page.order(Client.objects.all(), ['-id'])
+        except PaginationError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        clients = page.rows(clients.annotate(job_count=Count('job', filter=Q(job__status='pending'))).values(
             'id', 'first_name', 'last_name', 'email', 'job_count'
-        )
+        ), ['-id'])
 
         # Transform the queryset into a list of client details
         client_details = [
@@ -1184,7 +1779,7 @@ class ACDetailsView(APIView):
             for client in clients
         ]
 
-        return Response(client_details, status=status.HTTP_200_OK)
+        return page.response(client_details, status=status.HTTP_200_OK)
 
 class BMDetailsView(APIView):
     def get(self, request):
@@ -1219,23 +1814,25 @@ class AdminJobAndQuoteView(APIView):
         Get specific fields from both Job and GetQuote models.
         Admin users only.
         """
-        # Retrieve jobs and select only the required fields
-        jobs = Job.objects.only(
-            'id', 'created_at', 'county', 'building_type', 'property_size',
-            'bedrooms', 'heat_pump_installed', 'ber_purpose', 'additional_features',
-            'preferred_date', 'status'
-        )
-
-        # Retrieve get quotes and select only the required fields
-        quotes = Quote.objects.only(
-            'id', 'created_at', 'county', 'building_type', 'property_size',
-            'bedrooms', 'heat_pump_installed', 'ber_purpose', 'additional_features',
-            'preferred_date', 'status'
-        )
+        # Newest first, each list paged on its own by ?jobs_cursor=, ?jobs_limit=, ?quotes_cursor=
+        # and ?quotes_limit= (see core.pagination)
+        try:
+            job_page, quote_page = Page(request, 'jobs'), Page(request, 'quotes')
+            # Retrieve jobs and select only the required fields
+            jobs = job_page.order(Job.objects.only(
+                'id', 'created_at', 'county', 'building_type', 'property_size',
+                'bedrooms', 'heat_pump_installed', 'ber_purpose', 'additional_features',
+                'preferred_date', 'status'
+            ))
+            # Retrieve get quotes; QuoteSerializer needs every field, deferring some loaded them a row at a time
+            quotes = quote_page.order(Quote.objects.prefetch_related(
+                Prefetch('assessments', queryset=Assesment.objects.only('id', 'quote'))))
+        except PaginationError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
         # Serialize the data using serializers
-        job_serializer = TableJob(jobs, many=True)
-        quote_serializer = QuoteSerializer(quotes, many=True)
+        job_serializer = TableJob(job_page.rows(jobs), many=True)
+        quote_serializer = QuoteSerializer(quote_page.rows(quotes), many=True)
 
         # Combine both job and quote data
         data = {
@@ -1243,18 +1840,23 @@ class AdminJobAndQuoteView(APIView):
             'quotes': quote_serializer.data,
         }
 
-        return Response(data, status=status.HTTP_200_OK)
+        return quote_page.add_headers(job_page.response(data, status=status.HTTP_200_OK))
 
 
 class BerMemberView(APIView):
     permission_classes = [IsAdminUser]
 
     def get(self, request, *args, **kwargs):
-        # Annotate data with counts of projects grouped by accessor
-        accessor_data = (
-            Accessor.objects.values("id", "user__first_name", "user__last_name", "user__email", "user__is_active")
-            .annotate(total_projects=Count("projects"))
-            .order_by("user__first_name", "user__last_name")
+        # Annotate data with counts of projects grouped by accessor, by name and paged by ?cursor= and ?limit=
+        keys = ["user__first_name", "user__last_name", "id"]
+        try:
+            page = Page(request)
+            accessors = page.order(Accessor.objects.all(), keys)
+        except PaginationError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        accessor_data = page.rows(
+            accessors.values("id", "user__first_name", "user__last_name", "user__email", "user__is_active")
+            .annotate(total_projects=Count("projects")), keys
         )
 
         # Prepare the response
@@ -1267,11 +1869,57 @@ class BerMemberView(APIView):
                 "is_active": data["user__is_active"],
             })
 
-        return Response({
+        return page.response({
             "accessor_details": response_data,
         })
 
 
+class AdminHeatLossView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        # Indicative heat loss and BER band of assessments, see core.heat_loss
+        # ?accessor=, ?client=, ?project= narrow them down; ?results=0 only returns the band counts
+        assessments = Assesment.objects.all()
+        for name in ('accessor', 'client', 'project'):
+            value = request.query_params.get(name)
+            if value is not None:
+                if not value.isdigit():
+                    return Response({"error": f"{name} must be an id."}, status=status.HTTP_400_BAD_REQUEST)
+                assessments = assessments.filter(**{f'{name}_id': value})
+
+        results = estimate_heat_loss(assessments)
+        data = {"count": len(results['id']), "bands": heat_loss_band_counts(results)}
+        if request.query_params.get('results') not in ('0', 'false'):
+            data["results"] = heat_loss_rows(results)
+        return Response(data, status=status.HTTP_200_OK)
+
+
+class AdminAssessmentExportView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        # Streams the export, see core.export. ?output=parquet|arrow|csv, ?table=assessments|rooms|
+        # storeys|heat_loss_areas, filtered by ?county=, ?since= and ?until= (YYYY-MM-DD), ?accessor=
+        params = request.query_params
+        accessor = params.get('accessor')
+        if accessor is not None and not accessor.isdigit():
+            return Response({"error": "accessor must be an id."}, status=status.HTTP_400_BAD_REQUEST)
+        table = params.get('table', 'assessments')
+        file_format = params.get('output') or assessment_export.default_format()
+        try:
+            assessments = assessment_export.filter_assessments(
+                params.get('county'), params.get('since'), params.get('until'), accessor)
+            chunks = assessment_export.export(table, assessments, file_format)
+        except assessment_export.ExportError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        response = StreamingHttpResponse(chunks, content_type=assessment_export.CONTENT_TYPES[file_format])
+        extension = assessment_export.FILE_EXTENSIONS[file_format]
+        response['Content-Disposition'] = f'attachment; filename="{table}.{extension}"'
+        return response
+
+
         ################################# Email NOTIFICATIONS ###########################
 
 